@@ -0,0 +1,270 @@
+"""
+Transcription Checkpoint Modülü
+===============================
+Bu modül decode edilen segmentleri transcription sürerken diske yazar;
+çöken, bellek yetmediği için sonlandırılan veya Ctrl-C ile kesilen bir iş
+kaldığı yerden devam ettirilebilir (--resume).
+
+Neden Gerekli?
+--------------
+- Segmentler iş bitene kadar sadece bellekte tutulur; 3 saatlik bir kayıt
+  %90'da kesilirse tüm decode işi kaybolur
+- Önbellek (transcription_cache) sadece tamamlanmış sonuçları saklar
+
+İş Klasörü (cache/checkpoints/<iş anahtarı>/):
+    segments.jsonl  - decode edilen segmentler, satır başına bir segment (ekleme)
+    state.json      - son kalıcı hale getirilen (commit) nokta:
+                      segment sayısı, byte uzunluğu, ses ofseti (saniye)
+
+İş anahtarı transcription önbelleğinin anahtarıyla aynıdır (ses hash'i +
+decode parametreleri); farklı bir ses veya ayarla yanlışlıkla devam edilemez.
+
+Commit Sırası:
+1. Yeni segment satırları segments.jsonl'a yazılır, flush + fsync
+2. state.json geçici dosyaya yazılıp yerine taşınır (atomik)
+Kesinti commit'ler arasında olursa state.json'dan sonraki yarım satırlar
+devam ederken kesilip atılır.
+
+Devam (resume):
+- Son commit'teki segmentler geri yüklenir
+- Decode son segmentin bitişinden (ofset) başlar; önceki metnin sonu
+  initial_prompt olarak verilir (Whisper'ın önceki metne koşullanması korunur)
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from datetime import datetime
+import json
+import os
+import shutil
+import time
+from loguru import logger
+import config.settings as settings
+from app.json_stream import load_json, write_json
+
+
+# Devam ederken initial_prompt'a konacak önceki metnin en fazla uzunluğu (karakter)
+# Whisper zaten prompt'un son ~223 token'ını kullanır
+RESUME_PROMPT_CHARS = 600
+
+
+class TranscriptionCheckpoint:
+    """
+    Tek bir transcription işinin diskteki checkpoint'i.
+
+    Örnek:
+        >>> checkpoint = TranscriptionCheckpoint(cache_key)
+        >>> restored = checkpoint.load() if resume else None
+        >>> checkpoint.start(restored)
+        >>> try:
+        ...     for segment in stream:
+        ...         checkpoint.add(segment)
+        ...     checkpoint.commit(completed=True)
+        ... finally:
+        ...     checkpoint.close()
+        >>> checkpoint.discard()  # Çıktı kaydedildikten sonra
+    """
+
+    def __init__(
+        self,
+        job_key: str,
+        checkpoint_dir: Union[str, Path] = None,
+        interval: float = None,
+        metadata: Dict = None
+    ):
+        """
+        TranscriptionCheckpoint başlatıcı.
+
+        Args:
+            job_key: İş anahtarı (TranscriptionCache.make_key() sonucu)
+            checkpoint_dir: Checkpoint kök klasörü (verilmezse settings.CHECKPOINT_DIR)
+            interval: Commit aralığı (saniye)
+                Verilmezse settings.CHECKPOINT_INTERVAL_SECONDS
+            metadata: state.json'a eklenecek bilgi (video adı, ses süresi, ...)
+        """
+        root = Path(checkpoint_dir) if checkpoint_dir else Path(settings.CHECKPOINT_DIR)
+        self.job_key = job_key
+        self.job_dir = root / job_key
+        self.segments_path = self.job_dir / "segments.jsonl"
+        self.state_path = self.job_dir / "state.json"
+        self.interval = settings.CHECKPOINT_INTERVAL_SECONDS if interval is None else interval
+        self.metadata = metadata or {}
+
+        self._file = None
+        self._pending: List[str] = []
+        self._committed_segments = 0
+        self._committed_bytes = 0
+        self._offset = 0.0
+        self._language = None
+        self._last_commit = time.monotonic()
+
+    def exists(self) -> bool:
+        """Bu iş için commit edilmiş bir checkpoint var mı?"""
+        return self.state_path.exists()
+
+    def load(self) -> Optional[Dict]:
+        """
+        Son commit edilen durumu okur.
+
+        Returns:
+            Optional[Dict]: Checkpoint yoksa veya okunamıyorsa None, aksi halde
+                {
+                    "segments": [...],      # Commit edilmiş segmentler
+                    "offset": 5412.36,      # Son segmentin bitişi (saniye)
+                    "language": "tr",
+                    "completed": False,     # Decode bitmiş miydi?
+                    "initial_prompt": "...",  # Önceki metnin sonu
+                    "committed_bytes": 81234
+                }
+        """
+        if not self.exists():
+            return None
+
+        try:
+            state = load_json(self.state_path)
+
+            with open(self.segments_path, "rb") as f:
+                data = f.read(state["committed_bytes"])
+
+            segments = [json.loads(line) for line in data.splitlines() if line.strip()]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Checkpoint okunamadı, baştan başlanacak: {self.job_dir} - {e}")
+            return None
+
+        if len(segments) != state["committed_segments"]:
+            logger.warning(f"Checkpoint tutarsız, baştan başlanacak: {self.job_dir}")
+            return None
+
+        return {
+            "segments": segments,
+            "offset": state["offset"],
+            "language": state.get("language"),
+            "completed": state.get("completed", False),
+            "initial_prompt": build_resume_prompt(segments),
+            "committed_bytes": state["committed_bytes"]
+        }
+
+    def start(self, restored: Optional[Dict] = None, language: str = None):
+        """
+        Yazmaya başlar.
+
+        Args:
+            restored: load() sonucu; verilirse geri yüklenen segmentlerin
+                arkasına eklenir, verilmezse eski checkpoint dosyaları silinir
+            language: Transcription dili
+        """
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        self._language = language
+
+        if restored:
+            self._committed_segments = len(restored["segments"])
+            self._committed_bytes = restored["committed_bytes"]
+            self._offset = restored["offset"]
+
+            # Son commit'ten sonraki (yarım kalmış) satırlar atılır
+            self._file = open(self.segments_path, "r+b")
+            self._file.truncate(self._committed_bytes)
+            self._file.seek(self._committed_bytes)
+        else:
+            self.state_path.unlink(missing_ok=True)
+            self._file = open(self.segments_path, "wb")
+
+        self._last_commit = time.monotonic()
+
+    def add(self, segment: Dict):
+        """
+        Decode edilen segmenti ekler; commit aralığı dolduysa diske yazar.
+
+        Args:
+            segment: Transcriber'ın işlenmiş segmenti
+        """
+        self._pending.append(json.dumps(segment, ensure_ascii=False))
+        self._offset = segment["end"]
+
+        if time.monotonic() - self._last_commit >= self.interval:
+            self.commit()
+
+    def commit(self, completed: bool = False):
+        """
+        Bekleyen segmentleri kalıcı hale getirir (fsync + atomik state.json).
+
+        Args:
+            completed: Decode tamamlandı mı? (devam ederken decode atlanır)
+        """
+        if self._file is None:
+            return
+
+        if self._pending:
+            data = ("\n".join(self._pending) + "\n").encode("utf-8")
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+            self._committed_segments += len(self._pending)
+            self._committed_bytes += len(data)
+            self._pending = []
+
+        write_json(
+            {
+                "job_key": self.job_key,
+                **self.metadata,
+                "language": self._language,
+                "committed_segments": self._committed_segments,
+                "committed_bytes": self._committed_bytes,
+                "offset": self._offset,
+                "completed": completed,
+                "updated_at": datetime.now().isoformat()
+            },
+            self.state_path
+        )
+        self._last_commit = time.monotonic()
+
+        logger.debug(
+            f"Checkpoint: {self._committed_segments} segment, "
+            f"ofset {self._offset:.1f}s{' (tamamlandı)' if completed else ''}"
+        )
+
+    def close(self):
+        """Bekleyen segmentleri commit eder ve dosyayı kapatır (kesintide de çağrılır)."""
+        if self._file is None:
+            return
+
+        try:
+            if self._pending:
+                self.commit()
+        finally:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """İş klasörünü siler (çıktı kaydedildikten sonra checkpoint gereksiz)."""
+        self.close()
+        shutil.rmtree(self.job_dir, ignore_errors=True)
+
+
+def build_resume_prompt(segments: List[Dict], max_chars: int = RESUME_PROMPT_CHARS) -> Optional[str]:
+    """
+    Devam eden decode için önceki metnin sonunu initial_prompt olarak hazırlar.
+
+    Args:
+        segments: Geri yüklenen segmentler
+        max_chars: En fazla karakter (kelime ortasından kesilmez)
+
+    Returns:
+        Optional[str]: Prompt (segment yoksa None)
+    """
+    if not segments:
+        return None
+
+    parts = []
+    length = 0
+    for segment in reversed(segments):
+        parts.append(segment["text"])
+        length += len(segment["text"]) + 1
+        if length >= max_chars:
+            break
+
+    text = " ".join(reversed(parts))
+    if len(text) > max_chars:
+        text = text[-max_chars:].split(" ", 1)[-1]
+    return text or None
@@ -0,0 +1,259 @@
+"""
+Donanım Algılama Modülü
+========================
+Bu modül çalışılan makineye göre faster-whisper ayarlarını seçer.
+
+Neden Gerekli?
+--------------
+- process_video() eskiden her zaman device="cuda", compute_type="float16"
+  kullanıyordu; sadece CPU olan sunucularda bu ya hata veriyor ya da
+  CTranslate2 yavaş bir moda düşüyordu
+- Doğru ayar donanıma bağlıdır:
+  * GPU (CUDA) varsa: float16
+  * CPU'da: int8 (AVX2 / AVX-512 / VNNI komutlarıyla 2-4x hızlı)
+  * cpu_threads: Fiziksel çekirdek sayısı (hyper-threading çekirdekleri
+    matris çarpımında hız kazandırmaz)
+
+Öncelik Sırası (her ayar için ayrı ayrı):
+    1. Açık parametre (CLI: --device, --compute-type, --cpu-threads)
+    2. Environment / .env (WHISPER_DEVICE, WHISPER_COMPUTE_TYPE, ...)
+       "auto" veya 0 ise atlanır
+    3. Donanım algılama
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Set
+import os
+import platform
+from loguru import logger
+import config.settings as settings
+
+
+# Compute type tercih sırası (en hızlıdan yavaşa), desteklenen ilk tip seçilir
+# CUDA: float16 çoğu GPU'da int8_float16 kadar hızlı ve daha doğru
+# CPU: int8 ağırlıklar + float32 aktivasyon (VNNI varsa int8 çarpım donanımda)
+COMPUTE_TYPE_PREFERENCES = {
+    "cuda": ["float16", "int8_float16", "int8_float32", "float32"],
+    "cpu": ["int8", "int8_float32", "float32"],
+}
+
+# Raporlanan CPU komut seti özellikleri (/proc/cpuinfo "flags" satırından)
+CPU_ISA_FLAGS = ["sse4_2", "avx", "avx2", "fma", "f16c", "avx512f", "avx512bw", "avx512_vnni", "avx_vnni", "avx512_bf16", "amx_int8"]
+
+
+@lru_cache(maxsize=1)
+def detect_hardware() -> Dict:
+    """
+    Makinenin donanım özelliklerini algılar (sonuç süreç boyunca önbelleklenir).
+
+    Returns:
+        Dict: {
+            "cuda_devices": 0,
+            "cpu_model": "Intel(R) Xeon(R) ...",
+            "cpu_isa": ["avx", "avx2", "avx512f", "avx512_vnni", ...],
+            "logical_cores": 16,
+            "physical_cores": 8,
+            "machine": "x86_64"
+        }
+    """
+    cpu_info = _read_cpu_info()
+    logical_cores = _available_cores()
+    physical_cores = min(cpu_info["physical_cores"] or logical_cores, logical_cores)
+
+    hardware = {
+        "cuda_devices": _cuda_device_count(),
+        "cpu_model": cpu_info["model"],
+        "cpu_isa": [flag for flag in CPU_ISA_FLAGS if flag in cpu_info["flags"]],
+        "logical_cores": logical_cores,
+        "physical_cores": physical_cores,
+        "machine": platform.machine()
+    }
+
+    logger.debug(f"Donanım algılandı: {hardware}")
+    return hardware
+
+
+def get_supported_compute_types(device: str) -> Set[str]:
+    """
+    CTranslate2'nin bu cihazda desteklediği compute type'ları döndürür.
+
+    Args:
+        device: "cpu" veya "cuda"
+
+    Returns:
+        Set[str]: Desteklenen tipler (ör. {"int8", "int8_float32", "float32"})
+            Sorgulanamazsa boş küme
+    """
+    try:
+        import ctranslate2
+        return set(ctranslate2.get_supported_compute_types(device))
+    except Exception as e:
+        logger.debug(f"Desteklenen compute type'lar sorgulanamadı ({device}): {e}")
+        return set()
+
+
+def select_runtime_config(
+    device: str = None,
+    compute_type: str = None,
+    cpu_threads: int = None,
+    num_workers: int = None
+) -> Dict:
+    """
+    faster-whisper çalışma ayarlarını seçer.
+
+    Args:
+        device: "cpu", "cuda" veya "auto" (verilmezse WHISPER_DEVICE)
+        compute_type: "int8", "float16", ... veya "auto" (verilmezse WHISPER_COMPUTE_TYPE)
+        cpu_threads: CTranslate2 thread sayısı, 0 = otomatik (verilmezse WHISPER_CPU_THREADS)
+        num_workers: Aynı modelle eşzamanlı transcription sayısı, 0 = otomatik
+            (verilmezse WHISPER_NUM_WORKERS)
+
+    Returns:
+        Dict: {
+            "device": "cpu", "compute_type": "int8",
+            "cpu_threads": 8, "num_workers": 1,
+            "cpu_isa": [...], "cuda_devices": 0,
+            "sources": {"device": "detected", "compute_type": "cli", ...}
+        }
+    """
+    hardware = detect_hardware()
+    sources = {}
+
+    # Device
+    device, sources["device"] = _resolve(device, settings.WHISPER_DEVICE, "auto")
+    if device is None:
+        device = "cuda" if hardware["cuda_devices"] > 0 else "cpu"
+    elif device == "cuda" and hardware["cuda_devices"] == 0:
+        logger.warning("CUDA istendi ama GPU bulunamadı, CPU kullanılacak")
+        device = "cpu"
+        sources["device"] = "fallback"
+
+    # Compute type
+    compute_type, sources["compute_type"] = _resolve(compute_type, settings.WHISPER_COMPUTE_TYPE, "auto")
+    supported = get_supported_compute_types(device)
+    if compute_type is None:
+        compute_type = _pick_compute_type(device, supported)
+    elif supported and compute_type not in supported:
+        fallback = _pick_compute_type(device, supported)
+        logger.warning(f"{compute_type} bu cihazda ({device}) desteklenmiyor, {fallback} kullanılacak")
+        compute_type = fallback
+        sources["compute_type"] = "fallback"
+
+    # CPU thread sayısı
+    cpu_threads, sources["cpu_threads"] = _resolve(cpu_threads, settings.WHISPER_CPU_THREADS, 0)
+    if cpu_threads is None:
+        # GPU'da CPU sadece ön/son işlem yapar; CPU'da tüm fiziksel çekirdekler
+        cpu_threads = min(4, hardware["physical_cores"]) if device == "cuda" else hardware["physical_cores"]
+
+    # Eşzamanlı transcription sayısı (CLI ve toplu işleme tek akışta çözer)
+    num_workers, sources["num_workers"] = _resolve(num_workers, settings.WHISPER_NUM_WORKERS, 0)
+    if num_workers is None:
+        num_workers = 1
+
+    config = {
+        "device": device,
+        "compute_type": compute_type,
+        "cpu_threads": cpu_threads,
+        "num_workers": num_workers,
+        "cpu_isa": hardware["cpu_isa"],
+        "cuda_devices": hardware["cuda_devices"],
+        "sources": sources
+    }
+
+    logger.info(
+        f"Çalışma ayarları: {device}, {compute_type}, {cpu_threads} thread, "
+        f"{num_workers} worker (ISA: {', '.join(hardware['cpu_isa']) or '-'})"
+    )
+    return config
+
+
+def _resolve(explicit, configured, auto_value):
+    """
+    Tek bir ayarı öncelik sırasına göre çözer.
+
+    Returns:
+        Tuple: (değer veya None, kaynak) - None ise donanım algılama kullanılır
+    """
+    if explicit is not None and explicit != auto_value:
+        return explicit, "cli"
+    if configured is not None and configured != auto_value:
+        return configured, "env"
+    return None, "detected"
+
+
+def _pick_compute_type(device: str, supported: Set[str]) -> str:
+    """Tercih sırasındaki desteklenen ilk compute type'ı seçer."""
+    preferences: List[str] = COMPUTE_TYPE_PREFERENCES.get(device, COMPUTE_TYPE_PREFERENCES["cpu"])
+
+    if not supported:
+        # Sorgulanamadıysa güvenli varsayılan
+        return preferences[0]
+
+    for compute_type in preferences:
+        if compute_type in supported:
+            return compute_type
+
+    return "default"
+
+
+def _cuda_device_count() -> int:
+    """CUDA GPU sayısı (CTranslate2 üzerinden), GPU yoksa 0."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count()
+    except Exception as e:
+        logger.debug(f"CUDA sorgulanamadı: {e}")
+        return 0
+
+
+def _available_cores() -> int:
+    """Sürecin kullanabileceği mantıksal çekirdek sayısı (container/affinity sınırları dahil)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def _read_cpu_info() -> Dict:
+    """
+    /proc/cpuinfo'dan CPU modeli, komut seti bayrakları ve fiziksel çekirdek
+    sayısını okur. Linux dışı sistemlerde boş değerler döner.
+    """
+    info = {"model": platform.processor() or platform.machine(), "flags": set(), "physical_cores": 0}
+
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+    except OSError:
+        return info
+
+    cores = set()
+    model_name = None
+    physical_id = core_id = None
+
+    for line in content.splitlines():
+        key, _, value = line.partition(":")
+        key = key.strip()
+        value = value.strip()
+
+        if key == "model name" and model_name is None:
+            model_name = value
+        elif key == "flags" and not info["flags"]:
+            info["flags"] = set(value.split())
+        elif key == "physical id":
+            physical_id = value
+        elif key == "core id":
+            core_id = value
+        elif not line.strip():
+            # İşlemci bloğu sonu
+            if core_id is not None:
+                cores.add((physical_id, core_id))
+            physical_id = core_id = None
+
+    if core_id is not None:
+        cores.add((physical_id, core_id))
+
+    if model_name:
+        info["model"] = model_name
+    info["physical_cores"] = len(cores)
+    return info
@@ -0,0 +1,230 @@
+"""
+İş Kuyruğu İstemcisi Modülü
+===========================
+Bu modül job_server'ın HTTP API'sini Python'dan kullanır (Web UI ve
+betikler için). Sadece standart kütüphane (urllib) kullanır.
+
+Örnek:
+    >>> client = JobClient("http://127.0.0.1:8765")
+    >>> job_id = client.submit("mulakat.mp4", options={"language": "tr"})
+    >>> job = client.wait(job_id, on_update=lambda job: print(job["progress"]))
+    >>> result = client.fetch_result(job_id, "outputs/")
+    >>> result["json_path"]
+    PosixPath('outputs/mulakat_output.json')
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Union
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+import json
+import os
+import time
+import urllib.request
+import config.settings as settings
+from app.job_queue import FINISHED_STATUSES
+from app.job_server import DOWNLOAD_TYPES
+from app.output_formatter import OutputFormatter
+
+
+class JobServerError(Exception):
+    """Sunucu hata döndürdü veya erişilemedi."""
+    pass
+
+
+class JobClient:
+    """
+    İş kuyruğu sunucusunun istemcisi.
+
+    Tüm metodlar hata durumunda JobServerError fırlatır (mesaj sunucudan gelir).
+    """
+
+    def __init__(self, base_url: str = None, timeout: float = 30.0):
+        """
+        JobClient başlatıcı.
+
+        Args:
+            base_url: Sunucu adresi (verilmezse settings.JOB_SERVER_URL,
+                o da boşsa http://JOB_SERVER_HOST:JOB_SERVER_PORT)
+            timeout: İstek zaman aşımı (saniye, yükleme hariç)
+        """
+        base_url = base_url or settings.JOB_SERVER_URL or f"http://{settings.JOB_SERVER_HOST}:{settings.JOB_SERVER_PORT}"
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, data=None, headers: Dict = None, timeout: float = None):
+        """İstek gönderir, yanıt gövdesini (bytes) döndürür."""
+        request = urllib.request.Request(
+            self.base_url + path, data=data, headers=headers or {}, method=method
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self.timeout) as response:
+                return response.read()
+        except HTTPError as e:
+            try:
+                message = json.loads(e.read())["error"]
+            except (ValueError, KeyError):
+                message = e.reason
+            raise JobServerError(f"{e.code}: {message}") from e
+        except URLError as e:
+            raise JobServerError(f"Sunucuya bağlanılamadı ({self.base_url}): {e.reason}") from e
+
+    def _get_json(self, path: str) -> Dict:
+        return json.loads(self._request("GET", path))
+
+    def health(self) -> Dict:
+        """Sunucu durumu ({"status": "ok", "workers": {...}, "jobs": {...}})."""
+        return self._get_json("/health")
+
+    def submit(
+        self,
+        source: Union[str, Path, BinaryIO],
+        filename: str = None,
+        options: Dict = None
+    ) -> str:
+        """
+        Videoyu yükler ve işi kuyruğa ekler.
+
+        Args:
+            source: Video dosyası yolu veya okunabilir ikili akış
+                (ör. Streamlit UploadedFile); video belleğe alınmadan gönderilir
+            filename: Dosya adı (akış verildiyse gerekli)
+            options: İş seçenekleri: model_size, language, qa_method,
+                export_text, questions (soru metni, satır başına bir soru)
+
+        Returns:
+            str: İş kimliği
+        """
+        stream = None
+        if isinstance(source, (str, Path)):
+            filename = filename or Path(source).name
+            stream = open(source, "rb")
+            source = stream
+
+        try:
+            # Kalan boyut (akış başta olmayabilir)
+            position = source.tell()
+            size = source.seek(0, os.SEEK_END) - position
+            source.seek(position)
+
+            headers = {
+                "Content-Type": "application/octet-stream",
+                "Content-Length": str(size),
+                # Header'lar ASCII olmalı: Türkçe karakterler \\u kaçışıyla gider
+                "X-Job-Options": json.dumps(options or {}, ensure_ascii=True),
+            }
+            # Yükleme süresi dosya boyutuna bağlı: zaman aşımı yok
+            body = self._request(
+                "POST", f"/jobs?{urlencode({'filename': filename})}",
+                data=source, headers=headers, timeout=None
+            )
+        finally:
+            if stream is not None:
+                stream.close()
+
+        return json.loads(body)["id"]
+
+    def submit_server_path(self, path: Union[str, Path], options: Dict = None) -> str:
+        """
+        Sunucudaki dosyayı yüklemeden kuyruğa ekler (kopya oluşmaz).
+
+        Sunucuda settings.SERVER_PATH_ROOT ayarlı olmalı ve dosya o klasörün
+        altında olmalı; dosya iş bitince silinmez.
+
+        Args:
+            path: Sunucu tarafındaki dosya yolu (mutlak veya köke göre göreli)
+            options: submit() ile aynı
+
+        Returns:
+            str: İş kimliği
+        """
+        headers = {"X-Job-Options": json.dumps(options or {}, ensure_ascii=True)}
+        body = self._request("POST", f"/jobs?{urlencode({'path': str(path)})}", data=b"", headers=headers)
+        return json.loads(body)["id"]
+
+    def get(self, job_id: str) -> Dict:
+        """İşin durumu (status, stage, progress, processed_seconds, result, ...)."""
+        return self._get_json(f"/jobs/{job_id}")
+
+    def list_jobs(self, limit: int = 50, status: str = None) -> List[Dict]:
+        """Son işler (en yeni önce)."""
+        query = {"limit": limit, **({"status": status} if status else {})}
+        return self._get_json(f"/jobs?{urlencode(query)}")["jobs"]
+
+    def partial(self, job_id: str, since: int = 0) -> Dict:
+        """
+        Decode edilen segmentler (artımlı).
+
+        Returns:
+            Dict: {"segments": [...], "next": <sonraki since>, "reset": bool, "done": bool}
+        """
+        return self._get_json(f"/jobs/{job_id}/partial?since={since}")
+
+    def cancel(self, job_id: str) -> str:
+        """İşi iptal eder; işin yeni durumunu döndürür ("cancelled" veya "running")."""
+        return json.loads(self._request("POST", f"/jobs/{job_id}/cancel", data=b""))["status"]
+
+    def download(self, job_id: str, kind: str = "json") -> bytes:
+        """Çıktı dosyasının içeriği (kind: json, text, qa_json, qa_md)."""
+        return self._request("GET", f"/jobs/{job_id}/download/{quote(kind)}")
+
+    def wait(
+        self,
+        job_id: str,
+        poll_interval: float = 1.0,
+        on_update: Callable[[Dict], None] = None
+    ) -> Dict:
+        """
+        İş bitene kadar bekler.
+
+        Args:
+            job_id: İş kimliği
+            poll_interval: Sorgulama aralığı (saniye)
+            on_update: Her sorguda işin durumuyla çağrılır (opsiyonel)
+
+        Returns:
+            Dict: İşin son durumu (status: done, failed veya cancelled)
+        """
+        while True:
+            job = self.get(job_id)
+            if on_update is not None:
+                on_update(job)
+            if job["status"] in FINISHED_STATUSES:
+                return job
+            time.sleep(poll_interval)
+
+    def fetch_result(self, job_id: str, output_dir: Union[str, Path]) -> Dict:
+        """
+        Tamamlanan işin çıktılarını indirir.
+
+        Args:
+            job_id: İş kimliği (status "done" olmalı)
+            output_dir: Dosyaların yazılacağı klasör
+
+        Returns:
+            Dict: process_video() sonucuyla aynı anahtarlar
+                (json_path, text_path, qa_json_path, qa_md_path, num_speakers,
+                 num_segments, elapsed_time, result, ...); yollar yereldir
+        """
+        job = self.get(job_id)
+        if job["status"] != "done":
+            raise JobServerError(f"İş tamamlanmadı (durum: {job['status']}): {job.get('error') or ''}")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        summary = dict(job["result"])
+
+        for kind, (key, _) in DOWNLOAD_TYPES.items():
+            if not summary.get(key):
+                continue
+            local_path = output_dir / Path(summary[key]).name
+            local_path.write_bytes(self.download(job_id, kind))
+            summary[key] = local_path
+
+        return {
+            **summary,
+            "success": True,
+            "job_id": job_id,
+            "result": OutputFormatter.load_from_json(summary["json_path"])
+        }
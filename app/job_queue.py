@@ -0,0 +1,319 @@
+"""
+İş Kuyruğu Modülü
+=================
+Bu modül transcription işlerini kalıcı (SQLite) bir kuyrukta tutar.
+
+Neden Gerekli?
+--------------
+- Streamlit içinde senkron process_video() çağrısı oturumu iş bitene kadar
+  kilitler; aynı anda çalışan her kullanıcı kendi modelini yükler
+- Kuyruk sayesinde işler job_server'ın worker süreçlerine dağıtılır
+  (model her worker'da bir kez yüklenir ve sıcak kalır)
+- Kuyruk diskte durur: sunucu yeniden başlatılınca bekleyen işler kaybolmaz,
+  yarıda kalan işler tekrar kuyruğa alınır (checkpoint'ten devam eder)
+
+İş Durumları:
+    queued -> running -> done
+                      -> failed
+                      -> cancelled   (kuyruktayken veya çalışırken iptal)
+
+Depolama: outputs/jobs/jobs.db (settings.JOB_DIR)
+Her iş birden çok süreçten (HTTP sunucusu + worker'lar) okunur/yazılır;
+her işlem kendi bağlantısını açar, WAL modu okuyucuları yazıcıdan ayırır.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from datetime import datetime
+import contextlib
+import json
+import sqlite3
+import uuid
+import config.settings as settings
+
+
+# İş durumları
+JOB_STATUSES = ("queued", "running", "done", "failed", "cancelled")
+
+# Bitmiş (tekrar değişmeyecek) durumlar
+FINISHED_STATUSES = ("done", "failed", "cancelled")
+
+# Yarıda kalan (worker çöktü / sunucu kapandı) bir işin en fazla deneme sayısı
+# Aynı videoda sürekli çöken bir iş kuyruğu sonsuza kadar meşgul etmesin
+MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    video_name TEXT,
+    video_path TEXT,
+    options TEXT,
+    created_at TEXT,
+    started_at TEXT,
+    finished_at TEXT,
+    worker TEXT,
+    attempts INTEGER DEFAULT 0,
+    stage TEXT,
+    processed_seconds REAL DEFAULT 0,
+    audio_duration REAL,
+    num_segments INTEGER DEFAULT 0,
+    cancel_requested INTEGER DEFAULT 0,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs(status, created_at);
+"""
+
+
+class JobQueue:
+    """
+    SQLite tabanlı, süreçler arası paylaşılan iş kuyruğu.
+
+    Örnek:
+        >>> queue = JobQueue()
+        >>> job_id = queue.submit("mulakat.mp4", "outputs/jobs/ab12/mulakat.mp4", {"language": "tr"})
+        >>> job = queue.claim("worker-1")        # Worker tarafı
+        >>> queue.update_progress(job["id"], stage="transcribe", processed_seconds=125.3)
+        >>> queue.complete(job["id"], {"json_path": "..."})
+    """
+
+    def __init__(self, db_path: Union[str, Path] = None):
+        """
+        JobQueue başlatıcı.
+
+        Args:
+            db_path: SQLite dosyası (verilmezse settings.JOB_DIR / "jobs.db")
+        """
+        self.db_path = Path(db_path) if db_path else Path(settings.JOB_DIR) / "jobs.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """İşlem başına bağlantı (başarılıysa commit, hata olursa rollback)."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def new_job_id() -> str:
+        """Yeni iş kimliği (URL'de kullanılabilir, tahmin edilemez)."""
+        return uuid.uuid4().hex
+
+    def submit(self, video_name: str, video_path: Union[str, Path], options: Dict = None, job_id: str = None) -> str:
+        """
+        Yeni işi kuyruğa ekler.
+
+        Args:
+            video_name: Orijinal dosya adı (çıktı adları bundan türetilir)
+            video_path: Sunucudaki video dosyası
+            options: process_video() seçenekleri (model_size, language, ...)
+            job_id: İş kimliği (dosya önceden iş klasörüne yüklendiyse)
+
+        Returns:
+            str: İş kimliği
+        """
+        job_id = job_id or self.new_job_id()
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, video_name, video_path, options, created_at) "
+                "VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, video_name, str(video_path), json.dumps(options or {}, ensure_ascii=False),
+                 datetime.now().isoformat())
+            )
+
+        return job_id
+
+    def claim(self, worker: str) -> Optional[Dict]:
+        """
+        Sıradaki işi atomik olarak alır (aynı işi iki worker alamaz).
+
+        Args:
+            worker: Worker adı (durum ekranında gösterilir)
+
+        Returns:
+            Optional[Dict]: İş (kuyruk boşsa None)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, started_at = ?, "
+                "attempts = attempts + 1, stage = 'queued' "
+                "WHERE id = (SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1) "
+                "AND status = 'queued' RETURNING *",
+                (worker, datetime.now().isoformat())
+            ).fetchone()
+
+        return self._row_to_job(row) if row is not None else None
+
+    def update_progress(self, job_id: str, **fields) -> bool:
+        """
+        Çalışan işin ilerlemesini günceller.
+
+        Args:
+            job_id: İş kimliği
+            **fields: stage, processed_seconds, audio_duration, num_segments
+
+        Returns:
+            bool: İptal istendi mi? (worker işi durdurmalı)
+        """
+        allowed = {key: value for key, value in fields.items()
+                   if key in ("stage", "processed_seconds", "audio_duration", "num_segments")}
+
+        with self._connect() as conn:
+            if allowed:
+                assignments = ", ".join(f"{key} = ?" for key in allowed)
+                conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*allowed.values(), job_id))
+
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+        return bool(row and row["cancel_requested"])
+
+    def complete(self, job_id: str, result: Dict):
+        """İşi başarılı olarak bitirir (result: çıktı dosyaları ve özet)."""
+        self._finish(job_id, "done", result=json.dumps(result, ensure_ascii=False))
+
+    def fail(self, job_id: str, error: str):
+        """İşi hatalı olarak bitirir."""
+        self._finish(job_id, "failed", error=error)
+
+    def mark_cancelled(self, job_id: str):
+        """Çalışırken iptal edilen işi bitirir."""
+        self._finish(job_id, "cancelled", error="İptal edildi")
+
+    def _finish(self, job_id: str, status: str, result: str = None, error: str = None):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, stage = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, status, result, error, datetime.now().isoformat(), job_id)
+            )
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        İşi iptal eder.
+
+        Kuyruktaki iş hemen iptal edilir; çalışan iş için iptal isteği
+        bırakılır, worker bir sonraki ilerleme güncellemesinde durur.
+
+        Returns:
+            Optional[str]: İşin yeni durumu (iş yoksa None)
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'cancelled', stage = 'cancelled', finished_at = ?, error = 'İptal edildi' "
+                "WHERE id = ? AND status = 'queued'",
+                (datetime.now().isoformat(), job_id)
+            )
+            conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+        return row["status"] if row is not None else None
+
+    def requeue_running(self, worker: str = None, max_attempts: int = MAX_ATTEMPTS) -> int:
+        """
+        Yarıda kalmış (running) işleri tekrar kuyruğa alır.
+
+        Sunucu başlarken (tüm worker'lar) veya bir worker süreci beklenmedik
+        şekilde sonlandığında (sadece o worker) çağrılır. Bu işler
+        checkpoint'ten devam eder (worker'lar tekrar denemede resume=True
+        kullanır); max_attempts denemeye ulaşan iş hatalı olarak bitirilir.
+
+        Args:
+            worker: Sadece bu worker'ın işleri (None = hepsi)
+            max_attempts: En fazla deneme sayısı
+
+        Returns:
+            int: Tekrar kuyruğa alınan iş sayısı
+        """
+        condition = "status = 'running'"
+        params = []
+        if worker is not None:
+            condition += " AND worker = ?"
+            params.append(worker)
+
+        with self._connect() as conn:
+            # İptal isteği bırakılmış iş tekrar denenmez
+            conn.execute(
+                f"UPDATE jobs SET status = 'cancelled', stage = 'cancelled', finished_at = ?, "
+                f"error = 'İptal edildi' WHERE {condition} AND cancel_requested = 1",
+                (datetime.now().isoformat(), *params)
+            )
+            conn.execute(
+                f"UPDATE jobs SET status = 'failed', stage = 'failed', finished_at = ?, "
+                f"error = 'İş {max_attempts} denemede tamamlanamadı (worker sonlandı)' "
+                f"WHERE {condition} AND attempts >= ?",
+                (datetime.now().isoformat(), *params, max_attempts)
+            )
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = 'queued', worker = NULL, stage = 'queued' WHERE {condition}",
+                params
+            )
+            return cursor.rowcount
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """İşin güncel durumu (yoksa None)."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+        return self._row_to_job(row) if row is not None else None
+
+    def list_jobs(self, limit: int = 50, status: str = None) -> List[Dict]:
+        """Son işler (en yeni önce)."""
+        sql = "SELECT * FROM jobs"
+        params = []
+        if status:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [self._row_to_job(row) for row in rows]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Durum başına iş sayısı ({"queued": 3, "running": 1, ...})."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row["status"]: row["count"] for row in rows})
+        return counts
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """Kuyruktaki işin sırası (1 = sıradaki, kuyrukta değilse None)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS position FROM jobs WHERE status = 'queued' "
+                "AND created_at <= (SELECT created_at FROM jobs WHERE id = ? AND status = 'queued')",
+                (job_id,)
+            ).fetchone()
+
+        return row["position"] or None
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict:
+        """Veritabanı satırını API'nin döndürdüğü dict'e çevirir."""
+        job = dict(row)
+        job["options"] = json.loads(job["options"] or "{}")
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["cancel_requested"] = bool(job["cancel_requested"])
+
+        duration = job["audio_duration"]
+        if job["status"] == "done":
+            job["progress"] = 1.0
+        elif duration:
+            job["progress"] = round(min(job["processed_seconds"] / duration, 1.0), 4)
+        else:
+            job["progress"] = 0.0
+
+        return job
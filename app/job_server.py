@@ -0,0 +1,585 @@
+"""
+İş Kuyruğu Sunucusu Modülü
+==========================
+Bu modül yerel bir HTTP servisi ve worker süreç havuzu çalıştırır:
+videolar HTTP ile gönderilir, kalıcı kuyruğa (app.job_queue) eklenir ve
+modeli sıcak tutan worker süreçleri tarafından işlenir.
+
+Neden Gerekli?
+--------------
+- Streamlit içinde process_video() oturumu iş bitene kadar kilitler;
+  uzun bir kayıtta sayfa yenilenirse iş ve ilerleme kaybolur
+- Her worker modeli bir kez yükler (ModelRegistry) ve işler arasında tutar
+- Tamamen çevrimdışı çalışır: standart kütüphane HTTP sunucusu + SQLite,
+  harici servis (Redis, Celery, ...) gerekmez
+
+Çalıştırma:
+    python v_to_t.py serve                 # settings.JOB_SERVER_HOST:PORT
+    python v_to_t.py serve --workers 2 --port 9000
+
+Endpoint'ler (JSON):
+    GET  /health                           Sunucu ve worker durumu
+    GET  /metrics                          Prometheus metin formatı (aşama süreleri,
+                                           RTF, bellek, kuyruk durumu; app.metrics)
+    POST /jobs?filename=video.mp4          Gövde: video baytları
+         X-Job-Options: {"language": "tr", "questions": "...", ...}
+    POST /jobs?path=/srv/videolar/a.mp4    Sunucudaki dosya (gövde yok, kopyalanmaz;
+                                           sadece settings.SERVER_PATH_ROOT altı)
+    GET  /jobs                             Son işler
+    GET  /jobs/<id>                        Durum, aşama, ilerleme (0-1)
+    GET  /jobs/<id>/partial?since=<byte>   Decode edilen segmentler (artımlı)
+    GET  /jobs/<id>/download/<tür>         Çıktı dosyası (json, text, qa_json, qa_md)
+    POST /jobs/<id>/cancel                 İptal
+
+İş Klasörü (settings.JOB_DIR/<id>/):
+    <video>              Yüklenen video (iş bitince silinir; sunucu yolu verildiyse yok)
+    questions.txt        Sorular (opsiyonel)
+    partial.jsonl        Segmentler decode edildikçe (JSONLinesWriter)
+    <video>_output.json  Çıktılar (+ .txt, _qa.json, _qa.md)
+
+Worker süreci ölürse (ör. bellek yetmedi) işi tekrar kuyruğa alınır ve yeni
+worker checkpoint'ten devam eder; sunucu yeniden başlatıldığında da aynısı olur.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+import json
+import multiprocessing
+import re
+import shutil
+import threading
+import time
+from loguru import logger
+import config.settings as settings
+from app.job_queue import FINISHED_STATUSES, JobQueue
+from app.metrics import get_metrics_store
+from app.progress import ProcessingCancelled
+from app.uploads import UploadError, resolve_server_path, save_upload
+
+
+# Kuyruk boşken worker'ların yeni iş için bekleme aralığı (saniye)
+POLL_INTERVAL_SECONDS = 0.5
+
+# İlerleme veritabanına en fazla bu aralıkla yazılır (saniye)
+# İptal isteği de bu aralıkla kontrol edilir
+PROGRESS_INTERVAL_SECONDS = 1.0
+
+# İndirme blok boyutu (yükleme: app.uploads.UPLOAD_CHUNK_SIZE)
+COPY_BLOCK_SIZE = 1024 * 1024
+
+# Gönderimde kabul edilen seçenekler (process_video() parametreleri + sorular)
+JOB_OPTIONS = ("model_size", "language", "qa_method", "export_text", "questions", "profile")
+
+# İndirilebilir çıktılar: URL'deki tür -> (sonuç anahtarı, MIME tipi)
+DOWNLOAD_TYPES = {
+    "json": ("json_path", "application/json"),
+    "text": ("text_path", "text/plain"),
+    "qa_json": ("qa_json_path", "application/json"),
+    "qa_md": ("qa_md_path", "text/markdown"),
+}
+
+_JOB_PATH = re.compile(r"^/jobs/([0-9a-f]{32})(?:/(partial|cancel|download/(\w+)))?$")
+
+
+# ----------------------------------------------------------------------------
+# Worker süreci
+# ----------------------------------------------------------------------------
+
+def worker_cpu_threads(num_workers: int) -> Optional[int]:
+    """
+    Worker başına CTranslate2 thread sayısı.
+
+    WHISPER_CPU_THREADS ayarlıysa o kullanılır; değilse fiziksel çekirdekler
+    worker'lara bölünür (her worker tüm çekirdekleri kullanırsa birbirini yavaşlatır).
+
+    Returns:
+        Optional[int]: Thread sayısı (None = select_runtime_config() karar verir)
+    """
+    if settings.WHISPER_CPU_THREADS or num_workers <= 1:
+        return None
+
+    from app.hardware import detect_hardware
+    return max(1, detect_hardware()["physical_cores"] // num_workers)
+
+
+def run_job(queue: JobQueue, job: Dict, cpu_threads: int = None) -> Dict:
+    """
+    Tek bir işi process_video() ile çalıştırır ve sonucu kuyruğa yazar.
+
+    Args:
+        queue: İş kuyruğu
+        job: claim() sonucu
+        cpu_threads: Worker'ın thread sayısı (worker_cpu_threads())
+
+    Returns:
+        Dict: Kuyruğa yazılan sonuç (hata / iptal durumunda boş dict)
+    """
+    # Pipeline (model, ffmpeg) sadece worker süreçlerinde yüklenir
+    from v_to_t import process_video
+
+    job_id = job["id"]
+    job_dir = Path(settings.JOB_DIR) / job_id
+    video_path = Path(job["video_path"])
+    options = job["options"]
+    questions_path = job_dir / "questions.txt"
+    last_update = 0.0
+
+    def on_progress(event: Dict):
+        nonlocal last_update
+        now = time.monotonic()
+
+        # Aşama değişimleri hemen, segment ilerlemesi seyreltilerek yazılır
+        if event.get("segment") is not None and now - last_update < PROGRESS_INTERVAL_SECONDS:
+            return
+        last_update = now
+
+        fields = {key: value for key, value in event.items() if key != "segment"}
+        if queue.update_progress(job_id, **fields):
+            raise ProcessingCancelled(job_id)
+
+    logger.info(f"İş başladı: {job_id} ({job['video_name']}, deneme {job['attempts']})")
+
+    try:
+        result = process_video(
+            video_path=video_path,
+            model_size=options.get("model_size") or settings.WHISPER_MODEL_SIZE,
+            language=options.get("language") or settings.WHISPER_LANGUAGE,
+            output_path=job_dir / f"{Path(job['video_name']).stem}_output.json",
+            export_text=options.get("export_text", True),
+            questions_path=questions_path if questions_path.exists() else None,
+            qa_method=options.get("qa_method"),
+            jsonl_output=job_dir / "partial.jsonl",
+            cpu_threads=cpu_threads,
+            # Tekrar deneme: önceki denemenin checkpoint'inden devam
+            resume=job["attempts"] > 1,
+            # Yükleme sırasında hesaplanan hash (önbellek kaynak anahtarı)
+            content_hash=options.get("content_hash"),
+            # Profil dosyaları iş klasöründe, çıktıların yanında kalır
+            profile=bool(options.get("profile")),
+            progress_callback=on_progress
+        )
+    except ProcessingCancelled:
+        logger.info(f"İş iptal edildi: {job_id}")
+        queue.mark_cancelled(job_id)
+        _remove_input(video_path, job_dir)
+        return {}
+    except Exception as e:
+        logger.error(f"İş başarısız: {job_id} - {e}")
+        queue.fail(job_id, str(e))
+        _remove_input(video_path, job_dir)
+        return {}
+
+    summary = {
+        "json_path": str(result["json_path"]),
+        "text_path": str(result["text_path"]) if result.get("text_path") else None,
+        "qa_json_path": str(result["qa_json_path"]) if result.get("qa_json_path") else None,
+        "qa_md_path": str(result["qa_md_path"]) if result.get("qa_md_path") else None,
+        "num_speakers": result["num_speakers"],
+        "num_segments": result["num_segments"],
+        "audio_duration": result["audio_duration"],
+        "elapsed_time": result["elapsed_time"],
+        "cache_hit": result["cache_hit"],
+        "stage_timings": result["stage_timings"],
+        "profile_paths": [str(path) for path in result.get("profile_paths") or []],
+    }
+    queue.complete(job_id, summary)
+    _remove_input(video_path, job_dir)
+
+    logger.success(f"İş tamamlandı: {job_id} ({result['elapsed_time']:.1f}s)")
+    return summary
+
+
+def _remove_input(video_path: Path, job_dir: Path):
+    """Yüklenen videoyu siler (çıktılar iş klasöründe kalır)."""
+    # Sunucu yoluyla gönderilen dosya kullanıcınındır, silinmez
+    if settings.TEMP_FILE_CLEANUP and video_path.parent == job_dir:
+        video_path.unlink(missing_ok=True)
+
+
+def worker_main(name: str, model_size: str, num_workers: int, stop_event):
+    """
+    Worker süreci: modeli yükler, kuyruktan iş alıp çalıştırır.
+
+    spawn ile başlatılır (ana süreçteki HTTP thread'leri kopyalanmaz).
+
+    Args:
+        name: Worker adı ("worker-1")
+        model_size: Önceden yüklenecek model (işler farklı model isterse
+            o model de ilk kullanımda yüklenip registry'de tutulur)
+        num_workers: Toplam worker sayısı (thread bölüşümü için)
+        stop_event: Ana süreç kapanırken set edilir
+    """
+    from v_to_t import setup_logging
+    from app.hardware import select_runtime_config
+    from app.transcriber import Transcriber
+
+    setup_logging(verbose=False)
+    logger.info(f"{name} başlatılıyor (model: {model_size})")
+
+    queue = JobQueue()
+    cpu_threads = worker_cpu_threads(num_workers)
+
+    try:
+        # Model ilk işten önce yüklenir: ilk kullanıcı yükleme süresini beklemez
+        # (registry anahtarı process_video() ile aynı ayarlardan türetilir)
+        try:
+            runtime = select_runtime_config(cpu_threads=cpu_threads)
+            Transcriber(
+                model_size=model_size,
+                device=runtime["device"],
+                compute_type=runtime["compute_type"],
+                cpu_threads=runtime["cpu_threads"],
+                num_workers=runtime["num_workers"]
+            ).load_model()
+        except Exception as e:
+            # Worker yine de çalışır; hata ilk işte tekrar denenir ve işin hatası olarak raporlanır
+            logger.error(f"{name}: Model önceden yüklenemedi: {e}")
+
+        while not stop_event.is_set():
+            job = queue.claim(name)
+            if job is None:
+                stop_event.wait(POLL_INTERVAL_SECONDS)
+                continue
+            run_job(queue, job, cpu_threads=cpu_threads)
+    except KeyboardInterrupt:
+        # Çalışan iş "running" kalır, sunucu tekrar başlayınca kaldığı yerden devam eder
+        pass
+
+    logger.info(f"{name} durdu")
+
+
+# ----------------------------------------------------------------------------
+# HTTP sunucusu
+# ----------------------------------------------------------------------------
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """Kuyruk API'sinin HTTP istek işleyicisi."""
+
+    server_version = "v_to_t-jobs/1.0"
+
+    @property
+    def queue(self) -> JobQueue:
+        return self.server.queue
+
+    def log_message(self, format, *args):
+        logger.debug(f"HTTP {self.address_string()} - {format % args}")
+
+    # --- Yanıt yardımcıları ---
+
+    def _send_json(self, data, status: int = 200):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str):
+        self._send_json({"error": message}, status)
+
+    def _send_metrics(self):
+        # Kümülatif sayaçlar (worker süreçleri yazar) + anlık kuyruk durumu
+        queue_jobs = {
+            "help": "Durum başına iş sayısı",
+            "values": {f'{{status="{status}"}}': count for status, count in self.queue.count_by_status().items()}
+        }
+        body = get_metrics_store().render(extra={"queue_jobs": queue_jobs}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _get_job(self, job_id: str) -> Optional[Dict]:
+        job = self.queue.get(job_id)
+        if job is None:
+            self._send_error(404, f"İş bulunamadı: {job_id}")
+        return job
+
+    # --- GET ---
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == "/health":
+            self._send_json({
+                "status": "ok",
+                "workers": self.server.worker_status(),
+                "jobs": self.queue.count_by_status()
+            })
+            return
+
+        if url.path == "/metrics":
+            self._send_metrics()
+            return
+
+        if url.path == "/jobs":
+            limit = int(query.get("limit", ["50"])[0])
+            status = query.get("status", [None])[0]
+            self._send_json({"jobs": self.queue.list_jobs(limit=limit, status=status)})
+            return
+
+        match = _JOB_PATH.match(url.path)
+        if not match or match.group(2) == "cancel":
+            self._send_error(404, f"Bilinmeyen adres: {url.path}")
+            return
+
+        job = self._get_job(match.group(1))
+        if job is None:
+            return
+
+        if match.group(2) is None:
+            job["queue_position"] = self.queue.queue_position(job["id"]) if job["status"] == "queued" else None
+            self._send_json(job)
+        elif match.group(2) == "partial":
+            self._send_partial(job, int(query.get("since", ["0"])[0]))
+        else:
+            self._send_download(job, match.group(3))
+
+    def _send_partial(self, job: Dict, since: int):
+        """
+        partial.jsonl'ın since baytından sonraki tam satırlarını döndürür.
+
+        Yanıt: {"segments": [...], "next": <sonraki since>, "reset": bool, "done": bool}
+        Yarım yazılmış son satır bir sonraki istekte döner. İş tekrar
+        denendiyse dosya baştan yazılır: "reset" true ise istemci önceki
+        segmentleri atmalıdır (segmentler baştan gönderilir).
+        """
+        partial_path = Path(settings.JOB_DIR) / job["id"] / "partial.jsonl"
+        segments = []
+        next_offset = since
+        reset = False
+
+        if partial_path.exists():
+            if since > partial_path.stat().st_size:
+                since = 0
+                reset = True
+
+            with open(partial_path, "rb") as f:
+                f.seek(since)
+                data = f.read()
+
+            complete = data[:data.rfind(b"\n") + 1]
+            next_offset = since + len(complete)
+            for line in complete.splitlines():
+                record = json.loads(line)
+                if record.get("type") == "segment":
+                    segments.append(record)
+
+        self._send_json({
+            "segments": segments,
+            "next": next_offset,
+            "reset": reset,
+            "done": job["status"] in FINISHED_STATUSES
+        })
+
+    def _send_download(self, job: Dict, kind: str):
+        """Çıktı dosyasını gönderir (Content-Disposition ile)."""
+        if kind not in DOWNLOAD_TYPES:
+            self._send_error(404, f"Bilinmeyen çıktı türü: {kind} ({', '.join(DOWNLOAD_TYPES)})")
+            return
+        if job["status"] != "done":
+            self._send_error(409, f"İş tamamlanmadı (durum: {job['status']})")
+            return
+
+        key, mime = DOWNLOAD_TYPES[kind]
+        path = job["result"].get(key)
+        if not path or not Path(path).exists():
+            self._send_error(404, f"Bu iş için {kind} çıktısı yok")
+            return
+
+        path = Path(path)
+        self.send_response(200)
+        self.send_header("Content-Type", f"{mime}; charset=utf-8")
+        self.send_header("Content-Length", str(path.stat().st_size))
+        self.send_header("Content-Disposition", f'attachment; filename="{path.name}"')
+        self.end_headers()
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile, COPY_BLOCK_SIZE)
+
+    # --- POST ---
+
+    def do_POST(self):
+        url = urlparse(self.path)
+
+        if url.path == "/jobs":
+            self._submit(parse_qs(url.query))
+            return
+
+        match = _JOB_PATH.match(url.path)
+        if not match or match.group(2) != "cancel":
+            self._send_error(404, f"Bilinmeyen adres: {url.path}")
+            return
+
+        status = self.queue.cancel(match.group(1))
+        if status is None:
+            self._send_error(404, f"İş bulunamadı: {match.group(1)}")
+        else:
+            self._send_json({"id": match.group(1), "status": status})
+
+    def _submit(self, query: Dict):
+        """Gövdedeki videoyu iş klasörüne yazar (veya sunucu yolunu doğrular) ve işi kuyruğa ekler."""
+        try:
+            raw_options = json.loads(self.headers.get("X-Job-Options") or "{}")
+        except ValueError:
+            self._send_error(400, "X-Job-Options geçerli JSON değil")
+            return
+        options = {key: raw_options[key] for key in JOB_OPTIONS if raw_options.get(key) is not None}
+        questions = options.pop("questions", None)
+
+        server_path = query.get("path", [""])[0]
+        if server_path:
+            # Sunucudaki dosya yerinde işlenir (yükleme / kopya yok)
+            try:
+                video_path = resolve_server_path(server_path)
+            except PermissionError as e:
+                self._send_error(403, str(e))
+                return
+            except FileNotFoundError as e:
+                self._send_error(404, str(e))
+                return
+            except UploadError as e:
+                self._send_error(400, str(e))
+                return
+            filename = video_path.name
+            size = video_path.stat().st_size
+        else:
+            # Sadece dosya adı (yol bileşenleri atılır)
+            filename = Path(query.get("filename", [""])[0]).name
+            suffix = Path(filename).suffix.lower()
+            if suffix not in settings.SUPPORTED_VIDEO_FORMATS + settings.SUPPORTED_AUDIO_FORMATS:
+                self._send_error(400, f"Desteklenmeyen dosya: {filename or '(dosya adı yok)'}")
+                return
+
+            size = int(self.headers.get("Content-Length") or 0)
+            if size <= 0:
+                self._send_error(411, "Content-Length gerekli")
+                return
+            if size > settings.MAX_FILE_SIZE_MB * 1024 * 1024:
+                self._send_error(413, f"Dosya çok büyük (en fazla {settings.MAX_FILE_SIZE_MB} MB)")
+                return
+
+        job_id = JobQueue.new_job_id()
+        job_dir = Path(settings.JOB_DIR) / job_id
+        job_dir.mkdir(parents=True)
+
+        if not server_path:
+            # Gövde bloklar halinde diske yazılır (video belleğe alınmaz),
+            # hash yazarken hesaplanır: aynı video tekrar gönderilirse önbellek
+            # ses çıkarmadan sonucu bulur
+            try:
+                upload = save_upload(self.rfile, job_dir / filename, length=size)
+            except UploadError as e:
+                shutil.rmtree(job_dir, ignore_errors=True)
+                self._send_error(400, str(e))
+                return
+            video_path = upload["path"]
+            options["content_hash"] = upload["sha256"]
+
+        if questions and questions.strip():
+            (job_dir / "questions.txt").write_text(questions.strip(), encoding="utf-8")
+
+        self.queue.submit(filename, video_path, options, job_id=job_id)
+        logger.info(f"İş kuyruğa eklendi: {job_id} ({filename}, {size / 1024 / 1024:.1f} MB)")
+
+        self._send_json({"id": job_id, "status": "queued"}, 201)
+
+
+class JobServer(ThreadingHTTPServer):
+    """
+    HTTP sunucusu + worker süreç havuzu.
+
+    Örnek:
+        >>> server = JobServer(("127.0.0.1", 8765), num_workers=2)
+        >>> server.run()    # Ctrl-C ile durur
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, num_workers: int = None, model_size: str = None, db_path=None):
+        """
+        JobServer başlatıcı.
+
+        Args:
+            address: (host, port)
+            num_workers: Worker süreç sayısı (verilmezse settings.JOB_WORKERS)
+            model_size: Worker'ların önceden yükleyeceği model
+                (verilmezse settings.WHISPER_MODEL_SIZE)
+            db_path: Kuyruk veritabanı (verilmezse settings.JOB_DIR / "jobs.db")
+        """
+        super().__init__(address, JobRequestHandler)
+        self.num_workers = max(1, settings.JOB_WORKERS if num_workers is None else num_workers)
+        self.model_size = model_size or settings.WHISPER_MODEL_SIZE
+        self.queue = JobQueue(db_path)
+
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._workers: Dict[str, multiprocessing.Process] = {}
+
+    def worker_status(self) -> Dict[str, bool]:
+        """Worker adı -> çalışıyor mu?"""
+        return {name: process.is_alive() for name, process in self._workers.items()}
+
+    def _start_worker(self, name: str):
+        process = self._context.Process(
+            target=worker_main,
+            args=(name, self.model_size, self.num_workers, self._stop_event),
+            name=name,
+            daemon=True
+        )
+        process.start()
+        self._workers[name] = process
+
+    def _supervise(self):
+        """Ölen worker'ın işini tekrar kuyruğa alır ve worker'ı yeniden başlatır."""
+        for name, process in list(self._workers.items()):
+            if process.is_alive() or self._stop_event.is_set():
+                continue
+
+            requeued = self.queue.requeue_running(worker=name)
+            logger.warning(
+                f"{name} beklenmedik şekilde sonlandı (çıkış kodu {process.exitcode}), "
+                f"yeniden başlatılıyor ({requeued} iş tekrar kuyrukta)"
+            )
+            self._start_worker(name)
+
+    def run(self):
+        """Worker'ları başlatır ve HTTP isteklerini karşılar (Ctrl-C ile durur)."""
+        # Önceki çalıştırmadan yarım kalan işler (checkpoint'ten devam eder)
+        requeued = self.queue.requeue_running()
+        if requeued:
+            logger.info(f"Yarıda kalan {requeued} iş tekrar kuyruğa alındı")
+
+        for index in range(self.num_workers):
+            self._start_worker(f"worker-{index + 1}")
+
+        http_thread = threading.Thread(target=self.serve_forever, name="job-http", daemon=True)
+        http_thread.start()
+
+        host, port = self.server_address[:2]
+        logger.info(f"İş sunucusu hazır: http://{host}:{port} ({self.num_workers} worker, model: {self.model_size})")
+
+        try:
+            while True:
+                time.sleep(1.0)
+                self._supervise()
+        except KeyboardInterrupt:
+            logger.info("İş sunucusu kapatılıyor...")
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 10.0):
+        """HTTP sunucusunu ve worker'ları durdurur."""
+        self._stop_event.set()
+        self.shutdown()
+        self.server_close()
+
+        for process in self._workers.values():
+            process.join(timeout)
+            if process.is_alive():
+                # Çalışan iş "running" kalır, sonraki başlatmada kaldığı yerden devam eder
+                process.terminate()
+                process.join()
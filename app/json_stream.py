@@ -0,0 +1,466 @@
+"""
+JSON Akış (Streaming) Modülü
+============================
+Bu modül büyük çıktı JSON dosyalarını bölüm bölüm yazar ve okur.
+
+Neden Gerekli?
+--------------
+- json.dump(indent=2) girintili çıktıda C hızlandırıcısını kullanamaz,
+  her token için ayrı bir write() yapar: Büyük timeline'larda yavaştır
+- Okurken json.load() tüm dosyayı tek seferde belleğe alır
+- Bu modül:
+  * Üst seviye bölümleri (metadata, speakers, timeline, full_transcript)
+    ayrı ayrı, büyük listeleri eleman eleman yazar
+  * orjson kuruluysa elemanları onunla kodlar (5-10x hızlı), yoksa
+    standart json modülünü kullanır
+  * Okurken timeline elemanlarını tek tek üretir (bellek kullanımı
+    dosya boyutundan bağımsız)
+
+Çıktı Formatı:
+- indent=2: json.dump(..., indent=2, ensure_ascii=False) ile aynı düzen
+  (orjson ile sadece üslü sayı yazımı farklı olabilir: 1e-07 / 1e-7)
+- indent=None (kompakt): Boşluksuz, en küçük dosya
+
+Örnek:
+    >>> write_json(result, "out.json")                  # girintili
+    >>> write_json(result, "out.json", indent=None)     # kompakt
+    >>> for segment in iter_json_array("out.json", "timeline"):
+    ...     print(segment["text"])
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+import json
+import os
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Okuma tamponu (karakter), tek bir değer bundan büyükse tampon büyür
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Yazma tamponu (byte)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Bu derinliğe kadar dict/list'ler eleman eleman yazılır, daha derini tek parça
+# 0: Kök nesne, 1: Bölümler (timeline listesi, speakers dict'i), 2: Segmentler
+STREAM_DEPTH = 2
+
+_decoder = json.JSONDecoder()
+
+# ensure_ascii=False string kodlayıcısı (C hızlandırıcısı varsa onu kullanır)
+_encode_string = json.encoder.encode_basestring
+
+# Bir sayının bittiğini gösteren karakterler
+_NUMBER_END = frozenset(" \t\n\r,]}")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+
+def has_fast_encoder() -> bool:
+    """orjson kurulu mu?"""
+    return orjson is not None
+
+
+def write_json(
+    data: Any,
+    output_path: Union[str, Path],
+    indent: Optional[int] = 2,
+    use_orjson: Optional[bool] = None
+) -> Path:
+    """
+    Veriyi JSON dosyasına akış halinde yazar.
+
+    Dosya önce geçici isimle yazılır, tamamlanınca yerine taşınır; yarıda
+    kalan bir yazma eski çıktıyı bozmaz.
+
+    Args:
+        data: JSON'a çevrilebilir veri
+        output_path: Çıktı dosyası
+        indent: Girinti (2 = json.dump(indent=2) düzeni, None = kompakt)
+        use_orjson: orjson kullanılsın mı? (None = kuruluysa kullan)
+
+    Returns:
+        Path: Yazılan dosya yolu
+    """
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(f".{output_path.name}.tmp")
+
+    try:
+        with open(temp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            dump_json(data, f, indent=indent, use_orjson=use_orjson)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return output_path
+
+
+def dump_json(
+    data: Any,
+    fp,
+    indent: Optional[int] = 2,
+    use_orjson: Optional[bool] = None
+):
+    """
+    Veriyi binary dosya nesnesine akış halinde yazar.
+
+    Args:
+        data: JSON'a çevrilebilir veri
+        fp: Binary modda açık dosya (veya write(bytes) destekleyen nesne)
+        indent: Girinti (None = kompakt)
+        use_orjson: orjson kullanılsın mı? (None = kuruluysa kullan)
+    """
+    encoder = _ValueEncoder(indent, use_orjson)
+    for chunk in _iter_chunks(data, encoder, level=0):
+        fp.write(chunk)
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2, use_orjson: Optional[bool] = None) -> str:
+    """dump_json() çıktısını string olarak döndürür (küçük veriler için)."""
+    encoder = _ValueEncoder(indent, use_orjson)
+    return b"".join(_iter_chunks(data, encoder, level=0)).decode("utf-8")
+
+
+class _ValueEncoder:
+    """Tek bir değeri verilen girinti seviyesinde bytes'a çevirir."""
+
+    def __init__(self, indent: Optional[int], use_orjson: Optional[bool]):
+        self.indent = indent
+
+        if use_orjson is None:
+            use_orjson = orjson is not None
+        # orjson sadece 2 boşluk girintiyi destekler
+        self.use_orjson = use_orjson and orjson is not None and indent in (None, 2)
+
+        if self.use_orjson:
+            self.orjson_option = orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                self.orjson_option |= orjson.OPT_INDENT_2
+
+        # Eleman başına yeni encoder oluşturmamak için tek örnek
+        if indent:
+            self.std_encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+            self.key_separator = b": "
+        else:
+            self.std_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+            self.key_separator = b":"
+        self.item_separator = b","
+
+    def newline(self, level: int) -> bytes:
+        """Girintili modda satır sonu + seviye girintisi, kompakt modda boş."""
+        if not self.indent:
+            return b""
+        return b"\n" + b" " * (self.indent * level)
+
+    def encode(self, value: Any, level: int) -> bytes:
+        if self.use_orjson:
+            try:
+                encoded = orjson.dumps(value, option=self.orjson_option)
+            except TypeError:
+                # 64 bitten büyük tamsayı, str olmayan anahtar vb.: standart json
+                encoded = self._encode_std(value)
+        else:
+            encoded = self._encode_std(value)
+
+        # İç içe değerin satırlarını bulunduğu seviyeye kaydır
+        # (JSON string'leri ham satır sonu içeremez, güvenli)
+        if self.indent and level and b"\n" in encoded:
+            encoded = encoded.replace(b"\n", self.newline(level))
+        return encoded
+
+    def _encode_std(self, value: Any) -> bytes:
+        # Timeline segmenti gibi düz dict'ler: json.JSONEncoder her çağrıda
+        # iterencode closure'ı kurar, skalerleri doğrudan kodlamak ~3x hızlı
+        if self.indent and isinstance(value, dict) and value:
+            parts = []
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    break
+                encoded_item = _encode_scalar(item)
+                if encoded_item is None:
+                    break
+                parts.append(f"{_encode_string(key)}: {encoded_item}")
+            else:
+                separator = ",\n" + " " * self.indent
+                return ("{\n" + " " * self.indent + separator.join(parts) + "\n}").encode("utf-8")
+
+        return self.std_encoder.encode(value).encode("utf-8")
+
+
+def _encode_scalar(value: Any) -> Optional[str]:
+    """
+    Skaler değeri json modülüyle aynı biçimde kodlar (dict/list ise None).
+    """
+    if isinstance(value, str):
+        return _encode_string(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "Infinity" if value > 0 else "-Infinity"
+        return float.__repr__(value)
+    return None
+
+
+def _iter_chunks(value: Any, encoder: _ValueEncoder, level: int) -> Iterator[bytes]:
+    """
+    Değeri parça parça üretir: STREAM_DEPTH'e kadar dict/list elemanları
+    ayrı ayrı, daha derindekiler tek parça kodlanır.
+    """
+    if level >= STREAM_DEPTH or not isinstance(value, (dict, list, tuple)) or not value:
+        yield encoder.encode(value, level)
+        return
+
+    inner = encoder.newline(level + 1)
+    is_dict = isinstance(value, dict)
+    yield b"{" if is_dict else b"["
+
+    items: Iterable = value.items() if is_dict else value
+    for index, item in enumerate(items):
+        prefix = encoder.item_separator + inner if index else inner
+
+        if is_dict:
+            key, item = item
+            if not isinstance(key, str):
+                # json modülü gibi: 1 -> "1", True -> "true", None -> "null"
+                key = json.dumps(key).strip('"')
+            prefix += encoder.encode(key, 0) + encoder.key_separator
+
+        yield prefix
+        yield from _iter_chunks(item, encoder, level + 1)
+
+    yield encoder.newline(level) + (b"}" if is_dict else b"]")
+
+
+class _Scanner:
+    """
+    Metin dosyası üzerinde kayan tamponlu JSON tarayıcı.
+
+    Değerleri json.JSONDecoder.raw_decode ile tampondan çözer; değer
+    tamponun sonunda kesiliyorsa dosyadan okumaya devam eder. Her yeniden
+    denemede tampondaki bekleyen kısım en az iki katına çıkar: büyük bir
+    bölümü decode() ile okumak bölüm boyutunda doğrusal kalır (O(n²) değil).
+    """
+
+    def __init__(self, f, chunk_size: int = READ_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Tampona en az bir parça (ve en az min_size karakter) daha okur, dosya bittiyse False."""
+        if self.eof:
+            return False
+
+        data = self.f.read(max(self.chunk_size, min_size))
+        if not data:
+            self.eof = True
+            return False
+
+        # Tüketilen kısmı at (bellek kullanımı sınırlı kalsın)
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Boşlukları atlayıp sıradaki karakteri döndürür (dosya sonu: "")."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"'{char}' bekleniyordu, '{found}' bulundu", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Sıradaki tam JSON değerini çözer."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Değer tamponun sonunda kesilmiş olabilir: bekleyen kısım kadar
+                # daha oku (her başarısız deneme baştan taradığı için tampon
+                # katlanarak büyümeli, sabit parçalarla büyürse O(n²) olur)
+                if self._fill(len(self.buffer) - self.pos):
+                    continue
+                raise
+
+            # Sayı ancak ardından ayraç geliyorsa tamamdır: tampon "12" veya
+            # "1e" ile bitiyorsa devamı ("3", "-07") sonraki parçada olabilir
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and (end == len(self.buffer) or self.buffer[end] not in _NUMBER_END)
+                    and self._fill()):
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Sıradaki diziyi eleman eleman üretir."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.decode()
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise json.JSONDecodeError(f"',' veya ']' bekleniyordu, '{char}' bulundu", self.buffer, self.pos - 1)
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Sıradaki nesnenin anahtarlarını üretir; her anahtardan sonra çağıran
+        değeri decode() / iter_array() / skip() ile tüketmelidir.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise json.JSONDecodeError(f"',' veya '}}' bekleniyordu, '{char}' bulundu", self.buffer, self.pos - 1)
+
+    def skip(self):
+        """
+        Sıradaki değeri atlar. Diziler eleman eleman, string'ler parça parça
+        taranır; büyük bölümler (timeline, full_transcript) belleğe alınmaz.
+        """
+        char = self.peek()
+        if char == "[":
+            for _ in self.iter_array():
+                pass
+        elif char == '"':
+            self._skip_string()
+        else:
+            self.decode()
+
+    def _skip_string(self):
+        """String'i çözmeden kapanış tırnağına kadar atlar."""
+        self.pos += 1
+        while True:
+            # Kaçış dizileri (\" dahil) tek parça eşleşir; tampon bir "\"
+            # ile bitiyorsa eşleşme ondan önce durur, devamı okunup tekrar denenir
+            self.pos = _STRING_BODY.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) and self.buffer[self.pos] == '"':
+                self.pos += 1
+                return
+            if not self._fill():
+                raise json.JSONDecodeError("Kapanmamış string", self.buffer, self.pos)
+
+
+def iter_json_array(
+    json_path: Union[str, Path],
+    key: str,
+    header: Optional[Dict[str, Any]] = None,
+    skip_section: Optional[Callable[[str, Dict[str, Any]], bool]] = None
+) -> Iterator[Any]:
+    """
+    Üst seviye nesnedeki bir dizinin elemanlarını tek tek üretir.
+
+    Diğer bölümler okunup atlanır; bellek kullanımı en büyük tek elemanla
+    sınırlıdır.
+
+    Args:
+        json_path: JSON dosyası (üst seviyesi nesne olmalı)
+        key: Dizi anahtarı (ör. "timeline")
+        header: Verilirse diziden önce gelen bölümler atlanmak yerine bu
+            dict'e okunur (ilk eleman üretilmeden önce doldurulur)
+        skip_section: Verilirse header'a okunacak her bölüm için
+            (anahtar, o ana kadar okunan header) ile çağrılır; True dönerse
+            bölüm header'a alınmadan atlanır (ör. v1 dosyada speakers)
+
+    Yields:
+        Any: Dizi elemanları (dosyadaki sırayla)
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        scanner = _Scanner(f)
+        for current_key in scanner.iter_object():
+            if current_key == key:
+                yield from scanner.iter_array()
+                return
+            if header is not None and not (skip_section and skip_section(current_key, header)):
+                header[current_key] = scanner.decode()
+            else:
+                scanner.skip()
+
+
+def read_json_sections(
+    json_path: Union[str, Path],
+    skip_keys: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """
+    Üst seviye nesneyi bölüm bölüm okur, istenen bölümleri hiç yüklemeden atlar.
+
+    Args:
+        json_path: JSON dosyası (üst seviyesi nesne olmalı)
+        skip_keys: Atlanacak bölümler (ör. ("timeline",) - sonra
+            iter_json_array() ile akış halinde okunabilir)
+
+    Returns:
+        Dict: Okunan bölümler (dosyadaki sırayla)
+    """
+    skip_keys = set(skip_keys)
+    sections = {}
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        scanner = _Scanner(f)
+        for key in scanner.iter_object():
+            if key in skip_keys:
+                scanner.skip()
+            else:
+                sections[key] = scanner.decode()
+
+    return sections
+
+
+def load_json(json_path: Union[str, Path]) -> Any:
+    """
+    JSON dosyasını tamamen yükler (orjson kuruluysa onunla, 3-5x hızlı).
+
+    Args:
+        json_path: JSON dosyası
+
+    Returns:
+        Any: Yüklenmiş veri
+    """
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,389 @@
+"""
+Performans Metrikleri Modülü
+============================
+Bu modül pipeline aşamalarının süre / CPU / bellek ölçümlerini toplar:
+iş başına çıktı metadata'sına ("performance") ve tüm işler için
+kümülatif Prometheus metin dosyasına yazar.
+
+Neden Gerekli?
+--------------
+- process_video() sadece toplam elapsed_time döndürüyordu; yavaş bir işte
+  zamanın ses çıkarmaya mı, model yüklemeye mi, decode'a mı gittiği
+  görülmüyordu
+- Üretimde profiler bağlamadan "zaman nereye gidiyor?" sorusunu cevaplar
+- Prometheus metin formatı: dosya node_exporter textfile collector ile,
+  iş sunucusunda GET /metrics ile toplanabilir
+
+Ölçülen aşamalar:
+    duration_probe, validate, extract, cache, model_load, transcribe,
+    merge, text_export, dataset_export, qa, json_save, search_index
+
+Aşama ölçümü:
+- wall_seconds: Duvar saati süresi
+- cpu_seconds: Süreç CPU süresi (tüm thread'ler + biten alt süreçler, ör.
+  ffmpeg). Aynı süreçte paralel çalışan işler (toplu işlemede prefetch,
+  Web UI'da eşzamanlı kullanıcılar) birbirinin CPU süresine karışır
+- peak_rss_mb: Aşama sonunda sürecin o ana kadarki en yüksek RSS'i
+
+Kümülatif sayaçlar süreçler arası paylaşılan SQLite'ta tutulur
+(settings.METRICS_PATH yanında .db); iş sunucusunun worker süreçleri
+aynı dosyaya yazar.
+
+Örnek:
+    >>> metrics = StageMetrics()
+    >>> with metrics.stage("extract"):
+    ...     audio = extract_audio_to_array(video_path)
+    >>> metrics.summary(audio_duration=3600.0, num_segments=820, cache_hit=False)
+    {"stages": {"extract": {"wall_seconds": 41.2, ...}}, "rtf": 0.31, ...}
+    >>> get_metrics_store().record_job(performance)      # outputs/metrics.prom
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+import contextlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from loguru import logger
+import config.settings as settings
+
+try:
+    import resource
+except ImportError:
+    # Windows: tepe RSS ölçülmez
+    resource = None
+
+
+# Prometheus metrik adı öneki
+METRIC_PREFIX = "video_to_text"
+
+# Metrik tanımları: ad -> (tip, açıklama)
+METRIC_DEFINITIONS = {
+    "jobs_total": ("counter", "İşlenen işler (status: success, failed, cancelled)"),
+    "cache_hits_total": ("counter", "Transcription önbelleğinden gelen işler"),
+    "audio_seconds_total": ("counter", "İşlenen toplam ses süresi (saniye)"),
+    "segments_total": ("counter", "Üretilen toplam segment"),
+    "stage_seconds_total": ("counter", "Aşama başına toplam duvar saati süresi (saniye)"),
+    "stage_cpu_seconds_total": ("counter", "Aşama başına toplam CPU süresi (saniye)"),
+    "stage_runs_total": ("counter", "Aşama başına çalışma sayısı"),
+    "last_rtf": ("gauge", "Son işin real-time factor'ü (işlem süresi / ses süresi)"),
+    "last_segments_per_second": ("gauge", "Son işin decode hızı (segment / saniye)"),
+    "last_peak_rss_bytes": ("gauge", "Son işi çalıştıran sürecin tepe RSS'i (byte)"),
+    "max_peak_rss_bytes": ("gauge", "Görülen en yüksek tepe RSS (byte)"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    name TEXT NOT NULL,
+    labels TEXT NOT NULL DEFAULT '',
+    value REAL NOT NULL,
+    PRIMARY KEY (name, labels)
+);
+"""
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Sürecin şimdiye kadarki en yüksek bellek kullanımı (MB).
+
+    Returns:
+        Optional[float]: Tepe RSS, ölçülemiyorsa None (Windows)
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: byte
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _cpu_seconds() -> float:
+    """Süreç + biten alt süreçlerin CPU süresi (kullanıcı + sistem)."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class StageMetrics:
+    """
+    Bir işin aşama ölçümleri.
+
+    Aynı aşama birden çok kez ölçülürse (ör. wav modunda iki süre okuması)
+    süreler toplanır. Thread-safe: Toplu işlemede aşamalar farklı
+    thread'lerde çalışır.
+    """
+
+    def __init__(self, profiler=None):
+        """
+        StageMetrics başlatıcı.
+
+        Args:
+            profiler: Aşama sınırlarını bildirilecek app.profiler.SamplingProfiler
+                (opsiyonel, --profile)
+        """
+        self.stages: Dict[str, Dict] = {}
+        self.profiler = profiler
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Bloğu bir aşama olarak ölçer (hata olsa da kaydedilir).
+
+        Args:
+            name: Aşama adı (ör. "extract")
+        """
+        if self.profiler is not None:
+            self.profiler.enter_stage(name)
+        wall_start = time.perf_counter()
+        cpu_start = _cpu_seconds()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall_start, _cpu_seconds() - cpu_start)
+            if self.profiler is not None:
+                self.profiler.exit_stage(name)
+
+    def add(self, name: str, wall_seconds: float, cpu_seconds: float = 0.0):
+        """Aşamaya ölçüm ekler."""
+        with self._lock:
+            stage = self.stages.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_rss_mb": None})
+            stage["wall_seconds"] += wall_seconds
+            stage["cpu_seconds"] += cpu_seconds
+            stage["peak_rss_mb"] = peak_rss_mb()
+
+    def wall_seconds(self, name: str) -> float:
+        """Aşamanın toplam süresi (ölçülmediyse 0)."""
+        with self._lock:
+            return self.stages.get(name, {}).get("wall_seconds", 0.0)
+
+    def summary(self, audio_duration: float = None, num_segments: int = None, cache_hit: bool = False) -> Dict:
+        """
+        Metadata'ya yazılacak performans özeti.
+
+        Args:
+            audio_duration: Ses süresi (saniye, RTF için)
+            num_segments: Segment sayısı (decode hızı için)
+            cache_hit: Sonuç önbellekten mi geldi?
+
+        Returns:
+            Dict: {
+                "stages": {"extract": {"wall_seconds": 41.2, "cpu_seconds": 38.9,
+                                       "peak_rss_mb": 812.4}, ...},
+                "wall_seconds": 1130.5,
+                "cpu_seconds": 4410.2,
+                "rtf": 0.314,                   # Toplam süre / ses süresi
+                "transcribe_rtf": 0.282,        # Sadece decode
+                "segments_per_second": 0.73,    # Decode hızı
+                "peak_rss_mb": 2240.1,
+                "cache_hit": false
+            }
+        """
+        with self._lock:
+            stages = {
+                name: {
+                    "wall_seconds": round(stage["wall_seconds"], 3),
+                    "cpu_seconds": round(stage["cpu_seconds"], 3),
+                    "peak_rss_mb": round(stage["peak_rss_mb"], 1) if stage["peak_rss_mb"] is not None else None
+                }
+                for name, stage in self.stages.items()
+            }
+
+        wall = sum(stage["wall_seconds"] for stage in stages.values())
+        transcribe_wall = stages.get("transcribe", {}).get("wall_seconds", 0.0)
+        peak = peak_rss_mb()
+
+        return {
+            "stages": stages,
+            "wall_seconds": round(wall, 3),
+            "cpu_seconds": round(sum(stage["cpu_seconds"] for stage in stages.values()), 3),
+            "rtf": round(wall / audio_duration, 4) if audio_duration else None,
+            "transcribe_rtf": round(transcribe_wall / audio_duration, 4) if audio_duration else None,
+            "segments_per_second": (
+                round(num_segments / transcribe_wall, 2) if num_segments and transcribe_wall > 0 else None
+            ),
+            "peak_rss_mb": round(peak, 1) if peak is not None else None,
+            "cache_hit": cache_hit
+        }
+
+
+class MetricsStore:
+    """
+    Kümülatif metrikler (SQLite) ve Prometheus metin çıktısı.
+
+    Her kayıttan sonra Prometheus dosyası atomik olarak yeniden yazılır
+    (okuyucu yarım dosya görmez).
+    """
+
+    def __init__(self, prom_path: Union[str, Path] = None, db_path: Union[str, Path] = None):
+        """
+        MetricsStore başlatıcı.
+
+        Args:
+            prom_path: Prometheus metin dosyası (verilmezse settings.METRICS_PATH)
+            db_path: Sayaç veritabanı (verilmezse prom_path'in .db uzantılısı)
+        """
+        self.prom_path = Path(prom_path) if prom_path else Path(settings.METRICS_PATH)
+        self.db_path = Path(db_path) if db_path else self.prom_path.with_suffix(".db")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """İşlem başına bağlantı (başarılıysa commit, hata olursa rollback)."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _labels(**labels) -> str:
+        """Prometheus etiket metni: {stage="extract"} (etiket yoksa boş)."""
+        if not labels:
+            return ""
+
+        def escape(value) -> str:
+            return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in sorted(labels.items())) + "}"
+
+    def record_job(self, performance: Dict, audio_duration: float = None, num_segments: int = 0):
+        """
+        Başarılı bir işin ölçümlerini sayaçlara ekler.
+
+        Args:
+            performance: StageMetrics.summary() sonucu
+            audio_duration: Ses süresi (saniye)
+            num_segments: Segment sayısı
+        """
+        increments = [
+            ("jobs_total", self._labels(status="success"), 1),
+            ("cache_hits_total", "", 1 if performance.get("cache_hit") else 0),
+            ("audio_seconds_total", "", audio_duration or 0.0),
+            ("segments_total", "", num_segments or 0),
+        ]
+        for stage, values in performance["stages"].items():
+            labels = self._labels(stage=stage)
+            increments += [
+                ("stage_seconds_total", labels, values["wall_seconds"]),
+                ("stage_cpu_seconds_total", labels, values["cpu_seconds"]),
+                ("stage_runs_total", labels, 1),
+            ]
+
+        gauges = [("last_rtf", performance.get("rtf")),
+                  ("last_segments_per_second", performance.get("segments_per_second"))]
+        peak_bytes = performance["peak_rss_mb"] * 1024 * 1024 if performance.get("peak_rss_mb") else None
+        gauges.append(("last_peak_rss_bytes", peak_bytes))
+
+        with self._connect() as conn:
+            self._increment(conn, increments)
+            for name, value in gauges:
+                if value is not None:
+                    conn.execute(
+                        "INSERT INTO metrics (name, labels, value) VALUES (?, '', ?) "
+                        "ON CONFLICT(name, labels) DO UPDATE SET value = excluded.value",
+                        (name, value)
+                    )
+            if peak_bytes is not None:
+                conn.execute(
+                    "INSERT INTO metrics (name, labels, value) VALUES ('max_peak_rss_bytes', '', ?) "
+                    "ON CONFLICT(name, labels) DO UPDATE SET value = MAX(value, excluded.value)",
+                    (peak_bytes,)
+                )
+
+        self.write_prom_file()
+
+    def record_failure(self, status: str = "failed"):
+        """Başarısız / iptal edilen işi sayar (status: failed, cancelled)."""
+        with self._connect() as conn:
+            self._increment(conn, [("jobs_total", self._labels(status=status), 1)])
+        self.write_prom_file()
+
+    @staticmethod
+    def _increment(conn: sqlite3.Connection, increments):
+        conn.executemany(
+            "INSERT INTO metrics (name, labels, value) VALUES (?, ?, ?) "
+            "ON CONFLICT(name, labels) DO UPDATE SET value = value + excluded.value",
+            increments
+        )
+
+    def render(self, extra: Dict[str, Dict] = None) -> str:
+        """
+        Prometheus metin formatı (exposition format 0.0.4).
+
+        Args:
+            extra: Anlık eklenecek gauge'lar (kaydedilmez), ör. iş sunucusunun
+                kuyruk durumu: {"queue_jobs": {"help": "...", "values": {'{status="queued"}': 3}}}
+
+        Returns:
+            str: Metin çıktı
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT name, labels, value FROM metrics ORDER BY name, labels").fetchall()
+
+        samples: Dict[str, list] = {}
+        for name, labels, value in rows:
+            samples.setdefault(name, []).append((labels, value))
+
+        lines = []
+        for name, (kind, help_text) in METRIC_DEFINITIONS.items():
+            if name not in samples:
+                continue
+            lines += [f"# HELP {METRIC_PREFIX}_{name} {help_text}", f"# TYPE {METRIC_PREFIX}_{name} {kind}"]
+            lines += [f"{METRIC_PREFIX}_{name}{labels} {value:g}" for labels, value in samples[name]]
+
+        for name, metric in (extra or {}).items():
+            lines += [f"# HELP {METRIC_PREFIX}_{name} {metric['help']}", f"# TYPE {METRIC_PREFIX}_{name} gauge"]
+            lines += [f"{METRIC_PREFIX}_{name}{labels} {value:g}" for labels, value in metric["values"].items()]
+
+        return "\n".join(lines) + "\n"
+
+    def write_prom_file(self):
+        """Prometheus dosyasını yeniden yazar (geçici dosya + rename)."""
+        temp_path = self.prom_path.with_name(f".{self.prom_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(temp_path, self.prom_path)
+
+
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_metrics_store() -> MetricsStore:
+    """
+    Süreç genelinde paylaşılan MetricsStore'u döndürür.
+
+    Returns:
+        MetricsStore: Paylaşılan metrik deposu
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = MetricsStore()
+        return _store
+
+
+def record_job_metrics(performance: Dict, audio_duration: float = None, num_segments: int = 0):
+    """İş metriklerini kaydeder (METRICS_ENABLED kapalıysa hiçbir şey yapmaz; hata işi bozmaz)."""
+    if not settings.METRICS_ENABLED:
+        return
+    try:
+        get_metrics_store().record_job(performance, audio_duration=audio_duration, num_segments=num_segments)
+    except Exception as e:
+        logger.warning(f"Metrikler kaydedilemedi: {e}")
+
+
+def record_job_failure(status: str = "failed"):
+    """Başarısız / iptal edilen işi sayar (hata işi bozmaz)."""
+    if not settings.METRICS_ENABLED:
+        return
+    try:
+        get_metrics_store().record_failure(status)
+    except Exception as e:
+        logger.warning(f"Metrikler kaydedilemedi: {e}")
@@ -0,0 +1,469 @@
+"""
+Model Registry Modülü
+=====================
+Bu modül faster-whisper modellerini süreç (process) genelinde paylaşır.
+
+Neden Gerekli?
+--------------
+- Her process_video() çağrısı yeni bir Transcriber oluşturur
+- large-v3-turbo her yüklemede ~800 MB ağırlık okur (CPU'da saniyeler sürer)
+- Registry sayesinde aynı (model_size, device, compute_type, cpu_threads,
+  num_workers) için model bir kez yüklenir; UI, CLI toplu işleme ve sunucu aynı modeli kullanır
+
+Bellek Yönetimi:
+- Toplam RAM bütçesi (MODEL_REGISTRY_MAX_MEMORY_MB): Aşılırsa en uzun
+  süredir kullanılmayan (LRU) model boşaltılır
+- Boşta kalma süresi (MODEL_IDLE_TIMEOUT_SECONDS): Bu süre boyunca
+  kullanılmayan model arka plan thread'i tarafından boşaltılır
+- Kullanımdaki (kiralanmış, get_model(lease=True) ... release()) model
+  ne bütçe ne de boşta kalma nedeniyle boşaltılır: decode sürerken
+  boşaltılan model bellekte kalır, sonraki istek ikinci kopyayı yüklerdi
+
+Yükleme: Model kilit dışında yüklenir (ilk indirme dakikalar sürebilir);
+bu sırada diğer modeller, stats() ve evict_idle() beklemez. Aynı modeli
+isteyen ikinci çağrı yüklemenin bitmesini bekler, ikinci kez yüklemez.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import gc
+import os
+import threading
+import time
+from loguru import logger
+from faster_whisper import WhisperModel
+import config.settings as settings
+
+
+# Model boyutlarına göre yaklaşık bellek kullanımı (MB, float16)
+# Ölçüm yapılamayan platformlarda (Linux dışı) tahmin için kullanılır
+MODEL_MEMORY_ESTIMATES_MB = {
+    "tiny": 75,
+    "base": 145,
+    "small": 485,
+    "medium": 1530,
+    "large-v3": 3100,
+    "large-v3-turbo": 1620,
+}
+
+# Compute type'a göre bellek çarpanı (float16 = 1.0)
+COMPUTE_TYPE_MEMORY_FACTORS = {
+    "float32": 2.0,
+    "float16": 1.0,
+    "bfloat16": 1.0,
+    "int8_float32": 0.5,
+    "int8_float16": 0.5,
+    "int8_bfloat16": 0.5,
+    "int8": 0.5,
+}
+
+# Registry anahtarı: (model_size, device, compute_type, cpu_threads, num_workers)
+# cpu_threads/num_workers model oluşturulurken sabitlenir, anahtara dahildir
+ModelKey = Tuple[str, str, str, int, int]
+
+
+def _current_rss_mb() -> Optional[float]:
+    """
+    Sürecin anlık bellek kullanımını (RSS) MB cinsinden döndürür.
+
+    Returns:
+        Optional[float]: RSS (MB), ölçülemiyorsa None (Linux dışı sistemler)
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def estimate_model_memory_mb(model_size: str, compute_type: str) -> float:
+    """
+    Modelin bellekte kaplayacağı yaklaşık alanı tahmin eder.
+
+    Args:
+        model_size: Model boyutu (tiny, small, large-v3-turbo vb.)
+        compute_type: Compute type (int8, float16 vb.)
+
+    Returns:
+        float: Tahmini bellek kullanımı (MB)
+    """
+    base_mb = MODEL_MEMORY_ESTIMATES_MB.get(model_size, MODEL_MEMORY_ESTIMATES_MB["large-v3"])
+    factor = COMPUTE_TYPE_MEMORY_FACTORS.get(compute_type, 1.0)
+    return base_mb * factor
+
+
+class ModelRegistry:
+    """
+    Yüklü faster-whisper modellerini anahtar bazında tutan LRU registry.
+
+    Thread-safe: Streamlit oturumları ve sunucu thread'leri aynı anda
+    get_model() çağırabilir. Aynı model iki kez yüklenmez.
+    """
+
+    def __init__(self, max_memory_mb: int = None, idle_timeout: int = None):
+        """
+        ModelRegistry başlatıcı.
+
+        Args:
+            max_memory_mb: Toplam RAM bütçesi (MB)
+                Verilmezse settings.MODEL_REGISTRY_MAX_MEMORY_MB kullanılır
+            idle_timeout: Boşta kalma süresi (saniye), 0 = sınırsız
+                Verilmezse settings.MODEL_IDLE_TIMEOUT_SECONDS kullanılır
+        """
+        self.max_memory_mb = (
+            max_memory_mb if max_memory_mb is not None
+            else settings.MODEL_REGISTRY_MAX_MEMORY_MB
+        )
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None
+            else settings.MODEL_IDLE_TIMEOUT_SECONDS
+        )
+
+        # OrderedDict: en son kullanılan model sonda (LRU sırası)
+        # Değer: {"model", "memory_mb", "loaded_at", "last_used", "leases"}
+        self._models: "OrderedDict[ModelKey, Dict]" = OrderedDict()
+
+        # Yüklenmekte olan modeller: anahtar -> (bitince set edilen Event, tahmini MB)
+        # Aynı modeli isteyen diğer çağrılar Event'i bekler
+        self._loading: Dict[ModelKey, Tuple[threading.Event, float]] = {}
+
+        # Sadece registry durumunu korur; model yükleme kilit dışında yapılır
+        self._lock = threading.RLock()
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Boşta kalan modelleri boşaltan arka plan thread'i (ilk yüklemede başlar)
+        self._janitor_thread = None
+        self._stop_event = threading.Event()
+
+    def get_model(
+        self,
+        model_size: str,
+        device: str,
+        compute_type: str,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        lease: bool = False,
+        **model_kwargs
+    ) -> WhisperModel:
+        """
+        İstenen modeli döndürür; yüklü değilse yükler.
+
+        Args:
+            model_size: Model boyutu
+            device: "cpu", "cuda" veya "auto"
+            compute_type: "int8", "float16" vb.
+            cpu_threads: CTranslate2 thread sayısı (0 = CTranslate2 varsayılanı)
+            num_workers: Eşzamanlı transcription sayısı
+            lease: Model kullanım süresince kiralansın mı? (True ise işi
+                bitince release() çağrılmalı; kiralanmış model boşaltılmaz)
+            **model_kwargs: WhisperModel'e geçirilecek ekstra parametreler
+                (ör. download_root)
+
+        Returns:
+            WhisperModel: Yüklü model
+        """
+        key = (model_size, device, compute_type, cpu_threads, num_workers)
+
+        while True:
+            with self._lock:
+                entry = self._models.get(key)
+
+                if entry is not None:
+                    # Önbellekte: LRU sırasında sona taşı
+                    self._models.move_to_end(key)
+                    entry["last_used"] = time.monotonic()
+                    if lease:
+                        entry["leases"] += 1
+                    self.hits += 1
+                    logger.info(f"Model registry'den alındı (yükleme yok): {model_size} ({compute_type} on {device})")
+                    return entry["model"]
+
+                loading = self._loading.get(key)
+                if loading is None:
+                    # Bu çağrı yükler: yer tutucu ayrılır, diğerleri onu bekler
+                    self.misses += 1
+                    estimated_mb = estimate_model_memory_mb(model_size, compute_type)
+                    self._evict_for(estimated_mb)
+                    done = threading.Event()
+                    self._loading[key] = (done, estimated_mb)
+                    break
+
+            # Başka bir çağrı aynı modeli yüklüyor: bitince tekrar bakılır
+            # (yükleme hata verdiyse bu çağrı yüklemeyi dener)
+            loading[0].wait()
+
+        try:
+            model, memory_mb = self._load(key, estimated_mb, **model_kwargs)
+        except BaseException:
+            with self._lock:
+                del self._loading[key]
+            done.set()
+            raise
+
+        now = time.monotonic()
+        with self._lock:
+            del self._loading[key]
+            self._models[key] = {
+                "model": model,
+                "memory_mb": memory_mb,
+                "loaded_at": now,
+                "last_used": now,
+                "leases": 1 if lease else 0
+            }
+            total_mb = self.total_memory_mb()
+            self._ensure_janitor()
+        done.set()
+
+        logger.debug(
+            f"Model registry'ye eklendi: {model_size} ({compute_type} on {device}), "
+            f"~{memory_mb:.0f} MB, toplam {total_mb:.0f}/{self.max_memory_mb} MB"
+        )
+        return model
+
+    def _load(self, key: ModelKey, estimated_mb: float, **model_kwargs) -> Tuple[WhisperModel, float]:
+        """
+        Modeli yükler (kilit dışında çağrılır).
+
+        Returns:
+            Tuple[WhisperModel, float]: (model, bellek kullanımı MB)
+        """
+        model_size, device, compute_type, cpu_threads, num_workers = key
+        logger.info(
+            f"Model registry'de yok, yükleniyor: {model_size} ({compute_type} on {device}). "
+            f"İlk kullanımda model indirilecek, bu 2-10 dakika sürebilir."
+        )
+        rss_before = _current_rss_mb()
+
+        model_kwargs.setdefault("download_root", str(settings.MODEL_DIR))
+        model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+            **model_kwargs
+        )
+
+        # Gerçek bellek artışı ölçülebiliyorsa onu kullan
+        # (aynı anda başka model yükleniyorsa ölçüm şişebilir; tahmin alt sınırdır)
+        rss_after = _current_rss_mb()
+        memory_mb = estimated_mb
+        if rss_before is not None and rss_after is not None and rss_after - rss_before > 0:
+            memory_mb = rss_after - rss_before
+
+        return model, memory_mb
+
+    def is_loaded(
+        self,
+        model_size: str,
+        device: str,
+        compute_type: str,
+        cpu_threads: int = 0,
+        num_workers: int = 1
+    ) -> bool:
+        """Model registry'de yüklü mü?"""
+        with self._lock:
+            return (model_size, device, compute_type, cpu_threads, num_workers) in self._models
+
+    def release(
+        self,
+        model_size: str,
+        device: str,
+        compute_type: str,
+        cpu_threads: int = 0,
+        num_workers: int = 1
+    ):
+        """
+        get_model(lease=True) ile alınan modelin kullanımı bitti.
+
+        Boşta kalma süresi bu andan itibaren sayılır.
+        """
+        with self._lock:
+            entry = self._models.get((model_size, device, compute_type, cpu_threads, num_workers))
+            if entry is None or entry["leases"] <= 0:
+                return
+            entry["leases"] -= 1
+            entry["last_used"] = time.monotonic()
+
+    def unload(
+        self,
+        model_size: str,
+        device: str,
+        compute_type: str,
+        cpu_threads: int = 0,
+        num_workers: int = 1
+    ) -> bool:
+        """
+        Modeli registry'den çıkarır.
+
+        Returns:
+            bool: Model registry'de varsa True
+        """
+        with self._lock:
+            entry = self._models.pop((model_size, device, compute_type, cpu_threads, num_workers), None)
+
+        if entry is None:
+            return False
+
+        del entry
+        gc.collect()
+        logger.info(f"Model boşaltıldı: {model_size} ({compute_type} on {device})")
+        return True
+
+    def clear(self):
+        """Tüm modelleri boşaltır."""
+        with self._lock:
+            self._models.clear()
+        gc.collect()
+        logger.info("Model registry temizlendi")
+
+    def total_memory_mb(self) -> float:
+        """Registry'deki modellerin toplam (tahmini) bellek kullanımı (MB)."""
+        with self._lock:
+            return sum(entry["memory_mb"] for entry in self._models.values())
+
+    def stats(self) -> Dict:
+        """
+        Registry istatistiklerini döndürür.
+
+        Returns:
+            Dict: {
+                "hits": 3, "misses": 1, "evictions": 0,
+                "total_memory_mb": 812.0, "max_memory_mb": 4096,
+                "models": [{"model_size", "device", "compute_type", "cpu_threads",
+                            "num_workers", "memory_mb", "leases", "idle_seconds"}, ...]
+            }
+        """
+        now = time.monotonic()
+        with self._lock:
+            models = [
+                {
+                    "model_size": key[0],
+                    "device": key[1],
+                    "compute_type": key[2],
+                    "cpu_threads": key[3],
+                    "num_workers": key[4],
+                    "memory_mb": round(entry["memory_mb"], 1),
+                    "leases": entry["leases"],
+                    "idle_seconds": round(now - entry["last_used"], 1) if not entry["leases"] else 0.0
+                }
+                for key, entry in self._models.items()
+            ]
+
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "total_memory_mb": round(self.total_memory_mb(), 1),
+                "max_memory_mb": self.max_memory_mb,
+                "models": models
+            }
+
+    def evict_idle(self) -> int:
+        """
+        idle_timeout süresinden uzun süredir kullanılmayan modelleri boşaltır.
+
+        Kiralanmış (decode süren) modeller boşaltılmaz.
+
+        Returns:
+            int: Boşaltılan model sayısı
+        """
+        if not self.idle_timeout:
+            return 0
+
+        now = time.monotonic()
+        with self._lock:
+            idle_keys = [
+                key for key, entry in self._models.items()
+                if not entry["leases"] and now - entry["last_used"] > self.idle_timeout
+            ]
+            for key in idle_keys:
+                del self._models[key]
+                self.evictions += 1
+                logger.info(
+                    f"Boşta kalan model boşaltıldı ({self.idle_timeout}s): "
+                    f"{key[0]} ({key[2]} on {key[1]})"
+                )
+
+        if idle_keys:
+            gc.collect()
+
+        return len(idle_keys)
+
+    def _evict_for(self, required_mb: float):
+        """
+        Yeni model için bütçede yer açar (LRU sırasıyla boşaltır).
+
+        Yüklenmekte olan modellerin tahmini boyutu da bütçeden düşülür;
+        kiralanmış modeller boşaltılmaz. Kilit altında çağrılmalıdır.
+        """
+        reserved_mb = sum(estimated_mb for _, estimated_mb in self._loading.values())
+        evicted = False
+        while self.total_memory_mb() + reserved_mb + required_mb > self.max_memory_mb:
+            key = next((key for key, entry in self._models.items() if not entry["leases"]), None)
+            if key is None:
+                # Kalan modellerin hepsi kullanımda
+                break
+            entry = self._models.pop(key)
+            self.evictions += 1
+            evicted = True
+            logger.info(
+                f"Bellek bütçesi için model boşaltıldı (LRU): "
+                f"{key[0]} ({key[2]} on {key[1]}), ~{entry['memory_mb']:.0f} MB"
+            )
+
+        if evicted:
+            gc.collect()
+
+        if required_mb > self.max_memory_mb:
+            logger.warning(
+                f"Model tahmini boyutu ({required_mb:.0f} MB) bellek bütçesini "
+                f"({self.max_memory_mb} MB) aşıyor, yine de yükleniyor"
+            )
+
+    def _ensure_janitor(self):
+        """Boşta kalan modelleri boşaltan daemon thread'i başlatır (gerekirse)."""
+        if not self.idle_timeout or self._janitor_thread is not None:
+            return
+
+        def janitor():
+            # Kontrol aralığı: timeout'un yarısı (en fazla 60 saniye)
+            interval = max(1, min(60, self.idle_timeout // 2))
+            while not self._stop_event.wait(interval):
+                self.evict_idle()
+
+        self._janitor_thread = threading.Thread(
+            target=janitor,
+            name="model-registry-janitor",
+            daemon=True
+        )
+        self._janitor_thread.start()
+
+
+# Süreç genelinde tek registry (singleton)
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Süreç genelinde paylaşılan ModelRegistry'yi döndürür.
+
+    Returns:
+        ModelRegistry: Paylaşılan registry
+
+    Örnek:
+        >>> registry = get_model_registry()
+        >>> model = registry.get_model("large-v3-turbo", "cpu", "int8")
+    """
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
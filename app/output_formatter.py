@@ -12,10 +12,19 @@ Ana Görevler:
 """
 
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Tuple, Union
 from datetime import datetime
 from loguru import logger
+import bisect
 import json
+from app.json_stream import iter_json_array, load_json, read_json_sections, write_json
+from app.transcript_schema import (
+    compact_transcript,
+    expand_transcript,
+    iter_expanded_timeline,
+    skip_unused_header_section
+)
+import config.settings as settings
 
 
 class OutputFormatter:
@@ -75,34 +84,19 @@ class OutputFormatter:
             logger.warning("Diarization sonucu yok, tüm segmentler 'SPEAKER_00' olarak işaretlenecek")
 
         # Her transcription segmentine konuşmacı ata
-        merged_segments = []
-
-        for trans_seg in trans_segments:
-            # Bu segment'in başlangıç ve bitiş zamanları
-            trans_start = trans_seg["start"]
-            trans_end = trans_seg["end"]
-
-            # Konuşmacı ata
-            if has_diarization:
-                # Bu zaman aralığında hangi konuşmacı(lar) konuşuyor?
-                speaker = OutputFormatter._find_speaker_for_segment(
-                    trans_start,
-                    trans_end,
-                    diarization
-                )
-            else:
-                # Diarization yok, hepsini SPEAKER_00 yap
-                speaker = "SPEAKER_00"
-
-            # Birleştirilmiş segment oluştur
-            merged_segments.append({
-                "start": trans_start,
-                "end": trans_end,
-                "duration": round(trans_end - trans_start, 2),
-                "speaker": speaker,
-                "text": trans_seg["text"].strip(),
-                "confidence": trans_seg.get("confidence", 0.0)
-            })
+        if has_diarization:
+            # Bu zaman aralığında hangi konuşmacı(lar) konuşuyor?
+            # Diarization bir kez sıralanır, her segment ikili aramayla eşleştirilir
+            speakers = OutputFormatter._assign_speakers(trans_segments, diarization)
+        else:
+            # Diarization yok, hepsini SPEAKER_00 yap
+            speakers = ["SPEAKER_00"] * len(trans_segments)
+
+        # Birleştirilmiş segmentler oluştur
+        merged_segments = [
+            OutputFormatter.merge_segment(trans_seg, speaker)
+            for trans_seg, speaker in zip(trans_segments, speakers)
+        ]
 
         # Konuşmacılara göre grupla
         speakers_data = OutputFormatter._group_by_speaker(merged_segments, diarization if has_diarization else None)
@@ -143,6 +137,181 @@ class OutputFormatter:
 
         return result
 
+    @staticmethod
+    def merge_segment(trans_seg: Dict, speaker: str) -> Dict:
+        """
+        Tek bir transcription segmentini timeline formatına çevirir.
+
+        merge_results() ve akış (streaming) yazıcıları aynı formatı üretsin
+        diye ortak kullanılır.
+
+        Args:
+            trans_seg: Transcription segmenti {"start", "end", "text", "confidence"}
+            speaker: Atanan konuşmacı etiketi
+
+        Returns:
+            Dict: {"start", "end", "duration", "speaker", "text", "confidence"}
+        """
+        return {
+            "start": trans_seg["start"],
+            "end": trans_seg["end"],
+            "duration": round(trans_seg["end"] - trans_seg["start"], 2),
+            "speaker": speaker,
+            "text": trans_seg["text"].strip(),
+            "confidence": trans_seg.get("confidence", 0.0)
+        }
+
+    @staticmethod
+    def _assign_speakers(trans_segments: List[Dict], diarization: List[Dict]) -> List[str]:
+        """
+        Tüm transcription segmentlerine konuşmacı atar.
+
+        _find_speaker_for_segment() ile birebir aynı sonucu verir ama her
+        segment için tüm diarization listesini taramaz:
+        - Konuşmacı turları bir kez başlangıca göre sıralanır; bitişlerin
+          önek maksimumu (prefix max) tutulur
+        - Örtüşen turlar: bitişi segment başından sonra olabilecek ilk tur
+          ile başlangıcı segment sonundan önce olan son tur arası (bisect)
+        - Örtüşme yoksa en yakın başlangıç / bitiş, sıralı listelerde
+          ikili aramayla bulunur
+
+        Karmaşıklık: O((N + M) log M + K), K = toplam örtüşen tur sayısı
+        (eski yöntem O(N·M)).
+
+        Eşitlik kuralları korunur: En çok örtüşen, eşitse diarization
+        listesinde önce gelen tur seçilir; en yakın tur için de aynısı.
+
+        Args:
+            trans_segments: Transcription segmentleri [{"start", "end", ...}]
+            diarization: Diarization sonuçları [{"speaker", "start", "end"}]
+
+        Returns:
+            List[str]: Segment sırasıyla konuşmacı etiketleri
+        """
+        if not diarization:
+            return ["SPEAKER_UNKNOWN"] * len(trans_segments)
+
+        # Başlangıca göre sıralı turlar (eşit başlangıçta orijinal sıra korunur)
+        by_start = sorted(range(len(diarization)), key=lambda i: diarization[i]["start"])
+        sorted_starts = [diarization[i]["start"] for i in by_start]
+
+        # prefix_max_end[k]: by_start[0..k] turlarının en büyük bitişi
+        prefix_max_end = []
+        running_max = float("-inf")
+        for i in by_start:
+            running_max = max(running_max, diarization[i]["end"])
+            prefix_max_end.append(running_max)
+
+        # En yakın bitiş araması için bitişe göre sıralı turlar
+        by_end = sorted(range(len(diarization)), key=lambda i: diarization[i]["end"])
+        sorted_ends = [diarization[i]["end"] for i in by_end]
+
+        speakers = []
+        num_approximate = 0
+
+        for trans_seg in trans_segments:
+            start = trans_seg["start"]
+            end = trans_seg["end"]
+
+            # Aday aralık: [first, last) dışındaki turlar örtüşemez
+            # first: Önceki tüm turlar segment başlamadan bitmiş
+            # last: Sonraki tüm turlar segment bittikten sonra başlıyor
+            first = bisect.bisect_right(prefix_max_end, start)
+            last = bisect.bisect_left(sorted_starts, end)
+
+            max_overlap = 0
+            best_index = None
+
+            for k in range(first, last):
+                index = by_start[k]
+                dia_seg = diarization[index]
+
+                # Örtüşme hesapla (overlap) - _find_speaker_for_segment ile aynı formül
+                overlap = min(end, dia_seg["end"]) - max(start, dia_seg["start"])
+
+                if overlap > max_overlap or (overlap == max_overlap and best_index is not None and index < best_index):
+                    max_overlap = overlap
+                    best_index = index
+
+            if best_index is None:
+                # Hiç örtüşme yoksa en yakın tur (tek toplu uyarı aşağıda)
+                num_approximate += 1
+                best_index = OutputFormatter._find_nearest_turn(
+                    start, end, sorted_starts, by_start, sorted_ends, by_end
+                )
+
+            speakers.append(diarization[best_index]["speaker"])
+
+        if num_approximate:
+            logger.warning(
+                f"{num_approximate} segment için tam örtüşme bulunamadı, "
+                f"en yakın konuşmacı turu ile yaklaşık eşleştirme yapıldı"
+            )
+
+        return speakers
+
+    @staticmethod
+    def _find_nearest_turn(
+        start: float,
+        end: float,
+        sorted_starts: List[float],
+        by_start: List[int],
+        sorted_ends: List[float],
+        by_end: List[int]
+    ) -> int:
+        """
+        Segmente en yakın konuşmacı turunu bulur (örtüşme yokken).
+
+        Uzaklık: min(|start - tur_başı|, |end - tur_sonu|) - en küçük uzaklığa
+        sahip turlardan diarization listesinde önce geleni seçilir.
+
+        Returns:
+            int: Turun diarization listesindeki indeksi
+        """
+        start_distance, start_candidates = OutputFormatter._nearest_values(start, sorted_starts, by_start)
+        end_distance, end_candidates = OutputFormatter._nearest_values(end, sorted_ends, by_end)
+
+        min_distance = min(start_distance, end_distance)
+        candidates = []
+        if start_distance == min_distance:
+            candidates.extend(start_candidates)
+        if end_distance == min_distance:
+            candidates.extend(end_candidates)
+
+        return min(candidates)
+
+    @staticmethod
+    def _nearest_values(value: float, sorted_values: List[float], order: List[int]):
+        """
+        Sıralı listede value'ya en yakın değer(ler)i bulur.
+
+        Uzaklık eşit olan tüm değerler (iki yandaki ve tekrar eden değerler)
+        döndürülür; eşitlik kuralını çağıran uygular.
+
+        Returns:
+            Tuple[float, List[int]]: (en küçük uzaklık, orijinal indeksler)
+        """
+        position = bisect.bisect_left(sorted_values, value)
+
+        min_distance = float("inf")
+        if position > 0:
+            min_distance = abs(value - sorted_values[position - 1])
+        if position < len(sorted_values):
+            min_distance = min(min_distance, abs(value - sorted_values[position]))
+
+        # Uzaklık iki yönde de monoton artar: eşit uzaklıktakiler bitişiktir
+        candidates = []
+        k = position - 1
+        while k >= 0 and abs(value - sorted_values[k]) == min_distance:
+            candidates.append(order[k])
+            k -= 1
+        k = position
+        while k < len(sorted_values) and abs(value - sorted_values[k]) == min_distance:
+            candidates.append(order[k])
+            k += 1
+
+        return min_distance, candidates
+
     @staticmethod
     def _find_speaker_for_segment(
         start: float,
@@ -152,6 +321,9 @@ class OutputFormatter:
         """
         Belirli bir zaman aralığında konuşan kişiyi bulur.
 
+        Not: merge_results() artık _assign_speakers() kullanır; bu fonksiyon
+        tek segmentlik sorgular ve referans (doğrulama) için korunur.
+
         Mantık:
         1. Transcription segment'i ile diarization segment'lerini karşılaştır
         2. En çok örtüşen (overlap) konuşmacıyı bul
@@ -288,15 +460,25 @@ class OutputFormatter:
     def save_to_json(
         result: Dict,
         output_path: Union[str, Path],
-        pretty: bool = True
+        pretty: bool = True,
+        schema_version: int = None
     ) -> Path:
         """
         Sonucu JSON dosyasına kaydeder.
 
+        Bölümler ve timeline segmentleri json_stream ile tek tek yazılır;
+        orjson kuruluysa kullanılır.
+
         Args:
             result: merge_results()'dan dönen sonuç
             output_path: JSON dosyası yolu
-            pretty: Güzel formatlanmış mı? (indent, sort_keys)
+            pretty: Güzel formatlanmış mı?
+                True: 2 boşluk girinti (json.dump(indent=2) ile aynı düzen)
+                False: Kompakt JSON (küçük dosya boyutu)
+            schema_version: Çıktı şeması (bkz. app/transcript_schema.py)
+                2: Kompakt (segmentler tekrar edilmez, zamanlar milisaniye)
+                1: Eski format (metadata, speakers, timeline, full_transcript)
+                Verilmezse settings.OUTPUT_SCHEMA_VERSION kullanılır
 
         Returns:
             Path: Oluşturulan dosya yolu
@@ -308,22 +490,12 @@ class OutputFormatter:
 
         logger.info(f"JSON dosyası kaydediliyor: {output_path}")
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if pretty:
-                # Güzel formatlı JSON
-                # indent=2: Her seviye 2 boşluk girintili
-                # ensure_ascii=False: Türkçe karakterleri koru
-                # sort_keys=True: Anahtarları alfabetik sırala
-                json.dump(
-                    result,
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                    sort_keys=False  # Metadata üstte kalsın
-                )
-            else:
-                # Kompakt JSON (küçük dosya boyutu)
-                json.dump(result, f, ensure_ascii=False)
+        schema_version = schema_version or settings.OUTPUT_SCHEMA_VERSION
+        data = compact_transcript(result) if schema_version >= 2 else expand_transcript(result)
+
+        # ensure_ascii=False eşdeğeri: Türkçe karakterler korunur
+        # Anahtar sırası korunur: Metadata üstte kalsın
+        write_json(data, output_path, indent=2 if pretty else None)
 
         # Dosya boyutu
         file_size_kb = output_path.stat().st_size / 1024
@@ -335,12 +507,20 @@ class OutputFormatter:
         return output_path
 
     @staticmethod
-    def load_from_json(json_path: Union[str, Path]) -> Dict:
+    def load_from_json(json_path: Union[str, Path], skip_sections: Tuple[str, ...] = ()) -> Dict:
         """
         JSON dosyasından sonuç yükler.
 
+        Eski (v1) ve kompakt (v2) şemaların ikisi de okunur; sonuç her zaman
+        merge_results() formatındadır (v2'deki konuşmacı aralıkları segment
+        listelerine, milisaniyeler saniyeye açılır, full_transcript türetilir).
+
         Args:
             json_path: JSON dosyası yolu
+            skip_sections: Yüklenmeyecek bölümler (ör. ("timeline", "full_transcript"))
+                Atlanan bölümler belleğe alınmadan geçilir; timeline gerekirse
+                iter_timeline() ile segment segment okunabilir
+                (v2 dosyada timeline atlanırsa speakers aralıklarla döner)
 
         Returns:
             Dict: Yüklenmiş sonuç
@@ -356,19 +536,52 @@ class OutputFormatter:
 
         logger.info(f"JSON dosyası yükleniyor: {json_path}")
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            result = json.load(f)
+        if skip_sections:
+            result = read_json_sections(json_path, skip_keys=skip_sections)
+        else:
+            result = load_json(json_path)
+
+        result = expand_transcript(result)
 
         logger.success(f"JSON başarıyla yüklendi")
         return result
 
+    @staticmethod
+    def iter_timeline(json_path: Union[str, Path]) -> Iterator[Dict]:
+        """
+        JSON dosyasındaki timeline segmentlerini tek tek üretir.
+
+        Dosyanın tamamı belleğe alınmaz; yüzlerce MB'lık çıktılar sabit
+        bellekle işlenebilir. Her iki şemada da segmentler merge_results()
+        formatında üretilir.
+
+        Args:
+            json_path: JSON dosyası yolu
+
+        Yields:
+            Dict: Timeline segmenti {"start", "end", "speaker", "text", ...}
+        """
+        json_path = Path(json_path)
+
+        if not json_path.exists():
+            raise FileNotFoundError(f"JSON dosyası bulunamadı: {json_path}")
+
+        # v2: Konuşmacı aralıkları timeline'dan önce gelir, segmentlere uygulanır
+        # v1: speakers (segment kopyaları) okunmadan atlanır
+        header = {}
+        segments = iter_json_array(
+            json_path, "timeline", header=header, skip_section=skip_unused_header_section
+        )
+        yield from iter_expanded_timeline(header, segments)
+
     @staticmethod
     def export_to_text(result: Dict, output_path: Union[str, Path]) -> Path:
         """
         Sonucu okunabilir metin dosyasına dönüştürür.
 
         Args:
-            result: merge_results()'dan dönen sonuç
+            result: merge_results()'dan dönen sonuç veya yüklenmiş JSON
+                (eski ve kompakt şema)
             output_path: Text dosyası yolu
 
         Returns:
@@ -378,6 +591,7 @@ class OutputFormatter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Text dosyası oluşturuluyor: {output_path}")
+        result = expand_transcript(result)
 
         with open(output_path, 'w', encoding='utf-8') as f:
             # Başlık
@@ -0,0 +1,348 @@
+"""
+Örnekleyici Profiler Modülü
+===========================
+Bu modül bir işi düşük ek yükle profiller: ayrı bir thread belirli
+aralıklarla (settings.PROFILE_INTERVAL_MS) tüm thread'lerin Python
+yığınlarını (sys._current_frames) okur ve örnekleri pipeline aşamasına
+göre (app.metrics.StageMetrics aşama adları) gruplar.
+
+Neden Gerekli?
+--------------
+- Yavaş bir işte zamanın moviepy / ffmpeg'de mi, CTranslate2'de mi, yoksa
+  bizim Python kodumuzda mı geçtiği aşama metriklerinden görülmüyor
+- cProfile her fonksiyon çağrısını izler (decode döngüsünde ciddi yavaşlama);
+  örnekleyici profiler kodu hiç değiştirmez, maliyeti örnek sayısıyla
+  sınırlıdır (varsayılan 100 Hz, tipik olarak %1'in altında): üretim
+  işlerinde de açılabilir
+- Native kod (CTranslate2, numpy, ffmpeg alt süreci) GIL'i bıraktığı için
+  örnekleme onu durdurmaz; süre native çağrıyı yapan Python satırında görünür
+  (ör. faster_whisper/transcribe.py: generate_segment_with_fallback)
+
+Çıktılar (çıktı JSON'unun yanında, aşama başına):
+    <video>_output_profile_<aşama>.speedscope.json   https://www.speedscope.app
+    <video>_output_profile_<aşama>.folded            (PROFILE_FORMAT=collapsed;
+                                                      flamegraph.pl, speedscope)
+    <video>_output_profile_memory.txt                (memory=True: tracemalloc,
+                                                      aşama başına en çok ayıranlar)
+
+Örnekler duvar saati süresiyle ağırlıklandırılır (CPU değil): bekleme
+(ffmpeg alt süreci, disk, kuyruk) da görünür. Yığının kökü thread adıdır.
+
+Aşama dışında kalan örnekler: profiler'ı başlatan thread'de "other",
+profiler başladıktan sonra açılan thread'lerde (paralel parça worker'ları,
+ffmpeg okuyucuları) o an açık olan aşama. Profiler başlamadan önce var olan
+diğer thread'ler (ör. Streamlit sunucusu) bir aşamaya girmedikçe sayılmaz.
+
+Örnek:
+    >>> profiler = SamplingProfiler(memory=True)
+    >>> profiler.start()
+    >>> metrics = StageMetrics(profiler=profiler)
+    >>> with metrics.stage("extract"):
+    ...     audio = extract_audio_to_array(video_path)
+    >>> profiler.stop()
+    >>> profiler.write(Path("outputs/mulakat_output.json"))
+    [PosixPath('outputs/mulakat_output_profile_extract.speedscope.json'), ...]
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from loguru import logger
+import config.settings as settings
+
+
+# Aşama dışında, profiler'ı başlatan thread'de alınan örnekler
+OTHER_STAGE = "other"
+
+
+class SamplingProfiler:
+    """
+    Aşama bazlı örnekleyici profiler.
+
+    Thread-safe: Aşamalar farklı thread'lerde açılıp kapanabilir.
+    """
+
+    def __init__(self, interval_ms: float = None, memory: bool = False, output_format: str = None):
+        """
+        SamplingProfiler başlatıcı.
+
+        Args:
+            interval_ms: Örnekleme aralığı (ms); verilmezse settings.PROFILE_INTERVAL_MS
+            memory: tracemalloc ile aşama başına bellek ayıranlar da kaydedilsin mi?
+                (ayırma yoğun Python kodunu belirgin yavaşlatır, ayrıca açılır)
+            output_format: "speedscope" veya "collapsed"; verilmezse settings.PROFILE_FORMAT
+        """
+        self.interval = (interval_ms or settings.PROFILE_INTERVAL_MS) / 1000
+        self.memory = memory
+        self.output_format = output_format or settings.PROFILE_FORMAT
+
+        # aşama -> {(thread adı, code nesneleri kökten yaprağa): toplam süre}
+        self.samples: Dict[str, Dict[tuple, float]] = {}
+        self.sample_count = 0
+        self.memory_stages: List[Dict] = []
+
+        self._lock = threading.Lock()
+        self._thread_stages: Dict[int, List[str]] = {}
+        self._active_stages: List[str] = []
+        self._ignored_threads = set()
+        self._owner_thread = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+        self._memory_snapshot = None
+
+    # --- Yaşam döngüsü ---
+
+    def start(self):
+        """Örneklemeyi başlatır (çağıran thread işin ana thread'i sayılır)."""
+        self._owner_thread = threading.get_ident()
+        # Önceden var olan thread'ler (UI, HTTP sunucusu, ...) aşamaya girmedikçe sayılmaz
+        self._ignored_threads = set(sys._current_frames()) - {self._owner_thread}
+
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(settings.PROFILE_TRACEMALLOC_FRAMES)
+                self._started_tracemalloc = True
+            self._memory_snapshot = tracemalloc.take_snapshot()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        logger.info(f"Profiler başladı ({1 / self.interval:.0f} Hz{', tracemalloc' if self.memory else ''})")
+
+    def stop(self):
+        """Örneklemeyi durdurur (tekrar çağrılabilir)."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._memory_snapshot = None
+
+    # --- Aşama sınırları (StageMetrics.stage() çağırır) ---
+
+    def enter_stage(self, name: str):
+        """Çağıran thread'in örnekleri bu aşamaya yazılır."""
+        with self._lock:
+            self._thread_stages.setdefault(threading.get_ident(), []).append(name)
+            self._active_stages.append(name)
+
+        if self.memory and tracemalloc.is_tracing() and hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    def exit_stage(self, name: str):
+        """Aşamayı kapatır (memory=True ise aşamanın bellek farkını kaydeder)."""
+        with self._lock:
+            stack = self._thread_stages.get(threading.get_ident())
+            if stack:
+                stack.pop()
+            if name in self._active_stages:
+                # Son açılan aynı adlı aşama kapanır
+                del self._active_stages[len(self._active_stages) - 1 - self._active_stages[::-1].index(name)]
+
+        if self.memory and tracemalloc.is_tracing() and self._memory_snapshot is not None:
+            self._record_memory(name)
+
+    def _record_memory(self, stage: str):
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        top = snapshot.compare_to(self._memory_snapshot, "lineno")[:settings.PROFILE_TOP_ALLOCATORS]
+        self._memory_snapshot = snapshot
+
+        with self._lock:
+            self.memory_stages.append({
+                "stage": stage,
+                "peak_bytes": peak,
+                "top": [
+                    {
+                        "location": f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                        "size_diff": stat.size_diff,
+                        "size": stat.size,
+                        "count_diff": stat.count_diff
+                    }
+                    for stat in top if stat.size_diff
+                ]
+            })
+
+    # --- Örnekleme ---
+
+    def _run(self):
+        own_thread = threading.get_ident()
+        last = time.perf_counter()
+
+        while not self._stop_event.wait(self.interval):
+            now = time.perf_counter()
+            # Ağırlık: gerçek geçen süre (GIL beklemesi aralığı uzatabilir)
+            self._sample(now - last, own_thread)
+            last = now
+
+    def _sample(self, weight: float, own_thread: int):
+        frames = sys._current_frames()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+        with self._lock:
+            for thread_id, frame in frames.items():
+                if thread_id == own_thread:
+                    continue
+
+                stack = self._thread_stages.get(thread_id)
+                if stack:
+                    stage = stack[-1]
+                elif thread_id == self._owner_thread:
+                    stage = OTHER_STAGE
+                elif thread_id in self._ignored_threads or not self._active_stages:
+                    continue
+                else:
+                    stage = self._active_stages[-1]
+
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                codes.reverse()
+
+                key = (names.get(thread_id, f"thread-{thread_id}"), tuple(codes))
+                stage_samples = self.samples.setdefault(stage, {})
+                stage_samples[key] = stage_samples.get(key, 0.0) + weight
+
+            self.sample_count += 1
+
+    # --- Çıktı ---
+
+    def write(self, output_path: Path) -> List[Path]:
+        """
+        Profil dosyalarını çıktı JSON'unun yanına yazar.
+
+        Args:
+            output_path: İşin çıktı JSON yolu (dosya adları bundan türetilir)
+
+        Returns:
+            List[Path]: Yazılan dosyalar
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        base = output_path.with_suffix("")
+        paths = []
+
+        with self._lock:
+            samples = {stage: dict(stacks) for stage, stacks in self.samples.items()}
+            memory_stages = list(self.memory_stages)
+
+        for stage, stacks in samples.items():
+            if self.output_format == "collapsed":
+                path = Path(f"{base}_profile_{stage}.folded")
+                path.write_text(_to_collapsed(stacks), encoding="utf-8")
+            else:
+                path = Path(f"{base}_profile_{stage}.speedscope.json")
+                path.write_text(
+                    json.dumps(_to_speedscope(stacks, f"{output_path.stem} - {stage}"), ensure_ascii=False),
+                    encoding="utf-8"
+                )
+            paths.append(path)
+
+        if memory_stages:
+            path = Path(f"{base}_profile_memory.txt")
+            path.write_text(_memory_report(memory_stages), encoding="utf-8")
+            paths.append(path)
+
+        logger.info(f"Profil yazıldı: {len(paths)} dosya, {self.sample_count} örnek ({base}_profile_*)")
+        return paths
+
+
+def _short_path(filename: str) -> str:
+    """Dosya yolunun son iki bileşeni (faster_whisper/transcribe.py)."""
+    parts = Path(filename).parts
+    return os.path.join(*parts[-2:]) if len(parts) >= 2 else filename
+
+
+def _frame_name(code) -> str:
+    """Yığın çerçevesi adı: fonksiyon (dosya:satır)."""
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _to_collapsed(stacks: Dict[tuple, float]) -> str:
+    """
+    Collapsed-stack formatı: "thread;çerçeve;...;yaprak <değer>" satırları.
+
+    Değer mikrosaniyedir (araçlar tam sayı bekler).
+    """
+    lines = []
+    for (thread_name, codes), seconds in sorted(stacks.items(), key=lambda item: -item[1]):
+        frames = [thread_name] + [_frame_name(code).replace(";", ":") for code in codes]
+        lines.append(f"{';'.join(frames)} {max(1, round(seconds * 1_000_000))}")
+    return "\n".join(lines) + "\n"
+
+
+def _to_speedscope(stacks: Dict[tuple, float], name: str) -> Dict:
+    """Speedscope dosya formatı (tek "sampled" profil, birim: saniye)."""
+    frames = []
+    frame_index = {}
+
+    def index_of(key, frame: Dict) -> int:
+        if key not in frame_index:
+            frame_index[key] = len(frames)
+            frames.append(frame)
+        return frame_index[key]
+
+    samples = []
+    weights = []
+    for (thread_name, codes), seconds in stacks.items():
+        sample = [index_of(("thread", thread_name), {"name": thread_name})]
+        for code in codes:
+            sample.append(index_of(code, {
+                "name": getattr(code, "co_qualname", code.co_name),
+                "file": code.co_filename,
+                "line": code.co_firstlineno
+            }))
+        samples.append(sample)
+        weights.append(round(seconds, 6))
+
+    total = round(sum(weights), 6)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "video-to-text",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": total,
+            "samples": samples,
+            "weights": weights
+        }]
+    }
+
+
+def _memory_report(memory_stages: List[Dict]) -> str:
+    """tracemalloc raporu: aşama başına tepe ve en çok ayıran satırlar."""
+    lines = [
+        "# tracemalloc: aşama başına en çok bellek ayıran satırlar",
+        "# (fark: önceki aşama sonuna göre, aşama sonunda hâlâ ayrılmış bellek)",
+        ""
+    ]
+    for entry in memory_stages:
+        lines.append(f"## {entry['stage']} (tepe: {entry['peak_bytes'] / 1024 / 1024:.1f} MB)")
+        for stat in entry["top"]:
+            lines.append(
+                f"  {stat['size_diff'] / 1024:+12.1f} KB  {stat['count_diff']:+8d} blok  "
+                f"(toplam {stat['size'] / 1024:.1f} KB)  {stat['location']}"
+            )
+        lines.append("")
+    return "\n".join(lines)
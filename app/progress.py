@@ -0,0 +1,211 @@
+"""
+İlerleme Takibi Modülü
+======================
+Bu modül process_video() ilerleme bildirimlerinden (progress_callback)
+zamana dayalı ilerleme ve kalan süre tahmini üretir; işi arka plan
+thread'inde çalıştırıp iptal edilebilir hale getirir (Web UI için).
+
+Neden Gerekli?
+--------------
+- Web UI process_video() dönene kadar bloklanıyordu; ilerleme çubuğu %10'da
+  kalıyor, metin ancak iş bitince görünüyordu ve iş iptal edilemiyordu
+- İlerleme = son decode edilen segmentin bitişi / ses süresi (probe)
+- Kalan süre = kalan ses x gözlenen RTF (gerçek zaman oranı:
+  geçen süre / decode edilen ses süresi)
+
+Örnek:
+    >>> job = BackgroundJob(lambda callback: process_video(..., progress_callback=callback))
+    >>> job.start()
+    >>> job.snapshot()      # UI her yenilemede okur
+    {"status": "running", "stage": "transcribe", "progress": 0.42, "eta_seconds": 95.0, ...}
+    >>> job.cancel()        # Decode bir sonraki segmentte durur
+"""
+
+from typing import Callable, Dict, List, Optional
+import threading
+import time
+from loguru import logger
+
+
+# RTF tahmini için en az ölçüm süresi (saniye)
+# Model ısınırken ilk segmentler tahmini yanıltmasın
+MIN_RATE_WINDOW_SECONDS = 2.0
+
+
+class ProcessingCancelled(Exception):
+    """İşlem kullanıcı tarafından iptal edildi."""
+    pass
+
+
+class ProgressTracker:
+    """
+    İlerleme bildirimlerini toplar; ilerleme oranı, RTF ve kalan süreyi hesaplar.
+
+    update() process_video()'nun progress_callback imzasına uyar; sunucu
+    modunda iş durumu (GET /jobs/<id>) da aynı alanlarla verilebilir.
+    Thread-safe: Bildirimler işlem thread'inden, snapshot() UI'dan çağrılır.
+    """
+
+    def __init__(self):
+        """ProgressTracker başlatıcı."""
+        self._lock = threading.Lock()
+        self.stage = None
+        self.processed_seconds = 0.0
+        self.audio_duration = None
+        self.num_segments = 0
+        self.texts: List[str] = []
+        self.started_at = time.monotonic()
+
+        # RTF ölçümünün başladığı an: (zaman, o andaki processed_seconds)
+        self._rate_start = None
+
+    def update(self, event: Dict):
+        """
+        Bir ilerleme bildirimini işler.
+
+        Args:
+            event: {"stage", "processed_seconds", "audio_duration",
+                "num_segments", "segment", "restored"} (hepsi opsiyonel)
+        """
+        with self._lock:
+            self.stage = event.get("stage") or self.stage
+            if event.get("audio_duration"):
+                self.audio_duration = event["audio_duration"]
+            if event.get("processed_seconds") is not None:
+                self.processed_seconds = event["processed_seconds"]
+            if event.get("num_segments") is not None:
+                self.num_segments = event["num_segments"]
+            if event.get("segment") is not None:
+                self.texts.append(event["segment"]["text"])
+
+            # RTF ilk decode edilen segmentten ölçülür; model yükleme süresi ve
+            # checkpoint'ten geri yüklenen segmentler (anında gelir) dahil edilmez
+            if self.stage != "transcribe" or event.get("restored"):
+                self._rate_start = None
+            elif self._rate_start is None and self.processed_seconds > 0:
+                self._rate_start = (time.monotonic(), self.processed_seconds)
+
+    def clear_text(self):
+        """Toplanan metni siler (sunucuda iş baştan yazıldıysa)."""
+        with self._lock:
+            self.texts = []
+
+    def snapshot(self) -> Dict:
+        """
+        Anlık durum.
+
+        Returns:
+            Dict: {
+                "stage": "transcribe",
+                "progress": 0.42,           # processed / duration (0-1)
+                "processed_seconds": 1512.0,
+                "audio_duration": 3600.0,
+                "num_segments": 410,
+                "rtf": 0.35,                # None = henüz ölçülmedi
+                "eta_seconds": 730.8,       # None = henüz tahmin yok
+                "elapsed_seconds": 612.4,
+                "text": "..."               # Şu ana kadar decode edilen metin
+            }
+        """
+        with self._lock:
+            duration = self.audio_duration
+            processed = self.processed_seconds
+            progress = min(processed / duration, 1.0) if duration else 0.0
+
+            rtf = None
+            eta_seconds = None
+            if self._rate_start is not None and self.stage == "transcribe":
+                rate_time, rate_processed = self._rate_start
+                wall = time.monotonic() - rate_time
+                decoded = processed - rate_processed
+                if wall >= MIN_RATE_WINDOW_SECONDS and decoded > 0:
+                    rtf = wall / decoded
+                    if duration:
+                        eta_seconds = max(duration - processed, 0.0) * rtf
+
+            return {
+                "stage": self.stage,
+                "progress": progress,
+                "processed_seconds": processed,
+                "audio_duration": duration,
+                "num_segments": self.num_segments,
+                "rtf": rtf,
+                "eta_seconds": eta_seconds,
+                "elapsed_seconds": time.monotonic() - self.started_at,
+                "text": " ".join(self.texts)
+            }
+
+
+class BackgroundJob:
+    """
+    Uzun süren bir işlemi (process_video) arka plan thread'inde çalıştırır.
+
+    Hedef fonksiyon tek argüman olarak progress_callback alır ve sonucu
+    döndürür. İptal edilince callback bir sonraki bildirimde
+    ProcessingCancelled fırlatır; decode (generator) orada durur.
+
+    Durumlar: pending -> running -> done / failed / cancelled
+    """
+
+    def __init__(self, target: Callable[[Callable[[Dict], None]], Dict]):
+        """
+        BackgroundJob başlatıcı.
+
+        Args:
+            target: target(progress_callback) -> sonuç
+        """
+        self.target = target
+        self.tracker = ProgressTracker()
+        self.status = "pending"
+        self.result: Optional[Dict] = None
+        self.error: Optional[BaseException] = None
+        self._cancel_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """İşlemi başlatır (hemen döner)."""
+        self.status = "running"
+        self._thread = threading.Thread(target=self._run, name="background-job", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self.result = self.target(self._on_progress)
+            self.status = "done"
+        except ProcessingCancelled:
+            logger.info("İşlem iptal edildi")
+            self.status = "cancelled"
+        except Exception as e:
+            logger.error(f"Arka plan işlemi başarısız: {e}")
+            self.error = e
+            self.status = "failed"
+
+    def _on_progress(self, event: Dict):
+        if self._cancel_event.is_set():
+            raise ProcessingCancelled()
+        self.tracker.update(event)
+
+    def cancel(self):
+        """İptal ister; işlem bir sonraki ilerleme bildiriminde durur."""
+        self._cancel_event.set()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
+
+    def join(self, timeout: float = None):
+        """İşlem bitene kadar bekler."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def snapshot(self) -> Dict:
+        """ProgressTracker.snapshot() + durum ve iptal bilgisi."""
+        return {
+            **self.tracker.snapshot(),
+            "status": self.status,
+            "cancel_requested": self.cancel_requested
+        }
@@ -0,0 +1,304 @@
+"""
+Question-Answer Alignment Engine
+================================
+Finds where each interview question is actually spoken in the timeline.
+
+Equal time segmentation assumes every answer has the same length, which is
+rarely true. This module locates the questions themselves in the transcript
+so answer boundaries can be placed at the real question positions:
+
+1. Normalize text (Turkish-aware lowercasing and diacritic folding)
+2. Build a character trigram inverted index over timeline segments
+   (trigrams tolerate ASR spelling errors and paraphrased suffixes)
+3. Score candidate windows (1-2 consecutive segments) per question with
+   IDF-weighted trigram containment
+4. Pick one window per question with a monotonic dynamic-programming
+   alignment (questions are asked in order); questions that cannot be
+   located are skipped instead of forcing a bad match
+
+Cost is near-linear in timeline length: indexing is O(total characters) and
+each question only touches the postings of its own trigrams (very common
+trigrams are ignored).
+"""
+
+from typing import Dict, List, Optional, Set
+import math
+import re
+import unicodedata
+
+
+# Direct folding for common Turkish/Latin letters (fast path, no NFKD needed)
+# "İ".lower() yields "i" + combining dot (U+0307), which is dropped
+_TURKISH_FOLD = str.maketrans({
+    "ç": "c", "ğ": "g", "ı": "i", "ö": "o", "ş": "s", "ü": "u",
+    "â": "a", "î": "i", "û": "u", "\u0307": None
+})
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for fuzzy matching.
+
+    - Lowercase (İ/I and i/ı all fold to "i")
+    - Strip diacritics (ç->c, ğ->g, ö->o, ş->s, ü->u, â->a)
+    - Replace punctuation with spaces and collapse whitespace
+
+    Args:
+        text: Raw text
+
+    Returns:
+        str: Normalized text, e.g. "Kendinizden BAHSEDER misiniz?" -> "kendinizden bahseder misiniz"
+    """
+    text = text.lower().translate(_TURKISH_FOLD)
+
+    # Other accented letters (é, ñ, ...) are rare; decompose only when present
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def char_ngrams(text: str, n: int = 3) -> Set[str]:
+    """
+    Character n-grams of normalized text (word boundaries padded with spaces).
+
+    Args:
+        text: Normalized text
+        n: N-gram length
+
+    Returns:
+        Set[str]: Unique n-grams
+    """
+    if not text:
+        return set()
+
+    padded = f" {text} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class SegmentNgramIndex:
+    """
+    Character trigram inverted index over timeline segment texts.
+
+    Answers "how much of this question appears in segment i (and i+1)?"
+    without comparing the question against every segment.
+    """
+
+    def __init__(
+        self,
+        texts: List[str],
+        max_df_ratio: float = 0.05,
+        vocabulary: Optional[Set[str]] = None
+    ):
+        """
+        Build the index.
+
+        Transcripts reuse a small vocabulary, so normalization and trigram
+        extraction are cached per word: the trigrams of " w1 w2 " are the
+        trigrams of each padded word plus "<last char of w1> <first char of w2>".
+
+        Args:
+            texts: Segment texts in timeline order
+            max_df_ratio: Trigrams found in more than this fraction of segments
+                are ignored for lookup (too common to locate anything, and
+                their postings would dominate query time)
+            vocabulary: Only index these trigrams (e.g. the trigrams of all
+                questions); None indexes everything
+        """
+        self.num_segments = len(texts)
+        self.postings: Dict[str, List[int]] = {}
+
+        token_cache: Dict[str, tuple] = {}
+        word_cache: Dict[str, Set[str]] = {}
+
+        for index, text in enumerate(texts):
+            words = []
+            for token in text.split():
+                normalized = token_cache.get(token)
+                if normalized is None:
+                    normalized = token_cache[token] = tuple(normalize_text(token).split())
+                words.extend(normalized)
+
+            grams = set()
+            for position, word in enumerate(words):
+                word_grams = word_cache.get(word)
+                if word_grams is None:
+                    word_grams = char_ngrams(word)
+                    if vocabulary is not None:
+                        word_grams &= vocabulary
+                    word_cache[word] = word_grams
+                grams |= word_grams
+
+                if position:
+                    cross = f"{words[position - 1][-1]} {word[0]}"
+                    if vocabulary is None or cross in vocabulary:
+                        grams.add(cross)
+
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(index)
+
+        self.max_df = max(50, int(self.num_segments * max_df_ratio))
+
+    def idf(self, gram: str) -> float:
+        """Inverse document frequency weight (rare n-grams weigh more)."""
+        df = len(self.postings.get(gram, ()))
+        return math.log((self.num_segments + 1) / (df + 1)) + 1.0
+
+    def score_windows(self, question: str) -> Dict[int, Dict[str, float]]:
+        """
+        Score every window that shares n-grams with the question.
+
+        Window i covers segments i and i+1 (questions often span a segment
+        boundary). Score = weighted fraction of the question's n-grams found
+        in the window (containment, 0-1).
+
+        Args:
+            question: Question text
+
+        Returns:
+            Dict[int, Dict]: {window_start: {"window": 0.82, "single": 0.75}}
+                "single" is the score of segment i alone
+        """
+        grams = char_ngrams(normalize_text(question))
+        if not grams:
+            return {}
+
+        # Common n-grams are skipped unless the question has nothing else
+        lookup = [gram for gram in grams if len(self.postings.get(gram, ())) <= self.max_df]
+        if not lookup:
+            lookup = list(grams)
+
+        weights = {gram: self.idf(gram) for gram in lookup}
+        total_weight = sum(weights.values())
+
+        window_hits: Dict[int, float] = {}
+        single_hits: Dict[int, float] = {}
+
+        for gram in lookup:
+            weight = weights[gram]
+            last_window = -1
+
+            for segment_index in self.postings.get(gram, ()):
+                single_hits[segment_index] = single_hits.get(segment_index, 0.0) + weight
+
+                # Segment j belongs to windows j-1 and j; each window counts a gram once
+                for window in (segment_index - 1, segment_index):
+                    if window >= 0 and window != last_window:
+                        window_hits[window] = window_hits.get(window, 0.0) + weight
+                        last_window = window
+
+        return {
+            window: {
+                "window": hits / total_weight,
+                "single": single_hits.get(window, 0.0) / total_weight
+            }
+            for window, hits in window_hits.items()
+        }
+
+
+class _MaxFenwick:
+    """Fenwick tree for prefix maximum over positions (value, state id)."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [(float("-inf"), -1)] * (size + 1)
+
+    def update(self, position: int, item):
+        position += 1
+        while position <= self.size:
+            if item > self.tree[position]:
+                self.tree[position] = item
+            position += position & -position
+
+    def query(self, position: int):
+        """Maximum over positions [0, position] (position < 0 -> empty)."""
+        best = (float("-inf"), -1)
+        position += 1
+        while position > 0:
+            if self.tree[position] > best:
+                best = self.tree[position]
+            position -= position & -position
+        return best
+
+
+def align_questions(
+    questions: List[str],
+    segment_texts: List[str],
+    min_score: float = 0.5,
+    top_k: int = 20
+) -> List[Optional[Dict]]:
+    """
+    Locate each question in the timeline with a monotonic alignment.
+
+    Each question is either assigned one window (segment span) or skipped.
+    Assigned spans must appear in question order and must not overlap.
+    Among all such assignments the one with the highest total score wins.
+
+    Args:
+        questions: Questions in the order they were asked
+        segment_texts: Timeline segment texts, sorted by start time
+        min_score: Minimum containment score for a window to be a candidate
+        top_k: Candidates kept per question
+
+    Returns:
+        List[Optional[Dict]]: Per question, None if not located, otherwise
+            {"first_segment": 12, "last_segment": 13, "score": 0.87}
+    """
+    num_segments = len(segment_texts)
+    if not questions or not num_segments:
+        return [None] * len(questions)
+
+    # Segment n-grams that no question contains can never contribute a score
+    vocabulary = set()
+    for question in questions:
+        vocabulary |= char_ngrams(normalize_text(question))
+
+    index = SegmentNgramIndex(segment_texts, vocabulary=vocabulary)
+
+    # Candidate spans per question
+    candidates = []
+    for question in questions:
+        scored = []
+        for window, scores in index.score_windows(question).items():
+            # Window score counts segment i+1 only if it adds enough
+            if scores["single"] >= min_score and scores["single"] >= 0.9 * scores["window"]:
+                scored.append((scores["single"], window, window))
+            elif scores["window"] >= min_score and window + 1 < num_segments:
+                scored.append((scores["window"], window, window + 1))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        candidates.append(scored[:top_k])
+
+    # DP: best total score of an alignment whose last span ends at segment e
+    # states[id] = (question, first, last, score, previous state id)
+    fenwick = _MaxFenwick(num_segments)
+    states = []
+
+    for question_index, question_candidates in enumerate(candidates):
+        # Compute all candidates of this question first (a question matches once)
+        new_states = []
+        for score, first, last in question_candidates:
+            previous_total, previous_id = fenwick.query(first - 1)
+            total = score + max(previous_total, 0.0)
+            new_states.append((total, question_index, first, last, score, previous_id if previous_total > float("-inf") else -1))
+
+        for total, question_idx, first, last, score, previous_id in new_states:
+            states.append((question_idx, first, last, score, previous_id))
+            fenwick.update(last, (total, len(states) - 1))
+
+    # Backtrack from the best final state
+    alignment: List[Optional[Dict]] = [None] * len(questions)
+    _, state_id = fenwick.query(num_segments - 1)
+
+    while state_id >= 0:
+        question_idx, first, last, score, previous_id = states[state_id]
+        alignment[question_idx] = {
+            "first_segment": first,
+            "last_segment": last,
+            "score": score
+        }
+        state_id = previous_id
+
+    return alignment
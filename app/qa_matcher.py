@@ -1,29 +1,41 @@
 """
 Question-Answer Matcher
 =======================
-Matches interview questions to answers using equal time segmentation.
+Matches interview questions to answers.
 
-This module provides simple, deterministic question-answer matching:
+This module provides deterministic question-answer matching:
 1. Read questions from text file (one per line)
-2. Divide video duration into N equal segments
-3. Map each question to its corresponding time segment
-4. Extract transcript text from that segment
+2. Map each question to a time segment:
+   - equal_time_segmentation: Divide video duration into N equal segments
+   - content_alignment: Find where each question is spoken (app/qa_alignment.py)
+3. Extract transcript text from that segment
 """
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
-import json
 from loguru import logger
+from app.json_stream import write_json
+from app.qa_alignment import align_questions
+from app.timeline_index import TimelineIndex
+from app.transcript_schema import expand_transcript
+import config.settings as settings
+
+
+# Supported matching methods (metadata value -> Markdown label)
+MATCHING_METHODS = {
+    "equal_time_segmentation": "Eşit Zaman Segmentasyonu",
+    "content_alignment": "İçerik Hizalama (soru konumları)"
+}
 
 
 class QAMatcher:
     """
     Question-Answer Matcher
 
-    Matches questions to answers using equal time segmentation.
-    This is a simple, deterministic approach that divides the video
-    timeline into equal segments based on the number of questions.
+    Matches questions to answers using equal time segmentation (divides
+    the timeline into equal segments based on the number of questions) or
+    content alignment (places answer boundaries at the spoken questions).
     """
 
     def load_questions(self, questions_path: Path) -> List[str]:
@@ -58,49 +70,67 @@ class QAMatcher:
         logger.info(f"Loaded {len(questions)} questions from {questions_path}")
         return questions
 
-    def create_qa_pairs(self, questions: List[str], transcript_data: Dict) -> Dict:
+    def create_qa_pairs(
+        self,
+        questions: List[str],
+        transcript_data: Dict,
+        matching_method: Optional[str] = None
+    ) -> Dict:
         """
-        Create question-answer pairs using equal time segmentation.
-
-        Algorithm:
-        1. Get video duration D from metadata
-        2. Get number of questions N
-        3. Calculate segment_duration = D / N
-        4. For each question i (0 to N-1):
-           - start_time = i * segment_duration
-           - end_time = (i + 1) * segment_duration (or video end for last question)
-           - Extract all timeline segments in [start_time, end_time]
-           - Concatenate their text to form the answer
-           - Create QA pair
+        Create question-answer pairs.
+
+        Methods:
+        - "equal_time_segmentation": Divide video duration D into N equal
+          segments, question i gets [i * D/N, (i+1) * D/N]
+        - "content_alignment": Locate each question in the transcript text
+          (see app/qa_alignment.py); an answer runs from the end of its
+          question to the start of the next one. Questions that cannot be
+          located share the time between their located neighbours equally.
+
+        For each question the timeline segments in its time range are
+        concatenated to form the answer.
 
         Args:
             questions: List of questions from questions.txt
             transcript_data: Full transcript data from output_formatter
+                (merge_results() result or a loaded JSON, either schema)
+            matching_method: Matching method (default: QA_MATCHING_METHOD)
 
         Returns:
             Dict: QA pairs with metadata
         """
+        # Compact (v2) transcripts are expanded; segments are shared, not copied
+        transcript_data = expand_transcript(transcript_data)
+
+        matching_method = matching_method or settings.QA_MATCHING_METHOD
+        if matching_method not in MATCHING_METHODS:
+            raise ValueError(
+                f"Unknown matching method: {matching_method} "
+                f"(expected one of: {', '.join(MATCHING_METHODS)})"
+            )
+
         # Get video duration
         duration = transcript_data['metadata']['duration_seconds']
         num_questions = len(questions)
 
-        # Calculate segment duration
-        segment_duration = duration / num_questions
+        # Timeline is validated and indexed once; each question is a bisect lookup
+        timeline_index = TimelineIndex.from_transcript(transcript_data)
+
+        if matching_method == "content_alignment":
+            ranges, alignments = self._content_aligned_ranges(questions, timeline_index, duration)
+        else:
+            ranges, alignments = self._equal_time_ranges(num_questions, duration), None
 
-        logger.info(f"Video duration: {duration}s, {num_questions} questions, {segment_duration:.2f}s per question")
+        logger.info(f"Video duration: {duration}s, {num_questions} questions, method: {matching_method}")
 
         # Create QA pairs
         qa_pairs = []
-        timeline = transcript_data['timeline']
 
         for i, question in enumerate(questions):
-            # Calculate time range
-            start_time = i * segment_duration
-            # Last question goes to end of video
-            end_time = duration if i == num_questions - 1 else (i + 1) * segment_duration
+            start_time, end_time = ranges[i]
 
             # Extract segments in this time range
-            segments_in_range = self._extract_segments_in_range(timeline, start_time, end_time)
+            segments_in_range = self._extract_segments_in_range(timeline_index, start_time, end_time)
 
             if not segments_in_range:
                 logger.warning(f"No segments found for Q{i+1} in range [{start_time:.2f}s - {end_time:.2f}s]")
@@ -120,20 +150,37 @@ class QAMatcher:
                 "answer": answer_data
             }
 
+            if alignments is not None:
+                alignment = alignments[i]
+                qa_pair["alignment_score"] = round(alignment["score"], 3) if alignment else 0.0
+                qa_pair["question_time"] = {
+                    "start": round(alignment["start"], 2),
+                    "end": round(alignment["end"], 2)
+                } if alignment else None
+
             qa_pairs.append(qa_pair)
             logger.debug(f"Q{i+1}: {len(segments_in_range)} segments, {answer_data['word_count']} words")
 
         # Build result
+        avg_segment_duration = sum(end - start for start, end in ranges) / num_questions
+
+        metadata = {
+            "video_name": transcript_data['metadata']['video_name'],
+            "duration_seconds": duration,
+            "total_questions": num_questions,
+            "avg_segment_duration": round(avg_segment_duration, 2),
+            "matched_at": datetime.now().isoformat(),
+            "matching_method": matching_method,
+            "questions_source": "questions.txt"
+        }
+
+        if alignments is not None:
+            scores = [alignment["score"] for alignment in alignments if alignment]
+            metadata["aligned_questions"] = len(scores)
+            metadata["mean_alignment_score"] = round(sum(scores) / len(scores), 3) if scores else 0.0
+
         result = {
-            "metadata": {
-                "video_name": transcript_data['metadata']['video_name'],
-                "duration_seconds": duration,
-                "total_questions": num_questions,
-                "avg_segment_duration": round(segment_duration, 2),
-                "matched_at": datetime.now().isoformat(),
-                "matching_method": "equal_time_segmentation",
-                "questions_source": "questions.txt"
-            },
+            "metadata": metadata,
             "qa_pairs": qa_pairs,
             "original_transcript_metadata": {
                 "num_speakers": transcript_data['metadata']['num_speakers'],
@@ -145,7 +192,97 @@ class QAMatcher:
         logger.success(f"Created {num_questions} QA pairs")
         return result
 
-    def _extract_segments_in_range(self, timeline: List[Dict], start: float, end: float) -> List[Dict]:
+    def _equal_time_ranges(self, num_questions: int, duration: float) -> List[Tuple[float, float]]:
+        """
+        Equal time segmentation: question i gets [i * D/N, (i+1) * D/N].
+
+        Args:
+            num_questions: Number of questions N
+            duration: Video duration D (seconds)
+
+        Returns:
+            List[Tuple[float, float]]: (start, end) per question
+        """
+        segment_duration = duration / num_questions
+        ranges = []
+
+        for i in range(num_questions):
+            start_time = i * segment_duration
+            # Last question goes to end of video
+            end_time = duration if i == num_questions - 1 else (i + 1) * segment_duration
+            ranges.append((start_time, end_time))
+
+        return ranges
+
+    def _content_aligned_ranges(
+        self,
+        questions: List[str],
+        timeline_index: TimelineIndex,
+        duration: float
+    ) -> Tuple[List[Tuple[float, float]], List[Optional[Dict]]]:
+        """
+        Answer ranges from question positions found in the transcript.
+
+        Located question k: answer = [end of question k, start of next
+        located question]. Runs of unlocated questions between two anchors
+        split that gap equally (the first anchor is the video start, the
+        last one the video end), so with no located question at all this
+        degrades to equal time segmentation.
+
+        Args:
+            questions: List of questions
+            timeline_index: Indexed timeline
+            duration: Video duration (seconds)
+
+        Returns:
+            Tuple: ([(start, end) per question],
+                    [{"start", "end", "score"} or None per question])
+        """
+        ordered = timeline_index.sorted_segments()
+        matches = align_questions(
+            questions,
+            [segment.get('text', '') for segment in ordered],
+            min_score=settings.QA_ALIGNMENT_MIN_SCORE
+        )
+
+        alignments = [
+            {
+                "start": ordered[match["first_segment"]]['start'],
+                "end": ordered[match["last_segment"]]['end'],
+                "score": match["score"]
+            } if match else None
+            for match in matches
+        ]
+
+        located = sum(1 for alignment in alignments if alignment)
+        logger.info(f"Located {located}/{len(questions)} questions in transcript")
+
+        # Anchors: located questions plus virtual ones at video start and end
+        anchors = [-1] + [k for k, alignment in enumerate(alignments) if alignment] + [len(questions)]
+        ranges: List[Tuple[float, float]] = [(0.0, 0.0)] * len(questions)
+
+        for left, right in zip(anchors, anchors[1:]):
+            gap_start = alignments[left]["end"] if left >= 0 else 0.0
+            gap_end = alignments[right]["start"] if right < len(questions) else duration
+            gap_end = max(gap_end, gap_start)
+
+            # Located question `left` and the unlocated ones after it share the gap
+            members = list(range(max(left, 0), right))
+            if not members:
+                continue
+
+            step = (gap_end - gap_start) / len(members)
+            for offset, k in enumerate(members):
+                ranges[k] = (gap_start + offset * step, gap_start + (offset + 1) * step)
+
+        return ranges, alignments
+
+    def _extract_segments_in_range(
+        self,
+        timeline: Union[TimelineIndex, List[Dict]],
+        start: float,
+        end: float
+    ) -> List[Dict]:
         """
         Extract all timeline segments that fall within [start, end].
 
@@ -153,29 +290,18 @@ class QAMatcher:
         - segment.start < end AND segment.end > start
 
         Args:
-            timeline: Timeline segments from transcript
+            timeline: TimelineIndex (preferred, O(log N) per call) or raw
+                timeline segments (indexed on the fly)
             start: Range start (seconds)
             end: Range end (seconds)
 
         Returns:
-            List[Dict]: Segments in range
+            List[Dict]: Segments in range (timeline order)
         """
-        segments_in_range = []
+        if not isinstance(timeline, TimelineIndex):
+            timeline = TimelineIndex(timeline)
 
-        for segment in timeline:
-            seg_start = segment.get('start')
-            seg_end = segment.get('end')
-
-            # Skip segments with missing time information
-            if seg_start is None or seg_end is None:
-                logger.warning(f"Skipping segment with missing time info: {segment.get('text', '')[:50]}...")
-                continue
-
-            # Check if segment overlaps with range
-            if seg_start < end and seg_end > start:
-                segments_in_range.append(segment)
-
-        return segments_in_range
+        return timeline.segments_in_range(start, end)
 
     def _concatenate_segments(self, segments: List[Dict]) -> Dict:
         """
@@ -238,8 +364,8 @@ class QAMatcher:
         Returns:
             Path: Path to saved file
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(qa_data, f, ensure_ascii=False, indent=2)
+        # Streamed section by section (orjson when installed), same layout as json.dump(indent=2)
+        write_json(qa_data, output_path, indent=2)
 
         logger.info(f"QA JSON saved: {output_path}")
         return output_path
@@ -281,7 +407,13 @@ class QAMatcher:
         lines.append(f"**Süre:** {int(duration)} saniye ({duration_str})")
 
         lines.append(f"**Soru Sayısı:** {metadata['total_questions']}")
-        lines.append(f"**Eşleştirme Yöntemi:** Eşit Zaman Segmentasyonu")
+        method = metadata.get('matching_method', "equal_time_segmentation")
+        lines.append(f"**Eşleştirme Yöntemi:** {MATCHING_METHODS.get(method, method)}")
+        if 'aligned_questions' in metadata:
+            lines.append(
+                f"**Bulunan Soru:** {metadata['aligned_questions']}/{metadata['total_questions']} "
+                f"(ortalama skor: {metadata['mean_alignment_score']})"
+            )
 
         # Format timestamp
         matched_at = metadata['matched_at']
@@ -311,6 +443,15 @@ class QAMatcher:
 
             lines.append(f"**Zaman Aralığı:** {start_str} - {end_str} ({duration_seg} saniye)")
 
+            if 'alignment_score' in qa:
+                if qa['question_time']:
+                    lines.append(
+                        f"**Soru Konumu:** {format_time(qa['question_time']['start'])} "
+                        f"(hizalama skoru: {qa['alignment_score']})"
+                    )
+                else:
+                    lines.append("**Soru Konumu:** *Konuşmada bulunamadı, aralık tahminidir*")
+
             if answer['speakers']:
                 speakers_list = ", ".join(answer['speakers'].keys())
                 lines.append(f"**Konuşmacılar:** {speakers_list}")
@@ -0,0 +1,433 @@
+"""
+Tam Metin Arama İndeksi Modülü
+==============================
+Bu modül işlenmiş tüm transkriptlerin segmentlerini yerel bir SQLite FTS5
+indeksinde tutar: "Hangi mülakatta X geçti, kaçıncı saniyede?"
+
+Neden Gerekli?
+--------------
+- Bir kelimeyi bulmak için outputs/ altındaki tüm JSON'ları taramak
+  (grep veya tek tek yükleyip aramak) dosya sayısıyla doğrusal büyür
+- FTS5 ters indeksi sorguyu sadece aranan kelimelerin geçtiği segmentlere
+  indirir; 100k+ segmentte sorgu milisaniyeler sürer
+
+Türkçe Normalizasyon:
+- Segment metni indekslenmeden önce qa_alignment.normalize_text() ile
+  katlanır (küçük harf, İ/I/ı -> i, ç/ğ/ö/ş/ü -> c/g/o/s/u, noktalama yok)
+- Sorgu da aynı şekilde katlanır: "ÇALIŞMA", "calisma", "çalışma" aynı sonuç
+- Kelimeler önek olarak aranır (Türkçe ekler): "mülakat" -> "mülakatta",
+  "mülakatlar" da bulunur; tırnak içi ifade ("takım çalışması") yan yana arar
+- Ekranda gösterilen metin ve snippet orijinal (katlanmamış) metindir
+
+Artımlı İndeksleme:
+- v_to_t.finalize_result() her işten sonra JSON çıktısını upsert eder
+  (aynı JSON yolu tekrar kaydedilirse eski satırları silinip yenileri eklenir)
+- index_files() mevcut çıktıları tarar; boyutu ve değişiklik zamanı
+  indekstekiyle aynı olan dosyaları atlar, silinmiş dosyaları indeksten çıkarır
+
+Depolama: outputs/search_index.db (settings.SEARCH_INDEX_PATH)
+    documents     - JSON dosyası başına bir satır (video, dil, mtime, boyut)
+    segments      - segment başına bir satır (zaman, konuşmacı, orijinal metin)
+    segments_fts  - FTS5 tablosu (rowid = segments.id, katlanmış metin)
+
+Örnek:
+    >>> index = get_search_index()
+    >>> index.search("takım çalışması", limit=5)
+    [{"video": "mulakat.mp4", "start": 125.3, "speaker": "SPEAKER_01",
+      "snippet": "... **takım** **çalışmasına** önem veririm ...", ...}]
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+from datetime import datetime
+import contextlib
+import re
+import sqlite3
+import threading
+from loguru import logger
+import config.settings as settings
+from app.output_formatter import OutputFormatter
+from app.qa_alignment import normalize_text
+from app.transcript_schema import expand_transcript
+
+
+# Snippet'te eşleşmenin iki yanında gösterilecek kelime sayısı
+SNIPPET_CONTEXT_WORDS = 12
+
+# Bundan kısa kelimeler önek olarak değil tam kelime olarak aranır
+# ("ve", "o" gibi kelimeler önek olarak neredeyse her segmentle eşleşir)
+MIN_PREFIX_LENGTH = 3
+
+# Sorgu: "tırnak içi ifade" veya tek kelime
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    json_path TEXT NOT NULL UNIQUE,
+    video TEXT,
+    language TEXT,
+    processed_at TEXT,
+    num_segments INTEGER,
+    mtime_ns INTEGER,
+    size INTEGER,
+    indexed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    doc_id INTEGER NOT NULL,
+    start REAL,
+    end REAL,
+    speaker TEXT,
+    text TEXT
+);
+CREATE INDEX IF NOT EXISTS segments_doc_id ON segments(doc_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    body,
+    prefix='2 3',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    Kullanıcı sorgusunu FTS5 MATCH ifadesine çevirir.
+
+    - Kelimeler katlanır ve önek olarak aranır: mülakat -> "mulakat"*
+      (MIN_PREFIX_LENGTH'ten kısa kelimeler tam kelime olarak)
+    - Tırnak içi ifade yan yana kelimeler olarak aranır: "takım çalışması"
+    - Tüm terimler segmentte bulunmalıdır (VE)
+
+    Args:
+        query: Kullanıcı sorgusu
+
+    Returns:
+        Optional[str]: MATCH ifadesi (aranacak kelime yoksa None)
+    """
+    terms = []
+
+    for phrase, word in _QUERY_TOKEN.findall(query):
+        normalized = normalize_text(phrase or word)
+        if not normalized:
+            continue
+        # Katlanmış metinde tırnak kalmaz; FTS5 sözdizimi güvenli
+        if phrase:
+            terms.append(f'"{normalized}"')
+        else:
+            terms.extend(
+                f'"{part}"*' if len(part) >= MIN_PREFIX_LENGTH else f'"{part}"'
+                for part in normalized.split()
+            )
+
+    return " ".join(terms) or None
+
+
+def make_snippet(text: str, query: str, context_words: int = SNIPPET_CONTEXT_WORDS) -> str:
+    """
+    Orijinal metinden eşleşen kelimeleri **kalın** gösteren kısa alıntı.
+
+    Args:
+        text: Segmentin orijinal metni
+        query: Kullanıcı sorgusu
+        context_words: İlk eşleşmenin iki yanında bırakılacak kelime sayısı
+
+    Returns:
+        str: "... önce **takım** **çalışmasına** önem ..." (Markdown)
+    """
+    terms = normalize_text(query.replace('"', " ")).split()
+    prefixes = tuple(term for term in terms if len(term) >= MIN_PREFIX_LENGTH)
+    exact = set(terms)
+    words = text.split()
+    if not terms or not words:
+        return text
+
+    matches = [
+        index for index, word in enumerate(words)
+        if any(part in exact or part.startswith(prefixes) for part in normalize_text(word).split())
+    ]
+    if not matches:
+        return text
+
+    first = max(matches[0] - context_words, 0)
+    last = min(matches[0] + context_words + 1, len(words))
+    matched = set(matches)
+
+    snippet = " ".join(
+        f"**{words[index]}**" if index in matched else words[index]
+        for index in range(first, last)
+    )
+    return f"{'... ' if first > 0 else ''}{snippet}{' ...' if last < len(words) else ''}"
+
+
+class SearchIndex:
+    """
+    Transkript segmentleri için SQLite FTS5 arama indeksi.
+
+    Her işlem kendi bağlantısını açar: kayıt thread'i (toplu işleme),
+    CLI ve Streamlit aynı dosyayı güvenle kullanabilir (WAL modu,
+    okuyucular yazıcıyı beklemez).
+
+    Örnek:
+        >>> index = get_search_index()
+        >>> index.upsert(result, "outputs/mulakat_output.json")
+        >>> hits = index.search("maaş beklentisi", speaker="SPEAKER_01")
+    """
+
+    def __init__(self, db_path: Union[str, Path] = None):
+        """
+        SearchIndex başlatıcı.
+
+        Args:
+            db_path: SQLite dosyası (verilmezse settings.SEARCH_INDEX_PATH)
+        """
+        self.db_path = Path(db_path) if db_path else Path(settings.SEARCH_INDEX_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """İşlem başına bağlantı (başarılıysa commit, hata olursa rollback)."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _file_key(json_path: Union[str, Path]) -> str:
+        """Dosyanın indeksteki anahtarı (mutlak yol)."""
+        return str(Path(json_path).resolve())
+
+    def upsert(self, result: Dict, json_path: Union[str, Path]) -> int:
+        """
+        Bir çıktı dosyasının segmentlerini indekse ekler (varsa yeniler).
+
+        Args:
+            result: merge_results() sonucu veya yüklenmiş JSON (iki şema da)
+            json_path: Sonucun kaydedildiği JSON dosyası (indeks anahtarı)
+
+        Returns:
+            int: İndekslenen segment sayısı
+        """
+        result = expand_transcript(result)
+        metadata = result.get("metadata", {})
+        timeline = result.get("timeline", [])
+
+        json_path = Path(json_path)
+        stat = json_path.stat() if json_path.exists() else None
+
+        with self._lock, self._connect() as conn:
+            self._delete_document(conn, self._file_key(json_path))
+
+            cursor = conn.execute(
+                "INSERT INTO documents (json_path, video, language, processed_at, num_segments, "
+                "mtime_ns, size, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._file_key(json_path),
+                    metadata.get("video_name", json_path.stem),
+                    metadata.get("language"),
+                    metadata.get("processed_at"),
+                    len(timeline),
+                    stat.st_mtime_ns if stat else None,
+                    stat.st_size if stat else None,
+                    datetime.now().isoformat()
+                )
+            )
+            doc_id = cursor.lastrowid
+
+            # Segment id'leri ardışık ayrılır; FTS rowid'leri aynı id'leri kullanır
+            first_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM segments").fetchone()[0]
+
+            conn.executemany(
+                "INSERT INTO segments (id, doc_id, start, end, speaker, text) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (first_id + offset, doc_id, segment["start"], segment["end"],
+                     segment.get("speaker"), segment.get("text", ""))
+                    for offset, segment in enumerate(timeline)
+                )
+            )
+            conn.executemany(
+                "INSERT INTO segments_fts (rowid, body) VALUES (?, ?)",
+                (
+                    (first_id + offset, normalize_text(segment.get("text", "")))
+                    for offset, segment in enumerate(timeline)
+                )
+            )
+
+        logger.debug(f"Arama indeksi güncellendi: {json_path.name} ({len(timeline)} segment)")
+        return len(timeline)
+
+    @staticmethod
+    def _delete_document(conn: sqlite3.Connection, file_key: str) -> bool:
+        """Dosyanın tüm satırlarını siler (yoksa False)."""
+        row = conn.execute("SELECT id FROM documents WHERE json_path = ?", (file_key,)).fetchone()
+        if row is None:
+            return False
+
+        conn.execute(
+            "DELETE FROM segments_fts WHERE rowid IN (SELECT id FROM segments WHERE doc_id = ?)",
+            (row[0],)
+        )
+        conn.execute("DELETE FROM segments WHERE doc_id = ?", (row[0],))
+        conn.execute("DELETE FROM documents WHERE id = ?", (row[0],))
+        return True
+
+    def remove(self, json_path: Union[str, Path]) -> bool:
+        """
+        Dosyayı indeksten çıkarır.
+
+        Returns:
+            bool: Dosya indekste var mıydı?
+        """
+        with self._lock, self._connect() as conn:
+            return self._delete_document(conn, self._file_key(json_path))
+
+    def index_files(self, json_paths: Iterable[Union[str, Path]], force: bool = False, prune: bool = True) -> Dict:
+        """
+        Çıktı dosyalarını artımlı olarak indeksler.
+
+        Boyutu ve değişiklik zamanı indekstekiyle aynı olan dosyalar
+        okunmadan atlanır. Bir dosyadaki hata diğerlerini durdurmaz.
+
+        Args:
+            json_paths: *_output.json dosyaları
+            force: Değişmemiş dosyaları da yeniden indeksle
+            prune: Artık var olmayan dosyaları indeksten çıkar
+
+        Returns:
+            Dict: {"indexed": 3, "skipped": 120, "removed": 1, "segments": 950,
+                   "failed": [(path, hata), ...]}
+        """
+        summary = {"indexed": 0, "skipped": 0, "removed": 0, "segments": 0, "failed": []}
+
+        with self._connect() as conn:
+            known = {
+                json_path: (mtime_ns, size)
+                for json_path, mtime_ns, size in conn.execute("SELECT json_path, mtime_ns, size FROM documents")
+            }
+
+        for json_path in json_paths:
+            json_path = Path(json_path)
+            try:
+                stat = json_path.stat()
+                if not force and known.get(self._file_key(json_path)) == (stat.st_mtime_ns, stat.st_size):
+                    summary["skipped"] += 1
+                    continue
+
+                result = OutputFormatter.load_from_json(json_path)
+                summary["segments"] += self.upsert(result, json_path)
+                summary["indexed"] += 1
+            except Exception as e:
+                logger.error(f"İndekslenemedi: {json_path} - {e}")
+                summary["failed"].append((str(json_path), str(e)))
+
+        if prune:
+            for file_key in known:
+                if not Path(file_key).exists() and self.remove(file_key):
+                    summary["removed"] += 1
+
+        return summary
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        video: str = None,
+        speaker: str = None
+    ) -> List[Dict]:
+        """
+        Segmentlerde tam metin arama (en alakalı önce, BM25).
+
+        Args:
+            query: Aranacak kelimeler / "tırnak içi ifade"
+            limit: Maksimum sonuç sayısı
+            video: Sadece bu videoda ara (video adı)
+            speaker: Sadece bu konuşmacıda ara
+
+        Returns:
+            List[Dict]: [{"video", "json_path", "start", "end", "speaker",
+                          "text", "snippet", "score"}, ...]
+                score: BM25 (küçük = daha alakalı)
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        sql = (
+            "SELECT d.video, d.json_path, s.start, s.end, s.speaker, s.text, f.rank "
+            "FROM segments_fts AS f "
+            "JOIN segments AS s ON s.id = f.rowid "
+            "JOIN documents AS d ON d.id = s.doc_id "
+            "WHERE segments_fts MATCH ?"
+        )
+        params = [match]
+
+        if video:
+            sql += " AND d.video = ?"
+            params.append(video)
+        if speaker:
+            sql += " AND s.speaker = ?"
+            params.append(speaker)
+
+        sql += " ORDER BY f.rank LIMIT ?"
+        params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [
+            {
+                "video": video_name,
+                "json_path": json_path,
+                "start": start,
+                "end": end,
+                "speaker": speaker_name,
+                "text": text,
+                "snippet": make_snippet(text, query),
+                "score": round(rank, 4)
+            }
+            for video_name, json_path, start, end, speaker_name, text, rank in rows
+        ]
+
+    def get_stats(self) -> Dict:
+        """
+        İndeks istatistikleri.
+
+        Returns:
+            Dict: {"documents": 12, "segments": 4800, "size_mb": 1.2}
+        """
+        with self._connect() as conn:
+            documents = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            segments = conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+
+        size = sum(
+            path.stat().st_size
+            for path in (self.db_path, Path(f"{self.db_path}-wal"))
+            if path.exists()
+        )
+        return {"documents": documents, "segments": segments, "size_mb": round(size / (1024 * 1024), 2)}
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """
+    Süreç genelinde paylaşılan SearchIndex'i döndürür.
+
+    Returns:
+        SearchIndex: Paylaşılan indeks
+    """
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            _index = SearchIndex()
+        return _index
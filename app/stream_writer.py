@@ -0,0 +1,166 @@
+"""
+Akış (Streaming) Çıktı Modülü
+==============================
+Bu modül transcription segmentlerini geldikleri anda NDJSON (JSON Lines)
+formatında yazar.
+
+Neden Gerekli?
+--------------
+- OutputFormatter.save_to_json() sonucu işlem bittikten sonra tek seferde yazar
+- İki saatlik bir kayıtta ilk metin ancak tüm decode bitince görülür
+- JSON Lines: Her satır bağımsız bir JSON nesnesidir, her segment yazılır
+  yazılmaz flush edilir; okuyucular (tail -f, jq, başka servisler) metni
+  saniyeler içinde görür
+
+Satır Tipleri:
+    {"type": "metadata", "video_name": "...", "model_size": "...", ...}
+    {"type": "segment", "start": 0.0, "end": 3.5, "duration": 3.5,
+     "speaker": "SPEAKER_00", "text": "...", "confidence": 0.95}
+    ...
+    {"type": "summary", "num_segments": 120, "duration_seconds": 600.0,
+     "speakers": {"SPEAKER_00": {"total_duration": ..., ...}}}
+"""
+
+from pathlib import Path
+from typing import Dict, TextIO, Union
+from datetime import datetime
+from loguru import logger
+import json
+import sys
+
+
+class JSONLinesWriter:
+    """
+    Segmentleri NDJSON formatında artımlı (incremental) yazan sınıf.
+
+    Konuşmacı istatistikleri (süre, kelime, segment sayısı) her segmentte
+    güncellenir; sonda tüm timeline'ı tekrar gezmek gerekmez.
+
+    Context manager olarak kullanılabilir:
+        >>> with JSONLinesWriter("out.jsonl", metadata={"video_name": "a.mp4"}) as writer:
+        ...     for segment in segments:
+        ...         writer.write_segment(segment)
+    """
+
+    def __init__(self, output: Union[str, Path, TextIO], metadata: Dict = None):
+        """
+        JSONLinesWriter başlatıcı.
+
+        Args:
+            output: Çıktı hedefi
+                - Dosya yolu (str veya Path)
+                - "-": Standart çıktı (stdout)
+                - Açık bir metin akışı (ör. sys.stdout)
+            metadata: İlk satıra yazılacak metadata (opsiyonel)
+        """
+        self._owns_stream = False
+
+        if output == "-":
+            self.stream = sys.stdout
+            self.output_name = "<stdout>"
+        elif isinstance(output, (str, Path)):
+            output_path = Path(output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.stream = open(output_path, "w", encoding="utf-8")
+            self.output_name = str(output_path)
+            self._owns_stream = True
+        else:
+            self.stream = output
+            self.output_name = getattr(output, "name", "<stream>")
+
+        # Artımlı istatistikler
+        self.num_segments = 0
+        self.last_end = 0.0
+        self.speakers = {}
+        self.closed = False
+
+        self._write_line({
+            "type": "metadata",
+            **(metadata or {}),
+            "started_at": datetime.now().isoformat()
+        })
+
+        logger.info(f"JSON Lines çıktısı açıldı: {self.output_name}")
+
+    def write_segment(self, segment: Dict):
+        """
+        Bir timeline segmentini yazar ve hemen flush eder.
+
+        Args:
+            segment: OutputFormatter.merge_segment() formatında segment
+                {"start", "end", "duration", "speaker", "text", "confidence"}
+        """
+        self._write_line({"type": "segment", **segment})
+
+        # Konuşmacı istatistiklerini güncelle
+        speaker = segment.get("speaker", "SPEAKER_00")
+        if speaker not in self.speakers:
+            self.speakers[speaker] = {
+                "total_duration": 0,
+                "total_words": 0,
+                "num_segments": 0
+            }
+
+        stats = self.speakers[speaker]
+        stats["total_duration"] += segment["end"] - segment["start"]
+        stats["total_words"] += len(segment["text"].split())
+        stats["num_segments"] += 1
+
+        self.num_segments += 1
+        self.last_end = max(self.last_end, segment["end"])
+
+    def summary(self) -> Dict:
+        """
+        O ana kadar yazılan segmentlerin özetini döndürür.
+
+        Returns:
+            Dict: {"num_segments", "duration_seconds", "speakers"}
+                Konuşmacı formatı OutputFormatter._group_by_speaker() ile aynıdır
+                (segment listesi hariç)
+        """
+        speakers = {}
+        for speaker, stats in self.speakers.items():
+            speakers[speaker] = {
+                "total_duration": round(stats["total_duration"], 2),
+                "total_words": stats["total_words"],
+                "num_segments": stats["num_segments"],
+                "percentage": round(stats["total_duration"] / self.last_end * 100, 1) if self.last_end > 0 else 0
+            }
+
+        return {
+            "num_segments": self.num_segments,
+            "duration_seconds": round(self.last_end, 2),
+            "speakers": speakers
+        }
+
+    def close(self, extra: Dict = None):
+        """
+        Özet satırını yazar ve (dosya ise) akışı kapatır.
+
+        Args:
+            extra: Özet satırına eklenecek ek alanlar (ör. language)
+        """
+        if self.closed:
+            return
+
+        self._write_line({"type": "summary", **self.summary(), **(extra or {})})
+        self.closed = True
+
+        if self._owns_stream:
+            self.stream.close()
+
+        logger.info(f"JSON Lines çıktısı tamamlandı: {self.output_name} ({self.num_segments} segment)")
+
+    def _write_line(self, record: Dict):
+        """Tek satır JSON yazar ve flush eder."""
+        # ensure_ascii=False: Türkçe karakterleri koru
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Hata durumunda da özet yazılır; "completed" ile ayırt edilir
+        self.close({"completed": exc_type is None})
+        return False
@@ -0,0 +1,144 @@
+"""
+Timeline İndeks Modülü
+======================
+Bu modül transcript timeline'ı üzerinde hızlı zaman aralığı sorguları sağlar.
+
+Neden Gerekli?
+--------------
+- QAMatcher her soru için tüm timeline'ı baştan sona tarıyordu: O(Q·N)
+- Her taramada eksik zaman bilgisi kontrolü ve uyarıları tekrarlanıyordu
+- TimelineIndex timeline'ı bir kez doğrular ve başlangıca göre sıralar;
+  her sorgu ikili arama (bisect) ile cevaplanır
+
+Kullanım Alanları:
+- QA matching: Soru zaman aralığındaki segmentler
+- Dışa aktarıcılar: Belirli bir bölümün metni
+- UI: "Şu saniyeye git" (segment_at)
+
+Örnek:
+    >>> index = TimelineIndex.from_transcript(OutputFormatter.load_from_json("out.json"))
+    >>> index.segments_in_range(60.0, 120.0)   # 1. ve 2. dakika arası
+    >>> index.segment_at(75.3)                 # 75.3. saniyede konuşulan segment
+"""
+
+from typing import Dict, List, Optional
+import bisect
+from loguru import logger
+
+
+class TimelineIndex:
+    """
+    Timeline segmentleri için zaman aralığı indeksi.
+
+    Segmentlerin sıralı ve örtüşmesiz olması gerekmez: Başlangıca göre
+    sıralanır, bitişlerin önek maksimumu (prefix max) tutulur. Sorgu
+    süresi O(log N + K), K = sonuç sayısı (Whisper timeline'larında).
+
+    Sonuçlar her zaman timeline'daki orijinal sırayla döner.
+    """
+
+    def __init__(self, timeline: List[Dict]):
+        """
+        TimelineIndex başlatıcı (doğrulama ve sıralama burada bir kez yapılır).
+
+        Args:
+            timeline: Timeline segmentleri [{"start", "end", "text", ...}]
+                Zaman bilgisi eksik segmentler atlanır (tek toplu uyarı)
+        """
+        self.segments = []
+        skipped = 0
+
+        for segment in timeline:
+            if segment.get('start') is None or segment.get('end') is None:
+                skipped += 1
+                continue
+            self.segments.append(segment)
+
+        if skipped:
+            logger.warning(f"{skipped} segment zaman bilgisi eksik olduğu için atlandı")
+
+        # Başlangıca göre sıralı indeksler (eşit başlangıçta orijinal sıra korunur)
+        self._order = sorted(range(len(self.segments)), key=lambda i: self.segments[i]['start'])
+        self._starts = [self.segments[i]['start'] for i in self._order]
+
+        # _prefix_max_end[k]: _order[0..k] segmentlerinin en büyük bitişi
+        self._prefix_max_end = []
+        running_max = float("-inf")
+        for i in self._order:
+            running_max = max(running_max, self.segments[i]['end'])
+            self._prefix_max_end.append(running_max)
+
+    @classmethod
+    def from_transcript(cls, transcript_data: Dict) -> "TimelineIndex":
+        """
+        merge_results() / load_from_json() sonucundan indeks oluşturur.
+
+        Args:
+            transcript_data: {"metadata", "speakers", "timeline", ...}
+
+        Returns:
+            TimelineIndex: Timeline indeksi
+        """
+        return cls(transcript_data.get('timeline', []))
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def sorted_segments(self) -> List[Dict]:
+        """
+        Segmentleri başlangıç zamanına göre sıralı döndürür.
+
+        Returns:
+            List[Dict]: Sıralı segmentler (eşit başlangıçta orijinal sıra)
+        """
+        return [self.segments[i] for i in self._order]
+
+    def segments_in_range(self, start: float, end: float) -> List[Dict]:
+        """
+        [start, end] aralığıyla örtüşen segmentleri döndürür.
+
+        Kriter: segment.start < end VE segment.end > start
+
+        Args:
+            start: Aralık başı (saniye)
+            end: Aralık sonu (saniye)
+
+        Returns:
+            List[Dict]: Örtüşen segmentler (timeline sırasıyla)
+        """
+        # first: Önceki tüm segmentler aralık başlamadan bitmiş
+        # last: Sonraki tüm segmentler aralık bittikten sonra başlıyor
+        first = bisect.bisect_right(self._prefix_max_end, start)
+        last = bisect.bisect_left(self._starts, end)
+
+        indices = [
+            self._order[k] for k in range(first, last)
+            if self.segments[self._order[k]]['end'] > start
+        ]
+        indices.sort()
+
+        return [self.segments[i] for i in indices]
+
+    def segment_at(self, time: float) -> Optional[Dict]:
+        """
+        Belirli bir anda konuşulan segmenti döndürür (UI "zamana git" için).
+
+        Kriter: segment.start <= time < segment.end
+        Birden çok segment içeriyorsa timeline'da önce gelen döner.
+
+        Args:
+            time: Zaman (saniye)
+
+        Returns:
+            Optional[Dict]: Segment, o anda konuşma yoksa None
+        """
+        first = bisect.bisect_right(self._prefix_max_end, time)
+        last = bisect.bisect_right(self._starts, time)
+
+        best = None
+        for k in range(first, last):
+            i = self._order[k]
+            if self.segments[i]['end'] > time and (best is None or i < best):
+                best = i
+
+        return self.segments[best] if best is not None else None
@@ -24,13 +24,35 @@ Compute Types (Hız/Bellek Optimizasyonu):
 - float16: GPU için optimal (CUDA)
 - int8: CPU için optimal, 2x hız artışı
 - int8_float16: GPU için en hızlı
+
+Paralel Parça Modu (transcribe_chunked):
+- Uzun ses sessizlik noktalarından ~10 dakikalık parçalara bölünür
+- Her parça ayrı bir süreçte, kendi modeliyle çözülür
+- Zaman damgaları global zamana çevrilip sırayla birleştirilir
+
+Batch Modu (batch_size > 0):
+- faster-whisper BatchedInferencePipeline ile birçok 30 saniyelik pencere
+  tek bir ileri geçişte (forward pass) çözülür
+- Pencereler VAD ile (vad_filter=True) veya sessizlik noktalarından
+  (vad_filter=False, müzikli videolar) belirlenir
+- CPU + int8'de uzun, konuşma yoğun kayıtlarda belirgin hız kazancı
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Union, Dict, List
+from types import SimpleNamespace
+from typing import Union, Dict, List, Iterator, Tuple
+import multiprocessing
+import os
+import re
+import signal
+import numpy as np
 from loguru import logger
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from faster_whisper.audio import decode_audio
 from tqdm import tqdm
+from app.model_registry import get_model_registry
+from app.video_processor import WHISPER_SAMPLE_RATE
 import config.settings as settings
 
 
@@ -40,9 +62,21 @@ class Transcriber:
 
     Bu sınıf Whisper modelini yönetir ve transcription işlemlerini yapar.
     Sınıf kullanma nedeni: Model bir kez yüklenir, tekrar tekrar kullanılır.
+    Modeller süreç genelindeki ModelRegistry'den alınır; aynı ayarlarla
+    oluşturulan yeni Transcriber'lar modeli tekrar yüklemez.
     """
 
-    def __init__(self, model_size: str = None, language: str = None, device: str = "cpu", compute_type: str = "int8"):
+    def __init__(
+        self,
+        model_size: str = None,
+        language: str = None,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        use_registry: bool = True,
+        batch_size: int = 0,
+        cpu_threads: int = 0,
+        num_workers: int = 1
+    ):
         """
         Transcriber başlatıcı.
 
@@ -57,6 +91,17 @@ class Transcriber:
                 CPU için: "int8" (önerilen - 2x hızlı)
                 GPU için: "float16" veya "int8_float16" (önerilen)
                 Varsayılan: "int8"
+            use_registry: Model paylaşılan registry'den alınsın mı?
+                True = Süreç genelinde tek kopya (önerilen)
+                False = Bu Transcriber'a özel model yüklenir
+            batch_size: Batch modunda tek seferde çözülecek pencere sayısı
+                0 = Kapalı, sıralı transcription (varsayılan)
+                8-16 = CPU için önerilen, GPU'da daha yüksek olabilir
+            cpu_threads: CTranslate2 thread sayısı
+                0 = CTranslate2 varsayılanı (4)
+                app.hardware.select_runtime_config() fiziksel çekirdek sayısını önerir
+            num_workers: Aynı modelle eşzamanlı transcription sayısı
+                Varsayılan: 1
         """
         # Model boyutu belirtilmemişse settings'ten al
         self.model_size = model_size or settings.WHISPER_MODEL_SIZE
@@ -64,6 +109,10 @@ class Transcriber:
         # Device ve compute type
         self.device = device
         self.compute_type = compute_type
+        self.use_registry = use_registry
+        self.batch_size = batch_size or 0
+        self.cpu_threads = cpu_threads or 0
+        self.num_workers = num_workers or 1
 
         # Dil: None ise otomatik algılama yapılacak
         # Sadece language parametresi açıkça verilmediyse settings'ten al
@@ -79,6 +128,12 @@ class Transcriber:
         # Model henüz yüklenmedi
         self.model = None
 
+        # Batch modu pipeline'ı (ilk batch transcription'da oluşturulur)
+        self._batched_pipeline = None
+
+        # Son transcription'da algılanan dil (transcribe_stream() doldurur)
+        self.detected_language = None
+
     def load_model(self):
         """
         faster-whisper modelini yükler.
@@ -89,6 +144,7 @@ class Transcriber:
 
         Sonraki çalıştırmalarda:
         - Model cache'den yüklenir (hızlı)
+        - Aynı süreçte model zaten yüklüyse registry'den alınır (yükleme yok)
 
         faster-whisper avantajları:
         - 4-5x daha hızlı işlem
@@ -101,20 +157,34 @@ class Transcriber:
             return
 
         logger.info(f"faster-whisper {self.model_size} model yükleniyor ({self.compute_type} on {self.device})...")
-        logger.info("İlk kullanımda model indirilecek, bu 2-10 dakika sürebilir.")
 
         try:
-            # WhisperModel():
-            # - Model boyutunu al (tiny, small, medium, large-v3, large-v3-turbo)
-            # - CTranslate2 formatında yükle
-            # - Quantization uygula (int8, float16 vb.)
-            self.model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type,
-                # download_root: Modelin kaydedileceği yer
-                download_root=str(settings.MODEL_DIR)
-            )
+            if self.use_registry:
+                # Registry: model yüklüyse anında döner, değilse yükleyip saklar
+                self.model = get_model_registry().get_model(
+                    self.model_size,
+                    self.device,
+                    self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=self.num_workers,
+                    download_root=str(settings.MODEL_DIR)
+                )
+            else:
+                logger.info("İlk kullanımda model indirilecek, bu 2-10 dakika sürebilir.")
+
+                # WhisperModel():
+                # - Model boyutunu al (tiny, small, medium, large-v3, large-v3-turbo)
+                # - CTranslate2 formatında yükle
+                # - Quantization uygula (int8, float16 vb.)
+                self.model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=self.num_workers,
+                    # download_root: Modelin kaydedileceği yer
+                    download_root=str(settings.MODEL_DIR)
+                )
 
             logger.success(f"{self.model_size} model başarıyla yüklendi ({self.compute_type} on {self.device})")
 
@@ -124,7 +194,7 @@ class Transcriber:
 
     def transcribe(
         self,
-        audio_path: Union[str, Path],
+        audio_path: Union[str, Path, np.ndarray],
         beam_size: int = 5,
         temperature: float = 0.0,
         vad_filter: bool = True,
@@ -134,7 +204,9 @@ class Transcriber:
         Ses dosyasını metne çevirir (faster-whisper ile).
 
         Args:
-            audio_path: Ses dosyasının yolu (.wav, .mp3 vb.)
+            audio_path: Ses dosyasının yolu (.wav, .mp3 vb.) veya
+                bellekteki ses (float32, mono, 16 kHz NumPy dizisi)
+                NumPy dizisi verilirse dosya okuma/decode adımı atlanır
             beam_size: Arama algoritması beam sayısı (varsayılan: 5)
                 Daha yüksek = daha iyi doğruluk ama yavaş
                 Önerilen: 5 (openai/whisper varsayılanı: 1)
@@ -168,71 +240,511 @@ class Transcriber:
             FileNotFoundError: Ses dosyası bulunamazsa
             Exception: Transcription hatası
         """
-        audio_path = Path(audio_path)
+        try:
+            # Tüm segmentleri topla (akış API'si üzerinden)
+            segments = list(self.transcribe_stream(
+                audio_path,
+                beam_size=beam_size,
+                temperature=temperature,
+                vad_filter=vad_filter,
+                **kwargs
+            ))
 
-        # Dosya var mı?
-        if not audio_path.exists():
-            error_msg = f"Ses dosyası bulunamadı: {audio_path}"
-            logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
+            return self.build_result(segments)
+
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Transcription hatası: {str(e)}")
+            raise
+
+    def transcribe_stream(
+        self,
+        audio_path: Union[str, Path, np.ndarray],
+        beam_size: int = 5,
+        temperature: float = 0.0,
+        vad_filter: bool = True,
+        start_offset: float = 0.0,
+        start_index: int = 0,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """
+        Sesi metne çevirir ve segmentleri üretildikçe tek tek döndürür.
+
+        transcribe() tüm dosya bitene kadar bekler; bu metot ise
+        faster-whisper bir segmenti decode eder etmez onu (güven skoruyla
+        birlikte) verir. Uzun kayıtlarda ilk metin saniyeler içinde gelir.
+
+        Model yükleme, dosya kontrolü ve dil algılama çağrı anında yapılır;
+        decode işlemi generator tüketildikçe ilerler. Algılanan dil
+        self.detected_language'a yazılır.
+
+        Args:
+            audio_path, beam_size, temperature, vad_filter, **kwargs:
+                transcribe() ile aynı
+            start_offset: Decode'un başlayacağı saniye (yarım kalan işe devam)
+                Sesin bu noktadan sonrası çözülür, zaman damgaları yine
+                dosyanın başına göredir
+            start_index: İlk segmentin numarası (devam ederken önceki segment sayısı)
+
+        Returns:
+            Iterator[Dict]: İşlenmiş segmentler
+                {"id": 0, "start": 0.0, "end": 3.5, "text": "...", "confidence": 0.95}
+
+        Raises:
+            FileNotFoundError: Ses dosyası bulunamazsa
+
+        Örnek:
+            >>> for segment in transcriber.transcribe_stream(audio):
+            ...     print(segment["start"], segment["text"])
+        """
+        if isinstance(audio_path, np.ndarray):
+            # Bellek içi ses: faster-whisper diziyi doğrudan kabul eder
+            audio_input = audio_path
+            audio_name = f"bellek içi ses ({audio_path.size / 16000:.2f} saniye)"
+        else:
+            audio_path = Path(audio_path)
+
+            # Dosya var mı?
+            if not audio_path.exists():
+                error_msg = f"Ses dosyası bulunamadı: {audio_path}"
+                logger.error(error_msg)
+                raise FileNotFoundError(error_msg)
+
+            audio_input = str(audio_path)
+            audio_name = audio_path.name
+
+        if start_offset > 0:
+            # Kalan ses kesilip çözülür, segmentler ofset kadar kaydırılır
+            audio_input = self._load_audio_array(audio_input)[int(round(start_offset * WHISPER_SAMPLE_RATE)):]
+            audio_name = f"{audio_name}, {start_offset:.2f}. saniyeden itibaren"
 
-        # Model yüklü mü?
+        # Model yüklü mü? Registry modeli decode bitene kadar kiralanır
+        # (decode uzun sürse de boşta sayılıp boşaltılmaz)
+        release = self._lease_model() if self.use_registry else None
         if self.model is None:
             self.load_model()
 
-        logger.info(f"Transcription başlıyor: {audio_path.name}")
-        logger.debug(f"Parametreler: beam_size={beam_size}, temperature={temperature}, vad_filter={vad_filter}")
-
         try:
-            # faster-whisper transcribe():
-            # Ses dosyasını alıp (segments generator, info) tuple'ı döndürür
-            segments_generator, info = self.model.transcribe(
-                str(audio_path),
+            segment_stream = self._start_stream(audio_input, audio_name, beam_size, temperature, vad_filter, **kwargs)
+        except BaseException:
+            if release is not None:
+                release()
+            raise
 
-                # language: Dil belirtmek doğruluğu artırır
-                # None verilirse Whisper dili otomatik algılar
-                language=self.language,
+        segment_stream = _shift_segments(segment_stream, start_offset, start_index)
+        return _LeasedStream(segment_stream, release) if release is not None else segment_stream
 
-                # beam_size: Arama algoritması beam sayısı
-                # 5 önerilir (openai/whisper varsayılanı 1)
-                beam_size=beam_size,
+    def _lease_model(self):
+        """
+        Registry'deki modeli kiralar (boşaltılmışsa tekrar yükler).
 
-                # temperature: 0.0 = deterministic (tutarlı sonuçlar)
-                temperature=temperature,
+        Returns:
+            Callable: Kira bitince çağrılacak fonksiyon
+        """
+        registry = get_model_registry()
+        key = (self.model_size, self.device, self.compute_type, self.cpu_threads, self.num_workers)
 
-                # vad_filter: Voice Activity Detection
-                # Sessizlikleri filtreler, halüsinasyonu azaltır
+        if self.model is not None and not registry.is_loaded(*key):
+            # Boşta kaldığı için boşaltılmış: eski kopya yeni yüklemeden önce bırakılır
+            self.model = None
+            self._batched_pipeline = None
+
+        model = registry.get_model(*key, lease=True, download_root=str(settings.MODEL_DIR))
+        if model is not self.model:
+            self.model = model
+            self._batched_pipeline = None
+
+        return lambda: registry.release(*key)
+
+    def _start_stream(
+        self,
+        audio_input: Union[str, np.ndarray],
+        audio_name: str,
+        beam_size: int,
+        temperature: float,
+        vad_filter: bool,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """Decode'u başlatır (dil algılama burada yapılır), segment iteratörünü döndürür."""
+        logger.info(f"Transcription başlıyor: {audio_name}")
+        logger.debug(f"Parametreler: beam_size={beam_size}, temperature={temperature}, vad_filter={vad_filter}")
+
+        if self.batch_size > 0:
+            return self._transcribe_batched_stream(
+                audio_input,
+                beam_size=beam_size,
+                temperature=temperature,
                 vad_filter=vad_filter,
+                **kwargs
+            )
 
-                # **kwargs: Kullanıcının verdiği ekstra parametreler
+        # faster-whisper transcribe():
+        # Ses dosyasını (veya NumPy dizisini) alıp (segments generator, info) tuple'ı döndürür
+        # Generator tembeldir: segmentler ancak tüketildikçe decode edilir
+        segments_generator, info = self.model.transcribe(
+            audio_input,
+
+            # language: Dil belirtmek doğruluğu artırır
+            # None verilirse Whisper dili otomatik algılar
+            language=self.language,
+
+            # beam_size: Arama algoritması beam sayısı
+            # 5 önerilir (openai/whisper varsayılanı 1)
+            beam_size=beam_size,
+
+            # temperature: 0.0 = deterministic (tutarlı sonuçlar)
+            temperature=temperature,
+
+            # vad_filter: Voice Activity Detection
+            # Sessizlikleri filtreler, halüsinasyonu azaltır
+            vad_filter=vad_filter,
+
+            # **kwargs: Kullanıcının verdiği ekstra parametreler
+            **kwargs
+        )
+
+        # Algılanan dil bilgisi
+        self.detected_language = info.language if hasattr(info, 'language') else self.language
+
+        return self._iter_processed_segments(segments_generator)
+
+    def _transcribe_batched_stream(
+        self,
+        audio_input: Union[str, np.ndarray],
+        beam_size: int,
+        temperature: float,
+        vad_filter: bool,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """
+        Batch modu: pencereleri BatchedInferencePipeline ile toplu çözer.
+
+        Pencere belirleme:
+        - vad_filter=True: faster-whisper'ın Silero VAD'i konuşma bölgelerini bulur
+        - vad_filter=False: Batch pipeline pencere listesi ister; ses 30 saniyeyi
+          aşmayan parçalara en sessiz noktalardan bölünür (müzik de korunur)
+        """
+        if self._batched_pipeline is None:
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+
+        if not vad_filter and "clip_timestamps" not in kwargs:
+            audio_array = self._load_audio_array(audio_input)
+            audio_input = audio_array
+
+            # 25 s hedef, ±2.5 s sessizlik arama -> pencereler 30 s'yi aşmaz
+            windows = find_silence_boundaries(audio_array, chunk_length=25.0, search_window=2.5)
+            kwargs["clip_timestamps"] = [
+                {"start": start / WHISPER_SAMPLE_RATE, "end": end / WHISPER_SAMPLE_RATE}
+                for start, end in windows
+            ]
+
+        logger.info(f"Batch modu: batch_size={self.batch_size}, pencereler: {'VAD' if vad_filter else 'sessizlik noktaları'}")
+
+        segments_generator, info = self._batched_pipeline.transcribe(
+            audio_input,
+            language=self.language,
+            beam_size=beam_size,
+            temperature=temperature,
+            vad_filter=vad_filter,
+            batch_size=self.batch_size,
+            **kwargs
+        )
+
+        # Algılanan dil bilgisi
+        self.detected_language = info.language if hasattr(info, 'language') else self.language
+
+        return self._iter_processed_segments(segments_generator)
+
+    def _iter_processed_segments(self, segments_generator) -> Iterator[Dict]:
+        """faster-whisper segment generator'ını işlenmiş segment dict'lerine çevirir."""
+        for i, segment in enumerate(segments_generator):
+            yield self._process_segment(i, segment)
+
+    def transcribe_chunked(
+        self,
+        audio_path: Union[str, Path, np.ndarray],
+        chunk_length: float = None,
+        num_workers: int = None,
+        cpu_threads: int = None,
+        beam_size: int = 5,
+        temperature: float = 0.0,
+        vad_filter: bool = True,
+        **kwargs
+    ) -> Dict:
+        """
+        Uzun sesi parçalara bölüp CPU çekirdeklerine paralel dağıtarak çevirir.
+
+        Sonuç transcribe() ile aynı formattadır ({"text", "segments", "language"}),
+        OutputFormatter.merge_results() doğrudan kullanabilir.
+
+        Args:
+            audio_path: Ses dosyası yolu veya NumPy dizisi (float32, mono, 16 kHz)
+            chunk_length: Hedef parça uzunluğu (saniye)
+                Verilmezse settings.CHUNK_LENGTH_SECONDS
+            num_workers: Paralel süreç sayısı
+                Verilmezse çekirdek sayısı / cpu_threads
+            cpu_threads: Her worker'ın CPU thread sayısı
+                Verilmezse settings.CHUNK_CPU_THREADS
+            beam_size, temperature, vad_filter, **kwargs: transcribe() ile aynı
+
+        Returns:
+            Dict: Transcription sonucu (transcribe() ile aynı format)
+        """
+        segments = list(self.transcribe_chunked_stream(
+            audio_path,
+            chunk_length=chunk_length,
+            num_workers=num_workers,
+            cpu_threads=cpu_threads,
+            beam_size=beam_size,
+            temperature=temperature,
+            vad_filter=vad_filter,
+            **kwargs
+        ))
+
+        return self.build_result(segments)
+
+    def transcribe_chunked_stream(
+        self,
+        audio_path: Union[str, Path, np.ndarray],
+        chunk_length: float = None,
+        num_workers: int = None,
+        cpu_threads: int = None,
+        beam_size: int = 5,
+        temperature: float = 0.0,
+        vad_filter: bool = True,
+        start_offset: float = 0.0,
+        start_index: int = 0,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """
+        transcribe_chunked()'ın akış versiyonu: segmentleri sırayla döndürür.
+
+        Parçalar paralel çözülür ama segmentler her zaman zaman sırasıyla
+        verilir (tamamlanan parça, kendinden öncekiler bitene kadar bekletilir).
+        Parça sınırında bir önceki parçanın son segmentini tekrarlayan
+        segmentler atlanır.
+
+        Ses tek parçaya sığıyorsa veya tek worker kalıyorsa normal
+        transcribe_stream()'e düşer.
+
+        Args:
+            transcribe_chunked() ile aynı
+            start_offset, start_index: transcribe_stream() ile aynı
+                (sadece kalan ses parçalara bölünür; initial_prompt sadece
+                ilk parçaya verilir)
+
+        Returns:
+            Iterator[Dict]: İşlenmiş segmentler (global zaman damgalı)
+        """
+        full_audio = self._load_audio_array(audio_path)
+        start_sample = int(round(start_offset * WHISPER_SAMPLE_RATE))
+        audio = full_audio[start_sample:]
+        initial_prompt = kwargs.pop("initial_prompt", None)
+
+        chunk_length = chunk_length or settings.CHUNK_LENGTH_SECONDS
+        cpu_threads = cpu_threads or settings.CHUNK_CPU_THREADS
+        if not num_workers or num_workers <= 0:
+            num_workers = max(1, (os.cpu_count() or 1) // cpu_threads)
+
+        boundaries = find_silence_boundaries(audio, chunk_length)
+        num_workers = min(num_workers, len(boundaries))
+
+        decode_options = {
+            "language": self.language,
+            "beam_size": beam_size,
+            "temperature": temperature,
+            "vad_filter": vad_filter,
+            **kwargs
+        }
+
+        if num_workers <= 1:
+            logger.info("Ses tek parçaya sığıyor veya tek worker var, tek akış kullanılıyor")
+            return self.transcribe_stream(
+                full_audio,
+                beam_size=beam_size,
+                temperature=temperature,
+                vad_filter=vad_filter,
+                start_offset=start_offset,
+                start_index=start_index,
+                initial_prompt=initial_prompt,
                 **kwargs
             )
 
-            # Segments generator'u listeye çevir
-            # faster-whisper generator döndürür, hepsini listeye almamız gerekiyor
-            segments_list = list(segments_generator)
+        if self.device == "cuda":
+            logger.warning("Paralel parça modunda her worker GPU'ya ayrı model yükler")
 
-            # Algılanan dil bilgisi
-            detected_language = info.language if hasattr(info, 'language') else self.language
+        if self.batch_size > 0:
+            logger.warning("Paralel parça modunda batch_size kullanılmaz, worker'lar sıralı çözer")
 
-            # Sonuçları işle ve zenginleştir
-            processed_result = self._process_faster_whisper_result(segments_list, detected_language)
+        logger.info(
+            f"Paralel transcription: {len(boundaries)} parça (~{chunk_length:.0f}s), "
+            f"{num_workers} worker x {cpu_threads} thread"
+        )
 
-            # İstatistikler
-            total_duration = processed_result["segments"][-1]["end"] if processed_result["segments"] else 0
-            word_count = len(processed_result["text"].split())
+        # spawn: Ana süreçteki thread'ler (loguru, registry) worker'lara kopyalanmasın
+        mp_context = multiprocessing.get_context("spawn")
+        # Worker'lar başlarken PID'lerini bildirir (iptalde sonlandırmak için)
+        worker_pids = mp_context.SimpleQueue()
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=mp_context,
+            initializer=_init_chunk_worker,
+            initargs=(self.model_size, self.device, self.compute_type, cpu_threads, str(settings.MODEL_DIR), worker_pids)
+        )
 
-            logger.success(
-                f"Transcription tamamlandı: {word_count} kelime, "
-                f"{total_duration:.2f} saniye, "
-                f"dil: {detected_language}"
+        futures = [
+            executor.submit(
+                _transcribe_chunk,
+                chunk_index,
+                audio[start:end],
+                (start_sample + start) / WHISPER_SAMPLE_RATE,
+                # Önceki metin (devam) sadece ilk parçanın bağlamıdır
+                {**decode_options, "initial_prompt": initial_prompt} if chunk_index == 0 and initial_prompt else decode_options
             )
+            for chunk_index, (start, end) in enumerate(boundaries)
+        ]
 
-            return processed_result
+        self.detected_language = self.language
+        return self._iter_chunk_results(executor, futures, start_index=start_index, worker_pids=worker_pids)
 
-        except Exception as e:
-            logger.error(f"Transcription hatası: {str(e)}")
-            raise
+    def _iter_chunk_results(
+        self,
+        executor: ProcessPoolExecutor,
+        futures: List,
+        start_index: int = 0,
+        worker_pids=None
+    ) -> Iterator[Dict]:
+        """
+        Paralel parça sonuçlarını zaman sırasıyla birleştirip segment segment döndürür.
+
+        Generator kapatılırsa (ör. iptal) bekleyen parçalar iptal edilir,
+        çalışan worker süreçleri sonlandırılır.
+
+        Args:
+            executor: Parçaları çözen ProcessPoolExecutor
+            futures: Parça sırasıyla _transcribe_chunk() future'ları
+            start_index: İlk segmentin numarası
+            worker_pids: Worker'ların _register_chunk_worker() ile PID
+                bildirdiği kuyruk (iptalde sonlandırılacak süreçler)
+        """
+        completed_chunks = {}
+        next_chunk = 0
+        segment_index = start_index
+        previous_segment = None
+
+        try:
+            for future in as_completed(futures):
+                chunk_index, chunk_language, raw_segments = future.result()
+                completed_chunks[chunk_index] = (chunk_language, raw_segments)
+                logger.debug(f"Parça {chunk_index + 1}/{len(futures)} tamamlandı ({len(raw_segments)} segment)")
+
+                # Sıradaki parça(lar) hazırsa segmentlerini ver
+                while next_chunk in completed_chunks:
+                    chunk_language, raw_segments = completed_chunks.pop(next_chunk)
+
+                    if next_chunk == 0 and self.language is None:
+                        # Otomatik algılamada ilk parçanın dili esas alınır
+                        self.detected_language = chunk_language
+
+                    for position, raw_segment in enumerate(raw_segments):
+                        # Sınır tekrarı: yeni parçanın başındaki segment bir
+                        # öncekinin son segmentiyle aynıysa atla
+                        if position == 0 and _is_boundary_duplicate(previous_segment, raw_segment):
+                            logger.debug(f"Parça sınırında tekrar eden segment atlandı: {raw_segment.text.strip()[:50]}")
+                            continue
+
+                        yield self._process_segment(segment_index, raw_segment)
+                        segment_index += 1
+                        previous_segment = raw_segment
+
+                    next_chunk += 1
+        finally:
+            if next_chunk < len(futures):
+                # Yarıda kapatıldı (iptal / hata): çalışan parçalar da durdurulur,
+                # aksi halde worker'lar sonucu kimsenin okumayacağı parçaları çözmeye devam eder
+                executor.shutdown(wait=False, cancel_futures=True)
+                if worker_pids is not None:
+                    _terminate_chunk_workers(worker_pids)
+            else:
+                executor.shutdown(wait=False)
+
+    def _load_audio_array(self, audio_path: Union[str, Path, np.ndarray]) -> np.ndarray:
+        """
+        Sesi NumPy dizisi olarak döndürür (dosya ise decode eder).
+
+        Raises:
+            FileNotFoundError: Ses dosyası bulunamazsa
+        """
+        if isinstance(audio_path, np.ndarray):
+            return audio_path
+
+        audio_path = Path(audio_path)
+
+        if not audio_path.exists():
+            error_msg = f"Ses dosyası bulunamadı: {audio_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        # faster-whisper'ın kendi decoder'ı (16 kHz mono float32)
+        return decode_audio(str(audio_path), sampling_rate=WHISPER_SAMPLE_RATE)
+
+    def build_result(self, segments: List[Dict]) -> Dict:
+        """
+        transcribe_stream()'den toplanan segmentlerden transcribe() sonucunu oluşturur.
+
+        Args:
+            segments: İşlenmiş segment listesi
+
+        Returns:
+            Dict: {"text", "segments", "language"} (transcribe() ile aynı format)
+        """
+        detected_language = self.detected_language or self.language
+
+        result = {
+            "text": " ".join(segment["text"] for segment in segments),  # Tam metin
+            "segments": segments,  # Zaman damgalı parçalar
+            "language": detected_language,  # Algılanan dil
+        }
+
+        # İstatistikler
+        total_duration = segments[-1]["end"] if segments else 0
+        word_count = len(result["text"].split())
+
+        logger.success(
+            f"Transcription tamamlandı: {word_count} kelime, "
+            f"{total_duration:.2f} saniye, "
+            f"dil: {detected_language}"
+        )
+
+        return result
+
+    def _process_segment(self, index: int, segment) -> Dict:
+        """
+        Tek bir faster-whisper segmentini işlenmiş dict'e çevirir.
+
+        Args:
+            index: Segment numarası
+            segment: faster-whisper Segment nesnesi
+
+        Returns:
+            Dict: {"id", "start", "end", "text", "confidence"}
+        """
+        # faster-whisper segment yapısı:
+        # segment.start, segment.end, segment.text, segment.avg_logprob, segment.no_speech_prob
+        return {
+            "id": index,  # Segment numarası
+            "start": round(segment.start, 2),  # Başlangıç (saniye)
+            "end": round(segment.end, 2),  # Bitiş
+            "text": segment.text.strip(),  # Metin (baştaki/sondaki boşlukları kaldır)
+
+            # Güven skoru hesapla
+            # faster-whisper avg_logprob ve no_speech_prob sağlar
+            "confidence": self._calculate_confidence_from_logprob(
+                getattr(segment, 'avg_logprob', -1.0),
+                getattr(segment, 'no_speech_prob', 0.0)
+            ),
+        }
 
     def _process_faster_whisper_result(self, segments_list: List, detected_language: str) -> Dict:
         """
@@ -247,31 +759,13 @@ class Transcriber:
         """
         # Segment'leri işle
         # faster-whisper her cümleyi/parçayı ayrı segment olarak döndürür
-        processed_segments = []
-        full_text = []
-
-        for i, segment in enumerate(segments_list):
-            # faster-whisper segment yapısı:
-            # segment.start, segment.end, segment.text, segment.avg_logprob, segment.no_speech_prob
-            processed_segments.append({
-                "id": i,  # Segment numarası
-                "start": round(segment.start, 2),  # Başlangıç (saniye)
-                "end": round(segment.end, 2),  # Bitiş
-                "text": segment.text.strip(),  # Metin (baştaki/sondaki boşlukları kaldır)
-
-                # Güven skoru hesapla
-                # faster-whisper avg_logprob ve no_speech_prob sağlar
-                "confidence": self._calculate_confidence_from_logprob(
-                    getattr(segment, 'avg_logprob', -1.0),
-                    getattr(segment, 'no_speech_prob', 0.0)
-                ),
-            })
-
-            # Tam metin için birleştir
-            full_text.append(segment.text.strip())
+        processed_segments = [
+            self._process_segment(i, segment)
+            for i, segment in enumerate(segments_list)
+        ]
 
         return {
-            "text": " ".join(full_text),  # Tam metin
+            "text": " ".join(seg["text"] for seg in processed_segments),  # Tam metin
             "segments": processed_segments,  # Zaman damgalı parçalar
             "language": detected_language,  # Algılanan dil
         }
@@ -381,6 +875,246 @@ class Transcriber:
             return result
 
 
+def find_silence_boundaries(
+    audio: np.ndarray,
+    chunk_length: float,
+    search_window: float = None,
+    frame_length: float = 0.03
+) -> List[Tuple[int, int]]:
+    """
+    Sesi yaklaşık chunk_length uzunluğunda parçalara böler; kesim noktalarını
+    hedef sürenin çevresindeki en sessiz ana kaydırır.
+
+    Her 30 ms'lik çerçevenin enerjisi (kareler toplamı) hesaplanır; her hedef
+    kesim noktasının ±search_window çevresinde enerjisi en düşük çerçeveden
+    kesilir. Böylece kelimeler ortadan bölünmez.
+
+    Args:
+        audio: float32, mono, 16 kHz ses
+        chunk_length: Hedef parça uzunluğu (saniye)
+        search_window: Kesim noktası arama penceresi (saniye)
+            Verilmezse parça uzunluğunun %10'u (en fazla 30 saniye)
+        frame_length: Enerji çerçevesi uzunluğu (saniye)
+
+    Returns:
+        List[Tuple[int, int]]: (başlangıç, bitiş) örnek indeksleri
+
+    Örnek:
+        >>> find_silence_boundaries(audio, chunk_length=600)
+        [(0, 9598080), (9598080, 19203360), (19203360, 28800000)]
+    """
+    total_samples = audio.size
+    chunk_samples = int(chunk_length * WHISPER_SAMPLE_RATE)
+
+    if total_samples <= chunk_samples:
+        return [(0, total_samples)]
+
+    frame_samples = max(1, int(frame_length * WHISPER_SAMPLE_RATE))
+    num_frames = total_samples // frame_samples
+
+    # Çerçeve enerjisi: einsum büyük bir ara dizi (audio**2) oluşturmaz
+    frames = audio[:num_frames * frame_samples].reshape(num_frames, frame_samples)
+    energy = np.einsum("ij,ij->i", frames, frames)
+
+    if search_window is None:
+        search_window = min(30.0, chunk_length * 0.1)
+    window_frames = max(1, int(search_window * WHISPER_SAMPLE_RATE / frame_samples))
+
+    # Son parça bu uzunluktan kısaysa ayrı parça yapılmaz (öncekine eklenir)
+    min_tail_samples = chunk_samples // 10
+
+    cuts = [0]
+    while total_samples - cuts[-1] > chunk_samples:
+        target_frame = (cuts[-1] + chunk_samples) // frame_samples
+        low = max(cuts[-1] // frame_samples + 1, target_frame - window_frames)
+        high = min(num_frames, target_frame + window_frames + 1)
+
+        if low >= high:
+            cut = cuts[-1] + chunk_samples
+        else:
+            # En sessiz çerçevenin ortasından kes
+            quietest_frame = low + int(np.argmin(energy[low:high]))
+            cut = quietest_frame * frame_samples + frame_samples // 2
+
+        if total_samples - cut < min_tail_samples:
+            break
+
+        cuts.append(cut)
+
+    cuts.append(total_samples)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def _shift_segments(segments: Iterator[Dict], offset: float, start_index: int) -> Iterator[Dict]:
+    """
+    Kesilmiş sesten çözülen segmentleri dosya zamanına kaydırır ve yeniden numaralar.
+
+    Ofset ve numara yoksa akış olduğu gibi döner.
+    """
+    if offset <= 0 and start_index == 0:
+        return segments
+
+    def shifted():
+        for segment in segments:
+            segment["id"] += start_index
+            segment["start"] = round(segment["start"] + offset, 2)
+            segment["end"] = round(segment["end"] + offset, 2)
+            yield segment
+
+    return shifted()
+
+
+class _LeasedStream:
+    """
+    Segment iteratörü; bitince, kapatılınca veya çöp toplanınca registry
+    kirasını bırakır (hiç başlatılmamış generator'ın finally'si çalışmaz).
+    """
+
+    def __init__(self, segments: Iterator[Dict], release):
+        self._segments = segments
+        self._release = release
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Dict:
+        try:
+            return next(self._segments)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """Decode'u durdurur ve kirayı bırakır (tekrar çağrılabilir)."""
+        release, self._release = self._release, None
+        try:
+            if hasattr(self._segments, "close"):
+                self._segments.close()
+        finally:
+            if release is not None:
+                release()
+
+    def __del__(self):
+        self.close()
+
+
+def _normalize_segment_text(text: str) -> str:
+    """Karşılaştırma için metni sadeleştirir (küçük harf, noktalama yok)."""
+    return re.sub(r"[^\w\s]", "", text.lower()).strip()
+
+
+# Zamanda çakışmayan tekrar adayı en az bu kadar kelime olmalı
+# ("OK.", "Mi?" gibi kısa gerçek cevaplar atılmasın)
+BOUNDARY_DUPLICATE_MIN_WORDS = 3
+
+
+def _is_boundary_duplicate(previous_segment, segment, tolerance: float = 1.0) -> bool:
+    """
+    Parça sınırında tekrar eden segmenti tespit eder.
+
+    Koşullar:
+    - Yeni segment öncekinin bitişinden en fazla `tolerance` saniye sonra başlıyor
+    - Kelimeleri öncekinin son kelimeleriyle birebir aynı (kelime sınırında;
+      "look" + "OK" veya "mi" + "Mi?" gibi harf eşleşmeleri sayılmaz)
+    - Zamanda öncekiyle çakışıyor ya da en az BOUNDARY_DUPLICATE_MIN_WORDS kelime
+      (parçalar çakışmadığı için kısa, çakışmayan eşleşme büyük olasılıkla
+      gerçek tekrar / kısa cevaptır)
+    """
+    if previous_segment is None:
+        return False
+
+    if segment.start > previous_segment.end + tolerance:
+        return False
+
+    words = _normalize_segment_text(segment.text).split()
+    previous_words = _normalize_segment_text(previous_segment.text).split()
+
+    if not words or len(words) > len(previous_words) or previous_words[-len(words):] != words:
+        return False
+
+    return segment.start < previous_segment.end or len(words) >= BOUNDARY_DUPLICATE_MIN_WORDS
+
+
+# Paralel parça worker'larının modeli (her süreçte bir kez yüklenir)
+_chunk_worker_model = None
+
+
+def _init_chunk_worker(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int,
+    download_root: str,
+    worker_pids=None
+):
+    """ProcessPoolExecutor initializer: PID'ini bildirir, worker sürecinde modeli yükler."""
+    global _chunk_worker_model
+
+    # Model yüklenirken iptal edilirse de sonlandırılabilsin: önce bildir
+    _register_chunk_worker(worker_pids)
+
+    _chunk_worker_model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        # cpu_threads: Worker başına CTranslate2 thread sayısı
+        cpu_threads=cpu_threads,
+        download_root=download_root
+    )
+
+
+def _register_chunk_worker(worker_pids=None):
+    """Worker sürecinin PID'ini ana sürece bildirir (kuyruk verilmediyse hiçbir şey yapmaz)."""
+    if worker_pids is not None:
+        worker_pids.put(os.getpid())
+
+
+def _terminate_chunk_workers(worker_pids):
+    """
+    PID'ini bildirmiş worker süreçlerini sonlandırır.
+
+    Executor'ın iç süreç listesine (CPython'a özel, kapatıldıktan sonra
+    None olabilir) dayanmaz; zaten çıkmış süreçler sessizce atlanır.
+    """
+    pids = []
+    while not worker_pids.empty():
+        pids.append(worker_pids.get())
+
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            # Süreç zaten çıkmış (ProcessLookupError) veya erişilemiyor
+            pass
+
+    if pids:
+        logger.debug(f"{len(pids)} paralel parça worker'ı sonlandırıldı")
+
+
+def _transcribe_chunk(chunk_index: int, audio_chunk: np.ndarray, offset_seconds: float, decode_options: Dict):
+    """
+    Worker sürecinde tek bir parçayı çözer.
+
+    Returns:
+        Tuple: (chunk_index, algılanan dil, ham segmentler)
+            Segment zamanları global zamana (offset eklenmiş) çevrilmiştir
+    """
+    segments_generator, info = _chunk_worker_model.transcribe(audio_chunk, **decode_options)
+
+    raw_segments = [
+        SimpleNamespace(
+            start=segment.start + offset_seconds,
+            end=segment.end + offset_seconds,
+            text=segment.text,
+            avg_logprob=getattr(segment, "avg_logprob", -1.0),
+            no_speech_prob=getattr(segment, "no_speech_prob", 0.0)
+        )
+        for segment in segments_generator
+    ]
+
+    return chunk_index, getattr(info, "language", None), raw_segments
+
+
 # Yardımcı fonksiyon: Hızlı kullanım için
 def transcribe_audio(
     audio_path: Union[str, Path],
@@ -0,0 +1,266 @@
+"""
+Transcript Veri Seti (Parquet) Modülü
+=====================================
+Bu modül her işin timeline'ını bölümlenmiş (partitioned) bir Parquet veri
+setine ekler ve veri setini pandas DataFrame olarak sorgular.
+
+Neden Gerekli?
+--------------
+- Binlerce outputs/*_output.json üzerinde analiz (konuşma oranları, dakika
+  başına kelime, güven dağılımı) her sorguda tüm JSON'ları tekrar ayrıştırır
+- Parquet sütun bazlıdır: Sorgu sadece gereken sütunları okur, dosya ve
+  row group istatistikleri (min/max) sayesinde eşleşmeyen veri hiç okunmaz
+  (predicate pushdown)
+
+Veri Seti Düzeni (Hive bölümleme):
+    outputs/dataset/
+        date=2026-10-18/
+            interview_1a2b3c4d5e6f.parquet     # iş başına bir dosya
+            meeting_9f8e7d6c5b4a.parquet
+        date=2026-10-19/
+            ...
+
+Sütunlar:
+    video, segment_index, start, end, speaker, text, confidence,
+    language, model, processed_at, date (bölüm sütunu)
+
+Aynı iş (video + işlenme zamanı) tekrar eklenirse dosyası üzerine yazılır;
+dışa aktarma tekrar çalıştırılabilir.
+
+Bağımlılık: pyarrow (opsiyonel - kurulu değilse bu modül ImportError verir,
+diğer özellikler etkilenmez)
+
+Örnek:
+    >>> export_transcript(result)                        # tek iş
+    >>> df = read_dataset(filters=[("speaker", "=", "SPEAKER_00"),
+    ...                            ("confidence", ">=", 0.8)],
+    ...                   columns=["video", "start", "end", "text"])
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+from datetime import datetime
+import hashlib
+import os
+from loguru import logger
+import config.settings as settings
+from app.output_formatter import OutputFormatter
+from app.transcript_schema import expand_transcript
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+# Bölüm sütunu (işlenme günü, YYYY-MM-DD)
+PARTITION_COLUMN = "date"
+
+
+def is_available() -> bool:
+    """pyarrow kurulu mu?"""
+    return pa is not None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet veri seti için pyarrow gerekli: pip install pyarrow")
+
+
+def _schema():
+    """Veri seti şeması (bölüm sütunu hariç)."""
+    return pa.schema([
+        ("video", pa.string()),
+        ("segment_index", pa.int32()),
+        ("start", pa.float64()),
+        ("end", pa.float64()),
+        ("speaker", pa.string()),
+        ("text", pa.string()),
+        ("confidence", pa.float64()),
+        ("language", pa.string()),
+        ("model", pa.string()),
+        ("processed_at", pa.string()),
+    ])
+
+
+def get_dataset_dir(dataset_dir: Union[str, Path, None] = None) -> Path:
+    """Veri seti klasörü (verilmezse settings.TRANSCRIPT_DATASET_DIR)."""
+    return Path(dataset_dir) if dataset_dir else Path(settings.TRANSCRIPT_DATASET_DIR)
+
+
+def export_transcript(result: Dict, dataset_dir: Union[str, Path, None] = None) -> Path:
+    """
+    Bir işin timeline'ını veri setine ekler.
+
+    Args:
+        result: merge_results() sonucu veya yüklenmiş JSON (iki şema da)
+        dataset_dir: Veri seti klasörü (verilmezse settings.TRANSCRIPT_DATASET_DIR)
+
+    Returns:
+        Path: Yazılan Parquet dosyası
+
+    Raises:
+        ImportError: pyarrow kurulu değilse
+    """
+    _require_pyarrow()
+
+    result = expand_transcript(result)
+    metadata = result.get("metadata", {})
+    timeline = result.get("timeline", [])
+
+    video = metadata.get("video_name", "unknown")
+    processed_at = metadata.get("processed_at") or datetime.now().isoformat()
+    language = metadata.get("language")
+    model = metadata.get("model_size") or metadata.get("model_info", {}).get("transcription")
+
+    num_rows = len(timeline)
+    table = pa.table(
+        {
+            "video": [video] * num_rows,
+            "segment_index": list(range(num_rows)),
+            "start": [segment["start"] for segment in timeline],
+            "end": [segment["end"] for segment in timeline],
+            "speaker": [segment.get("speaker") for segment in timeline],
+            "text": [segment.get("text", "") for segment in timeline],
+            "confidence": [segment.get("confidence") for segment in timeline],
+            "language": [language] * num_rows,
+            "model": [model] * num_rows,
+            "processed_at": [processed_at] * num_rows,
+        },
+        schema=_schema()
+    )
+
+    # Hive bölümü: date=YYYY-MM-DD (sorgularda tarih filtresi klasörleri eler)
+    partition = processed_at[:10]
+    partition_dir = get_dataset_dir(dataset_dir) / f"{PARTITION_COLUMN}={partition}"
+    partition_dir.mkdir(parents=True, exist_ok=True)
+
+    # Aynı iş tekrar eklenirse aynı dosya adı: üzerine yazılır (kopya satır oluşmaz)
+    job_id = hashlib.sha1(f"{video}\0{processed_at}".encode("utf-8")).hexdigest()[:12]
+    output_path = partition_dir / f"{Path(video).stem}_{job_id}.parquet"
+    temp_path = partition_dir / f".{output_path.name}.tmp"
+
+    # Sözlük kodlama (video, speaker, model tekrarları) + zstd sıkıştırma
+    pq.write_table(table, temp_path, compression="zstd")
+    os.replace(temp_path, output_path)
+
+    logger.info(f"Veri setine eklendi: {output_path} ({num_rows} segment)")
+    return output_path
+
+
+def export_json_files(
+    json_paths: Iterable[Union[str, Path]],
+    dataset_dir: Union[str, Path, None] = None
+) -> Dict:
+    """
+    Mevcut çıktı JSON dosyalarını veri setine ekler (geçmiş işler için).
+
+    Bir dosyadaki hata diğerlerini durdurmaz.
+
+    Args:
+        json_paths: *_output.json dosyaları
+        dataset_dir: Veri seti klasörü
+
+    Returns:
+        Dict: {"exported": 12, "rows": 4800, "failed": [(path, hata), ...]}
+    """
+    _require_pyarrow()
+
+    summary = {"exported": 0, "rows": 0, "failed": []}
+
+    for json_path in json_paths:
+        try:
+            result = OutputFormatter.load_from_json(json_path)
+            export_transcript(result, dataset_dir)
+        except Exception as e:
+            logger.error(f"Veri setine eklenemedi: {json_path} - {e}")
+            summary["failed"].append((str(json_path), str(e)))
+            continue
+
+        summary["exported"] += 1
+        summary["rows"] += len(result.get("timeline", []))
+
+    return summary
+
+
+def read_dataset(
+    dataset_dir: Union[str, Path, None] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List] = None
+):
+    """
+    Veri setini pandas DataFrame olarak okur.
+
+    Filtreler okumadan önce uygulanır (predicate pushdown):
+    - "date" filtresi eşleşmeyen bölüm klasörlerini hiç açmaz
+    - Diğer sütun filtreleri dosya / row group min-max istatistikleriyle
+      eşleşemeyecek blokları atlar, kalan satırları Arrow'da süzer
+
+    Args:
+        dataset_dir: Veri seti klasörü (verilmezse settings.TRANSCRIPT_DATASET_DIR)
+        columns: Okunacak sütunlar (None = hepsi)
+        filters: pyarrow / pandas.read_parquet formatında filtreler
+            [("video", "=", "a.mp4"), ("confidence", "<", 0.5)]  (VE)
+            [[...], [...]]                                       (VEYA gruplar)
+
+    Returns:
+        pandas.DataFrame: Sorgu sonucu (veri seti boşsa şemaya uygun boş tablo)
+
+    Raises:
+        ImportError: pyarrow kurulu değilse
+    """
+    _require_pyarrow()
+
+    dataset_dir = get_dataset_dir(dataset_dir)
+
+    if not dataset_dir.exists() or not any(dataset_dir.glob(f"{PARTITION_COLUMN}=*/*.parquet")):
+        schema = _schema().append(pa.field(PARTITION_COLUMN, pa.string()))
+        table = schema.empty_table()
+        return table.select(columns).to_pandas() if columns else table.to_pandas()
+
+    table = pq.read_table(
+        dataset_dir,
+        columns=columns,
+        filters=filters,
+        partitioning="hive",
+        # Geçici (.tmp) dosyalar okunmaz
+        ignore_prefixes=[".", "_"]
+    )
+    return table.to_pandas()
+
+
+def summarize_speakers(df):
+    """
+    Video / konuşmacı başına konuşma istatistikleri.
+
+    Args:
+        df: read_dataset() sonucu (video, speaker, start, end, text sütunları)
+
+    Returns:
+        pandas.DataFrame: video, speaker, segments, talk_seconds, talk_ratio
+            (videodaki toplam konuşmaya oranı), words, words_per_minute,
+            mean_confidence
+    """
+    df = df.assign(
+        talk_seconds=df["end"] - df["start"],
+        words=df["text"].str.split().str.len().fillna(0).astype("int64")
+    )
+
+    summary = df.groupby(["video", "speaker"], as_index=False).agg(
+        segments=("text", "size"),
+        talk_seconds=("talk_seconds", "sum"),
+        words=("words", "sum"),
+        mean_confidence=("confidence", "mean")
+    )
+
+    video_total = summary.groupby("video")["talk_seconds"].transform("sum")
+    summary["talk_ratio"] = (summary["talk_seconds"] / video_total.where(video_total > 0)).fillna(0.0)
+    minutes = summary["talk_seconds"] / 60
+    summary["words_per_minute"] = (summary["words"] / minutes.where(minutes > 0)).fillna(0.0)
+
+    columns = ["video", "speaker", "segments", "talk_seconds", "talk_ratio",
+               "words", "words_per_minute", "mean_confidence"]
+    return summary[columns].round({"talk_seconds": 1, "talk_ratio": 3,
+                                   "words_per_minute": 1, "mean_confidence": 3})
@@ -0,0 +1,299 @@
+"""
+Transcript Şema Modülü
+======================
+Bu modül çıktı JSON'unun sürümlü kompakt şemasını (v2) ve eski şemayla
+(v1) uyumluluğu yönetir.
+
+Neden Gerekli?
+--------------
+v1 (merge_results() bellek formatı) her segmenti üç kez yazar:
+- timeline içinde
+- speakers[*]["segments"] içinde (aynı segmentin kopyası)
+- full_transcript içinde (tüm metin tekrar)
+Dosya boyutu ve dosyadan yüklenen verinin bellek kullanımı ~3 katına çıkar.
+
+v2 Şeması:
+    {
+      "schema_version": 2,
+      "metadata": {...},                                  # v1 ile aynı
+      "speakers": {
+        "SPEAKER_00": {"total_duration": 12.5, "total_words": 40,
+                       "num_segments": 6, "ranges": [[0, 4], [7, 9]],
+                       "percentage": 62.5}
+      },
+      "timeline": [
+        {"start_ms": 0, "end_ms": 3500, "text": "...", "confidence": 0.95},
+        ...
+      ]
+    }
+
+- Zamanlar tam sayı milisaniye (start_ms, end_ms); duration türetilir
+- Konuşmacılar segment kopyası yerine timeline'a [başlangıç, bitiş)
+  indeks aralıkları tutar; segmentin konuşmacısı aralıklardan türetilir
+- full_transcript saklanmaz, timeline metinlerinden türetilir
+
+Bellekte her zaman v1 formatı kullanılır (expand_transcript()); v2'den
+açılan sonuçta speakers[*]["segments"] timeline'daki segmentlerin kendisini
+gösterir (kopya değil). Eski (v1) dosyalar olduğu gibi okunur.
+"""
+
+from typing import Dict, Iterable, Iterator, List
+import itertools
+
+# Kompakt şema sürümü
+SCHEMA_VERSION = 2
+
+# v1 segment alanları (v2'de türetilen veya yeniden adlandırılanlar)
+_LEGACY_SEGMENT_KEYS = ("start", "end", "duration", "speaker", "text", "confidence")
+
+
+def get_schema_version(data: Dict) -> int:
+    """
+    Sonucun şema sürümünü döndürür ("schema_version" yoksa 1).
+
+    Args:
+        data: merge_results() sonucu veya yüklenmiş JSON
+
+    Returns:
+        int: 1 veya 2
+    """
+    return data.get("schema_version", 1)
+
+
+def to_ms(seconds: float) -> int:
+    """Saniyeyi tam sayı milisaniyeye çevirir."""
+    return int(round(seconds * 1000))
+
+
+def from_ms(milliseconds: int) -> float:
+    """Milisaniyeyi saniyeye çevirir (0.29 -> 290 -> 0.29, gidiş-dönüş kayıpsız)."""
+    return milliseconds / 1000
+
+
+def build_full_transcript(timeline: Iterable[Dict]) -> str:
+    """
+    Tam metni timeline segmentlerinden türetir.
+
+    Transcriber'ın ürettiği tam metinle aynıdır (segment metinleri
+    tek boşlukla birleştirilir).
+
+    Args:
+        timeline: Timeline segmentleri (v1 veya v2)
+
+    Returns:
+        str: Tam metin
+    """
+    return " ".join(segment["text"] for segment in timeline).strip()
+
+
+def compact_transcript(result: Dict) -> Dict:
+    """
+    v1 sonucunu v2 kompakt şemasına çevirir (v2 ise olduğu gibi döner).
+
+    Args:
+        result: merge_results() sonucu
+
+    Returns:
+        Dict: v2 şemasında sonuç
+    """
+    if get_schema_version(result) >= SCHEMA_VERSION:
+        return result
+
+    timeline = result.get("timeline", [])
+
+    # Konuşmacı istatistikleri aynı anahtar sırasıyla, "segments" yerine "ranges"
+    speakers = {}
+    for speaker, data in result.get("speakers", {}).items():
+        speakers[speaker] = {
+            ("ranges" if key == "segments" else key): ([] if key == "segments" else value)
+            for key, value in data.items()
+        }
+        speakers[speaker].setdefault("ranges", [])
+
+    # Ardışık aynı konuşmacılı segmentler tek aralık olur
+    run_start = 0
+    for index in range(1, len(timeline) + 1):
+        if index == len(timeline) or timeline[index]["speaker"] != timeline[run_start]["speaker"]:
+            speaker = timeline[run_start]["speaker"]
+            speakers.setdefault(speaker, {"ranges": []})["ranges"].append([run_start, index])
+            run_start = index
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "metadata": result.get("metadata", {}),
+        "speakers": speakers,
+        "timeline": [compact_segment(segment) for segment in timeline]
+    }
+
+
+def compact_segment(segment: Dict) -> Dict:
+    """
+    v1 timeline segmentini v2 formatına çevirir.
+
+    Args:
+        segment: {"start", "end", "duration", "speaker", "text", "confidence", ...}
+
+    Returns:
+        Dict: {"start_ms", "end_ms", "text", "confidence", ...}
+            Bilinmeyen ek alanlar korunur
+    """
+    compact = {
+        "start_ms": to_ms(segment["start"]),
+        "end_ms": to_ms(segment["end"]),
+        "text": segment["text"],
+        "confidence": segment.get("confidence", 0.0)
+    }
+
+    for key, value in segment.items():
+        if key not in _LEGACY_SEGMENT_KEYS:
+            compact[key] = value
+
+    return compact
+
+
+def expand_transcript(data: Dict) -> Dict:
+    """
+    Yüklenmiş sonucu bellek (v1) formatına açar (v1 ise olduğu gibi döner).
+
+    Konuşmacıların "segments" listeleri timeline'daki segment nesnelerini
+    gösterir; segmentler kopyalanmaz.
+
+    Args:
+        data: v1 veya v2 şemasında sonuç
+
+    Returns:
+        Dict: {"metadata", "speakers", "timeline", "full_transcript"}
+            Timeline bölümü yoksa (okunurken atlandıysa) konuşmacı aralıkları
+            çözülemez, veri olduğu gibi döner
+    """
+    if get_schema_version(data) < SCHEMA_VERSION or "timeline" not in data:
+        return data
+
+    speakers_v2 = data.get("speakers", {})
+    labels = _speaker_labels(speakers_v2, len(data.get("timeline", [])))
+    timeline = [
+        expand_segment(segment, speaker)
+        for segment, speaker in zip(data.get("timeline", []), labels)
+    ]
+
+    speakers = {}
+    for speaker, stats in speakers_v2.items():
+        speakers[speaker] = {
+            ("segments" if key == "ranges" else key): (
+                [timeline[index] for start, end in value for index in range(start, end)]
+                if key == "ranges" else value
+            )
+            for key, value in stats.items()
+        }
+
+    return {
+        "metadata": data.get("metadata", {}),
+        "speakers": speakers,
+        "timeline": timeline,
+        "full_transcript": build_full_transcript(timeline)
+    }
+
+
+def expand_segment(segment: Dict, speaker: str) -> Dict:
+    """
+    v2 timeline segmentini v1 formatına çevirir (merge_segment() alan sırası).
+
+    Args:
+        segment: {"start_ms", "end_ms", "text", "confidence", ...}
+        speaker: Aralıklardan türetilen konuşmacı
+
+    Returns:
+        Dict: {"start", "end", "duration", "speaker", "text", "confidence", ...}
+    """
+    start = from_ms(segment["start_ms"])
+    end = from_ms(segment["end_ms"])
+
+    expanded = {
+        "start": start,
+        "end": end,
+        "duration": round(end - start, 2),
+        "speaker": speaker,
+        "text": segment["text"],
+        "confidence": segment.get("confidence", 0.0)
+    }
+
+    for key, value in segment.items():
+        if key not in ("start_ms", "end_ms", "text", "confidence"):
+            expanded[key] = value
+
+    return expanded
+
+
+def skip_unused_header_section(key: str, header: Dict) -> bool:
+    """
+    Akış halinde timeline okurken gereksiz header bölümlerini belirler.
+
+    iter_json_array(skip_section=...) için: v1 dosyada speakers bölümü
+    segmentlerin kopyasını taşır ve segment üretmek için gerekmez; yüklenirse
+    bellek kullanımı ~2 katına çıkar. v2 yazarken "schema_version" ilk
+    bölümdür (compact_transcript()), bu yüzden speakers'a gelindiğinde hâlâ
+    sürüm görülmemişse dosya v1'dir.
+
+    Args:
+        key: Sıradaki üst seviye bölüm
+        header: O ana kadar okunan bölümler
+
+    Returns:
+        bool: Bölüm atlanmalıysa True
+    """
+    return key == "speakers" and get_schema_version(header) < SCHEMA_VERSION
+
+
+def iter_expanded_timeline(header: Dict, segments: Iterable[Dict]) -> Iterator[Dict]:
+    """
+    Akış halinde okunan timeline segmentlerini v1 formatında üretir.
+
+    Args:
+        header: Timeline'dan önce okunan bölümler ("schema_version", "speakers")
+            iter_json_array(header=...) bu dict'i ilk eleman istendiğinde
+            doldurur; bu yüzden sürüm ilk eleman alındıktan sonra okunur
+        segments: Timeline segmentleri (dosyadaki sırayla)
+
+    Yields:
+        Dict: v1 formatında segment
+    """
+    segments = iter(segments)
+    first = next(segments, None)
+    if first is None:
+        return
+    segments = itertools.chain([first], segments)
+
+    if get_schema_version(header) < SCHEMA_VERSION:
+        yield from segments
+        return
+
+    # Aralıkları başlangıca göre sırala, indeks ilerledikçe sıradakine geç
+    ranges = sorted(
+        (start, end, speaker)
+        for speaker, stats in header.get("speakers", {}).items()
+        for start, end in stats.get("ranges", [])
+    )
+    position = 0
+
+    for index, segment in enumerate(segments):
+        while position < len(ranges) and ranges[position][1] <= index:
+            position += 1
+
+        if position < len(ranges) and ranges[position][0] <= index:
+            speaker = ranges[position][2]
+        else:
+            speaker = "SPEAKER_UNKNOWN"
+
+        yield expand_segment(segment, speaker)
+
+
+def _speaker_labels(speakers: Dict, num_segments: int) -> List[str]:
+    """Her timeline indeksinin konuşmacısı (aralık dışı kalanlar SPEAKER_UNKNOWN)."""
+    labels = ["SPEAKER_UNKNOWN"] * num_segments
+
+    for speaker, stats in speakers.items():
+        for start, end in stats.get("ranges", []):
+            start, end = max(start, 0), min(end, num_segments)
+            labels[start:end] = [speaker] * max(end - start, 0)
+
+    return labels
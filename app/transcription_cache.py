@@ -0,0 +1,317 @@
+"""
+Transcription Önbellek (Cache) Modülü
+======================================
+Bu modül Transcriber sonuçlarını diskte içerik adresli (content-addressed)
+olarak saklar.
+
+Neden Gerekli?
+--------------
+- Aynı video tekrar işlendiğinde (ör. sadece soru dosyası veya çıktı
+  formatı değiştiğinde) tüm Whisper decode işlemi baştan yapılıyordu
+- Önbellek anahtarı = decode edilmiş sesin hash'i + tüm decode parametreleri
+  (model_size, compute_type, language, beam_size, temperature, vad_filter, ...)
+- Parametrelerden biri değişirse anahtar değişir, eski sonuç kullanılmaz
+
+Ek Kısayol (Kaynak Dosya İndeksi):
+- Sesin hash'ini bulmak için önce sesi çıkarmak gerekir (büyük videoda saniyeler)
+- Kaynak dosyanın parmak izi (yol + boyut + değişiklik zamanı veya içerik
+  hash'i) -> ses hash'i eşlemesi de saklanır; aynı dosya tekrar gelirse
+  ses çıkarma da atlanır
+
+Depolama:
+- cache/<ilk 2 karakter>/<anahtar>.json.gz: gzip'li kompakt JSON
+- Toplam boyut TRANSCRIPTION_CACHE_MAX_MB'ı aşarsa en uzun süredir
+  kullanılmayan (LRU, dosya mtime) kayıtlar silinir
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import numpy as np
+from loguru import logger
+import config.settings as settings
+
+
+# Dosya hash'lerken tek seferde okunacak byte sayısı (1 MB)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class TranscriptionCache:
+    """
+    Transcription sonuçları için boyut sınırlı, LRU disk önbelleği.
+
+    Örnek:
+        >>> cache = get_transcription_cache()
+        >>> key = cache.make_key(cache.hash_audio(audio), {"model_size": "small"})
+        >>> result = cache.get(key)
+        >>> if result is None:
+        ...     result = transcriber.transcribe(audio)
+        ...     cache.put(key, result, audio_duration=125.5)
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = None, max_size_mb: int = None):
+        """
+        TranscriptionCache başlatıcı.
+
+        Args:
+            cache_dir: Önbellek klasörü (verilmezse settings.CACHE_DIR)
+            max_size_mb: Maksimum toplam boyut (MB)
+                Verilmezse settings.TRANSCRIPTION_CACHE_MAX_MB
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else settings.CACHE_DIR / "transcriptions"
+        self.sources_dir = self.cache_dir / "sources"
+        self.max_size_mb = max_size_mb if max_size_mb is not None else settings.TRANSCRIPTION_CACHE_MAX_MB
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.sources_dir.mkdir(parents=True, exist_ok=True)
+
+        # İstatistikler (süreç ömrü boyunca)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def hash_audio(audio: Union[str, Path, np.ndarray]) -> str:
+        """
+        Decode edilmiş sesin SHA-256 hash'ini hesaplar.
+
+        Args:
+            audio: NumPy dizisi (bellek içi ses) veya ses dosyası yolu (WAV)
+
+        Returns:
+            str: Hex formatında SHA-256
+        """
+        hasher = hashlib.sha256()
+
+        if isinstance(audio, np.ndarray):
+            # Dizinin ham byte'ları kopyalanmadan hash'lenir
+            hasher.update(memoryview(np.ascontiguousarray(audio)).cast("B"))
+        else:
+            with open(audio, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+
+        return hasher.hexdigest()
+
+    @staticmethod
+    def make_key(audio_hash: str, params: Dict) -> str:
+        """
+        Ses hash'i ve decode parametrelerinden önbellek anahtarı üretir.
+
+        Args:
+            audio_hash: hash_audio() sonucu
+            params: Sonucu etkileyen tüm parametreler
+                (model_size, compute_type, language, beam_size, temperature,
+                vad_filter, batch_size, ek faster-whisper parametreleri ...)
+
+        Returns:
+            str: Hex formatında SHA-256 anahtar
+        """
+        # sort_keys: Parametre sırası anahtarı değiştirmesin
+        params_json = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(f"{audio_hash}:{params_json}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def source_fingerprint(source_path: Union[str, Path], content_hash: str = None) -> str:
+        """
+        Kaynak (video) dosyası için ucuz bir parmak izi üretir.
+
+        Args:
+            source_path: Kaynak dosya yolu
+            content_hash: Dosyanın içerik hash'i biliniyorsa (ör. yükleme
+                sırasında hesaplandıysa) yol/zaman yerine bu kullanılır
+
+        Returns:
+            str: Parmak izi
+        """
+        if content_hash:
+            return f"sha256:{content_hash}"
+
+        source_path = Path(source_path).resolve()
+        stat = source_path.stat()
+        return f"file:{source_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Önbellekten sonucu okur.
+
+        Args:
+            key: make_key() sonucu
+
+        Returns:
+            Optional[Dict]: {"transcription": {...}, "audio_duration": 125.5}
+                Bulunamazsa None
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            logger.debug(f"Transcription önbelleğinde yok: {key[:12]}")
+            return None
+        except (OSError, ValueError) as e:
+            # Bozuk kayıt: sil ve yokmuş gibi davran
+            logger.warning(f"Bozuk önbellek kaydı siliniyor ({key[:12]}): {e}")
+            entry_path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # LRU için son kullanım zamanını güncelle
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+
+        logger.info(f"Transcription önbellekten alındı: {key[:12]}")
+        return entry
+
+    def put(self, key: str, transcription: Dict, audio_duration: float = None):
+        """
+        Sonucu önbelleğe yazar (atomik) ve gerekirse eski kayıtları siler.
+
+        Args:
+            key: make_key() sonucu
+            transcription: Transcriber.transcribe() sonucu
+            audio_duration: Ses süresi (saniye), önbellekten dönülünce
+                sesi tekrar çıkarmadan süreyi bilmek için
+        """
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "transcription": transcription,
+            "audio_duration": audio_duration
+        }
+
+        # Önce geçici dosyaya yaz, sonra yeniden adlandır (yarım kayıt kalmasın)
+        # Geçici isim her yazmada benzersiz: aynı süreçte aynı anahtarı yazan
+        # thread'ler (toplu işleme, iş sunucusu) birbirinin dosyasını bozmaz
+        fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, prefix=f"{entry_path.name}.", suffix=".tmp")
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as raw_file, gzip.open(raw_file, "wt", encoding="utf-8") as f:
+                # Kompakt JSON: girinti ve boşluk yok
+                json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        logger.debug(
+            f"Transcription önbelleğe yazıldı: {key[:12]} "
+            f"({entry_path.stat().st_size / 1024:.1f} KB)"
+        )
+
+        self._evict()
+
+    def lookup_source(self, fingerprint: str) -> Optional[str]:
+        """
+        Kaynak dosya parmak izinden daha önce hesaplanan ses hash'ini bulur.
+
+        Returns:
+            Optional[str]: Ses hash'i, bilinmiyorsa None
+        """
+        source_path = self._source_path(fingerprint)
+        try:
+            return source_path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def remember_source(self, fingerprint: str, audio_hash: str):
+        """Kaynak dosya parmak izi -> ses hash'i eşlemesini kaydeder."""
+        self._source_path(fingerprint).write_text(audio_hash, encoding="utf-8")
+
+    def stats(self) -> Dict:
+        """
+        Önbellek istatistiklerini döndürür.
+
+        Returns:
+            Dict: {"hits", "misses", "entries", "size_mb", "max_size_mb"}
+        """
+        entries = list(self._iter_entries())
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "size_mb": round(sum(entry.stat().st_size for entry in entries) / (1024 * 1024), 2),
+            "max_size_mb": self.max_size_mb
+        }
+
+    def clear(self):
+        """Tüm önbellek kayıtlarını siler."""
+        for entry in self._iter_entries():
+            entry.unlink(missing_ok=True)
+        for source in self.sources_dir.glob("*.txt"):
+            source.unlink(missing_ok=True)
+        logger.info("Transcription önbelleği temizlendi")
+
+    def _entry_path(self, key: str) -> Path:
+        """Anahtarın dosya yolu (ilk 2 karakter alt klasör: çok dosyalı klasörden kaçın)."""
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def _source_path(self, fingerprint: str) -> Path:
+        """Kaynak parmak izinin dosya yolu."""
+        digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+        return self.sources_dir / f"{digest}.txt"
+
+    def _iter_entries(self):
+        """Tüm önbellek kayıt dosyalarını döndürür."""
+        return self.cache_dir.glob("??/*.json.gz")
+
+    def _evict(self):
+        """Toplam boyut sınırı aşıldıysa en eski kullanılan kayıtları siler."""
+        max_bytes = self.max_size_mb * 1024 * 1024
+
+        entries = []
+        total_bytes = 0
+        for entry in self._iter_entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total_bytes += stat.st_size
+
+        if total_bytes <= max_bytes:
+            return
+
+        # En eski kullanılan (mtime) önce
+        entries.sort()
+        for _, size, entry in entries:
+            if total_bytes <= max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_bytes -= size
+            logger.debug(f"Önbellek kaydı silindi (LRU): {entry.name}")
+
+
+# Süreç genelinde tek önbellek nesnesi (sayaçlar paylaşılsın)
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_transcription_cache() -> TranscriptionCache:
+    """
+    Süreç genelinde paylaşılan TranscriptionCache'i döndürür.
+
+    Returns:
+        TranscriptionCache: Paylaşılan önbellek
+    """
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = TranscriptionCache()
+        return _cache
@@ -0,0 +1,162 @@
+"""
+Yükleme Modülü
+==============
+Bu modül yüklenen videoları belleğe almadan, bloklar halinde diske yazar
+ve yazarken içerik hash'ini (SHA-256) hesaplar.
+
+Neden Gerekli?
+--------------
+- Web UI videoyu video_file.read() ile tek seferde kopyalıyordu: 500 MB'lık
+  bir yükleme, eşzamanlı her kullanıcı için 500 MB+ ek Python belleği
+- Hash yazma sırasında hesaplanır (dosya ikinci kez okunmaz); transcription
+  önbelleği aynı videonun farklı adla tekrar yüklendiğini ses çıkarmadan tanır
+- Her yükleme kendi klasörüne yazılır: aynı adlı dosyayı yükleyen iki
+  kullanıcı birbirinin dosyasını ezmez / silmez
+- Yönetici izin verirse (settings.SERVER_PATH_ROOT) sunucudaki dosya
+  yerinde işlenir: yükleme kopyası hiç oluşmaz
+
+Örnek:
+    >>> upload = save_upload(video_file, new_upload_path(video_file.name))
+    >>> upload
+    {"path": PosixPath('uploads/3f2a.../mulakat.mp4'), "sha256": "9b1c...", "size": 524288000}
+    >>> process_video(upload["path"], ..., content_hash=upload["sha256"])
+    >>> remove_upload(upload["path"])
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Dict, Union
+import hashlib
+import uuid
+import config.settings as settings
+
+
+# Okuma / yazma blok boyutu (bellekte en fazla bir blok tutulur)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadError(ValueError):
+    """Yükleme yarıda kesildi veya boyut sınırını aştı."""
+    pass
+
+
+def new_upload_path(filename: str, upload_dir: Union[str, Path] = None) -> Path:
+    """
+    Yükleme için benzersiz hedef yol (upload_dir/<rastgele>/<dosya adı>).
+
+    Args:
+        filename: Orijinal dosya adı (yol bileşenleri atılır)
+        upload_dir: Yükleme klasörü (verilmezse settings.UPLOAD_DIR)
+
+    Returns:
+        Path: Henüz oluşturulmamış dosya yolu
+    """
+    upload_dir = Path(upload_dir) if upload_dir else settings.UPLOAD_DIR
+    return upload_dir / uuid.uuid4().hex / Path(filename).name
+
+
+def save_upload(
+    stream: BinaryIO,
+    path: Union[str, Path],
+    length: int = None,
+    max_bytes: int = None
+) -> Dict:
+    """
+    Akışı bloklar halinde dosyaya yazar, SHA-256'yı yazarken hesaplar.
+
+    Hata olursa (kesinti, boyut sınırı) yarım dosya silinir.
+
+    Args:
+        stream: Okunabilir ikili akış (Streamlit UploadedFile, HTTP gövdesi, ...)
+        path: Hedef dosya (klasörü yoksa oluşturulur)
+        length: Okunacak bayt sayısı (HTTP Content-Length; None = akış sonuna kadar)
+        max_bytes: En fazla boyut (None = sınırsız)
+
+    Returns:
+        Dict: {"path": Path, "sha256": str, "size": int}
+
+    Raises:
+        UploadError: Akış length'ten önce bitti veya boyut max_bytes'ı aştı
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    hasher = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(path, "wb") as f:
+            while length is None or size < length:
+                block_size = UPLOAD_CHUNK_SIZE if length is None else min(UPLOAD_CHUNK_SIZE, length - size)
+                block = stream.read(block_size)
+                if not block:
+                    break
+
+                size += len(block)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadError(f"Dosya çok büyük (en fazla {max_bytes / 1024 / 1024:.0f} MB)")
+
+                hasher.update(block)
+                f.write(block)
+
+        if length is not None and size < length:
+            raise UploadError("Yükleme yarıda kesildi")
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+    return {"path": path, "sha256": hasher.hexdigest(), "size": size}
+
+
+def remove_upload(path: Union[str, Path]):
+    """Yüklenen dosyayı ve new_upload_path() ile oluşturulan klasörünü siler."""
+    path = Path(path)
+    path.unlink(missing_ok=True)
+
+    # Sadece yükleme başına açılan (boşalmış) klasör silinir
+    try:
+        path.parent.rmdir()
+    except OSError:
+        pass
+
+
+def server_paths_enabled() -> bool:
+    """Sunucudaki dosyaları yerinde işleme açık mı? (settings.SERVER_PATH_ROOT)"""
+    return bool(settings.SERVER_PATH_ROOT)
+
+
+def resolve_server_path(path_text: str) -> Path:
+    """
+    Sunucu tarafı dosya yolunu doğrular (yükleme yapılmadan işlenecek).
+
+    Sadece settings.SERVER_PATH_ROOT altındaki, desteklenen formattaki
+    dosyalar kabul edilir; göreli yollar bu klasöre göre çözülür ve
+    sembolik bağlantılar / ".." ile klasör dışına çıkılamaz.
+
+    Args:
+        path_text: Kullanıcının girdiği yol (mutlak veya köke göre göreli)
+
+    Returns:
+        Path: Çözülmüş mutlak dosya yolu
+
+    Raises:
+        PermissionError: Özellik kapalı veya yol izin verilen klasörün dışında
+        FileNotFoundError: Dosya yok
+        UploadError: Desteklenmeyen dosya formatı
+    """
+    if not server_paths_enabled():
+        raise PermissionError("Sunucudaki dosyaları işleme kapalı (SERVER_PATH_ROOT ayarlı değil)")
+
+    root = Path(settings.SERVER_PATH_ROOT).expanduser().resolve()
+    path = Path(path_text.strip()).expanduser()
+    if not path.is_absolute():
+        path = root / path
+    path = path.resolve()
+
+    if root not in path.parents:
+        raise PermissionError(f"Sadece {root} altındaki dosyalar işlenebilir")
+    if not path.is_file():
+        raise FileNotFoundError(f"Dosya bulunamadı: {path}")
+    if path.suffix.lower() not in settings.SUPPORTED_VIDEO_FORMATS + settings.SUPPORTED_AUDIO_FORMATS:
+        raise UploadError(f"Desteklenmeyen dosya: {path.name}")
+
+    return path
@@ -5,15 +5,55 @@ Bu modül video dosyalarından ses çıkarır ve işler.
 - Video'dan ses extraction (çıkarma)
 - Ses formatını WAV'a çevirme
 - Sample rate ve kanal ayarlama (16kHz, mono)
+- Video'dan ses'i doğrudan belleğe (NumPy) decode etme
+- Medya başlığını okuyarak süre/codec/ses akışı bilgisi alma (probe)
 """
 
 from pathlib import Path
-from typing import Union
+from typing import Union, Dict, Optional
+import json
+import re
+import shutil
+import subprocess
+import threading
+import wave
+import numpy as np
 from loguru import logger
-from moviepy.editor import VideoFileClip, AudioFileClip
+from moviepy.editor import VideoFileClip
 import config.settings as settings
 
 
+# Whisper modelleri sadece 16 kHz mono ses ile çalışır
+# Bellek içi modda ses her zaman bu formatta üretilir
+WHISPER_SAMPLE_RATE = 16000
+
+# ffmpeg stdout'undan tek seferde okunacak byte sayısı (1 MB)
+PCM_READ_CHUNK_SIZE = 1024 * 1024
+
+
+def get_ffmpeg_binary() -> str:
+    """
+    Kullanılacak ffmpeg çalıştırılabilir dosyasını bulur.
+
+    Öncelik sırası:
+    1. settings.FFMPEG_BINARY (.env'den FFMPEG_BINARY)
+    2. imageio-ffmpeg binary'si (moviepy'nin de kullandığı)
+    3. PATH'teki "ffmpeg"
+
+    Returns:
+        str: ffmpeg yolu veya komut adı
+    """
+    if settings.FFMPEG_BINARY:
+        return settings.FFMPEG_BINARY
+
+    try:
+        # moviepy zaten imageio-ffmpeg'e bağımlı, ek kurulum gerekmez
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
 def extract_audio_from_video(
     video_path: Union[str, Path],
     output_path: Union[str, Path] = None
@@ -136,6 +176,379 @@ def extract_audio_from_video(
         raise
 
 
+def get_ffprobe_binary() -> Optional[str]:
+    """
+    Kullanılacak ffprobe çalıştırılabilir dosyasını bulur.
+
+    Returns:
+        Optional[str]: ffprobe yolu, bulunamazsa None
+            (imageio-ffmpeg sadece ffmpeg içerir, ffprobe içermez)
+    """
+    if settings.FFPROBE_BINARY:
+        return settings.FFPROBE_BINARY
+
+    return shutil.which("ffprobe")
+
+
+def probe_media(media_path: Union[str, Path]) -> Dict:
+    """
+    Medya dosyasının başlığını (header) okur, içeriği decode etmez.
+
+    Kullanılan yöntemler (sırayla):
+    1. .wav dosyaları: Python'un wave modülü ile başlık okuma (saf Python)
+    2. ffprobe: Container başlığını JSON olarak okur
+    3. ffmpeg -i: ffprobe yoksa ffmpeg'in stderr çıktısı ayrıştırılır
+
+    Hepsi milisaniyeler sürer; moviepy'nin AudioFileClip/VideoFileClip
+    gibi ffmpeg okuma süreci başlatmaz.
+
+    Args:
+        media_path: Video veya ses dosyasının yolu
+
+    Returns:
+        Dict: Medya bilgisi
+            {
+                "duration": 125.5,          # Saniye (okunamazsa None)
+                "format_name": "mov,mp4,...",
+                "audio_codec": "aac",       # İlk ses akışının codec'i
+                "sample_rate": 44100,       # İlk ses akışının sample rate'i
+                "channels": 2,              # İlk ses akışının kanal sayısı
+                "num_audio_streams": 1,
+                "num_video_streams": 1,
+                "probe_method": "ffprobe"   # wave, ffprobe veya ffmpeg
+            }
+
+    Raises:
+        FileNotFoundError: Dosya bulunamazsa
+        ValueError: Dosya okunamıyorsa (bozuk veya desteklenmeyen format)
+
+    Örnek:
+        >>> info = probe_media("video.mp4")
+        >>> print(info["duration"], info["num_audio_streams"])
+        125.5 1
+    """
+    media_path = Path(media_path)
+
+    if not media_path.exists():
+        raise FileNotFoundError(f"Medya dosyası bulunamadı: {media_path}")
+
+    media_info = None
+
+    # 1. WAV: saf Python başlık okuma
+    if media_path.suffix.lower() == ".wav":
+        media_info = _probe_wav_header(media_path)
+
+    # 2. ffprobe
+    if media_info is None:
+        ffprobe_binary = get_ffprobe_binary()
+        if ffprobe_binary:
+            media_info = _probe_with_ffprobe(media_path, ffprobe_binary)
+
+    # 3. ffmpeg -i (stderr ayrıştırma)
+    if media_info is None:
+        media_info = _probe_with_ffmpeg(media_path)
+
+    logger.debug(
+        f"Medya bilgisi ({media_info['probe_method']}): {media_path.name} - "
+        f"süre={media_info['duration']}, ses akışı={media_info['num_audio_streams']}, "
+        f"codec={media_info['audio_codec']}, {media_info['sample_rate']} Hz, "
+        f"{media_info['channels']} kanal"
+    )
+
+    return media_info
+
+
+def _empty_media_info(probe_method: str) -> Dict:
+    """Tüm alanları boş bir medya bilgisi sözlüğü oluşturur."""
+    return {
+        "duration": None,
+        "format_name": None,
+        "audio_codec": None,
+        "sample_rate": None,
+        "channels": None,
+        "num_audio_streams": 0,
+        "num_video_streams": 0,
+        "probe_method": probe_method
+    }
+
+
+def _probe_wav_header(media_path: Path) -> Optional[Dict]:
+    """
+    WAV başlığını wave modülü ile okur.
+
+    Returns:
+        Optional[Dict]: Medya bilgisi, wave modülünün desteklemediği
+            WAV türlerinde (ör. float32 WAV) None
+    """
+    try:
+        with wave.open(str(media_path), "rb") as wav_file:
+            frame_rate = wav_file.getframerate()
+            num_frames = wav_file.getnframes()
+            media_info = _empty_media_info("wave")
+            media_info.update({
+                "duration": num_frames / frame_rate if frame_rate else None,
+                "format_name": "wav",
+                # Sample width (byte) -> pcm codec adı (2 -> pcm_s16le)
+                "audio_codec": f"pcm_s{wav_file.getsampwidth() * 8}le",
+                "sample_rate": frame_rate,
+                "channels": wav_file.getnchannels(),
+                "num_audio_streams": 1
+            })
+            return media_info
+    except (wave.Error, EOFError):
+        return None
+
+
+def _probe_with_ffprobe(media_path: Path, ffprobe_binary: str) -> Dict:
+    """
+    ffprobe ile container başlığını okur.
+
+    Raises:
+        ValueError: ffprobe dosyayı açamazsa (bozuk dosya)
+    """
+    command = [
+        ffprobe_binary,
+        "-v", "error",
+        "-show_entries",
+        "format=duration,format_name:"
+        "stream=codec_type,codec_name,sample_rate,channels,duration",
+        "-of", "json",
+        str(media_path)
+    ]
+
+    completed = subprocess.run(command, capture_output=True, text=True)
+
+    if completed.returncode != 0:
+        raise ValueError(
+            f"Medya dosyası okunamadı: {media_path.name}\n"
+            f"{completed.stderr.strip()[-500:]}"
+        )
+
+    probe_data = json.loads(completed.stdout or "{}")
+    streams = probe_data.get("streams", [])
+    format_data = probe_data.get("format", {})
+
+    audio_streams = [stream for stream in streams if stream.get("codec_type") == "audio"]
+    video_streams = [stream for stream in streams if stream.get("codec_type") == "video"]
+
+    media_info = _empty_media_info("ffprobe")
+    media_info["format_name"] = format_data.get("format_name")
+    media_info["num_audio_streams"] = len(audio_streams)
+    media_info["num_video_streams"] = len(video_streams)
+
+    # Süre: önce ses akışının süresi, yoksa container süresi
+    duration = None
+    if audio_streams:
+        first_audio = audio_streams[0]
+        media_info["audio_codec"] = first_audio.get("codec_name")
+        media_info["sample_rate"] = int(first_audio["sample_rate"]) if first_audio.get("sample_rate") else None
+        media_info["channels"] = first_audio.get("channels")
+        duration = first_audio.get("duration")
+
+    duration = duration or format_data.get("duration")
+    media_info["duration"] = float(duration) if duration not in (None, "N/A") else None
+
+    return media_info
+
+
+# "ffmpeg -i" stderr çıktısını ayrıştırmak için regex'ler
+_FFMPEG_INPUT_PATTERN = re.compile(r"Input #0, (?P<format>[^,]+(?:,[^,\s]+)*), from")
+_FFMPEG_DURATION_PATTERN = re.compile(r"Duration: (?P<h>\d+):(?P<m>\d+):(?P<s>\d+(?:\.\d+)?)")
+_FFMPEG_STREAM_PATTERN = re.compile(r"Stream #\d+:\d+.*?: (?P<type>Audio|Video): (?P<details>.*)")
+_FFMPEG_CHANNEL_LAYOUTS = {"mono": 1, "stereo": 2, "2.1": 3, "quad": 4, "5.0": 5, "5.1": 6, "6.1": 7, "7.1": 8}
+
+
+def _probe_with_ffmpeg(media_path: Path) -> Dict:
+    """
+    ffprobe yoksa "ffmpeg -i" çıktısından başlık bilgisini ayrıştırır.
+
+    ffmpeg çıktı dosyası verilmediği için sadece başlığı okuyup çıkar,
+    içerik decode edilmez.
+
+    Raises:
+        ValueError: ffmpeg dosyayı açamazsa (bozuk dosya)
+    """
+    command = [get_ffmpeg_binary(), "-nostdin", "-hide_banner", "-i", str(media_path)]
+
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, errors="replace")
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"ffmpeg bulunamadı: {command[0]}\n"
+            f"FFmpeg kurun veya .env dosyasında FFMPEG_BINARY ayarlayın"
+        )
+
+    output = completed.stderr
+
+    if "Input #0" not in output:
+        raise ValueError(
+            f"Medya dosyası okunamadı: {media_path.name}\n"
+            f"{output.strip()[-500:]}"
+        )
+
+    media_info = _empty_media_info("ffmpeg")
+
+    input_match = _FFMPEG_INPUT_PATTERN.search(output)
+    if input_match:
+        media_info["format_name"] = input_match.group("format")
+
+    duration_match = _FFMPEG_DURATION_PATTERN.search(output)
+    if duration_match:
+        media_info["duration"] = (
+            int(duration_match.group("h")) * 3600
+            + int(duration_match.group("m")) * 60
+            + float(duration_match.group("s"))
+        )
+
+    for stream_match in _FFMPEG_STREAM_PATTERN.finditer(output):
+        if stream_match.group("type") == "Video":
+            media_info["num_video_streams"] += 1
+            continue
+
+        media_info["num_audio_streams"] += 1
+        if media_info["num_audio_streams"] > 1:
+            continue
+
+        # Örnek: "aac (LC) (mp4a / 0x6134706D), 44100 Hz, stereo, fltp, 128 kb/s"
+        details = [part.strip() for part in stream_match.group("details").split(",")]
+        media_info["audio_codec"] = details[0].split(" ")[0]
+
+        for part in details[1:]:
+            if part.endswith(" Hz"):
+                media_info["sample_rate"] = int(part[:-3])
+            elif part in _FFMPEG_CHANNEL_LAYOUTS:
+                media_info["channels"] = _FFMPEG_CHANNEL_LAYOUTS[part]
+            elif part.endswith(" channels"):
+                media_info["channels"] = int(part.split(" ")[0])
+            elif "(" in part and part.split("(")[0] in _FFMPEG_CHANNEL_LAYOUTS:
+                # Örnek: "5.1(side)"
+                media_info["channels"] = _FFMPEG_CHANNEL_LAYOUTS[part.split("(")[0]]
+
+    return media_info
+
+
+def extract_audio_to_array(video_path: Union[str, Path]) -> np.ndarray:
+    """
+    Video dosyasındaki sesi tek bir ffmpeg decode ile belleğe çıkarır.
+
+    extract_audio_from_video()'dan farkı:
+    - Diske WAV yazılmaz (geçici dosya yok)
+    - Whisper sesi ikinci kez decode etmez
+    - ffmpeg float32 mono 16 kHz PCM üretir, stdout üzerinden doğrudan
+      NumPy dizisine akar ve WhisperModel.transcribe()'a verilir
+
+    Args:
+        video_path: Video dosyasının yolu
+
+    Returns:
+        np.ndarray: float32, mono, 16 kHz ses örnekleri (-1.0 ile 1.0 arası)
+
+    Raises:
+        FileNotFoundError: Video dosyası bulunamazsa
+        ValueError: Video'da ses yoksa
+        RuntimeError: ffmpeg hatası
+
+    Örnek Kullanım:
+        >>> audio = extract_audio_to_array("video.mp4")
+        >>> print(f"{len(audio) / 16000:.2f} saniye")
+        125.50 saniye
+    """
+    video_path = Path(video_path)
+
+    if not video_path.exists():
+        error_msg = f"Video dosyası bulunamadı: {video_path}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg)
+
+    logger.info(f"Ses belleğe çıkarılıyor (ffmpeg -> float32 PCM): {video_path.name}")
+
+    command = [
+        get_ffmpeg_binary(),
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-i", str(video_path),
+        # -vn: Video akışını decode etme (sadece ses)
+        "-vn",
+        # Mono, 16 kHz (Whisper formatı)
+        "-ac", "1",
+        "-ar", str(WHISPER_SAMPLE_RATE),
+        # Ham float32 little-endian PCM, stdout'a
+        "-f", "f32le",
+        "-acodec", "pcm_f32le",
+        "pipe:1"
+    ]
+
+    try:
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"ffmpeg bulunamadı: {command[0]}\n"
+            f"FFmpeg kurun veya .env dosyasında FFMPEG_BINARY ayarlayın"
+        )
+
+    # stderr ayrı thread'de okunur, yoksa pipe dolduğunda ffmpeg kilitlenebilir
+    stderr_chunks = []
+    stderr_thread = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()),
+        daemon=True
+    )
+    stderr_thread.start()
+
+    # PCM verisini parça parça tek bir buffer'a topla
+    # bytearray + np.frombuffer: sonda ekstra kopya oluşmaz
+    pcm_buffer = bytearray()
+    try:
+        while True:
+            chunk = process.stdout.read(PCM_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            pcm_buffer += chunk
+    except BaseException:
+        # Okuma yarıda kesildi (Ctrl-C, MemoryError, ...): ffmpeg'i sonlandır,
+        # pipe'lar kapanınca stderr thread'i de biter
+        process.kill()
+        raise
+    finally:
+        process.wait()
+        stderr_thread.join()
+        process.stdout.close()
+        process.stderr.close()
+    stderr_text = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+
+    if process.returncode != 0:
+        # Ses akışı olmayan videolarda ffmpeg çıktı akışı oluşturamaz
+        if "does not contain any stream" in stderr_text or "matches no streams" in stderr_text:
+            error_msg = f"Video'da ses bulunamadı: {video_path.name}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        error_msg = f"ffmpeg ses çıkarma hatası ({process.returncode}): {stderr_text[-500:]}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+    # float32 = 4 byte; yarım kalmış son örneği at
+    usable_bytes = len(pcm_buffer) - (len(pcm_buffer) % 4)
+    audio = np.frombuffer(pcm_buffer, dtype=np.float32, count=usable_bytes // 4)
+
+    if audio.size == 0:
+        error_msg = f"Video'da ses bulunamadı: {video_path.name}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+    duration = audio.size / WHISPER_SAMPLE_RATE
+    logger.success(
+        f"Ses belleğe çıkarıldı: {duration:.2f} saniye "
+        f"({audio.nbytes / (1024 * 1024):.2f} MB)"
+    )
+
+    return audio
+
+
 def get_audio_duration(audio_path: Union[str, Path]) -> float:
     """
     Ses dosyasının süresini saniye cinsinden döndürür.
@@ -156,24 +569,32 @@ def get_audio_duration(audio_path: Union[str, Path]) -> float:
     if not audio_path.exists():
         raise FileNotFoundError(f"Ses dosyası bulunamadı: {audio_path}")
 
-    # AudioFileClip: sadece ses dosyaları için
-    audio = AudioFileClip(str(audio_path))
-    duration = audio.duration  # Saniye cinsinden
-    audio.close()
+    # Sadece başlık okunur (WAV için saf Python), ses decode edilmez
+    duration = probe_media(audio_path)["duration"]
+
+    if duration is None:
+        raise ValueError(f"Ses dosyasının süresi okunamadı: {audio_path}")
 
     logger.debug(f"Ses dosyası süresi: {duration:.2f} saniye")
     return duration
 
 
-def validate_video_file(video_path: Union[str, Path]) -> bool:
+def validate_video_file(video_path: Union[str, Path], media_info: Dict = None) -> bool:
     """
     Video dosyasını doğrular.
     - Dosya var mı?
     - Desteklenen format mı?
     - Boyut limiti içinde mi?
+    - Başlık okunabiliyor mu, ses akışı var mı, süre geçerli mi?
+
+    Bozuk veya sessiz videolar ses çıkarma başlamadan, milisaniyeler
+    içinde reddedilir.
 
     Args:
         video_path: Kontrol edilecek video dosyası
+        media_info: probe_media() sonucu (opsiyonel)
+            Verilmezse dosya burada probe edilir. Çağıran taraf sonucu
+            zaten aldıysa tekrar açmamak için buraya geçirir.
 
     Returns:
         bool: Geçerli ise True
@@ -205,9 +626,20 @@ def validate_video_file(video_path: Union[str, Path]) -> bool:
             f"Maksimum boyut: {settings.MAX_FILE_SIZE_MB} MB"
         )
 
+    # Başlık bilgisi (verilmediyse şimdi oku)
+    if media_info is None:
+        media_info = probe_media(video_path)
+
+    if media_info["num_audio_streams"] == 0:
+        raise ValueError(f"Video'da ses bulunamadı: {video_path.name}")
+
+    if not media_info["duration"] or media_info["duration"] <= 0:
+        raise ValueError(f"Video süresi okunamadı (dosya bozuk olabilir): {video_path.name}")
+
     logger.info(
         f"Video doğrulandı: {video_path.name} "
-        f"({file_size_mb:.2f} MB, {video_path.suffix})"
+        f"({file_size_mb:.2f} MB, {video_path.suffix}, "
+        f"{media_info['duration']:.2f} saniye, ses: {media_info['audio_codec']})"
     )
 
     return True
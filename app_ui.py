@@ -7,7 +7,15 @@ Streamlit tabanlı basit arayüz
 import streamlit as st
 from pathlib import Path
 import time
-from v_to_t import process_video
+from v_to_t import process_video, format_duration, format_timestamp
+from app.search_index import get_search_index
+from app.job_client import JobClient, JobServerError
+from app.job_queue import FINISHED_STATUSES
+from app.progress import BackgroundJob, ProgressTracker
+from app.uploads import (
+    UploadError, new_upload_path, remove_upload, resolve_server_path, save_upload, server_paths_enabled
+)
+import config.settings as settings
 import json
 
 # Sayfa yapılandırması
@@ -116,6 +124,159 @@ model_size = "large-v3-turbo"  # En iyi doğruluk/hız dengesi
 language = "tr"  # Türkçe
 export_text = True  # Her zaman text dosyası oluştur
 
+# JOB_SERVER_URL ayarlıysa işler iş kuyruğu sunucusuna gönderilir
+# (python v_to_t.py serve); UI sadece gönderir ve ilerlemeyi izler
+job_client = JobClient(settings.JOB_SERVER_URL) if settings.JOB_SERVER_URL else None
+
+# İşlem aşaması etiketleri
+STAGE_LABELS = {
+    "queued": "⏳ Kuyrukta bekliyor...",
+    "prepare": "🎞️ Ses çıkarılıyor...",
+    "transcribe": "🗣️ Konuşma tanınıyor...",
+    "finalize": "💾 Sonuçlar kaydediliyor...",
+}
+
+
+def clear_previous_result():
+    """Eski sonuçları session state'ten temizle."""
+    for key in ('result', 'video_path', 'questions_path', 'job_message'):
+        if key in st.session_state:
+            del st.session_state[key]
+
+
+def active_remote_job():
+    """Sunucuda izlenen işin kimliği (gönderimden sonra veya URL'den, yoksa None)."""
+    if job_client is None:
+        return None
+    return st.session_state.get('job_id') or st.query_params.get("job")
+
+
+def finish_processing(status: str, result: dict = None, error: str = None):
+    """İş bittiğinde sonucu veya mesajı session state'e yazar ve sayfayı yeniler."""
+    if status == "done":
+        st.session_state['result'] = result
+        st.session_state['video_path'] = Path(result['result']['metadata']['video_name'])
+    elif status == "cancelled":
+        st.session_state['job_message'] = ("warning", "⛔ İşlem iptal edildi")
+    else:
+        st.session_state['job_message'] = ("error", f"❌ Hata oluştu: {error}")
+
+    # Sonuçlar bölümü tüm sayfa yeniden çalışınca görünür
+    st.rerun()
+
+
+def lazy_file(path):
+    """
+    İndirme butonu verisi: dosya sadece butona basılınca okunur.
+
+    Sonuç bölümü her yenilemede (ilerleme, arama, ...) yeniden çizilir;
+    içerik doğrudan verilse tüm çıktılar her seferinde okunurdu.
+    """
+    return lambda: Path(path).read_bytes()
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def read_text_cached(path: str, mtime_ns: int) -> str:
+    """Önizleme metni (dosya değişmedikçe diskten tekrar okunmaz)."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def render_progress(snapshot: dict, note: str = ""):
+    """
+    İlerleme çubuğu, aşama / süre / kalan süre ve gelen metin.
+
+    Args:
+        snapshot: ProgressTracker.snapshot() sonucu
+        note: Durum satırına eklenecek bilgi (ör. kuyruk sırası)
+    """
+    st.progress(snapshot["progress"])
+
+    stage = snapshot["stage"] or "queued"
+    status = STAGE_LABELS.get(stage, stage)
+    if stage == "transcribe" and snapshot["audio_duration"]:
+        status += f" {format_timestamp(snapshot['processed_seconds'])} / {format_timestamp(snapshot['audio_duration'])}"
+    if snapshot["eta_seconds"] is not None:
+        # Kalan süre gözlenen hızdan (RTF) tahmin edilir
+        status += f" · kalan ~{format_duration(snapshot['eta_seconds'])} (RTF {snapshot['rtf']:.2f})"
+    st.text(status + note)
+
+    if snapshot["text"]:
+        # Uzun kayıtlarda sadece son kısım gösterilir
+        st.markdown(f"_{snapshot['text'][-3000:]}_")
+
+
+@st.fragment(run_every=1.0)
+def watch_local_job():
+    """
+    Arka plan thread'indeki işi izler (saniyede bir sadece bu bölüm yenilenir).
+
+    Sayfanın geri kalanı (arama vb.) işlem sürerken kullanılabilir.
+    """
+    job = st.session_state['local_job']
+
+    if st.button("⛔ İptal Et", key="cancel_local_job", disabled=job.cancel_requested):
+        job.cancel()
+
+    render_progress(job.snapshot(), " · iptal ediliyor..." if job.cancel_requested and not job.finished else "")
+
+    if job.finished:
+        del st.session_state['local_job']
+        finish_processing(job.status, job.result, str(job.error))
+
+
+@st.fragment(run_every=1.0)
+def watch_remote_job(job_id: str):
+    """
+    Sunucudaki işi izler: ilerleme, kısmi metin, iptal.
+
+    İş kimliği URL'de (?job=...) tutulur; sayfa yenilense de izleme devam eder.
+    """
+    # İzleme durumu: ilerleme takibi ve partial.jsonl'da okunan konum
+    if st.session_state.get('job_tracker_id') != job_id:
+        st.session_state['job_tracker_id'] = job_id
+        st.session_state['job_tracker'] = ProgressTracker()
+        st.session_state['job_offset'] = 0
+    tracker = st.session_state['job_tracker']
+
+    if st.button("⛔ İptal Et", key="cancel_remote_job"):
+        try:
+            job_client.cancel(job_id)
+        except JobServerError as e:
+            st.error(f"❌ İptal edilemedi: {str(e)}")
+
+    try:
+        job = job_client.get(job_id)
+        partial = job_client.partial(job_id, since=st.session_state['job_offset'])
+    except JobServerError as e:
+        # Sunucu geçici olarak erişilemezse izleme devam eder
+        st.error(f"❌ Sunucu hatası: {str(e)}")
+        return
+
+    if partial["reset"]:
+        tracker.clear_text()
+    for segment in partial["segments"]:
+        tracker.update({"segment": segment})
+    st.session_state['job_offset'] = partial["next"]
+    tracker.update(job)
+
+    note = f" (sıra: {job['queue_position']})" if job["status"] == "queued" and job.get("queue_position") else ""
+    render_progress(tracker.snapshot(), note)
+
+    if job["status"] in FINISHED_STATUSES:
+        # Biten iş artık izlenmez
+        st.session_state.pop('job_id', None)
+        if "job" in st.query_params:
+            del st.query_params["job"]
+
+        result = None
+        if job["status"] == "done":
+            try:
+                result = job_client.fetch_result(job_id, Path("outputs"))
+            except JobServerError as e:
+                finish_processing("failed", error=str(e))
+        finish_processing(job["status"], result, job.get("error"))
+
+
 # Ana içerik
 col1, col2 = st.columns([2, 1])
 
@@ -127,6 +288,15 @@ with col1:
         help="Mülakat veya toplantı videosu"
     )
 
+    # Yönetici ayarı (SERVER_PATH_ROOT): sunucudaki dosya yüklemeden işlenir
+    server_path_text = ""
+    if server_paths_enabled():
+        server_path_text = st.text_input(
+            "veya sunucudaki dosya yolu",
+            placeholder=f"{settings.SERVER_PATH_ROOT}/mulakat.mp4",
+            help=f"{settings.SERVER_PATH_ROOT} altındaki dosya yerinde işlenir (yükleme ve kopya yok)"
+        )
+
 with col2:
     st.header("📝 Sorular (Opsiyonel)")
     questions_option = st.radio(
@@ -154,75 +324,139 @@ elif questions_option == "Manuel Gir":
         placeholder="Kendinizden bahseder misiniz?\nNeden bu pozisyonda çalışmak istiyorsunuz?\nEn büyük başarınız nedir?"
     )
 
+# Eşleştirme yöntemi (sadece soru varsa anlamlı)
+qa_method = None
+if questions_option != "Yok":
+    qa_method_label = st.radio(
+        "Eşleştirme yöntemi",
+        ["Eşit Zaman Segmentasyonu", "İçerik Hizalama"],
+        horizontal=True,
+        help="İçerik Hizalama: Sorular konuşmada aranır, cevaplar sorunun sorulduğu andan başlar"
+    )
+    qa_method = "content_alignment" if qa_method_label == "İçerik Hizalama" else "equal_time_segmentation"
+
+# Örnekleyici profiler (ek yük düşük, üretim işlerinde de açılabilir)
+profile = st.checkbox(
+    "🔬 Profil çıkar",
+    help="Aşama başına flamegraph (speedscope.app ile açılır): zaman ffmpeg'de mi, modelde mi, Python'da mı?"
+)
+
 # İşlem butonu
 st.markdown("---")
 
-if st.button("🚀 İşleme Başla", type="primary", use_container_width=True):
-    if not video_file:
-        st.error("❌ Lütfen bir video dosyası yükleyin!")
-    else:
-        # Video'yu geçici olarak kaydet
-        video_path = Path("uploads") / video_file.name
-        video_path.parent.mkdir(exist_ok=True)
+# Bir iş sürerken yenisi başlatılamaz
+processing_active = 'local_job' in st.session_state or active_remote_job() is not None
 
-        with open(video_path, "wb") as f:
-            f.write(video_file.read())
+def start_local_processing(video_path: Path, content_hash: str = None, uploaded: bool = True):
+    """
+    Videoyu bu süreçte, arka plan thread'inde işlemeye başlar.
 
-        # Questions dosyası varsa kaydet
-        questions_path = None
-        if questions_text and questions_text.strip():
-            questions_path = Path("uploads/questions_temp.txt")
-            with open(questions_path, "w", encoding="utf-8") as f:
-                f.write(questions_text.strip())
+    Args:
+        video_path: İşlenecek dosya
+        content_hash: Yükleme sırasında hesaplanan SHA-256 (önbellek için)
+        uploaded: Dosya yükleme kopyası mı? (işlem bitince silinir;
+            sunucudaki dosya silinmez)
+    """
+    # Questions dosyası varsa videonun yanına kaydet (aynı adlı dosyalar çakışmaz)
+    questions_path = None
+    if questions_text and questions_text.strip():
+        questions_path = new_upload_path("questions.txt")
+        questions_path.parent.mkdir(parents=True)
+        questions_path.write_text(questions_text.strip(), encoding="utf-8")
 
-        # Progress bar
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-
-        try:
-            # Eski sonuçları temizle
-            if 'result' in st.session_state:
-                del st.session_state['result']
-            if 'video_path' in st.session_state:
-                del st.session_state['video_path']
-            if 'questions_path' in st.session_state:
-                del st.session_state['questions_path']
+    # Eski sonuçları temizle
+    clear_previous_result()
 
-            # İşlemi başlat
-            status_text.text("⏳ Video işleniyor...")
-            progress_bar.progress(10)
+    output_path = Path("outputs") / f"{video_path.stem}_output.json"
 
-            output_path = Path("outputs") / f"{video_path.stem}_output.json"
-
-            result = process_video(
+    def run_processing(progress_callback):
+        try:
+            return process_video(
                 video_path=video_path,
                 model_size=model_size,
                 language=language,
                 output_path=output_path,
                 export_text=export_text,
-                questions_path=questions_path
+                questions_path=questions_path,
+                qa_method=qa_method,
+                content_hash=content_hash,
+                profile=profile,
+                progress_callback=progress_callback
             )
-
-            progress_bar.progress(100)
-            status_text.empty()
-
-            # Sonuçları session state'e kaydet
-            st.session_state['result'] = result
-            st.session_state['video_path'] = video_path
-            st.session_state['questions_path'] = questions_path
-
-        except Exception as e:
-            progress_bar.empty()
-            status_text.empty()
-            st.error(f"❌ Hata oluştu: {str(e)}")
-            st.exception(e)
-
         finally:
             # Geçici dosyaları temizle
-            if video_path.exists():
-                video_path.unlink()
-            if questions_path and questions_path.exists():
-                questions_path.unlink()
+            if uploaded:
+                remove_upload(video_path)
+            if questions_path:
+                remove_upload(questions_path)
+
+    # İşlem arka plan thread'inde çalışır; ilerleme aşağıda izlenir
+    local_job = BackgroundJob(run_processing)
+    local_job.start()
+    st.session_state['local_job'] = local_job
+
+
+if st.button("🚀 İşleme Başla", type="primary", use_container_width=True, disabled=processing_active):
+    job_options = {
+        "model_size": model_size,
+        "language": language,
+        "export_text": export_text,
+        "qa_method": qa_method,
+        "questions": questions_text,
+        "profile": profile
+    }
+
+    if server_path_text.strip():
+        # Sunucudaki dosya: yükleme kopyası oluşmaz
+        try:
+            if job_client is not None:
+                clear_previous_result()
+                job_id = job_client.submit_server_path(server_path_text.strip(), options=job_options)
+                st.session_state['job_id'] = job_id
+                st.query_params["job"] = job_id
+            else:
+                start_local_processing(resolve_server_path(server_path_text), uploaded=False)
+        except (PermissionError, FileNotFoundError, UploadError) as e:
+            st.error(f"❌ {str(e)}")
+        except JobServerError as e:
+            st.error(f"❌ İş gönderilemedi: {str(e)}")
+    elif not video_file:
+        st.error("❌ Lütfen bir video dosyası yükleyin!")
+    elif job_client is not None:
+        # Sunucu modu: video kuyruğa gönderilir, ilerleme aşağıda izlenir
+        clear_previous_result()
+        try:
+            job_id = job_client.submit(video_file, filename=video_file.name, options=job_options)
+            st.session_state['job_id'] = job_id
+            st.query_params["job"] = job_id
+        except JobServerError as e:
+            st.error(f"❌ İş gönderilemedi: {str(e)}")
+    else:
+        # Video bloklar halinde diske yazılır (tek seferde kopyalanmaz),
+        # hash yazarken hesaplanır: aynı video tekrar yüklenirse önbellekten gelir
+        video_file.seek(0)
+        upload_path = new_upload_path(video_file.name)
+        try:
+            upload = save_upload(video_file, upload_path, max_bytes=settings.MAX_FILE_SIZE_MB * 1024 * 1024)
+        except UploadError as e:
+            remove_upload(upload_path)
+            st.error(f"❌ {str(e)}")
+        else:
+            start_local_processing(upload["path"], content_hash=upload["sha256"])
+
+# İşlem durumu (yerel thread veya sunucudaki iş; sayfa yenilendiğinde de)
+remote_job_id = active_remote_job()
+if 'local_job' in st.session_state or remote_job_id:
+    st.markdown("---")
+    st.header("⏳ İşlem Durumu")
+    if 'local_job' in st.session_state:
+        watch_local_job()
+    else:
+        watch_remote_job(remote_job_id)
+
+if 'job_message' in st.session_state:
+    level, message = st.session_state.pop('job_message')
+    getattr(st, level)(message)
 
 # Sonuçları Göster (session_state'ten - download sonrası da kalıcı)
 if 'result' in st.session_state:
@@ -256,11 +490,9 @@ if 'result' in st.session_state:
 
     # JSON dosyası
     with download_col1:
-        with open(result['json_path'], 'r', encoding='utf-8') as f:
-            json_data = f.read()
         st.download_button(
             label="📄 JSON İndir",
-            data=json_data,
+            data=lazy_file(result['json_path']),
             file_name=f"{saved_video_path.stem}_output.json" if saved_video_path else "output.json",
             mime="application/json"
         )
@@ -268,11 +500,9 @@ if 'result' in st.session_state:
     # Text dosyası
     if result.get('text_path'):
         with download_col2:
-            with open(result['text_path'], 'r', encoding='utf-8') as f:
-                text_data = f.read()
             st.download_button(
                 label="📝 Text İndir",
-                data=text_data,
+                data=lazy_file(result['text_path']),
                 file_name=f"{saved_video_path.stem}_output.txt" if saved_video_path else "output.txt",
                 mime="text/plain"
             )
@@ -280,11 +510,9 @@ if 'result' in st.session_state:
     # QA JSON dosyası
     if result.get('qa_json_path'):
         with download_col3:
-            with open(result['qa_json_path'], 'r', encoding='utf-8') as f:
-                qa_json_data = f.read()
             st.download_button(
                 label="🔍 QA JSON İndir",
-                data=qa_json_data,
+                data=lazy_file(result['qa_json_path']),
                 file_name=f"{saved_video_path.stem}_qa.json" if saved_video_path else "qa.json",
                 mime="application/json"
             )
@@ -292,23 +520,35 @@ if 'result' in st.session_state:
     # QA Markdown dosyası
     if result.get('qa_md_path'):
         with download_col4:
-            with open(result['qa_md_path'], 'r', encoding='utf-8') as f:
-                qa_md_data = f.read()
             st.download_button(
                 label="📋 QA Rapor İndir",
-                data=qa_md_data,
+                data=lazy_file(result['qa_md_path']),
                 file_name=f"{saved_video_path.stem}_qa.md" if saved_video_path else "qa.md",
                 mime="text/markdown"
             )
 
+    # Profil dosyaları (sunucu modunda sunucudaki iş klasöründe kalır)
+    if result.get('profile_paths'):
+        with st.expander("🔬 Profil"):
+            st.caption("Dosyaları https://www.speedscope.app adresinde açın (çevrimdışı: speedscope npm paketi)")
+            for profile_path in map(Path, result['profile_paths']):
+                if profile_path.exists():
+                    st.download_button(
+                        label=f"⬇️ {profile_path.name}",
+                        data=lazy_file(profile_path),
+                        file_name=profile_path.name,
+                        key=f"profile_{profile_path.name}"
+                    )
+                else:
+                    st.text(str(profile_path))
+
     # Önizleme - Her zaman paragraf formatı
     st.markdown("### 📜 Transkript")
 
     if result.get('qa_md_path'):
         # QA Paragrafları (Soru-Cevap Formatı)
-        with open(result['qa_md_path'], 'r', encoding='utf-8') as f:
-            qa_md = f.read()
-        st.markdown(qa_md)
+        qa_md_path = Path(result['qa_md_path'])
+        st.markdown(read_text_cached(str(qa_md_path), qa_md_path.stat().st_mtime_ns))
     else:
         # Konuşmacı Paragrafları
         speakers = result['result']['speakers']
@@ -328,6 +568,33 @@ if 'result' in st.session_state:
 
             st.markdown("---")
 
+# Arama - İşlenmiş tüm transkriptler (SQLite FTS5 indeksi)
+st.markdown("---")
+st.header("🔎 Transkriptlerde Ara")
+
+search_query = st.text_input(
+    "Aranacak kelimeler",
+    placeholder='takım çalışması   veya   "maaş beklentisi"',
+    help="Türkçe karakter ve büyük/küçük harf duyarsız; kelimeler ekleriyle birlikte bulunur"
+)
+
+if search_query.strip():
+    try:
+        hits = get_search_index().search(search_query, limit=50)
+    except Exception as e:
+        hits = []
+        st.error(f"❌ Arama yapılamadı: {str(e)}")
+
+    if hits:
+        st.caption(f"{len(hits)} sonuç (en alakalı önce)")
+        for hit in hits:
+            st.markdown(
+                f"**{hit['video']}** · `{format_timestamp(hit['start'])} - {format_timestamp(hit['end'])}` · "
+                f"{hit['speaker']}  \n{hit['snippet']}"
+            )
+    else:
+        st.info("Sonuç bulunamadı")
+
 # Alt bilgi - B-LΞXIS Lexical Theme
 st.markdown("---")
 st.markdown("""
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Uçtan Uca Ölçek Benchmark'ı
+===========================
+process_video()'yu 1 dakikadan saatlere kadar sentetik videolarla
+çalıştırır (kapasite planlaması için).
+
+Test videoları yerelde üretilir (repoda test medyası yok):
+- speech: Konuşmaya benzer sinyal (numpy): hece hızında harmonik
+  patlamalar, iki farklı ses tonu, kelime / cümle arası sessizlikler,
+  düşük seviyeli arka plan gürültüsü. ffmpeg'e akışla verilir
+  (3 saatlik ses bile belleğe alınmaz)
+- lavfi: Sadece ffmpeg lavfi kaynakları: sine + pembe gürültü,
+  periyodik konuşma / sessizlik deseni
+
+Video akışı 1 fps siyah kare (mpeg4), ses AAC; aynı --seed ile aynı
+dosya üretilir. Üretilen dosyalar --media-dir'de tutulur ve tekrar
+kullanılır (ses akışının MD5'i sonuçlara yazılır).
+
+Her çalıştırma ayrı bir süreçte yapılır (tepe RSS çalıştırmalar arasında
+karışmasın). Raporlanan:
+- Aşama süreleri: model_load (ayrı ölçülür), prepare, transcribe, finalize
+- RTF: işlem süresi (model yükleme hariç) / ses süresi
+- Tepe RSS: Python süreci ve alt süreçler (ffmpeg) ayrı
+- CPU süresi, segment sayısı, çıktı boyutu (JSON + TXT)
+
+Farklı CPU düğümlerini karşılaştırmak için aynı --seed, --model ve
+--cpu-threads ile çalıştırın; ortam bilgisi (CPU, sürümler) JSON'a yazılır.
+
+Kullanım:
+    python benchmarks/bench_end_to_end.py
+    python benchmarks/bench_end_to_end.py --durations 1m 10m 1h 3h --model small
+    python benchmarks/bench_end_to_end.py --durations 30m --signal lavfi --cpu-threads 8 --json e2e.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Proje kökünü import yoluna ekle (benchmarks/ alt klasöründen çalıştırılır)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from loguru import logger
+
+import config.settings as settings
+from app.video_processor import get_ffmpeg_binary
+
+
+SAMPLE_RATE = 16000
+
+# Sentetik sinyal bir seferde bu uzunlukta (saniye) ffmpeg'e yazılır
+STREAM_BLOCK_SECONDS = 60
+
+# Konuşmacı temel frekansları (Hz): biri kalın, biri ince ses
+SPEAKER_F0 = (115.0, 205.0)
+
+STAGES = ("model_load", "prepare", "transcribe", "finalize")
+
+
+def parse_duration(text: str) -> float:
+    """'90', '90s', '10m', '1h', '1h30m' -> saniye."""
+    match = re.fullmatch(r"(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m)?(?:(\d+(?:\.\d+)?)s?)?", text.strip())
+    if not match or not any(match.groups()):
+        raise argparse.ArgumentTypeError(f"Geçersiz süre: {text} (ör. 90s, 10m, 1h)")
+    hours, minutes, seconds = (float(group or 0) for group in match.groups())
+    return hours * 3600 + minutes * 60 + seconds
+
+
+# ----------------------------------------------------------------------------
+# Sentetik medya üretimi
+# ----------------------------------------------------------------------------
+
+def _syllable(rng: np.random.Generator, f0: float) -> np.ndarray:
+    """Tek hece: ünsüz gürültüsü + harmonik ünlü, yumuşak zarf."""
+    vowel_length = int(SAMPLE_RATE * rng.uniform(0.10, 0.26))
+    t = np.arange(vowel_length) / SAMPLE_RATE
+
+    # Tonlama: hece boyunca hafif perde kayması
+    pitch = f0 * rng.uniform(0.85, 1.2) * (1 + rng.uniform(-0.08, 0.08) * t / t[-1])
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+
+    # Formant benzeri vurgu: hece başına rastgele iki harmonik bölgesi güçlenir
+    formants = rng.uniform(300, 900), rng.uniform(1000, 2500)
+    vowel = np.zeros(vowel_length)
+    for k in range(1, 16):
+        harmonic = k * pitch.mean()
+        if harmonic > SAMPLE_RATE / 2:
+            break
+        gain = sum(np.exp(-((harmonic - f) / 250) ** 2) for f in formants) + 0.15
+        vowel += gain / k * np.sin(k * phase)
+    vowel *= np.hanning(vowel_length)
+
+    consonant_length = int(SAMPLE_RATE * rng.uniform(0.02, 0.06))
+    consonant = rng.standard_normal(consonant_length) * 0.15 * np.hanning(consonant_length)
+
+    return np.concatenate([consonant, vowel])
+
+
+def iter_speech_like(duration: float, seed: int):
+    """
+    Konuşmaya benzer sinyali bloklar halinde üretir (float32, -1..1).
+
+    Cümleler: 2-8 kelime (kelime başına 1-3 hece), kelime arası 50-250 ms,
+    cümle arası 0.3-1.5 s (bazen 2-5 s) sessizlik; konuşmacı cümle
+    sonlarında değişebilir. Her blok aynı tohumdan sırayla üretilir.
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration * SAMPLE_RATE)
+    block_size = STREAM_BLOCK_SECONDS * SAMPLE_RATE
+    pending = []
+    pending_size = 0
+    produced = 0
+    speaker = 0
+
+    while produced < total:
+        # Bir cümle (veya uzun sessizlik) üret
+        words = []
+        for _ in range(rng.integers(2, 9)):
+            word = [_syllable(rng, SPEAKER_F0[speaker]) for _ in range(rng.integers(1, 4))]
+            words.extend(word)
+            words.append(np.zeros(int(SAMPLE_RATE * rng.uniform(0.05, 0.25))))
+        long_pause = rng.random() < 0.1
+        pause = rng.uniform(2.0, 5.0) if long_pause else rng.uniform(0.3, 1.5)
+        words.append(np.zeros(int(SAMPLE_RATE * pause)))
+        if rng.random() < 0.3:
+            speaker = 1 - speaker
+
+        sentence = np.concatenate(words)
+        pending.append(sentence)
+        pending_size += sentence.size
+
+        while pending_size >= block_size or (pending and produced + pending_size >= total):
+            buffer = np.concatenate(pending)
+            size = min(block_size, buffer.size, total - produced)
+            block, rest = buffer[:size], buffer[size:]
+            pending = [rest] if rest.size else []
+            pending_size = rest.size
+            produced += size
+
+            # Arka plan gürültüsü (~-45 dB) ve seviye
+            block = 0.3 * block + rng.standard_normal(size) * 0.005
+            yield np.clip(block, -1.0, 1.0).astype(np.float32)
+            if produced >= total:
+                return
+
+
+def generate_media(path: Path, duration: float, signal: str, seed: int) -> Path:
+    """
+    Sentetik test videosu üretir (ffmpeg).
+
+    Args:
+        path: Hedef .mp4 dosyası
+        duration: Süre (saniye)
+        signal: "speech" (numpy, stdin'den) veya "lavfi" (sadece ffmpeg)
+        seed: Rastgele tohum
+
+    Returns:
+        Path: Üretilen dosya
+    """
+    ffmpeg = get_ffmpeg_binary()
+    video_input = ["-f", "lavfi", "-i", f"color=c=black:s=320x240:r=1:d={duration}"]
+    # Yarım kalan üretim tekrar kullanılmasın: önce geçici ada yazılır
+    partial = path.with_suffix(".partial.mp4")
+    output = [
+        "-c:v", "mpeg4", "-q:v", "31", "-c:a", "aac", "-b:a", "64k", "-t", str(duration),
+        # bitexact: kodlayıcı sürüm etiketi / zaman damgası yazılmaz, aynı tohum aynı dosya
+        "-fflags", "+bitexact", "-flags:v", "+bitexact", "-flags:a", "+bitexact", "-map_metadata", "-1",
+        str(partial)
+    ]
+
+    if signal == "lavfi":
+        # Ton + pembe gürültü; 7 saniyelik döngünün 5 saniyesi "konuşma"
+        audio_inputs = [
+            "-f", "lavfi", "-i", f"sine=frequency=180:sample_rate={SAMPLE_RATE}:duration={duration}",
+            "-f", "lavfi", "-i",
+            f"anoisesrc=color=pink:seed={seed}:amplitude=0.3:sample_rate={SAMPLE_RATE}:duration={duration}",
+        ]
+        command = [
+            ffmpeg, "-y", "-hide_banner", "-loglevel", "error", *audio_inputs, *video_input,
+            "-filter_complex",
+            "[0:a][1:a]amix=inputs=2:weights='1 0.5',volume='if(lt(mod(t,7),5),0.8,0.01)':eval=frame[a]",
+            "-map", "2:v", "-map", "[a]", *output
+        ]
+        subprocess.run(command, check=True)
+    else:
+        command = [
+            ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "-i", "pipe:0",
+            *video_input, "-map", "1:v", "-map", "0:a", *output
+        ]
+        process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        try:
+            for block in iter_speech_like(duration, seed):
+                process.stdin.write((block * 32767).astype("<i2").tobytes())
+        finally:
+            process.stdin.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"ffmpeg başarısız (kod {process.returncode})")
+
+    partial.replace(path)
+    return path
+
+
+def audio_stream_md5(path: Path) -> str:
+    """
+    Ses akışının (kodlanmış paketler) MD5'i: üretimin tekrarlanabilirliği için.
+
+    Dosyanın kendi hash'i kullanılmaz: mp4 muxer'ı girişlerin okunma
+    sırasına göre paketleri farklı serpiştirebilir (içerik aynı olsa da).
+    """
+    output = subprocess.run(
+        [get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-i", str(path),
+         "-map", "0:a", "-c", "copy", "-f", "md5", "-"],
+        capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return output.split("=", 1)[-1]
+
+
+# ----------------------------------------------------------------------------
+# Ölçüm (her çalıştırma ayrı süreçte)
+# ----------------------------------------------------------------------------
+
+def _max_rss_mb(who: int) -> float:
+    """getrusage tepe RSS'i (Linux: KB, macOS: byte) -> MB."""
+    max_rss = resource.getrusage(who).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _run_pipeline(media_path: str, output_dir: str, options: dict, queue):
+    """Alt süreç: modeli yükler, process_video()'yu çalıştırır, ölçümleri kuyruğa yazar."""
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+    # process_video() ilerleme çubuğu tabloyu bozmasın
+    sys.stdout = open(os.devnull, "w")
+
+    try:
+        from app.hardware import select_runtime_config
+        from app.transcriber import Transcriber
+        import v_to_t
+
+        # Benchmark çıktıları kullanıcının arama indeksine / veri setine girmesin
+        settings.SEARCH_INDEX_ENABLED = False
+        v_to_t._logging_configured = True
+
+        runtime = select_runtime_config(
+            device=options["device"], compute_type=options["compute_type"], cpu_threads=options["cpu_threads"]
+        )
+
+        start = time.perf_counter()
+        Transcriber(
+            model_size=options["model"],
+            language=options["language"],
+            device=runtime["device"],
+            compute_type=runtime["compute_type"],
+            cpu_threads=runtime["cpu_threads"],
+            num_workers=runtime["num_workers"]
+        ).load_model()
+        model_load = time.perf_counter() - start
+
+        cpu_start = os.times()
+        start = time.perf_counter()
+        result = v_to_t.process_video(
+            video_path=Path(media_path),
+            model_size=options["model"],
+            language=options["language"],
+            output_path=Path(output_dir) / f"{Path(media_path).stem}_output.json",
+            export_text=True,
+            use_cache=False,
+            dataset_export=False,
+            device=runtime["device"],
+            compute_type=runtime["compute_type"],
+            cpu_threads=runtime["cpu_threads"]
+        )
+        wall = time.perf_counter() - start
+        cpu_end = os.times()
+
+        output_bytes = sum(
+            Path(result[key]).stat().st_size for key in ("json_path", "text_path") if result.get(key)
+        )
+        queue.put({
+            "runtime": {key: runtime[key] for key in ("device", "compute_type", "cpu_threads", "num_workers")},
+            "stage_seconds": {"model_load": round(model_load, 3), **result["stage_timings"]},
+            "wall_seconds": round(wall, 3),
+            "cpu_seconds": round(
+                (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system)
+                + (cpu_end.children_user - cpu_start.children_user)
+                + (cpu_end.children_system - cpu_start.children_system), 3
+            ),
+            "audio_duration": round(result["audio_duration"], 2),
+            "num_segments": result["num_segments"],
+            "output_bytes": output_bytes,
+            "peak_rss_mb": round(_max_rss_mb(resource.RUSAGE_SELF), 1),
+            "children_peak_rss_mb": round(_max_rss_mb(resource.RUSAGE_CHILDREN), 1),
+        })
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def run_measurement(media_path: Path, output_dir: Path, options: dict) -> dict:
+    """process_video()'yu temiz bir süreçte çalıştırır (spawn: miras bellek yok)."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run_pipeline, args=(str(media_path), str(output_dir), options, queue))
+    process.start()
+    try:
+        measurement = queue.get()
+    finally:
+        process.join()
+
+    if "error" not in measurement:
+        duration = measurement["audio_duration"]
+        measurement["rtf"] = round(measurement["wall_seconds"] / duration, 4) if duration else None
+        measurement["rtf_with_model_load"] = round(
+            (measurement["wall_seconds"] + measurement["stage_seconds"]["model_load"]) / duration, 4
+        ) if duration else None
+    return measurement
+
+
+def environment_info() -> dict:
+    """Düğümleri karşılaştırmak için ortam bilgisi."""
+    cpu_model = platform.processor() or platform.machine()
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    cpu_model = line.split(":", 1)[1].strip()
+                    break
+    except OSError:
+        pass
+
+    versions = {}
+    for package in ("faster_whisper", "ctranslate2", "numpy"):
+        try:
+            versions[package] = __import__(package).__version__
+        except (ImportError, AttributeError):
+            versions[package] = None
+
+    try:
+        ffmpeg_version = subprocess.run(
+            [get_ffmpeg_binary(), "-version"], capture_output=True, text=True, check=True
+        ).stdout.splitlines()[0]
+    except (OSError, subprocess.CalledProcessError, IndexError):
+        ffmpeg_version = None
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_model": cpu_model,
+        "cpu_count": os.cpu_count(),
+        "ffmpeg": ffmpeg_version,
+        **versions,
+    }
+
+
+def print_table(results: list):
+    """Sonuçları tablo olarak yazdırır."""
+    stage_header = "".join(f"{stage:>12}" for stage in STAGES)
+    print(f"\n{'Süre':>9}{stage_header} {'RTF':>7} {'Tepe RSS':>9} {'ffmpeg':>8} {'Segment':>8} {'Çıktı (KB)':>11}")
+    print("-" * (9 + 12 * len(STAGES) + 47))
+    for r in results:
+        if "error" in r:
+            print(f"{r['duration_label']:>9}  HATA: {r['error']}")
+            continue
+        stages = "".join(f"{r['stage_seconds'].get(stage, 0):>11.2f}s" for stage in STAGES)
+        print(
+            f"{r['duration_label']:>9}{stages} {r['rtf']:>7.3f} {r['peak_rss_mb']:>7.0f}MB "
+            f"{r['children_peak_rss_mb']:>6.0f}MB {r['num_segments']:>8} {r['output_bytes'] / 1024:>11.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik videolarla uçtan uca process_video() benchmark'ı")
+    parser.add_argument("--durations", type=str, nargs="+", default=["1m", "10m"],
+                        help="Video süreleri (ör. 1m 10m 1h 3h; default: 1m 10m)")
+    parser.add_argument("--signal", choices=("speech", "lavfi"), default="speech",
+                        help="Ses sinyali: speech (konuşma benzeri) veya lavfi (ton/gürültü/sessizlik)")
+    parser.add_argument("--model", default="small", help="Model boyutu (default: small)")
+    parser.add_argument("--language", default="tr", help="Dil kodu (default: tr)")
+    parser.add_argument("--device", default=None, help="Device (default: WHISPER_DEVICE)")
+    parser.add_argument("--compute-type", default=None, help="Compute type (default: WHISPER_COMPUTE_TYPE)")
+    parser.add_argument("--cpu-threads", type=int, default=None, help="CPU thread sayısı (default: WHISPER_CPU_THREADS)")
+    parser.add_argument("--seed", type=int, default=42, help="Sinyal tohumu (default: 42)")
+    parser.add_argument("--media-dir", type=str, default=str(settings.CACHE_DIR / "bench_media"),
+                        help="Üretilen videoların klasörü (default: cache/bench_media)")
+    parser.add_argument("--regenerate", action="store_true", help="Videoları klasörde olsa da yeniden üret")
+    parser.add_argument("--json", type=str, default=None, help="Sonuçları JSON dosyasına da yaz")
+    args = parser.parse_args()
+
+    durations = [(label, parse_duration(label)) for label in args.durations]
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    media_dir = Path(args.media_dir)
+    media_dir.mkdir(parents=True, exist_ok=True)
+    options = {
+        "model": args.model,
+        "language": args.language,
+        "device": args.device,
+        "compute_type": args.compute_type,
+        "cpu_threads": args.cpu_threads,
+    }
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_e2e_") as output_dir:
+        for label, seconds in durations:
+            media_path = media_dir / f"synthetic_{args.signal}_{int(seconds)}s_seed{args.seed}.mp4"
+            if args.regenerate or not media_path.exists():
+                print(f"Video üretiliyor: {media_path.name}...", file=sys.stderr)
+                start = time.perf_counter()
+                generate_media(media_path, seconds, args.signal, args.seed)
+                print(f"  {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+            print(f"Ölçülüyor: {label} ({args.model})...", file=sys.stderr)
+            measurement = run_measurement(media_path, Path(output_dir), options)
+            results.append({
+                "duration_label": label,
+                "duration_seconds": seconds,
+                "media": media_path.name,
+                "media_bytes": media_path.stat().st_size,
+                "media_audio_md5": audio_stream_md5(media_path),
+                **measurement,
+            })
+
+    print_table(results)
+
+    if args.json:
+        report = {
+            "environment": environment_info(),
+            "config": {**options, "signal": args.signal, "seed": args.seed},
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"JSON: {args.json}")
+
+    sys.exit(1 if any("error" in r for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
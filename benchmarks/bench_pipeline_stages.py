@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Pipeline Aşamaları Benchmark'ı
+==============================
+Model gerektirmeyen (saf Python) pipeline aşamalarını sentetik
+transkriptlerle ölçer ve performans gerilemelerini yakalar:
+
+- merge_results:   OutputFormatter.merge_results() (konuşmacı atama dahil)
+- group_by_speaker: OutputFormatter._group_by_speaker()
+- export_text:     OutputFormatter.export_to_text()
+- qa_equal_time:   QAMatcher.create_qa_pairs() (eşit zaman segmentasyonu)
+- qa_alignment:    QAMatcher.create_qa_pairs() (içerik hizalama)
+- qa_markdown:     QAMatcher.save_to_markdown()
+
+Boyut (segment sayısı) ve diarization yoğunluğu (segment başına tur
+sayısı; 0 = diarization yok) ızgarasında her aşama için süre, segment/s
+(ops/sec) ve tracemalloc tepe belleği raporlanır. Ölçekleme sütunu bir
+önceki boyuta göre üsteldir (t ~ n^k): ~1.0 doğrusal, ~2.0 karesel.
+
+Gerileme kontrolü: --baseline dosyasındaki süreler ile karşılaştırılır;
+bir ölçüm --threshold yüzdesinden fazla yavaşladıysa çıkış kodu 1 olur.
+Baseline makineye özgüdür: aynı makinede --update-baseline ile üretin.
+
+Tamamen çevrimdışı çalışır (model, ffmpeg veya ağ gerekmez).
+
+Kullanım:
+    python benchmarks/bench_pipeline_stages.py
+    python benchmarks/bench_pipeline_stages.py --sizes 100 10000 1000000 --densities 0 1
+    python benchmarks/bench_pipeline_stages.py --baseline stages_baseline.json --update-baseline
+    python benchmarks/bench_pipeline_stages.py --baseline stages_baseline.json --threshold 15
+    python benchmarks/bench_pipeline_stages.py --stages merge_results qa_alignment --no-memory
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Proje kökünü import yoluna ekle (benchmarks/ alt klasöründen çalıştırılır)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+
+from app.output_formatter import OutputFormatter
+from app.qa_matcher import QAMatcher
+
+
+STAGES = ("merge_results", "group_by_speaker", "export_text", "qa_equal_time", "qa_alignment", "qa_markdown")
+
+# Sentetik konuşma kelime hazinesi (içerik hizalama gerçekçi n-gram dağılımı görsün)
+WORDS = (
+    "bu proje ekip olarak geçen yıl müşteri için geliştirdiğimiz sistem veri "
+    "performans test süreç karar zaman sorun çözüm önce sonra çok daha iyi "
+    "yani aslında şöyle bir durum vardı ve biz de bunu farklı şekilde ele aldık"
+).split()
+
+QUESTIONS = [
+    "Kendinizden bahseder misiniz?",
+    "Neden bu pozisyonda çalışmak istiyorsunuz?",
+    "En büyük başarınız nedir?",
+    "Zor bir ekip arkadaşıyla nasıl çalıştınız?",
+    "Beş yıl sonra kendinizi nerede görüyorsunuz?",
+    "Baskı altında nasıl karar verirsiniz?",
+    "Son projenizde hangi teknolojileri kullandınız?",
+    "Bir hatanızdan ne öğrendiniz?",
+    "Takım liderliği deneyiminiz var mı?",
+    "Bizim için neden doğru adaysınız?",
+]
+
+
+def make_transcription(num_segments: int, num_questions: int, rng: random.Random) -> dict:
+    """
+    Whisper benzeri transcription sonucu üretir (~3 saniyelik segmentler).
+
+    Sorular zaman çizelgesine eşit aralıklarla konuşma olarak yerleştirilir
+    (içerik hizalama onları bulabilsin).
+    """
+    segments = []
+    question_every = max(num_segments // max(num_questions, 1), 1)
+    t = 0.0
+
+    for i in range(num_segments):
+        start = round(t + rng.uniform(0, 0.4), 1)
+        end = round(start + rng.uniform(1.5, 4.0), 1)
+        t = end
+
+        question_number = i // question_every
+        if i % question_every == 0 and question_number < num_questions:
+            text = QUESTIONS[question_number % len(QUESTIONS)]
+        else:
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+
+        segments.append({"start": start, "end": end, "text": text, "confidence": round(rng.uniform(0.6, 0.99), 3)})
+
+    return {
+        "text": " ".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": "tr"
+    }
+
+
+def make_diarization(num_turns: int, duration: float, num_speakers: int, rng: random.Random) -> list:
+    """Boşluklu ve kısmen üst üste binen diarization turları üretir."""
+    if num_turns <= 0:
+        return []
+
+    step = duration / num_turns
+    turns = []
+    for i in range(num_turns):
+        start = round(max(i * step + rng.uniform(-step * 0.2, step * 0.2), 0.0), 1)
+        end = round(start + step * rng.choice([0.5, 0.95, 0.95, 1.3]), 1)
+        turns.append({"speaker": f"SPEAKER_{rng.randrange(num_speakers):02d}", "start": start, "end": end})
+    return turns
+
+
+def measure(func, repeat: int, memory: bool) -> dict:
+    """
+    Fonksiyonu ölçer.
+
+    Süre: repeat çalıştırmanın en kısası (gürültü en az).
+    Bellek: tracemalloc altında ayrı bir çalıştırmanın tepe değeri
+    (tracemalloc süreyi yavaşlattığı için süre ölçümüne dahil edilmez).
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+
+    return {"seconds": min(times), "peak_mb": peak_mb}
+
+
+def run_case(num_segments: int, density: float, args, workdir: Path) -> list:
+    """Bir (boyut, yoğunluk) kombinasyonu için seçilen aşamaları ölçer."""
+    rng = random.Random(args.seed)
+    transcription = make_transcription(num_segments, args.questions, rng)
+    duration = transcription["segments"][-1]["end"]
+    diarization = make_diarization(int(num_segments * density), duration, args.speakers, rng)
+
+    # Sonraki aşamaların girdileri ölçüm dışında bir kez hazırlanır
+    merged = OutputFormatter.merge_results(transcription, diarization, video_name="bench.mp4")
+    questions = [QUESTIONS[i % len(QUESTIONS)] for i in range(args.questions)]
+    matcher = QAMatcher()
+    qa_data = matcher.create_qa_pairs(questions, merged, matching_method="equal_time_segmentation")
+
+    stage_funcs = {
+        "merge_results": lambda: OutputFormatter.merge_results(transcription, diarization, video_name="bench.mp4"),
+        "group_by_speaker": lambda: OutputFormatter._group_by_speaker(merged["timeline"], diarization or None),
+        "export_text": lambda: OutputFormatter.export_to_text(merged, workdir / "bench.txt"),
+        "qa_equal_time": lambda: matcher.create_qa_pairs(questions, merged, matching_method="equal_time_segmentation"),
+        "qa_alignment": lambda: matcher.create_qa_pairs(questions, merged, matching_method="content_alignment"),
+        "qa_markdown": lambda: matcher.save_to_markdown(qa_data, workdir / "bench_qa.md"),
+    }
+
+    results = []
+    for stage in args.stages:
+        measurement = measure(stage_funcs[stage], args.repeat, not args.no_memory)
+        seconds = measurement["seconds"]
+        results.append({
+            "stage": stage,
+            "segments": num_segments,
+            "density": density,
+            "turns": len(diarization),
+            "seconds": round(seconds, 6),
+            "ops_per_sec": round(num_segments / seconds) if seconds else None,
+            "peak_mb": round(measurement["peak_mb"], 2) if measurement["peak_mb"] is not None else None,
+        })
+
+    return results
+
+
+def add_scaling(results: list):
+    """Her sonuca bir önceki boyuta göre ölçekleme üssünü ekler (t ~ n^k)."""
+    previous = {}
+    for result in sorted(results, key=lambda r: (r["stage"], r["density"], r["segments"])):
+        key = (result["stage"], result["density"])
+        prev = previous.get(key)
+        result["scaling"] = None
+        if prev and prev["seconds"] > 0 and result["seconds"] > 0:
+            result["scaling"] = round(
+                math.log(result["seconds"] / prev["seconds"]) / math.log(result["segments"] / prev["segments"]), 2
+            )
+        previous[key] = result
+
+
+def result_key(result: dict) -> str:
+    """Baseline anahtarı: aşama / boyut / yoğunluk."""
+    return f"{result['stage']}/{result['segments']}/{result['density']:g}"
+
+
+def compare_baseline(results: list, baseline: dict, threshold: float, min_seconds: float) -> list:
+    """
+    Baseline'a göre yavaşlayan ölçümleri bulur.
+
+    min_seconds altındaki ölçümler (hem şimdi hem baseline'da) zamanlayıcı
+    gürültüsüne çok açık olduğundan karşılaştırılmaz.
+
+    Returns:
+        list: [(anahtar, baseline süresi, yeni süre, değişim yüzdesi), ...]
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result_key(result))
+        if base is None or max(base, result["seconds"]) < min_seconds:
+            continue
+        change = (result["seconds"] / base - 1) * 100 if base else 0.0
+        if change > threshold:
+            regressions.append((result_key(result), base, result["seconds"], change))
+    return regressions
+
+
+def print_table(results: list):
+    """Sonuçları aşama bazında tablo olarak yazar."""
+    print(f"\n{'Aşama':<17} {'Segment':>9} {'Yoğunluk':>9} {'Tur':>9} {'Süre (s)':>10} "
+          f"{'Segment/s':>11} {'Tepe (MB)':>10} {'Ölçekleme':>10}")
+    print("-" * 92)
+
+    last_stage = None
+    for r in sorted(results, key=lambda r: (STAGES.index(r["stage"]), r["density"], r["segments"])):
+        if last_stage is not None and r["stage"] != last_stage:
+            print()
+        last_stage = r["stage"]
+
+        peak = f"{r['peak_mb']:.1f}" if r["peak_mb"] is not None else "-"
+        scaling = f"n^{r['scaling']:.2f}" if r["scaling"] is not None else "-"
+        ops = f"{r['ops_per_sec']:,}" if r["ops_per_sec"] else "-"
+        print(f"{r['stage']:<17} {r['segments']:>9,} {r['density']:>9g} {r['turns']:>9,} {r['seconds']:>10.4f} "
+              f"{ops:>11} {peak:>10} {scaling:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model gerektirmeyen pipeline aşamalarının benchmark'ı")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000],
+                        help="Segment sayıları (default: 100 1000 10000 100000; 1000000'a kadar)")
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.0, 0.2, 1.0],
+                        help="Segment başına diarization turu (0 = diarization yok; default: 0 0.2 1)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES),
+                        help="Ölçülecek aşamalar (default: hepsi)")
+    parser.add_argument("--speakers", type=int, default=4, help="Konuşmacı sayısı (default: 4)")
+    parser.add_argument("--questions", type=int, default=10, help="Soru sayısı (default: 10)")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı, en kısa süre alınır (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Rastgele tohum (default: 42)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc ölçümünü atla (daha hızlı)")
+    parser.add_argument("--baseline", type=str, default=None, help="Baseline JSON dosyası (karşılaştırma için)")
+    parser.add_argument("--update-baseline", action="store_true", help="Sonuçları --baseline dosyasına yaz")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="İzin verilen yavaşlama yüzdesi (default: 20)")
+    parser.add_argument("--min-seconds", type=float, default=0.005,
+                        help="Bundan kısa ölçümler karşılaştırılmaz (default: 0.005)")
+    parser.add_argument("--json", type=str, default=None, help="Sonuçları JSON dosyasına da yaz")
+    args = parser.parse_args()
+
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline için --baseline gerekli")
+
+    # Aşamalar her çağrıda bilgi logu basar; benchmark çıktısı sade kalsın
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_stages_") as tmp:
+        for num_segments in args.sizes:
+            for density in args.densities:
+                print(f"Ölçülüyor: {num_segments:,} segment, yoğunluk {density:g}...", file=sys.stderr)
+                results.extend(run_case(num_segments, density, args, Path(tmp)))
+
+    add_scaling(results)
+    print_table(results)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "speakers": args.speakers,
+            "questions": args.questions,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    exit_code = 0
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        if args.update_baseline:
+            # Mevcut baseline'daki diğer ölçümler korunur, ölçülenler güncellenir
+            baseline = {}
+            if baseline_path.exists():
+                baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("seconds", {})
+            baseline.update({result_key(r): r["seconds"] for r in results})
+            baseline_path.write_text(json.dumps({
+                "environment": report["environment"],
+                "config": report["config"],
+                "seconds": dict(sorted(baseline.items())),
+            }, indent=2, ensure_ascii=False), encoding="utf-8")
+            print(f"\nBaseline güncellendi: {baseline_path}")
+        else:
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["seconds"]
+            regressions = compare_baseline(results, baseline, args.threshold, args.min_seconds)
+            report["regressions"] = [
+                {"key": key, "baseline_seconds": base, "seconds": seconds, "change_percent": round(change, 1)}
+                for key, base, seconds, change in regressions
+            ]
+
+            if regressions:
+                print(f"\nGERİLEME (>{args.threshold:g}% yavaşlama):")
+                for key, base, seconds, change in regressions:
+                    print(f"  {key:<36} {base:.4f}s -> {seconds:.4f}s (+{change:.1f}%)")
+                exit_code = 1
+            else:
+                print(f"\nBaseline'a göre gerileme yok (eşik: %{args.threshold:g})")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"JSON: {args.json}")
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
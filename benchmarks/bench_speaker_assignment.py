@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Konuşmacı Atama Benchmark'ı
+===========================
+OutputFormatter'ın iki konuşmacı atama yolunu karşılaştırır:
+- reference: Segment başına _find_speaker_for_segment() (O(N·M), eski yöntem)
+- indexed:   _assign_speakers() (sıralı turlar + bisect, O((N + M) log M))
+
+Sentetik veri gerçek bir toplantıya benzer: konuşmacı turları arasında
+boşluklar (örtüşmesiz segmentler -> en yakın tur yolu), üst üste binen
+turlar ve 0.1 saniyeye yuvarlanmış zamanlar (eşit örtüşme / eşit uzaklık
+durumları) bulunur.
+
+İki yolun ürettiği konuşmacı listeleri ve merge_results() timeline'ının
+JSON çıktısı byte byte karşılaştırılır; fark varsa çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/bench_speaker_assignment.py
+    python benchmarks/bench_speaker_assignment.py --segments 10000 --turns 10000
+    python benchmarks/bench_speaker_assignment.py --segments 100000 --turns 20000 --no-reference
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Proje kökünü import yoluna ekle (benchmarks/ alt klasöründen çalıştırılır)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+
+from app.output_formatter import OutputFormatter
+
+
+def make_segments(num_segments: int, duration: float, rng: random.Random) -> list:
+    """Whisper benzeri ardışık transcription segmentleri üretir."""
+    step = duration / num_segments
+    segments = []
+    for i in range(num_segments):
+        start = round(i * step + rng.uniform(0, step * 0.2), 1)
+        end = round(start + rng.uniform(step * 0.5, step * 1.2), 1)
+        segments.append({"start": start, "end": end, "text": f"segment {i}", "confidence": 0.9})
+    return segments
+
+
+def make_turns(num_turns: int, duration: float, num_speakers: int, rng: random.Random) -> list:
+    """Boşluklu ve kısmen üst üste binen diarization turları üretir."""
+    step = duration / num_turns
+    turns = []
+    for i in range(num_turns):
+        start = round(i * step + rng.uniform(-step * 0.3, step * 0.3), 1)
+        # %15 tur kısa kalır (ardından boşluk), %15 tur sonrakinin üstüne taşar
+        length_factor = rng.choice([0.4] * 15 + [1.4] * 15 + [0.95] * 70)
+        end = round(start + step * length_factor, 1)
+        turns.append({"speaker": f"SPEAKER_{rng.randrange(num_speakers):02d}", "start": start, "end": end})
+
+    # Diarization çıktısı genelde sıralıdır ama garanti değil: biraz karıştır
+    for _ in range(num_turns // 50):
+        a, b = rng.randrange(num_turns), rng.randrange(num_turns)
+        turns[a], turns[b] = turns[b], turns[a]
+    return turns
+
+
+def timed(func, *args):
+    """Fonksiyonu çalıştırır, (sonuç, süre) döndürür."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def reference_assign(segments: list, turns: list) -> list:
+    """Eski yöntem: Her segment için tüm turları tara."""
+    return [OutputFormatter._find_speaker_for_segment(seg["start"], seg["end"], turns) for seg in segments]
+
+
+def timeline_json(segments: list, speakers: list) -> str:
+    """Karşılaştırma için merge_results() timeline formatında JSON."""
+    timeline = [OutputFormatter.merge_segment(seg, speaker) for seg, speaker in zip(segments, speakers)]
+    return json.dumps(timeline, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Konuşmacı atama (speaker assignment) benchmark'ı")
+    parser.add_argument("--segments", type=int, default=10000, help="Transcription segment sayısı (default: 10000)")
+    parser.add_argument("--turns", type=int, default=10000, help="Diarization tur sayısı (default: 10000)")
+    parser.add_argument("--speakers", type=int, default=4, help="Konuşmacı sayısı (default: 4)")
+    parser.add_argument("--duration", type=float, default=4 * 3600, help="Kayıt süresi, saniye (default: 4 saat)")
+    parser.add_argument("--seed", type=int, default=42, help="Rastgele tohum (default: 42)")
+    parser.add_argument("--no-reference", action="store_true", help="O(N·M) referansı çalıştırma (büyük boyutlar için)")
+    parser.add_argument("--json", type=str, default=None, help="Sonuçları JSON dosyasına da yaz")
+    args = parser.parse_args()
+
+    # Referans yol segment başına uyarı basar; benchmark çıktısı sade kalsın
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    rng = random.Random(args.seed)
+    segments = make_segments(args.segments, args.duration, rng)
+    turns = make_turns(args.turns, args.duration, args.speakers, rng)
+
+    indexed, indexed_time = timed(OutputFormatter._assign_speakers, segments, turns)
+    results = {
+        "segments": args.segments,
+        "turns": args.turns,
+        "indexed_seconds": round(indexed_time, 4),
+    }
+
+    print(f"\nSegment: {args.segments}  Tur: {args.turns}  Konuşmacı: {args.speakers}")
+    print(f"{'Yol':<12} {'Süre (s)':>10}")
+    print("-" * 24)
+    print(f"{'indexed':<12} {indexed_time:>10.4f}")
+
+    exit_code = 0
+    if not args.no_reference:
+        reference, reference_time = timed(reference_assign, segments, turns)
+        identical = reference == indexed and timeline_json(segments, reference) == timeline_json(segments, indexed)
+        mismatches = sum(1 for a, b in zip(reference, indexed) if a != b)
+
+        results.update({
+            "reference_seconds": round(reference_time, 4),
+            "speedup": round(reference_time / indexed_time, 1) if indexed_time else None,
+            "identical": identical,
+            "mismatches": mismatches
+        })
+
+        print(f"{'reference':<12} {reference_time:>10.4f}")
+        print(f"\nHızlanma: {results['speedup']}x")
+        print(f"Çıktı aynı mı (byte byte): {'EVET' if identical else f'HAYIR ({mismatches} farklı segment)'}")
+        if not identical:
+            exit_code = 1
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"JSON: {args.json}")
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Transcription Benchmark'ı
+=========================
+Aynı ses üzerinde transcription yollarını karşılaştırır:
+- sequential: Tek akış (Transcriber.transcribe)
+- chunked-N:  Paralel parça modu, N worker (Transcriber.transcribe_chunked)
+- batched-N:  Batch modu, batch_size=N (BatchedInferencePipeline)
+
+Her yol için duvar saati süresi, real-time factor (RTF = işlem süresi /
+ses süresi), segment sayısı ve tek akışa göre hızlanma raporlanır.
+
+Not: Paralel modda worker'ların model yükleme süresi ölçüme dahildir
+(her işte ödenen gerçek maliyet). Tek akışta model önceden yüklenir.
+
+Kullanım:
+    python benchmarks/bench_transcription.py interview.mp4 --model small
+    python benchmarks/bench_transcription.py audio.wav --workers 2 4 8 --chunk-length 300
+    python benchmarks/bench_transcription.py audio.wav --workers --batch-sizes 8 16
+    python benchmarks/bench_transcription.py audio.wav --json sonuc.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Proje kökünü import yoluna ekle (benchmarks/ alt klasöründen çalıştırılır)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+
+from app.transcriber import Transcriber, WHISPER_SAMPLE_RATE
+from app.video_processor import extract_audio_to_array
+
+
+def run_benchmark(args) -> list:
+    """
+    Seçilen transcription yollarını sırayla çalıştırır.
+
+    Returns:
+        list: Her yol için sonuç dict'i
+    """
+    audio = extract_audio_to_array(args.input)
+    audio_duration = audio.size / WHISPER_SAMPLE_RATE
+    decode_options = {
+        "beam_size": args.beam_size,
+        "temperature": 0.0,
+        "vad_filter": args.vad_filter
+    }
+
+    results = []
+
+    # Tek akış (referans)
+    transcriber = Transcriber(
+        model_size=args.model,
+        language=args.language,
+        device=args.device,
+        compute_type=args.compute_type
+    )
+    transcriber.load_model()
+
+    start = time.perf_counter()
+    transcription = transcriber.transcribe(audio, **decode_options)
+    elapsed = time.perf_counter() - start
+    results.append({
+        "mode": "sequential",
+        "elapsed_seconds": round(elapsed, 2),
+        "rtf": round(elapsed / audio_duration, 4),
+        "num_segments": len(transcription["segments"]),
+        "num_words": len(transcription["text"].split())
+    })
+
+    # Paralel parça modları
+    for num_workers in args.workers:
+        start = time.perf_counter()
+        transcription = transcriber.transcribe_chunked(
+            audio,
+            chunk_length=args.chunk_length,
+            num_workers=num_workers,
+            cpu_threads=args.cpu_threads,
+            **decode_options
+        )
+        elapsed = time.perf_counter() - start
+        results.append({
+            "mode": f"chunked-{num_workers}",
+            "elapsed_seconds": round(elapsed, 2),
+            "rtf": round(elapsed / audio_duration, 4),
+            "num_segments": len(transcription["segments"]),
+            "num_words": len(transcription["text"].split())
+        })
+
+    # Batch modları (aynı yüklü model, registry'den)
+    for batch_size in args.batch_sizes:
+        batched_transcriber = Transcriber(
+            model_size=args.model,
+            language=args.language,
+            device=args.device,
+            compute_type=args.compute_type,
+            batch_size=batch_size
+        )
+        batched_transcriber.load_model()
+
+        start = time.perf_counter()
+        transcription = batched_transcriber.transcribe(audio, **decode_options)
+        elapsed = time.perf_counter() - start
+        results.append({
+            "mode": f"batched-{batch_size}",
+            "elapsed_seconds": round(elapsed, 2),
+            "rtf": round(elapsed / audio_duration, 4),
+            "num_segments": len(transcription["segments"]),
+            "num_words": len(transcription["text"].split())
+        })
+
+    baseline = results[0]["elapsed_seconds"]
+    for result in results:
+        result["speedup"] = round(baseline / result["elapsed_seconds"], 2) if result["elapsed_seconds"] else None
+
+    return [{"audio_duration": round(audio_duration, 2), **result} for result in results]
+
+
+def print_table(results: list):
+    """Sonuçları tablo olarak yazdırır."""
+    print(f"\n{'Mod':<14} {'Süre (s)':>10} {'RTF':>8} {'Hızlanma':>9} {'Segment':>8} {'Kelime':>8}")
+    print("-" * 62)
+    for result in results:
+        print(
+            f"{result['mode']:<14} {result['elapsed_seconds']:>10.2f} {result['rtf']:>8.3f} "
+            f"{result['speedup']:>8.2f}x {result['num_segments']:>8} {result['num_words']:>8}"
+        )
+    print(f"\nSes süresi: {results[0]['audio_duration']:.1f} saniye")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tek akış / paralel parça / batch transcription benchmark'ı")
+    parser.add_argument("input", type=str, help="Video veya ses dosyası")
+    parser.add_argument("--model", default="small", help="Model boyutu (default: small)")
+    parser.add_argument("--language", default="tr", help="Dil kodu (default: tr)")
+    parser.add_argument("--device", default="cpu", help="Device (default: cpu)")
+    parser.add_argument("--compute-type", default="int8", help="Compute type (default: int8)")
+    parser.add_argument("--beam-size", type=int, default=5, help="Beam size (default: 5)")
+    parser.add_argument("--vad-filter", action="store_true", help="VAD filtresini aç")
+    parser.add_argument("--workers", type=int, nargs="*", default=[2, 4], help="Denenecek worker sayıları (default: 2 4, boş = atla)")
+    parser.add_argument("--batch-sizes", type=int, nargs="*", default=[8, 16], help="Denenecek batch boyutları (default: 8 16, boş = atla)")
+    parser.add_argument("--cpu-threads", type=int, default=None, help="Worker başına CPU thread (default: CHUNK_CPU_THREADS)")
+    parser.add_argument("--chunk-length", type=float, default=None, help="Parça uzunluğu, saniye (default: CHUNK_LENGTH_SECONDS)")
+    parser.add_argument("--json", type=str, default=None, help="Sonuçları JSON dosyasına da yaz")
+    args = parser.parse_args()
+
+    # Benchmark çıktısı sade kalsın
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    results = run_benchmark(args)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"JSON: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -54,10 +54,11 @@ UPLOAD_DIR = BASE_DIR / "uploads"        # Yüklenen videolar buraya
 OUTPUT_DIR = BASE_DIR / "outputs"        # Üretilen JSON dosyaları
 MODEL_DIR = BASE_DIR / "models"          # İndirilen AI modelleri
 LOG_DIR = BASE_DIR / "logs"              # Log dosyaları
+CACHE_DIR = BASE_DIR / "cache"           # Transcription önbelleği
 
 # Klasörlerin var olduğundan emin ol
 # exist_ok=True: Klasör zaten varsa hata verme
-for directory in [UPLOAD_DIR, OUTPUT_DIR, MODEL_DIR, LOG_DIR]:
+for directory in [UPLOAD_DIR, OUTPUT_DIR, MODEL_DIR, LOG_DIR, CACHE_DIR]:
     directory.mkdir(exist_ok=True)
 
 # faster-whisper (Speech-to-Text) Ayarları
@@ -78,11 +79,86 @@ WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")
 # Device: "cpu", "cuda", "auto"
 # CUDA varsa GPU kullanmak için "cuda" veya "auto"
 
-WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "float16")
-# Compute type: "float32", "float16", "int8", "int8_float16"
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "auto")
+# Compute type: "auto", "float32", "float16", "int8", "int8_float16"
+# "auto": Donanıma göre seçilir (GPU: float16, CPU: int8) - ÖNERİLEN
 # CPU için: "int8" (önerilen - 2x hızlı)
 # GPU için: "float16" veya "int8_float16" (önerilen)
 
+WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", "0"))
+# CTranslate2'nin kullanacağı CPU thread sayısı
+# 0: Otomatik (CPU'da fiziksel çekirdek sayısı, GPU'da en fazla 4)
+
+WHISPER_NUM_WORKERS = int(os.getenv("WHISPER_NUM_WORKERS", "0"))
+# Aynı modelle eşzamanlı çalışabilecek transcription sayısı
+# 0: Otomatik (1 - CLI ve toplu işleme dosyaları tek akışta çözer)
+
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "0"))
+# Batch modu: Birden çok 30 saniyelik pencere tek seferde çözülür
+# 0: Kapalı (sıralı transcription)
+# 8-16: CPU + int8 için önerilen (uzun, konuşma yoğun kayıtlarda daha hızlı)
+
+# Paralel Parça (Chunk) Transcription Ayarları
+# Uzun kayıtlar sessizlik noktalarından parçalara bölünür ve her parça ayrı
+# bir süreçte (kendi modeliyle) çözülür; çok çekirdekli CPU'lar tam kullanılır
+CHUNK_WORKERS = int(os.getenv("CHUNK_WORKERS", "0"))
+# Paralel worker süreci sayısı
+# 0 veya 1: Kapalı (tek akış, varsayılan)
+# Her worker modelin ayrı bir kopyasını yükler (large-v3-turbo int8 ~800 MB)
+
+CHUNK_LENGTH_SECONDS = float(os.getenv("CHUNK_LENGTH_SECONDS", "600"))
+# Hedef parça uzunluğu (saniye), kesim noktası bu sürenin çevresindeki
+# en sessiz ana kaydırılır
+
+CHUNK_CPU_THREADS = int(os.getenv("CHUNK_CPU_THREADS", "4"))
+# Her worker'ın kullanacağı CPU thread sayısı (CTranslate2 intra_threads)
+# Önerilen: worker sayısı x thread sayısı = fiziksel çekirdek sayısı
+
+# Toplu İşleme Hattı (Pipeline) Ayarları
+# Bir dosya transcribe edilirken sonraki dosyaların sesi arka planda çıkarılır,
+# sonuçlar ayrı bir thread'de kaydedilir
+PREFETCH_FILES = int(os.getenv("PREFETCH_FILES", "2"))
+# Transcription sürerken önceden hazırlanacak (sesi çıkarılacak) dosya sayısı
+# 0: Kapalı (dosyalar tamamen sırayla işlenir)
+# Her hazır dosya bellekte tutulur (1 saatlik ses float32 ~230 MB)
+
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "1"))
+# Aynı anda çalışan ses çıkarma thread'i sayısı
+# Genelde 1 yeterli: ffmpeg decode, Whisper decode'dan çok daha hızlıdır
+
+# Model Registry Ayarları (süreç genelinde paylaşılan modeller)
+MODEL_REGISTRY_MAX_MEMORY_MB = int(os.getenv("MODEL_REGISTRY_MAX_MEMORY_MB", "4096"))
+# Bellekte aynı anda tutulacak modellerin toplam RAM bütçesi (MB)
+# Bütçe aşılırsa en uzun süredir kullanılmayan (LRU) model boşaltılır
+# large-v3-turbo (int8, CPU) yaklaşık 800 MB yer kaplar
+
+MODEL_IDLE_TIMEOUT_SECONDS = int(os.getenv("MODEL_IDLE_TIMEOUT_SECONDS", "1800"))
+# Bu süre (saniye) boyunca kullanılmayan model bellekten boşaltılır
+# 0: Boşta kalma süresi sınırı yok (model süreç bitene kadar bellekte kalır)
+
+# Transcription Önbelleği Ayarları
+TRANSCRIPTION_CACHE_ENABLED = os.getenv("TRANSCRIPTION_CACHE_ENABLED", "1") == "1"
+# "1": Aynı ses + aynı decode parametreleri için Whisper tekrar çalıştırılmaz,
+#      sonuç cache/ klasöründen okunur (tekrar işlemler saniyenin altında biter)
+# "0": Önbellek kapalı (her işlemde tam decode)
+
+TRANSCRIPTION_CACHE_MAX_MB = int(os.getenv("TRANSCRIPTION_CACHE_MAX_MB", "1024"))
+# Önbelleğin diskte kaplayabileceği toplam alan (MB)
+# Aşılırsa en uzun süredir kullanılmayan (LRU) kayıtlar silinir
+
+CHECKPOINT_ENABLED = os.getenv("CHECKPOINT_ENABLED", "1") == "1"
+# "1": Decode edilen segmentler transcription sürerken cache/checkpoints/ altına yazılır
+#      Çöken / iptal edilen iş --resume ile kaldığı yerden devam ettirilebilir
+# "0": Kapalı (segmentler sadece bellekte)
+
+CHECKPOINT_DIR = BASE_DIR / os.getenv("CHECKPOINT_DIR", "cache/checkpoints")
+# Checkpoint klasörü (iş başına bir alt klasör, çıktı kaydedilince silinir)
+
+CHECKPOINT_INTERVAL_SECONDS = float(os.getenv("CHECKPOINT_INTERVAL_SECONDS", "30"))
+# Segmentlerin diske yazılma (commit) aralığı (saniye)
+# Kesintide en fazla bu kadar sürelik decode işi tekrarlanır
+# Bir saatlik kaydın sonucu gzip ile sıkıştırılmış olarak ~100-200 KB tutar
+
 # Pyannote (Speaker Diarization) Ayarları
 HUGGINGFACE_TOKEN = os.getenv("HUGGINGFACE_TOKEN", "")
 # Hugging Face token - pyannote.audio modeli indirmek için gerekli
@@ -98,6 +174,106 @@ AUDIO_CHANNELS = int(os.getenv("AUDIO_CHANNELS", "1"))
 # Kanal sayısı: 1=Mono, 2=Stereo
 # Konuşma tanıma için mono yeterli, dosya boyutu yarı yarıya iner
 
+AUDIO_EXTRACTION_MODE = os.getenv("AUDIO_EXTRACTION_MODE", "memory")
+# Ses çıkarma modu:
+# "memory": ffmpeg tek seferde decode eder, float32 PCM doğrudan belleğe akar
+#           ve Whisper'a NumPy dizisi olarak verilir (geçici WAV yok, ÖNERİLEN)
+# "wav": Eski yöntem - moviepy ile uploads/ altına WAV yazılır, Whisper tekrar okur
+
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "")
+# ffmpeg çalıştırılabilir dosyası
+# Boş bırakılırsa moviepy'nin kullandığı imageio-ffmpeg binary'si,
+# o da yoksa PATH'teki "ffmpeg" kullanılır
+
+FFPROBE_BINARY = os.getenv("FFPROBE_BINARY", "")
+# ffprobe çalıştırılabilir dosyası (medya başlığı okuma için)
+# Boş bırakılırsa PATH'te aranır, bulunamazsa "ffmpeg -i" çıktısı kullanılır
+
+# Soru-Cevap Eşleştirme Ayarları
+QA_MATCHING_METHOD = os.getenv("QA_MATCHING_METHOD", "equal_time_segmentation")
+# "equal_time_segmentation": Video süresi soru sayısına eşit bölünür (eski yöntem)
+# "content_alignment": Sorular konuşma metninde aranır, cevap sınırları
+#                      soruların gerçekten sorulduğu anlara yerleştirilir
+
+QA_ALIGNMENT_MIN_SCORE = float(os.getenv("QA_ALIGNMENT_MIN_SCORE", "0.5"))
+# content_alignment: Sorunun bulunmuş sayılması için minimum benzerlik (0-1)
+# Düşük: Yanlış eşleşme riski artar, Yüksek: Daha çok soru tahmini aralığa düşer
+
+# Çıktı Ayarları
+OUTPUT_SCHEMA_VERSION = int(os.getenv("OUTPUT_SCHEMA_VERSION", "1"))
+# Çıktı JSON şeması:
+# 1: Mevcut format (varsayılan) - segmentler speakers altında tekrar, full_transcript dahil
+# 2: Kompakt şema (opsiyonel) - segmentler bir kez yazılır, konuşmacılar timeline'a
+#    indeks aralığı tutar, zamanlar milisaniye, full_transcript türetilir (~3x küçük)
+#    Diskteki format değişir: JSON'u doğrudan okuyan araçlar güncellenmeli
+# Okuma her iki şemayı da destekler
+
+TRANSCRIPT_DATASET_DIR = BASE_DIR / os.getenv("TRANSCRIPT_DATASET_DIR", "outputs/dataset")
+# Analiz için Parquet veri seti klasörü (pyarrow gerekli, göreli yollar proje köküne göre)
+# Her işin timeline'ı date=YYYY-MM-DD/ altına ayrı bir dosya olarak eklenir
+
+TRANSCRIPT_DATASET_EXPORT = os.getenv("TRANSCRIPT_DATASET_EXPORT", "0") == "1"
+# "1": Her iş bittiğinde timeline veri setine otomatik eklenir
+# "0": Kapalı (CLI: --dataset ile iş bazında açılabilir)
+
+SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX_ENABLED", "1") == "1"
+# "1": Her JSON kaydında segmentler SQLite FTS5 arama indeksine eklenir
+# "0": Kapalı (indeks "v_to_t.py search --index" ile sonradan doldurulabilir)
+
+SEARCH_INDEX_PATH = BASE_DIR / os.getenv("SEARCH_INDEX_PATH", "outputs/search_index.db")
+# Arama indeksi dosyası (göreli yollar proje köküne göre)
+
+# Performans Metrikleri
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+# "1": Aşama süreleri / CPU / bellek her işin metadata'sına ("performance") yazılır,
+#      kümülatif sayaçlar Prometheus metin dosyasına eklenir
+# "0": Sadece metadata (dosya ve sayaçlar güncellenmez)
+
+METRICS_PATH = BASE_DIR / os.getenv("METRICS_PATH", "outputs/metrics.prom")
+# Prometheus metin dosyası (node_exporter textfile collector ile toplanabilir)
+# Sayaçlar yanındaki .db dosyasında tutulur; iş sunucusu GET /metrics ile de verir
+
+# Profiler (--profile, Web UI "Profil çıkar")
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "10"))
+# Örnekleme aralığı (ms): 10 = 100 Hz (ek yük tipik olarak %1'in altında)
+# Daha küçük değer daha ayrıntılı ama daha pahalı
+
+PROFILE_FORMAT = os.getenv("PROFILE_FORMAT", "speedscope")
+# "speedscope": Aşama başına *_profile_<aşama>.speedscope.json (https://www.speedscope.app)
+# "collapsed": Aşama başına *_profile_<aşama>.folded (flamegraph.pl, speedscope)
+
+PROFILE_TRACEMALLOC_FRAMES = int(os.getenv("PROFILE_TRACEMALLOC_FRAMES", "1"))
+# --profile-memory: tracemalloc'un ayırma başına sakladığı çerçeve sayısı
+# (1 = sadece ayıran satır; artırmak bellek ve süre maliyetini artırır)
+
+PROFILE_TOP_ALLOCATORS = int(os.getenv("PROFILE_TOP_ALLOCATORS", "25"))
+# --profile-memory: Aşama başına raporlanan en çok bellek ayıran satır sayısı
+
+# İş Kuyruğu Sunucusu ("v_to_t.py serve")
+JOB_SERVER_HOST = os.getenv("JOB_SERVER_HOST", "127.0.0.1")
+# Dinlenecek adres (127.0.0.1 = sadece bu makine; ağa açmak için 0.0.0.0)
+
+JOB_SERVER_PORT = int(os.getenv("JOB_SERVER_PORT", "8765"))
+# HTTP portu
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+# Worker süreç sayısı (her worker modeli bir kez yükler ve sıcak tutar)
+# CPU'da thread'ler worker'lara bölünür; RAM: worker sayısı x model boyutu
+
+JOB_DIR = BASE_DIR / os.getenv("JOB_DIR", "outputs/jobs")
+# Kuyruk veritabanı (jobs.db) ve iş başına yüklenen video / çıktılar
+
+JOB_SERVER_URL = os.getenv("JOB_SERVER_URL", "")
+# Boş: Web UI videoyu kendi sürecinde işler
+# Dolu (ör. http://127.0.0.1:8765): Web UI işi sunucuya gönderir, ilerlemeyi izler
+
+# Sunucudaki Dosyalar (yönetici ayarı)
+SERVER_PATH_ROOT = os.getenv("SERVER_PATH_ROOT", "")
+# Boş: Kapalı, videolar sadece yüklenerek işlenir
+# Dolu (ör. /srv/videolar): Web UI ve iş sunucusu bu klasör altındaki dosyaları
+# yolu verilerek yerinde işler (yükleme / kopya yok, dosya silinmez)
+# Klasör dışındaki yollar reddedilir; sadece güvenilen kullanıcılar için açın
+
 # Video İşleme Ayarları
 SUPPORTED_VIDEO_FORMATS = [".mp4", ".avi", ".mov", ".mkv", ".webm"]
 # Desteklenen video formatları
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Testler proje kökünden import eder (v_to_t, app, config)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
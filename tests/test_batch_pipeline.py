@@ -0,0 +1,69 @@
+"""
+Toplu işleme hattı (process_batch_pipelined) testleri.
+
+Aşamalar sahte fonksiyonlarla değiştirilir (model / ffmpeg gerekmez); sahte
+prepare_media() argümanları gerçek imzaya bağlar, böylece hatta
+prepare_media()'nın tanımadığı bir seçenek iletilirse test başarısız olur.
+"""
+
+import inspect
+from pathlib import Path
+
+import v_to_t
+
+
+def _fake_stages(monkeypatch):
+    """prepare / transcribe / finalize aşamalarını sahteleriyle değiştirir."""
+    real_signature = inspect.signature(v_to_t.prepare_media)
+    prepared = []
+
+    def fake_prepare_media(video_path, *args, **kwargs):
+        # Gerçek imzada olmayan parametre TypeError fırlatır (gerçek çağrıdaki gibi)
+        real_signature.bind(video_path, *args, **kwargs)
+        prepared.append(Path(video_path))
+        return {"video_path": Path(video_path), "audio_duration": 10.0, "stage_timings": {"prepare": 0.0}}
+
+    def fake_transcribe_media(job, jsonl_output=None, **kwargs):
+        return {"segments": []}
+
+    def fake_finalize_result(job, transcription, output_path=None, **kwargs):
+        return {
+            "json_path": output_path,
+            "audio_duration": job["audio_duration"],
+            "elapsed_time": 1.0,
+            "num_segments": 0,
+            "cache_hit": False
+        }
+
+    monkeypatch.setattr(v_to_t, "prepare_media", fake_prepare_media)
+    monkeypatch.setattr(v_to_t, "transcribe_media", fake_transcribe_media)
+    monkeypatch.setattr(v_to_t, "finalize_result", fake_finalize_result)
+    monkeypatch.setattr(v_to_t, "cleanup_media", lambda job: None)
+    monkeypatch.setattr(v_to_t, "record_job_failure", lambda status="failed": None)
+    return prepared
+
+
+def test_pipelined_batch_ignores_profile_options(monkeypatch, tmp_path):
+    prepared = _fake_stages(monkeypatch)
+    videos = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+
+    # main()'in kurduğu seçenekler (profil kapalıyken de anahtarlar bulunur)
+    results = v_to_t.process_batch(
+        videos,
+        output_dir=tmp_path / "out",
+        prefetch=2,
+        model_size="tiny",
+        language="tr",
+        export_text=False,
+        questions_path=None,
+        qa_method=None,
+        use_cache=False,
+        dataset_export=None,
+        resume=False,
+        profile=False,
+        profile_memory=False
+    )
+
+    assert [item["error"] for item in results] == [None, None]
+    assert [item["success"] for item in results] == [True, True]
+    assert prepared == videos
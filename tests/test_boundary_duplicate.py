@@ -0,0 +1,30 @@
+"""Paralel parça sınırında tekrar eden segment tespiti (_is_boundary_duplicate)."""
+
+from types import SimpleNamespace
+
+from app.transcriber import _is_boundary_duplicate
+
+
+def _segment(start, end, text):
+    return SimpleNamespace(start=start, end=end, text=text)
+
+
+def test_short_answer_after_matching_letters_is_kept():
+    assert not _is_boundary_duplicate(_segment(0, 10, "I will take a look"), _segment(10.2, 11, "OK."))
+    assert not _is_boundary_duplicate(_segment(0, 10, "...biliyorsun değil mi"), _segment(10.2, 11, "Mi?"))
+
+
+def test_repeated_tail_words_are_dropped():
+    previous = _segment(0, 10, "Bunu daha önce de söyledim")
+    assert _is_boundary_duplicate(previous, _segment(10.2, 12, "önce de söyledim."))
+
+
+def test_short_repeat_needs_time_overlap():
+    previous = _segment(0, 10, "evet tamam")
+    assert _is_boundary_duplicate(previous, _segment(9.5, 10.5, "Tamam"))
+    assert not _is_boundary_duplicate(previous, _segment(10.5, 11, "Tamam"))
+
+
+def test_far_segment_is_not_duplicate():
+    previous = _segment(0, 10, "bunu daha önce de söyledim")
+    assert not _is_boundary_duplicate(previous, _segment(15, 17, "önce de söyledim"))
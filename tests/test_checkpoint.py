@@ -0,0 +1,108 @@
+"""Transcription checkpoint (TranscriptionCheckpoint) testleri."""
+
+from app.checkpoint import TranscriptionCheckpoint, build_resume_prompt
+
+
+def _segment(index):
+    return {"start": index * 2.0, "end": index * 2.0 + 1.5, "text": f"cümle {index}"}
+
+
+def _checkpoint(tmp_path, interval=3600):
+    # Uzun aralık: sadece açık commit() çağrıları yazar
+    return TranscriptionCheckpoint("is-anahtari", checkpoint_dir=tmp_path, interval=interval)
+
+
+def test_only_committed_segments_are_restored(tmp_path):
+    checkpoint = _checkpoint(tmp_path)
+    checkpoint.start(language="tr")
+    for index in range(3):
+        checkpoint.add(_segment(index))
+    checkpoint.commit()
+
+    # Commit'ten sonra eklenen segment ve yarım kalmış satır (çökme)
+    checkpoint.add(_segment(3))
+    checkpoint._file.write(b'{"start": 6.0, "end": 7')
+    checkpoint._file.flush()
+
+    restored = _checkpoint(tmp_path).load()
+
+    assert restored["segments"] == [_segment(index) for index in range(3)]
+    assert restored["offset"] == 5.5
+    assert restored["language"] == "tr"
+    assert restored["completed"] is False
+    assert restored["initial_prompt"] == "cümle 0 cümle 1 cümle 2"
+
+
+def test_resume_truncates_uncommitted_tail(tmp_path):
+    checkpoint = _checkpoint(tmp_path)
+    checkpoint.start(language="tr")
+    checkpoint.add(_segment(0))
+    checkpoint.add(_segment(1))
+    checkpoint.commit()
+    checkpoint._file.write(b'{"start": 4.0, "en')
+    checkpoint._file.flush()
+
+    resumed = _checkpoint(tmp_path)
+    restored = resumed.load()
+    resumed.start(restored, language="tr")
+    resumed.add(_segment(2))
+    resumed.commit(completed=True)
+    resumed.close()
+
+    final = _checkpoint(tmp_path).load()
+
+    # Yarım satır atıldı, yeni segment commit edilenlerin arkasına eklendi
+    assert final["segments"] == [_segment(index) for index in range(3)]
+    assert final["completed"] is True
+    assert (tmp_path / "is-anahtari" / "segments.jsonl").stat().st_size == final["committed_bytes"]
+
+
+def test_close_commits_pending_segments(tmp_path):
+    checkpoint = _checkpoint(tmp_path)
+    checkpoint.start()
+    checkpoint.add(_segment(0))
+    checkpoint.close()
+
+    assert _checkpoint(tmp_path).load()["segments"] == [_segment(0)]
+
+
+def test_interval_triggers_commit(tmp_path):
+    checkpoint = _checkpoint(tmp_path, interval=0)
+    checkpoint.start()
+    checkpoint.add(_segment(0))
+
+    assert _checkpoint(tmp_path).load()["segments"] == [_segment(0)]
+
+
+def test_fresh_start_discards_old_checkpoint(tmp_path):
+    checkpoint = _checkpoint(tmp_path)
+    checkpoint.start()
+    checkpoint.add(_segment(0))
+    checkpoint.close()
+
+    restarted = _checkpoint(tmp_path)
+    restarted.start()
+
+    assert not restarted.exists()
+    restarted.discard()
+    assert not (tmp_path / "is-anahtari").exists()
+
+
+def test_inconsistent_state_is_ignored(tmp_path):
+    checkpoint = _checkpoint(tmp_path)
+    checkpoint.start()
+    checkpoint.add(_segment(0))
+    checkpoint.close()
+    (tmp_path / "is-anahtari" / "segments.jsonl").write_bytes(b"")
+
+    assert _checkpoint(tmp_path).load() is None
+
+
+def test_resume_prompt_keeps_text_tail_on_word_boundary():
+    segments = [{"text": "kelime " * 20}, {"text": "son cümle"}]
+    prompt = build_resume_prompt(segments, max_chars=30)
+
+    assert prompt.endswith("son cümle")
+    assert len(prompt) <= 30
+    assert prompt.split(" ")[0] == "kelime"
+    assert build_resume_prompt([]) is None
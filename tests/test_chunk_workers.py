@@ -0,0 +1,79 @@
+"""Paralel parça worker'larının iptali (_iter_chunk_results) testleri."""
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.transcriber import Transcriber, _register_chunk_worker
+
+
+def _quick_chunk(chunk_index):
+    segment = SimpleNamespace(start=0.0, end=1.0, text=" merhaba", avg_logprob=-0.2, no_speech_prob=0.0)
+    return chunk_index, "tr", [segment]
+
+
+def _slow_chunk(chunk_index):
+    time.sleep(60)
+    return chunk_index, "tr", []
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    # Sonlandırılmış ama henüz toplanmamış (zombie) süreç de çıkmış sayılır (Linux)
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(") ")[-1].split()[0] != "Z"
+    except OSError:
+        return True
+
+
+def _transcriber():
+    # Model yüklemeden: _iter_chunk_results sadece dil ve segment işlemeyi kullanır
+    transcriber = Transcriber.__new__(Transcriber)
+    transcriber.language = "tr"
+    transcriber.detected_language = "tr"
+    return transcriber
+
+
+# os.kill(pid, 0) Windows'ta süreci sonlandırır
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX süreç kontrolü")
+def test_closing_stream_terminates_running_workers():
+    mp_context = multiprocessing.get_context("spawn")
+    worker_pids = mp_context.SimpleQueue()
+    executor = ProcessPoolExecutor(
+        max_workers=2, mp_context=mp_context,
+        initializer=_register_chunk_worker, initargs=(worker_pids,)
+    )
+    futures = [executor.submit(_quick_chunk, 0), executor.submit(_slow_chunk, 1), executor.submit(_slow_chunk, 2)]
+
+    stream = _transcriber()._iter_chunk_results(executor, futures, worker_pids=worker_pids)
+    assert next(stream)["text"] == "merhaba"
+
+    # İki worker'ın da başlayıp PID bildirmesini bekle (sonra kuyruğa geri koy)
+    pids = []
+    deadline = time.monotonic() + 30
+    while len(pids) < 2 and time.monotonic() < deadline:
+        if worker_pids.empty():
+            time.sleep(0.05)
+        else:
+            pids.append(worker_pids.get())
+    for pid in pids:
+        worker_pids.put(pid)
+    assert len(pids) == 2
+
+    # İptal: generator kapatılır, 60 sn'lik parçalar beklenmez
+    stream.close()
+
+    deadline = time.monotonic() + 10
+    while any(_is_alive(pid) for pid in pids) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(_is_alive(pid) for pid in pids)
+    assert all(future.done() for future in futures)
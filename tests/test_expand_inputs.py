@@ -0,0 +1,73 @@
+"""Toplu işleme girdilerinin açılması (expand_inputs) testleri."""
+
+from pathlib import Path
+
+import pytest
+
+import v_to_t
+
+
+@pytest.fixture
+def videos(tmp_path):
+    """a.mp4, b.mkv, notlar.txt ve alt/c.mp4 içeren klasör."""
+    for name in ("a.mp4", "b.mkv", "notlar.txt", "alt/c.mp4"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    return tmp_path
+
+
+def test_glob_pattern(videos):
+    paths, missing = v_to_t.expand_inputs([str(videos / "*.mp4")])
+    assert paths == [videos / "a.mp4"]
+    assert missing == []
+
+
+def test_recursive_glob(videos):
+    paths, _ = v_to_t.expand_inputs([str(videos / "**" / "*.mp4")])
+    assert paths == [videos / "a.mp4", videos / "alt" / "c.mp4"]
+
+
+def test_directory_keeps_only_supported_formats(videos):
+    paths, _ = v_to_t.expand_inputs([str(videos)])
+    # Alt klasörler ve desteklenmeyen uzantılar (notlar.txt) alınmaz
+    assert paths == [videos / "a.mp4", videos / "b.mkv"]
+
+
+def test_manifest_order_comments_and_duplicates(videos):
+    manifest = videos / "liste.txt"
+    manifest.write_text(
+        "# mülakatlar\n"
+        f"{videos / 'alt' / 'c.mp4'}\n"
+        "\n"
+        f"{videos / 'a.mp4'}\n",
+        encoding="utf-8"
+    )
+
+    paths, missing = v_to_t.expand_inputs([str(videos / "b.mkv"), f"@{manifest}", str(videos / "a.mp4")])
+
+    # Manifest verildiği yerde açılır, aynı dosya bir kez işlenir
+    assert paths == [videos / "b.mkv", videos / "alt" / "c.mp4", videos / "a.mp4"]
+    assert missing == []
+
+
+def test_manifest_option_is_appended(videos):
+    manifest = videos / "liste.txt"
+    manifest.write_text(f"{videos / 'b.mkv'}\n", encoding="utf-8")
+
+    paths, _ = v_to_t.expand_inputs([str(videos / "a.mp4")], manifest_path=str(manifest))
+
+    assert paths == [videos / "a.mp4", videos / "b.mkv"]
+
+
+def test_unmatched_inputs_are_reported(videos):
+    paths, missing = v_to_t.expand_inputs([str(videos / "yok.mp4"), str(videos / "*.avi"), str(videos / "a.mp4")])
+    assert paths == [videos / "a.mp4"]
+    assert missing == [str(videos / "yok.mp4"), str(videos / "*.avi")]
+
+
+def test_batch_output_names_do_not_collide(tmp_path):
+    used = set()
+    first = v_to_t.get_batch_output_path(Path("x/intro.mp4"), tmp_path, used)
+    second = v_to_t.get_batch_output_path(Path("y/intro.mp4"), tmp_path, used)
+    assert (first.name, second.name) == ("intro_output.json", "intro_2_output.json")
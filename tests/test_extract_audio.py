@@ -0,0 +1,101 @@
+"""Belleğe ses çıkarma (extract_audio_to_array) testleri - ffmpeg süreci sahtedir."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from app import video_processor
+
+
+class FakeProcess:
+    """ffmpeg yerine: stdout verilen parçaları üretir, stderr süreç bitene kadar bekler."""
+
+    def __init__(self, chunks, returncode=0):
+        self.exited = threading.Event()
+        self.killed = False
+        self.waited = False
+        self.returncode = None
+        self._returncode = returncode
+        self.stdout = FakeStream(chunks, self)
+        self.stderr = FakeStream([], self, blocking=True)
+
+    def kill(self):
+        self.killed = True
+        self._returncode = -9
+        self.exited.set()
+
+    def wait(self):
+        self.waited = True
+        self.exited.set()
+        self.returncode = self._returncode
+        return self.returncode
+
+
+class FakeStream:
+    def __init__(self, chunks, process, blocking=False):
+        self.chunks = list(chunks)
+        self.process = process
+        self.blocking = blocking
+        self.closed = False
+
+    def read(self, size=-1):
+        if self.blocking:
+            # Gerçek stderr pipe'ı gibi: süreç çıkana kadar döner
+            self.process.exited.wait(timeout=5)
+            return b""
+        if not self.chunks:
+            return b""
+        chunk = self.chunks.pop(0)
+        if isinstance(chunk, BaseException):
+            raise chunk
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "mulakat.mp4"
+    path.write_bytes(b"")
+    return path
+
+
+def _patch_popen(monkeypatch, process):
+    monkeypatch.setattr(video_processor.subprocess, "Popen", lambda *args, **kwargs: process)
+
+
+def test_pcm_is_read_into_array(video, monkeypatch):
+    samples = np.linspace(-1, 1, 1000, dtype=np.float32)
+    data = samples.tobytes()
+    process = FakeProcess([data[:1001], data[1001:] + b"\x00\x00"])
+    _patch_popen(monkeypatch, process)
+
+    audio = video_processor.extract_audio_to_array(video)
+
+    # Yarım kalan son örnek atılır
+    np.testing.assert_array_equal(audio, samples)
+    assert process.waited and not process.killed
+
+
+def test_interrupted_read_kills_and_reaps_ffmpeg(video, monkeypatch):
+    process = FakeProcess([b"\x00" * 8, KeyboardInterrupt()])
+    _patch_popen(monkeypatch, process)
+    threads_before = set(threading.enumerate())
+
+    with pytest.raises(KeyboardInterrupt):
+        video_processor.extract_audio_to_array(video)
+
+    assert process.killed and process.waited
+    assert process.stdout.closed and process.stderr.closed
+    # stderr okuyucu thread'i beklemede kalmaz
+    assert not [thread for thread in threading.enumerate() if thread not in threads_before and thread.is_alive()]
+
+
+def test_ffmpeg_error_raises_runtime_error(video, monkeypatch):
+    process = FakeProcess([], returncode=1)
+    _patch_popen(monkeypatch, process)
+
+    with pytest.raises(RuntimeError):
+        video_processor.extract_audio_to_array(video)
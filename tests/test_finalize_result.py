@@ -0,0 +1,68 @@
+"""Pipeline son aşaması (finalize_result) testleri."""
+
+from pathlib import Path
+
+import pytest
+
+import config.settings as settings
+import v_to_t
+from app.metrics import StageMetrics
+from app.output_formatter import OutputFormatter
+
+
+def _job(tmp_path):
+    return {
+        "video_path": tmp_path / "mulakat.mp4",
+        "model_size": "tiny",
+        "language": "tr",
+        "runtime": {"device": "cpu", "compute_type": "int8", "cpu_threads": 1, "num_workers": 1, "cpu_isa": None},
+        "audio": None,
+        "audio_path": None,
+        "audio_duration": 4.0,
+        "cached": None,
+        "checkpoint": None,
+        "stage_timings": {"prepare": 0.0},
+        "metrics": StageMetrics()
+    }
+
+
+def _transcription():
+    return {
+        "language": "tr",
+        "text": "merhaba nasılsınız",
+        "segments": [
+            {"start": 0.0, "end": 2.0, "text": "merhaba", "confidence": 0.9},
+            {"start": 2.0, "end": 4.0, "text": "nasılsınız", "confidence": 0.8},
+        ]
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_side_outputs(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", False)
+    monkeypatch.setattr(settings, "TRANSCRIPT_DATASET_EXPORT", False)
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+
+def test_json_is_saved_before_text_export(tmp_path, monkeypatch):
+    def failing_export(result, output_path):
+        raise OSError("disk dolu")
+
+    monkeypatch.setattr(OutputFormatter, "export_to_text", staticmethod(failing_export))
+    output_path = tmp_path / "mulakat_output.json"
+
+    with pytest.raises(OSError):
+        v_to_t.finalize_result(_job(tmp_path), _transcription(), output_path=output_path)
+
+    # Transkripsiyon tamamlandı: ana çıktı sonraki export'un hatasından etkilenmez
+    assert output_path.exists()
+    assert len(list(OutputFormatter.iter_timeline(output_path))) == 2
+
+
+def test_json_save_stage_is_reported(tmp_path):
+    output = v_to_t.finalize_result(
+        _job(tmp_path), _transcription(), output_path=tmp_path / "mulakat_output.json"
+    )
+
+    assert Path(output["json_path"]).exists()
+    assert {"merge", "json_save", "text_export"} <= set(output["performance"]["stages"])
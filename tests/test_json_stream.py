@@ -0,0 +1,160 @@
+"""Akış halinde JSON yazma / okuma (json_stream) testleri."""
+
+import io
+import json
+
+import pytest
+
+from app.json_stream import (
+    _Scanner,
+    dumps_json,
+    has_fast_encoder,
+    iter_json_array,
+    load_json,
+    read_json_sections,
+    write_json
+)
+
+
+def _result(num_segments=50):
+    timeline = [
+        {
+            "start": index * 1.5,
+            "end": index * 1.5 + 1.25,
+            "speaker": f"SPEAKER_0{index % 2}",
+            "text": f"Segment {index}: \"alıntı\" \\ ters bölü, şçğüöı 🎤",
+            "confidence": 1e-07 if index == 3 else 0.5 + index / 1000,
+            "words": [{"word": "merhaba", "probability": 0.9}] if index % 5 == 0 else []
+        }
+        for index in range(num_segments)
+    ]
+    return {
+        "metadata": {"video_name": "mülakat.mp4", "num_segments": num_segments, "runtime": {"cpu_threads": 4}},
+        "speakers": {"SPEAKER_00": {"total_words": 12, "segments": timeline[::2]}},
+        "timeline": timeline,
+        "full_transcript": " ".join(segment["text"] for segment in timeline),
+        "empty_list": [],
+        "empty_dict": {},
+        "flag": True,
+        "nothing": None
+    }
+
+
+@pytest.mark.parametrize("indent", [2, None])
+def test_std_output_matches_json_dumps(indent):
+    data = _result()
+    separators = None if indent else (",", ":")
+    expected = json.dumps(data, indent=indent, ensure_ascii=False, separators=separators)
+
+    assert dumps_json(data, indent=indent, use_orjson=False) == expected
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_write_and_load_round_trip(tmp_path, use_orjson):
+    if use_orjson and not has_fast_encoder():
+        pytest.skip("orjson kurulu değil")
+
+    data = _result()
+    path = write_json(data, tmp_path / "out.json", use_orjson=use_orjson)
+
+    assert load_json(path) == data
+    assert json.loads(path.read_text(encoding="utf-8")) == data
+    # Geçici dosya kalmaz
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = write_json({"eski": 1}, tmp_path / "out.json")
+
+    with pytest.raises(TypeError):
+        write_json({"timeline": [object()]}, path, use_orjson=False)
+
+    assert load_json(path) == {"eski": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_iter_json_array_reads_header_and_elements(tmp_path):
+    data = _result()
+    path = write_json(data, tmp_path / "out.json")
+    header = {}
+
+    segments = list(iter_json_array(path, "timeline", header=header))
+
+    assert segments == data["timeline"]
+    assert header == {"metadata": data["metadata"], "speakers": data["speakers"]}
+
+
+def test_iter_json_array_skip_section(tmp_path):
+    path = write_json(_result(), tmp_path / "out.json")
+    header = {}
+
+    list(iter_json_array(path, "timeline", header=header, skip_section=lambda key, _: key == "speakers"))
+
+    assert list(header) == ["metadata"]
+
+
+def test_read_json_sections_skips_keys(tmp_path):
+    data = _result()
+    path = write_json(data, tmp_path / "out.json")
+
+    sections = read_json_sections(path, skip_keys=("timeline", "full_transcript"))
+
+    assert sections == {key: value for key, value in data.items() if key not in ("timeline", "full_transcript")}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_scanner_handles_values_split_across_reads(chunk_size):
+    # Küçük tampon: string kaçışları, unicode ve sayılar parça sınırında bölünür
+    data = _result(num_segments=8)
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    scanner = _Scanner(io.StringIO(text), chunk_size=chunk_size)
+
+    sections = {}
+    for key in scanner.iter_object():
+        if key == "timeline":
+            sections[key] = list(scanner.iter_array())
+        elif key == "full_transcript":
+            scanner.skip()
+        else:
+            sections[key] = scanner.decode()
+
+    assert sections == {key: value for key, value in data.items() if key != "full_transcript"}
+
+
+def test_scanner_number_at_buffer_end():
+    scanner = _Scanner(io.StringIO('{"a": 12345, "b": 1e-07}'), chunk_size=9)
+    assert {key: scanner.decode() for key in scanner.iter_object()} == {"a": 12345, "b": 1e-07}
+
+
+def test_truncated_file_raises(tmp_path):
+    path = tmp_path / "yarim.json"
+    path.write_text('{"metadata": {}, "timeline": [{"start": 0.0}, {"start"', encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(path, "timeline"))
+
+
+def test_large_value_is_decoded_in_linear_time(monkeypatch):
+    import app.json_stream as json_stream
+
+    scanned = []
+    real_decoder = json_stream._decoder
+
+    class CountingDecoder:
+        def raw_decode(self, text, position):
+            scanned.append(len(text) - position)
+            return real_decoder.raw_decode(text, position)
+
+    monkeypatch.setattr(json_stream, "_decoder", CountingDecoder())
+
+    # Tampondan çok büyük tek bir değer (ör. read_json_sections ile v1 speakers)
+    value = {"segments": [{"text": "x" * 50, "start": index} for index in range(20000)]}
+    text = json.dumps({"speakers": value})
+    scanner = _Scanner(io.StringIO(text), chunk_size=1024)
+
+    sections = {key: scanner.decode() for key in scanner.iter_object()}
+
+    assert sections == {"speakers": value}
+    # Yeniden denemeler katlanarak büyüyen tamponu tarar: toplam tarama
+    # değer boyutunun sabit katı (sabit parçalarla büyüseydi ~n²/chunk)
+    assert sum(scanned) < 4 * len(text)
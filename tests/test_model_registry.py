@@ -0,0 +1,101 @@
+"""ModelRegistry: kilit dışında yükleme ve kiralanan modellerin korunması."""
+
+import threading
+import time
+
+import pytest
+
+import app.model_registry as model_registry
+from app.model_registry import ModelRegistry
+
+
+class FakeWhisperModel:
+    """Yüklemesi `load_event` set edilene kadar süren sahte model."""
+
+    load_event = None
+    created = 0
+
+    def __init__(self, model_size, **kwargs):
+        type(self).created += 1
+        if type(self).load_event is not None:
+            type(self).load_event.wait(5)
+        self.model_size = model_size
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    FakeWhisperModel.load_event = None
+    FakeWhisperModel.created = 0
+    monkeypatch.setattr(model_registry, "WhisperModel", FakeWhisperModel)
+    # Bellek tahminden alınır (RSS ölçümü testte anlamsız)
+    monkeypatch.setattr(model_registry, "_current_rss_mb", lambda: None)
+    return FakeWhisperModel
+
+
+def test_slow_load_does_not_block_loaded_models(fake_model):
+    registry = ModelRegistry(max_memory_mb=100000, idle_timeout=0)
+    tiny = registry.get_model("tiny", "cpu", "int8")
+
+    fake_model.load_event = threading.Event()
+    loader = threading.Thread(target=registry.get_model, args=("small", "cpu", "int8"))
+    loader.start()
+    time.sleep(0.1)
+
+    # Yükleme sürerken: önbellekteki model ve stats() beklemeden döner
+    started = time.monotonic()
+    assert registry.get_model("tiny", "cpu", "int8") is tiny
+    assert len(registry.stats()["models"]) == 1
+    assert time.monotonic() - started < 1
+
+    fake_model.load_event.set()
+    loader.join()
+    assert len(registry.stats()["models"]) == 2
+
+
+def test_concurrent_requests_load_once(fake_model):
+    registry = ModelRegistry(max_memory_mb=100000, idle_timeout=0)
+    fake_model.load_event = threading.Event()
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get_model("tiny", "cpu", "int8")))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    fake_model.load_event.set()
+    for thread in threads:
+        thread.join()
+
+    assert fake_model.created == 1
+    assert len({id(model) for model in results}) == 1
+
+
+def test_leased_model_is_not_evicted(fake_model):
+    registry = ModelRegistry(max_memory_mb=100000, idle_timeout=1)
+    registry.get_model("tiny", "cpu", "int8", lease=True)
+
+    # Decode boşta kalma süresinden uzun sürüyor
+    registry._models[("tiny", "cpu", "int8", 0, 1)]["last_used"] -= 10
+    assert registry.evict_idle() == 0
+
+    # Kira bitince süre yeniden başlar, sonra boşaltılabilir
+    registry.release("tiny", "cpu", "int8")
+    assert registry.evict_idle() == 0
+    registry._models[("tiny", "cpu", "int8", 0, 1)]["last_used"] -= 10
+    assert registry.evict_idle() == 1
+
+
+def test_budget_eviction_skips_leased_models(fake_model):
+    # tiny (~38 MB) + base (~73 MB) bütçeyi aşar; tiny kullanımda olduğu için kalır
+    registry = ModelRegistry(max_memory_mb=100, idle_timeout=0)
+    registry.get_model("tiny", "cpu", "int8", lease=True)
+    registry.get_model("base", "cpu", "int8")
+    assert registry.is_loaded("tiny", "cpu", "int8")
+    assert registry.evictions == 0
+
+    # Kira bittikten sonra LRU sırasıyla boşaltılabilir
+    registry.release("tiny", "cpu", "int8")
+    registry.get_model("small", "cpu", "int8")
+    assert not registry.is_loaded("tiny", "cpu", "int8")
@@ -0,0 +1,132 @@
+"""Medya başlığı okuma (probe_media) testleri - ffprobe / ffmpeg çıktısı sahtedir."""
+
+import json
+import subprocess
+import wave
+
+import pytest
+
+from app import video_processor
+
+
+FFMPEG_STDERR = """Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'mulakat.mp4':
+  Metadata:
+    major_brand     : isom
+  Duration: 00:02:05.50, start: 0.000000, bitrate: 1205 kb/s
+  Stream #0:0[0x1](und): Video: h264 (High) (avc1 / 0x31637661), yuv420p, 1280x720, 1070 kb/s, 25 fps
+  Stream #0:1[0x2](und): Audio: aac (LC) (mp4a / 0x6134706D), 44100 Hz, stereo, fltp, 128 kb/s
+  Stream #0:2[0x3](eng): Audio: ac3, 48000 Hz, 5.1(side), fltp, 384 kb/s
+At least one output file must be specified
+"""
+
+FFPROBE_STDOUT = json.dumps({
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264", "duration": "125.480000"},
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "44100", "channels": 2, "duration": "125.500000"}
+    ],
+    "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2", "duration": "125.520000"}
+})
+
+
+def _fake_run(stdout="", stderr="", returncode=0):
+    def run(command, **kwargs):
+        return subprocess.CompletedProcess(command, returncode, stdout=stdout, stderr=stderr)
+    return run
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    path = tmp_path / "mulakat.mp4"
+    path.write_bytes(b"\x00" * 16)
+    return path
+
+
+def test_ffprobe_json_is_parsed(media_file, monkeypatch):
+    monkeypatch.setattr(video_processor, "get_ffprobe_binary", lambda: "ffprobe")
+    monkeypatch.setattr(video_processor.subprocess, "run", _fake_run(stdout=FFPROBE_STDOUT))
+
+    info = video_processor.probe_media(media_file)
+
+    assert info == {
+        "duration": 125.5,
+        "format_name": "mov,mp4,m4a,3gp,3g2,mj2",
+        "audio_codec": "aac",
+        "sample_rate": 44100,
+        "channels": 2,
+        "num_audio_streams": 1,
+        "num_video_streams": 1,
+        "probe_method": "ffprobe"
+    }
+
+
+def test_ffprobe_falls_back_to_container_duration(media_file, monkeypatch):
+    stdout = json.dumps({"streams": [{"codec_type": "video"}], "format": {"duration": "N/A"}})
+    monkeypatch.setattr(video_processor, "get_ffprobe_binary", lambda: "ffprobe")
+    monkeypatch.setattr(video_processor.subprocess, "run", _fake_run(stdout=stdout))
+
+    info = video_processor.probe_media(media_file)
+
+    assert info["duration"] is None
+    assert info["num_audio_streams"] == 0
+
+
+def test_ffprobe_failure_raises_value_error(media_file, monkeypatch):
+    monkeypatch.setattr(video_processor, "get_ffprobe_binary", lambda: "ffprobe")
+    monkeypatch.setattr(
+        video_processor.subprocess, "run",
+        _fake_run(stderr="Invalid data found when processing input", returncode=1)
+    )
+
+    with pytest.raises(ValueError):
+        video_processor.probe_media(media_file)
+
+
+def test_ffmpeg_stderr_is_parsed(media_file, monkeypatch):
+    monkeypatch.setattr(video_processor, "get_ffprobe_binary", lambda: None)
+    monkeypatch.setattr(video_processor.subprocess, "run", _fake_run(stderr=FFMPEG_STDERR, returncode=1))
+
+    info = video_processor.probe_media(media_file)
+
+    assert info["probe_method"] == "ffmpeg"
+    assert info["format_name"] == "mov,mp4,m4a,3gp,3g2,mj2"
+    assert info["duration"] == pytest.approx(125.5)
+    assert info["num_video_streams"] == 1
+    assert info["num_audio_streams"] == 2
+    # Codec / sample rate / kanal ilk ses akışından gelir
+    assert (info["audio_codec"], info["sample_rate"], info["channels"]) == ("aac", 44100, 2)
+
+
+def test_ffmpeg_unreadable_file_raises_value_error(media_file, monkeypatch):
+    monkeypatch.setattr(video_processor, "get_ffprobe_binary", lambda: None)
+    monkeypatch.setattr(
+        video_processor.subprocess, "run",
+        _fake_run(stderr="mulakat.mp4: Invalid data found when processing input", returncode=1)
+    )
+
+    with pytest.raises(ValueError):
+        video_processor.probe_media(media_file)
+
+
+def test_wav_header_is_read_without_subprocess(tmp_path, monkeypatch):
+    path = tmp_path / "ses.wav"
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(b"\x00\x00" * 8000)
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("WAV başlığı için alt süreç başlatılmamalı")
+
+    monkeypatch.setattr(video_processor.subprocess, "run", no_subprocess)
+
+    info = video_processor.probe_media(path)
+
+    assert info["probe_method"] == "wave"
+    assert info["duration"] == pytest.approx(0.5)
+    assert (info["audio_codec"], info["sample_rate"], info["channels"]) == ("pcm_s16le", 16000, 1)
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        video_processor.probe_media(tmp_path / "yok.mp4")
@@ -0,0 +1,91 @@
+"""Soru konumlarının bulunması (qa_alignment) testleri."""
+
+from app.qa_alignment import align_questions, normalize_text
+
+
+FILLER = [
+    "geçen yıl bir e-ticaret projesinde çalıştım",
+    "ekipte dört kişiydik ve sprint planlaması yaptık",
+    "veritabanı tarafında indeksleri yeniden düzenledik",
+    "müşteriyle haftalık toplantılar yapıyorduk",
+    "en çok test otomasyonu kısmından keyif aldım",
+    "sonrasında mobil uygulamaya geçtik",
+    "kod incelemelerini dönüşümlü yapıyorduk",
+    "performans sorunlarını profil çıkararak bulduk",
+    "dağıtımları gece otomatik yapıyorduk",
+    "bu süreçte çok şey öğrendim",
+]
+
+QUESTIONS = [
+    "Kendinizden bahseder misiniz?",
+    "Takım çalışmasında zorlandığınız bir anı anlatır mısınız?",
+    "Neden bu pozisyona başvurdunuz?",
+]
+
+
+def _first_segments(alignment):
+    return [match["first_segment"] if match else None for match in alignment]
+
+
+def test_questions_are_found_at_their_segments():
+    texts = list(FILLER)
+    # ASR çıktısı gibi: küçük harf, noktalama ve Türkçe karakter farkları
+    texts.insert(1, "kendinizden bahseder misiniz")
+    texts.insert(5, "takim calismasinda zorlandiginiz bir ani anlatir misiniz")
+    texts.insert(9, "neden bu pozisyona başvurdunuz")
+
+    alignment = align_questions(QUESTIONS, texts)
+
+    assert _first_segments(alignment) == [1, 5, 9]
+    assert all(match["score"] >= 0.5 for match in alignment)
+
+
+def test_alignment_is_monotonic():
+    texts = list(FILLER)
+    # İkinci soru metinde birinciden önce geçiyor: ikisi birden seçilemez
+    texts.insert(2, "takım çalışmasında zorlandığınız bir anı anlatır mısınız")
+    texts.insert(7, "kendinizden bahseder misiniz")
+
+    alignment = align_questions(QUESTIONS[:2], texts)
+
+    located = [match for match in alignment if match is not None]
+    assert len(located) == 1
+    spans = [(m["first_segment"], m["last_segment"]) for m in alignment if m]
+    assert spans == sorted(spans)
+
+
+def test_repeated_question_uses_occurrence_that_keeps_order():
+    texts = list(FILLER)
+    texts.insert(1, "kendinizden bahseder misiniz")
+    texts.insert(4, "neden bu pozisyona başvurdunuz")
+    texts.insert(8, "kendinizden bahseder misiniz")
+
+    alignment = align_questions([QUESTIONS[0], QUESTIONS[2]], texts)
+
+    # 8. segmenti seçmek ikinci soruyu kaybettirir; toplam skor 1. segmenti seçer
+    assert _first_segments(alignment) == [1, 4]
+
+
+def test_question_split_across_two_segments():
+    texts = list(FILLER)
+    texts.insert(3, "takım çalışmasında zorlandığınız")
+    texts.insert(4, "bir anı anlatır mısınız")
+
+    match = align_questions([QUESTIONS[1]], texts)[0]
+
+    assert (match["first_segment"], match["last_segment"]) == (3, 4)
+
+
+def test_missing_question_is_skipped():
+    alignment = align_questions(QUESTIONS, FILLER)
+    assert alignment == [None, None, None]
+
+
+def test_empty_inputs():
+    assert align_questions([], FILLER) == []
+    assert align_questions(QUESTIONS, []) == [None, None, None]
+
+
+def test_normalize_text_folds_turkish_characters():
+    assert normalize_text("İŞ Görüşmesi: Çalıştığınız ŞİRKET?") == "is gorusmesi calistiginiz sirket"
+    assert normalize_text("Iğdır") == normalize_text("ığdır")
@@ -0,0 +1,54 @@
+"""Konuşmacı atama (OutputFormatter._assign_speakers) testleri."""
+
+import random
+
+import pytest
+
+from app.output_formatter import OutputFormatter
+
+
+def _random_case(rng, num_turns, num_segments):
+    """Örtüşen turlar, boşluklar ve eşit uzunluklar içeren rastgele girdi."""
+    diarization = []
+    for _ in range(num_turns):
+        start = rng.randint(0, 200) / 2
+        diarization.append({
+            "speaker": f"SPEAKER_{rng.randint(0, 3):02d}",
+            "start": start,
+            "end": start + rng.randint(1, 12) / 2
+        })
+
+    segments = []
+    for _ in range(num_segments):
+        start = rng.randint(0, 220) / 2
+        segments.append({"start": start, "end": start + rng.randint(0, 8) / 2})
+
+    return segments, diarization
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference_scan(seed):
+    rng = random.Random(seed)
+    segments, diarization = _random_case(rng, num_turns=rng.randint(1, 40), num_segments=60)
+
+    expected = [
+        OutputFormatter._find_speaker_for_segment(segment["start"], segment["end"], diarization)
+        for segment in segments
+    ]
+
+    assert OutputFormatter._assign_speakers(segments, diarization) == expected
+
+
+def test_tie_prefers_earlier_turn_in_list():
+    diarization = [
+        {"speaker": "SPEAKER_01", "start": 5.0, "end": 10.0},
+        {"speaker": "SPEAKER_00", "start": 0.0, "end": 5.0},
+    ]
+    segments = [{"start": 4.0, "end": 6.0}]
+
+    assert OutputFormatter._assign_speakers(segments, diarization) == ["SPEAKER_01"]
+
+
+def test_without_diarization_speaker_is_unknown():
+    segments = [{"start": 0.0, "end": 1.0}, {"start": 1.0, "end": 2.0}]
+    assert OutputFormatter._assign_speakers(segments, []) == ["SPEAKER_UNKNOWN"] * 2
@@ -0,0 +1,47 @@
+"""Zaman aralığı indeksi (TimelineIndex) testleri."""
+
+import random
+
+import pytest
+
+from app.timeline_index import TimelineIndex
+
+
+def _random_timeline(rng, size):
+    """Sırasız, örtüşen ve sıfır uzunluklu segmentler içeren timeline."""
+    timeline = []
+    for index in range(size):
+        start = rng.randint(0, 100) / 2
+        timeline.append({"start": start, "end": start + rng.randint(0, 10) / 2, "text": str(index)})
+    return timeline
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_segments_in_range_matches_brute_force(seed):
+    rng = random.Random(seed)
+    timeline = _random_timeline(rng, rng.randint(0, 50))
+    index = TimelineIndex(timeline)
+
+    for _ in range(50):
+        start = rng.randint(-4, 110) / 2
+        end = start + rng.randint(0, 30) / 2
+        expected = [segment for segment in timeline if segment["start"] < end and segment["end"] > start]
+        assert index.segments_in_range(start, end) == expected
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_segment_at_matches_brute_force(seed):
+    rng = random.Random(seed)
+    timeline = _random_timeline(rng, 40)
+    index = TimelineIndex(timeline)
+
+    for step in range(-2, 120):
+        time = step / 2
+        expected = next((s for s in timeline if s["start"] <= time < s["end"]), None)
+        assert index.segment_at(time) is expected
+
+
+def test_segments_without_times_are_skipped():
+    index = TimelineIndex([{"start": 0.0, "end": 1.0}, {"start": None, "end": 2.0}, {"text": "zamansız"}])
+    assert len(index) == 1
+    assert index.segments_in_range(0.0, 10.0) == [{"start": 0.0, "end": 1.0}]
@@ -0,0 +1,41 @@
+"""Timeline'ın akış halinde okunması (OutputFormatter.iter_timeline)."""
+
+from app.json_stream import iter_json_array
+from app.output_formatter import OutputFormatter
+from app.transcript_schema import skip_unused_header_section
+
+
+def _result():
+    transcription = {
+        "language": "tr",
+        "text": "merhaba nasılsınız iyiyim",
+        "segments": [
+            {"start": 0.0, "end": 1.5, "text": "merhaba", "confidence": 0.9},
+            {"start": 1.5, "end": 3.0, "text": "nasılsınız", "confidence": 0.8},
+            {"start": 3.0, "end": 4.2, "text": "iyiyim", "confidence": 0.7},
+        ]
+    }
+    return OutputFormatter.merge_results(transcription, diarization=None, video_name="test.mp4")
+
+
+def test_v1_speakers_section_is_not_loaded(tmp_path):
+    result = _result()
+    path = OutputFormatter.save_to_json(result, tmp_path / "v1.json", schema_version=1)
+
+    header = {}
+    segments = list(iter_json_array(path, "timeline", header=header, skip_section=skip_unused_header_section))
+
+    assert "speakers" not in header
+    assert "metadata" in header
+    assert len(segments) == 3
+    assert [s["text"] for s in OutputFormatter.iter_timeline(path)] == [s["text"] for s in result["timeline"]]
+
+
+def test_v2_speakers_are_applied_to_segments(tmp_path):
+    result = _result()
+    path = OutputFormatter.save_to_json(result, tmp_path / "v2.json", schema_version=2)
+
+    timeline = list(OutputFormatter.iter_timeline(path))
+
+    assert [s["speaker"] for s in timeline] == ["SPEAKER_00"] * 3
+    assert [s["text"] for s in timeline] == [s["text"] for s in result["timeline"]]
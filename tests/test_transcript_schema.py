@@ -0,0 +1,73 @@
+"""Kompakt çıktı şeması (v1 <-> v2) testleri."""
+
+import json
+
+import pytest
+
+from app.output_formatter import OutputFormatter
+from app.transcript_schema import SCHEMA_VERSION, compact_transcript, expand_transcript, get_schema_version
+
+
+def _v1_result():
+    """İki konuşmacılı, aralıkları bölünmüş bir merge_results() sonucu."""
+    texts = ["Merhaba, hoş geldiniz.", "Teşekkürler.", "Kendinizden bahseder misiniz?",
+             "Tabii, beş yıldır yazılım geliştiriyorum.", "Hangi dilleri kullanıyorsunuz?",
+             "Çoğunlukla Python."]
+    segments = [
+        {"start": round(index * 2.29, 2), "end": round(index * 2.29 + 2.1, 2), "text": text, "confidence": 0.9}
+        for index, text in enumerate(texts)
+    ]
+    diarization = [
+        {"speaker": "SPEAKER_00" if index % 2 == 0 else "SPEAKER_01",
+         "start": segment["start"], "end": segment["end"]}
+        for index, segment in enumerate(segments)
+    ]
+    transcription = {"language": "tr", "text": " ".join(texts), "segments": segments}
+    return OutputFormatter.merge_results(transcription, diarization, video_name="mulakat.mp4")
+
+
+def test_compact_drops_duplicates():
+    result = _v1_result()
+    compact = compact_transcript(result)
+
+    assert get_schema_version(compact) == SCHEMA_VERSION
+    assert "full_transcript" not in compact
+    assert compact["timeline"][1] == {"start_ms": 2290, "end_ms": 4390, "text": "Teşekkürler.", "confidence": 0.9}
+    assert compact["speakers"]["SPEAKER_00"]["ranges"] == [[0, 1], [2, 3], [4, 5]]
+    assert "segments" not in compact["speakers"]["SPEAKER_00"]
+
+
+def test_round_trip_restores_v1_result():
+    result = _v1_result()
+
+    # JSON üzerinden geçir (dosyaya yazılıp okunmuş gibi)
+    restored = expand_transcript(json.loads(json.dumps(compact_transcript(result))))
+
+    assert restored == result
+    # Konuşmacı segmentleri timeline nesnelerinin kendisi (kopya değil)
+    assert restored["speakers"]["SPEAKER_01"]["segments"][0] is restored["timeline"][1]
+
+
+def test_v1_and_v2_are_returned_unchanged():
+    result = _v1_result()
+    compact = compact_transcript(result)
+
+    assert expand_transcript(result) is result
+    assert compact_transcript(compact) is compact
+
+
+@pytest.mark.parametrize("schema_version", [1, 2])
+def test_saved_file_loads_back_to_v1(tmp_path, schema_version):
+    result = _v1_result()
+    path = OutputFormatter.save_to_json(result, tmp_path / "out.json", schema_version=schema_version)
+
+    assert OutputFormatter.load_from_json(path) == result
+    assert list(OutputFormatter.iter_timeline(path)) == result["timeline"]
+
+
+def test_v2_file_is_smaller(tmp_path):
+    result = _v1_result()
+    v1_path = OutputFormatter.save_to_json(result, tmp_path / "v1.json", schema_version=1)
+    v2_path = OutputFormatter.save_to_json(result, tmp_path / "v2.json", schema_version=2)
+
+    assert v2_path.stat().st_size < v1_path.stat().st_size
@@ -0,0 +1,113 @@
+"""Transcription önbelleği (TranscriptionCache) testleri."""
+
+import os
+import threading
+
+import numpy as np
+
+from app.transcription_cache import TranscriptionCache
+
+
+def _transcription(seed):
+    # Rastgele metin: gzip küçültemesin, kayıt boyutları öngörülebilir olsun
+    text = np.random.default_rng(seed).integers(0, 2 ** 32, size=4096).astype(str)
+    return {"language": "tr", "text": " ".join(text), "segments": []}
+
+
+def _set_last_used(cache, key, timestamp):
+    os.utime(cache._entry_path(key), (timestamp, timestamp))
+
+
+def test_round_trip_and_counters(tmp_path):
+    cache = TranscriptionCache(cache_dir=tmp_path, max_size_mb=10)
+    key = cache.make_key(cache.hash_audio(np.zeros(16000, dtype=np.float32)), {"model_size": "tiny"})
+
+    assert cache.get(key) is None
+    cache.put(key, {"language": "tr", "text": "merhaba", "segments": []}, audio_duration=1.0)
+    entry = cache.get(key)
+
+    assert entry == {"transcription": {"language": "tr", "text": "merhaba", "segments": []}, "audio_duration": 1.0}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key_depends_on_params():
+    audio_hash = TranscriptionCache.hash_audio(np.ones(100, dtype=np.float32))
+    assert TranscriptionCache.make_key(audio_hash, {"model_size": "tiny", "beam_size": 5}) == \
+        TranscriptionCache.make_key(audio_hash, {"beam_size": 5, "model_size": "tiny"})
+    assert TranscriptionCache.make_key(audio_hash, {"model_size": "tiny"}) != \
+        TranscriptionCache.make_key(audio_hash, {"model_size": "small"})
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = TranscriptionCache(cache_dir=tmp_path, max_size_mb=10)
+    cache.put("aa01", _transcription(1))
+    cache.put("bb02", _transcription(2))
+    cache.put("cc03", _transcription(3))
+
+    # aa01 en yeni kullanılan, bb02 en eski
+    _set_last_used(cache, "aa01", 3000)
+    _set_last_used(cache, "bb02", 1000)
+    _set_last_used(cache, "cc03", 2000)
+
+    # Sınırı yaklaşık iki kayda indir ve yeni kayıt ekle
+    entry_size = cache._entry_path("aa01").stat().st_size
+    cache.max_size_mb = (entry_size * 3.5) / (1024 * 1024)
+    cache.put("dd04", _transcription(4))
+
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") is not None
+    assert cache.get("cc03") is not None
+    assert cache.get("dd04") is not None
+
+
+def test_get_refreshes_last_used(tmp_path):
+    cache = TranscriptionCache(cache_dir=tmp_path, max_size_mb=10)
+    cache.put("aa01", _transcription(1))
+    cache.put("bb02", _transcription(2))
+    _set_last_used(cache, "aa01", 1000)
+    _set_last_used(cache, "bb02", 2000)
+
+    # Okunan kayıt en yeni kullanılan olur, sıradaki tahliyede korunur
+    assert cache.get("aa01") is not None
+    entry_size = cache._entry_path("aa01").stat().st_size
+    cache.max_size_mb = (entry_size * 2.5) / (1024 * 1024)
+    cache.put("cc03", _transcription(3))
+
+    assert cache.get("aa01") is not None
+    assert cache.get("bb02") is None
+
+
+def test_corrupt_entry_is_dropped(tmp_path):
+    cache = TranscriptionCache(cache_dir=tmp_path, max_size_mb=10)
+    path = cache._entry_path("aa01")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"gzip degil")
+
+    assert cache.get("aa01") is None
+    assert not path.exists()
+
+
+def test_concurrent_puts_of_same_key(tmp_path):
+    cache = TranscriptionCache(cache_dir=tmp_path, max_size_mb=100)
+    transcriptions = [_transcription(seed) for seed in range(8)]
+    barrier = threading.Barrier(len(transcriptions))
+    errors = []
+
+    def writer(transcription):
+        barrier.wait()
+        try:
+            for _ in range(5):
+                cache.put("aa01", transcription)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in transcriptions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Son yazan kazanır ama kayıt bütün ve geçici dosya kalmaz
+    assert errors == []
+    assert cache.get("aa01")["transcription"] in transcriptions
+    assert [path.name for path in (tmp_path / "aa").iterdir()] == ["aa01.json.gz"]
@@ -8,26 +8,52 @@ Kullanım:
     python v_to_t.py video.mp4
     python v_to_t.py video.mp4 --model medium --language tr --num-speakers 2
     python v_to_t.py video.mp4 --output sonuc.json
+    python v_to_t.py video.mp4 --jsonl -        # Segmentleri anında stdout'a yaz
+    python v_to_t.py videos/*.mp4 --output-dir sonuclar/   # Toplu işleme
+    python v_to_t.py --manifest liste.txt       # Her satırda bir dosya
 """
 
 import argparse
+import contextlib
+import glob
+import itertools
+import json
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
 from loguru import logger
 import time
 
 # Proje modüllerini import et
 from app.video_processor import (
     extract_audio_from_video,
+    extract_audio_to_array,
     validate_video_file,
-    get_audio_duration
+    get_audio_duration,
+    probe_media,
+    WHISPER_SAMPLE_RATE
 )
 from app.transcriber import Transcriber
 # from app.diarizer import SpeakerDiarizer  # KALDIRILDI: pyannote.audio kullanılmıyor
 from app.output_formatter import OutputFormatter
+from app.stream_writer import JSONLinesWriter
+from app.transcription_cache import TranscriptionCache, get_transcription_cache
+from app.checkpoint import TranscriptionCheckpoint
+from app.hardware import select_runtime_config
+from app.metrics import StageMetrics, record_job_failure, record_job_metrics
+from app.search_index import get_search_index
+from app.progress import ProcessingCancelled
 import config.settings as settings
 
 
+# Logging bir kez kurulduysa process_video() tekrar kurmaz
+# (toplu işlemede her dosya için yeni log dosyası açılmasın, --verbose korunsun)
+_logging_configured = False
+
+
 def setup_logging(verbose: bool = False):
     """
     Logging sistemini kur.
@@ -35,6 +61,9 @@ def setup_logging(verbose: bool = False):
     Args:
         verbose: Detaylı log çıktısı (DEBUG seviyesi)
     """
+    global _logging_configured
+    _logging_configured = True
+
     # Mevcut handler'ları kaldır
     logger.remove()
 
@@ -107,139 +136,501 @@ def format_duration(seconds: float) -> str:
         return f"{secs}s"
 
 
-def process_video(
+def format_timestamp(seconds: float) -> str:
+    """
+    Saniyeyi video zaman damgasına çevir.
+
+    Args:
+        seconds: Videonun başından itibaren saniye
+
+    Returns:
+        str: "05:07" veya "1:02:15" formatında
+    """
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
+
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def prepare_media(
     video_path: Path,
     model_size: str,
     language: str,
-    output_path: Path = None,
-    export_text: bool = True,
-    questions_path: Path = None
+    extract_mode: str = None,
+    chunk_workers: int = None,
+    chunk_length: float = None,
+    batch_size: int = None,
+    use_cache: bool = None,
+    device: str = None,
+    compute_type: str = None,
+    cpu_threads: int = None,
+    resume: bool = False,
+    content_hash: str = None,
+    profiler=None,
+    progress=None
 ) -> dict:
     """
-    Video dosyasını işle (ana pipeline).
+    Pipeline 1. aşama: Validasyon, önbellek kontrolü ve ses çıkarma.
 
-    NOT: Konuşmacı ayırma (diarization) devre dışı - sadece transkripsiyon yapılır.
+    CPU'yu az kullanan (ffmpeg alt süreci, disk okuma) bu aşama toplu
+    işlemede bir sonraki dosya için transcription ile paralel çalıştırılır.
 
     Args:
         video_path: Video dosyası yolu
         model_size: Whisper model boyutu
         language: Dil kodu (tr, en)
-        output_path: Çıktı JSON dosyası yolu
-        export_text: Text dosyası da oluştur mu?
-        questions_path: Soru dosyası yolu (opsiyonel, QA matching için)
+        extract_mode, chunk_workers, chunk_length, batch_size, use_cache,
+        device, compute_type, cpu_threads, resume, content_hash: process_video() ile aynı
+        profiler: Aşama sınırlarını alacak SamplingProfiler (opsiyonel)
+        progress: İlerleme fonksiyonu (opsiyonel, print_progress imzası)
 
     Returns:
-        dict: İşlem sonucu
-
-    Raises:
-        Exception: İşlem hatası
+        dict: Sonraki aşamaların kullanacağı iş bilgisi (job)
+            {"video_path", "audio", "audio_path", "audio_duration", "cached",
+             "cache_key", "checkpoint_key", "decode_options", ...}
     """
-    # Logging sistemini kur (UI'dan çağrılırsa)
-    setup_logging(verbose=False)
-
-    total_steps = 4
-    start_time = time.time()
+    stage_start = time.time()
+    metrics = StageMetrics(profiler=profiler)
 
-    # ADIM 1: Video Validasyonu ve Ses Çıkarma
-    print_progress(0, total_steps, "Video validasyonu yapılıyor...")
+    if progress:
+        progress(0, 4, "Video validasyonu yapılıyor...")
     logger.info(f"Video işleniyor: {video_path.name}")
 
-    validate_video_file(video_path)
+    # Başlık bir kez okunur; doğrulama ve süre bilgisi bu sonucu kullanır
+    with metrics.stage("duration_probe"):
+        media_info = probe_media(video_path)
+    with metrics.stage("validate"):
+        validate_video_file(video_path, media_info=media_info)
+
+    if progress:
+        progress(1, 4, "Ses çıkarılıyor...")
+    extract_mode = extract_mode or settings.AUDIO_EXTRACTION_MODE
+    chunk_workers = settings.CHUNK_WORKERS if chunk_workers is None else chunk_workers
+    batch_size = settings.WHISPER_BATCH_SIZE if batch_size is None else batch_size
+    use_cache = settings.TRANSCRIPTION_CACHE_ENABLED if use_cache is None else use_cache
+    transcribe_language = language if language else "tr"  # Varsayılan: Türkçe
+
+    # Device / compute type / thread sayısı: CLI > .env > donanım algılama
+    runtime = select_runtime_config(device=device, compute_type=compute_type, cpu_threads=cpu_threads)
 
-    print_progress(1, total_steps, "Ses çıkarılıyor...")
-    audio_path = extract_audio_from_video(video_path)
-    audio_duration = get_audio_duration(audio_path)
+    # Optimize edilmiş parametreler:
+    # - beam_size=5: Daha iyi doğruluk (varsayılan 1'den yüksek)
+    # - temperature=0.0: Deterministic, tutarlı sonuçlar
+    # - vad_filter=False: MÜZİKLİ videolar için VAD kapalı (yoksa şarkı sözlerini filtreler)
+    #   NOT: Sadece konuşma olan videolar için vad_filter=True kullanın
+    decode_options = {
+        "beam_size": 5,
+        "temperature": 0.0,
+        "vad_filter": False  # Müzikli videolar için KAPALI
+    }
+
+    # Önbellek anahtarı: ses hash'i + sonucu etkileyen tüm parametreler
+    # (paralel parça ve batch modları farklı segmentasyon üretir, anahtara dahil)
+    cache_params = {
+        "model_size": model_size,
+        "compute_type": runtime["compute_type"],
+        "language": transcribe_language,
+        "batch_size": batch_size,
+        "chunk_length": (chunk_length or settings.CHUNK_LENGTH_SECONDS) if chunk_workers > 1 else None,
+        **decode_options
+    }
+
+    cache = get_transcription_cache() if use_cache else None
+    cache_key = None
+    cached = None
+    audio = None
+    audio_path = None
+
+    if cache is not None:
+        # Aynı kaynak dosya daha önce işlendiyse ses hash'i bilinir:
+        # ses çıkarmadan önbelleğe bakılır (içerik hash'i verildiyse aynı
+        # video farklı yol/adla tekrar yüklense de bulunur)
+        with metrics.stage("cache"):
+            source_fingerprint = cache.source_fingerprint(video_path, content_hash)
+            audio_hash = cache.lookup_source(source_fingerprint)
+            if audio_hash is not None:
+                cache_key = cache.make_key(audio_hash, cache_params)
+                cached = cache.get(cache_key)
+
+    if cached is not None:
+        audio_duration = cached["audio_duration"]
+        logger.info("Ses çıkarma atlandı (önbellekte sonuç var)")
+    else:
+        if extract_mode == "memory":
+            # Tek ffmpeg decode, PCM doğrudan belleğe (geçici WAV yok)
+            with metrics.stage("extract"):
+                audio = extract_audio_to_array(video_path)
+            audio_duration = audio.size / WHISPER_SAMPLE_RATE
+        else:
+            # Eski yöntem: moviepy ile geçici WAV
+            with metrics.stage("extract"):
+                audio_path = extract_audio_from_video(video_path)
+            audio = audio_path
+            with metrics.stage("duration_probe"):
+                audio_duration = get_audio_duration(audio_path)
+
+        if cache is not None:
+            # Kaynak dosya farklı olsa da ses aynıysa sonuç yine bulunur
+            with metrics.stage("cache"):
+                audio_hash = cache.hash_audio(audio)
+                cache.remember_source(source_fingerprint, audio_hash)
+                cache_key = cache.make_key(audio_hash, cache_params)
+                cached = cache.get(cache_key)
     logger.info(f"Ses süresi: {format_duration(audio_duration)}")
 
-    # ADIM 2: Konuşma Tanıma (Speech-to-Text)
-    print_progress(2, total_steps, f"Konuşma metne çevriliyor ({model_size} model - faster-whisper)...")
-    logger.info(f"faster-whisper {model_size} model yükleniyor...")
+    # Checkpoint anahtarı = önbellek anahtarı (önbellek kapalıysa ses hash'inden)
+    # Aynı ses + aynı ayarlar olmadan yarım kalan işe devam edilemez
+    checkpoint_key = None
+    if settings.CHECKPOINT_ENABLED and cached is None:
+        with metrics.stage("cache"):
+            checkpoint_key = cache_key or TranscriptionCache.make_key(TranscriptionCache.hash_audio(audio), cache_params)
+
+    return {
+        "video_path": video_path,
+        "model_size": model_size,
+        "language": language,
+        "transcribe_language": transcribe_language,
+        "runtime": runtime,
+        "chunk_workers": chunk_workers,
+        "chunk_length": chunk_length,
+        "batch_size": batch_size,
+        "decode_options": decode_options,
+        "media_info": media_info,
+        "audio": audio,
+        "audio_path": audio_path,
+        "audio_duration": audio_duration,
+        "cache": cache,
+        "cache_key": cache_key,
+        "cached": cached,
+        "checkpoint_key": checkpoint_key,
+        "resume": resume,
+        "checkpoint": None,
+        "stage_timings": {"prepare": time.time() - stage_start},
+        "metrics": metrics
+    }
+
+
+def transcribe_media(job: dict, jsonl_output=None, progress=None, progress_callback=None) -> dict:
+    """
+    Pipeline 2. aşama: Konuşma tanıma (Speech-to-Text).
+
+    CPU/GPU'yu yoğun kullanan aşama; toplu işlemede tek bir thread'de sırayla
+    çalışır. Bittiğinde ses verisi job'dan çıkarılır (bellek serbest kalsın).
+
+    Args:
+        job: prepare_media() sonucu (güncellenir)
+        jsonl_output: Segmentlerin anında yazılacağı JSON Lines hedefi (opsiyonel)
+        progress: İlerleme fonksiyonu (opsiyonel, print_progress imzası)
+        progress_callback: Her segmentte çağrılır (opsiyonel, bkz. process_video())
+
+    Returns:
+        dict: Transcriber.transcribe() formatında sonuç
+    """
+    stage_start = time.time()
+    model_size = job["model_size"]
+    runtime = job["runtime"]
+    cached = job["cached"]
+
+    if progress:
+        progress(2, 4, f"Konuşma metne çevriliyor ({model_size} model - faster-whisper)...")
 
     # faster-whisper ile optimized transcription
     # Dil parametresi: None ise otomatik algılama, "tr" ise Türkçe
     # Müzikli videolar için dil belirtmek daha iyi sonuç verir
     transcriber = Transcriber(
         model_size=model_size,
-        language=language if language else "tr",  # Varsayılan: Türkçe
-        device="cuda",  # GPU kullan (hardcoded)
-        compute_type="float16"  # GPU optimizasyonu (hardcoded)
+        language=job["transcribe_language"],
+        device=runtime["device"],
+        compute_type=runtime["compute_type"],
+        batch_size=job["batch_size"],
+        cpu_threads=runtime["cpu_threads"],
+        num_workers=runtime["num_workers"]
     )
-    transcriber.load_model()
 
-    logger.info("Transcription başlıyor (optimized parameters)...")
-    # Optimize edilmiş parametreler:
-    # - beam_size=5: Daha iyi doğruluk (varsayılan 1'den yüksek)
-    # - temperature=0.0: Deterministic, tutarlı sonuçlar
-    # - vad_filter=False: MÜZİKLİ videolar için VAD kapalı (yoksa şarkı sözlerini filtreler)
-    #   NOT: Sadece konuşma olan videolar için vad_filter=True kullanın
-    transcription = transcriber.transcribe(
-        audio_path,
-        beam_size=5,
-        temperature=0.0,
-        vad_filter=False  # Müzikli videolar için KAPALI
-    )
+    checkpoint = None
+    restored = None
+
+    if cached is not None:
+        # Önbellekten: model yüklenmez, segmentler kayıttan okunur
+        logger.info("Transcription önbellekten alınıyor (Whisper çalıştırılmayacak)")
+        transcriber.detected_language = cached["transcription"]["language"]
+        segment_stream = iter(cached["transcription"]["segments"])
+    elif job["checkpoint_key"] is not None:
+        # Decode edilen segmentler periyodik olarak diske yazılır (--resume)
+        checkpoint = TranscriptionCheckpoint(
+            job["checkpoint_key"],
+            metadata={"video_name": job["video_path"].name, "audio_duration": round(job["audio_duration"], 2)}
+        )
+        if job["resume"]:
+            restored = checkpoint.load()
+            if restored is not None:
+                logger.info(
+                    f"Checkpoint'ten devam ediliyor: {len(restored['segments'])} segment, "
+                    f"{format_duration(restored['offset'])} / {format_duration(job['audio_duration'])}"
+                )
+            else:
+                logger.info("Devam edilecek checkpoint bulunamadı, baştan başlanıyor")
+        elif checkpoint.exists():
+            logger.warning("Bu video için yarım kalmış bir iş vardı, baştan başlanıyor (devam etmek için --resume)")
+
+        checkpoint.start(restored, language=job["transcribe_language"])
+        job["checkpoint"] = checkpoint
+
+    if restored is not None and restored["completed"]:
+        # Decode bitmiş ama çıktı kaydedilememişti
+        logger.info("Checkpoint'te transcription tamamlanmış (Whisper çalıştırılmayacak)")
+        transcriber.detected_language = restored["language"]
+        segment_stream = iter(())
+    elif cached is None:
+        decode_options = dict(job["decode_options"])
+        if restored is not None:
+            # Kalan ses çözülür; önceki metnin sonu Whisper'a bağlam olarak verilir
+            decode_options.update(
+                start_offset=restored["offset"],
+                start_index=len(restored["segments"]),
+                initial_prompt=restored["initial_prompt"]
+            )
+
+        logger.info(f"faster-whisper {model_size} model yükleniyor...")
+
+        # Paralel parça modunda her worker kendi modelini yükler,
+        # ana süreçte model yüklemeye gerek yok
+        if job["chunk_workers"] <= 1:
+            with job["metrics"].stage("model_load"):
+                transcriber.load_model()
+
+        logger.info("Transcription başlıyor (optimized parameters)...")
+
+        if job["chunk_workers"] > 1:
+            # Uzun kayıtlar: sessizlik noktalarından bölünüp paralel çözülür
+            segment_stream = transcriber.transcribe_chunked_stream(
+                job["audio"],
+                chunk_length=job["chunk_length"],
+                num_workers=job["chunk_workers"],
+                **decode_options
+            )
+        else:
+            segment_stream = transcriber.transcribe_stream(job["audio"], **decode_options)
+
+    # Kesinti/iptal durumunda decode generator'ı hemen kapatılır
+    decode_stream = segment_stream
+
+    restored_count = 0
+    if restored is not None:
+        restored_count = len(restored["segments"])
+        segment_stream = itertools.chain(restored["segments"], segment_stream)
+
+    # Segmentler decode edildikçe işlenir (akış API'si)
+    # JSON Lines çıktısı istenmişse her segment anında yazılır
+    jsonl_writer = None
+    if jsonl_output is not None:
+        jsonl_writer = JSONLinesWriter(
+            jsonl_output,
+            metadata={
+                "video_name": job["video_path"].name,
+                "model_size": model_size,
+                "language": job["language"],
+                "audio_duration": round(job["audio_duration"], 2),
+                "device": runtime["device"],
+                "compute_type": runtime["compute_type"]
+            }
+        )
+
+    segments = []
+    try:
+        with jsonl_writer if jsonl_writer is not None else contextlib.nullcontext(), job["metrics"].stage("transcribe"):
+            for segment in segment_stream:
+                segments.append(segment)
+
+                # Geri yüklenen segmentler zaten checkpoint'te
+                if checkpoint is not None and len(segments) > restored_count:
+                    checkpoint.add(segment)
+
+                if jsonl_writer is not None:
+                    # Diarization devre dışı: tüm segmentler SPEAKER_00
+                    jsonl_writer.write_segment(OutputFormatter.merge_segment(segment, "SPEAKER_00"))
+
+                if progress_callback is not None:
+                    progress_callback({
+                        "stage": "transcribe",
+                        "processed_seconds": segment["end"],
+                        "audio_duration": job["audio_duration"],
+                        "num_segments": len(segments),
+                        "segment": segment,
+                        # Checkpoint'ten geri yüklenen segment (decode edilmedi, RTF'ye katılmaz)
+                        "restored": len(segments) <= restored_count
+                    })
+
+            if checkpoint is not None:
+                checkpoint.commit(completed=True)
+
+            transcription = transcriber.build_result(segments)
+
+            if jsonl_writer is not None:
+                jsonl_writer.close({"language": transcription["language"], "completed": True})
+    except BaseException:
+        # Whisper decode'u (paralel modda worker süreçleri) durdurulur
+        if hasattr(decode_stream, "close"):
+            decode_stream.close()
+
+        if checkpoint is not None:
+            # Kesinti/hata: o ana kadar decode edilenler kalıcı hale getirilir
+            checkpoint.close()
+            logger.warning(
+                f"Transcription yarıda kaldı, checkpoint kaydedildi ({len(segments)} segment). "
+                f"Aynı komutu --resume ile çalıştırarak devam edebilirsiniz"
+            )
+        raise
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    if job["cache"] is not None and cached is None:
+        job["cache"].put(job["cache_key"], transcription, audio_duration=job["audio_duration"])
 
     word_count = len(transcription['text'].split())
     logger.success(f"Transcription tamamlandı: {word_count} kelime")
 
+    # Bellek içi ses artık gerekmiyor (prefetch kuyruğunda bellek birikmesin)
+    job["audio"] = None
+    job["stage_timings"]["transcribe"] = time.time() - stage_start
+    return transcription
+
+
+def finalize_result(
+    job: dict,
+    transcription: dict,
+    output_path: Path = None,
+    export_text: bool = True,
+    questions_path: Path = None,
+    progress=None,
+    qa_method: str = None,
+    dataset_export: bool = None
+) -> dict:
+    """
+    Pipeline 3. aşama: Birleştirme, kaydetme, QA matching ve temizlik.
+
+    Disk yazma ağırlıklı bu aşama toplu işlemede ayrı bir writer thread'inde
+    çalışır; transcription bir sonraki dosyaya geçebilir.
+
+    Args:
+        job: prepare_media() sonucu
+        transcription: transcribe_media() sonucu
+        output_path: Çıktı JSON dosyası yolu
+        export_text: Text dosyası da oluştur mu?
+        questions_path: Soru dosyası yolu (opsiyonel, QA matching için)
+        progress: İlerleme fonksiyonu (opsiyonel, print_progress imzası)
+        qa_method: QA eşleştirme yöntemi ("equal_time_segmentation" veya
+            "content_alignment"), verilmezse settings.QA_MATCHING_METHOD
+        dataset_export: Timeline Parquet veri setine eklensin mi?
+            Verilmezse settings.TRANSCRIPT_DATASET_EXPORT kullanılır
+
+    Returns:
+        dict: process_video() formatında işlem sonucu
+    """
+    stage_start = time.time()
+    video_path = job["video_path"]
+    audio_path = job["audio_path"]
+    audio_duration = job["audio_duration"]
+    metrics = job["metrics"]
+
     # ADIM 3: Konuşmacı Ayırma - KALDIRILDI
     # pyannote.audio artık kullanılmıyor, sadece transkripsiyon yapılıyor
     diarization = None
-    print_progress(3, total_steps, "Konuşmacı ayırma devre dışı (sadece transkripsiyon)...")
+    if progress:
+        progress(3, 4, "Konuşmacı ayırma devre dışı (sadece transkripsiyon)...")
     logger.info("Konuşmacı ayırma devre dışı - pyannote.audio kullanılmıyor")
 
     # ADIM 4: Sonuçları Birleştir ve Kaydet
-    print_progress(4, total_steps, "Sonuçlar birleştiriliyor ve kaydediliyor...")
+    if progress:
+        progress(4, 4, "Sonuçlar birleştiriliyor ve kaydediliyor...")
     logger.info("Sonuçlar birleştiriliyor...")
 
-    result = OutputFormatter.merge_results(
-        transcription,
-        diarization,
-        video_name=video_path.name,
-        additional_metadata={
-            "model_size": model_size,
-            "language": language,
-            "audio_duration": round(audio_duration, 2)
-        }
-    )
+    with metrics.stage("merge"):
+        result = OutputFormatter.merge_results(
+            transcription,
+            diarization,
+            video_name=video_path.name,
+            additional_metadata={
+                "model_size": job["model_size"],
+                "language": job["language"],
+                "audio_duration": round(audio_duration, 2),
+                # Seçilen çalışma ayarları (tekrar üretilebilirlik ve performans takibi için)
+                "runtime": {
+                    key: job["runtime"][key]
+                    for key in ("device", "compute_type", "cpu_threads", "num_workers", "cpu_isa")
+                }
+            }
+        )
 
-    # JSON kaydet
     if output_path is None:
         output_path = settings.OUTPUT_DIR / f"{video_path.stem}_output.json"
 
-    json_path = OutputFormatter.save_to_json(result, output_path, pretty=True)
+    # JSON kaydet (ilk: sonraki export'lar hata verse de ana çıktı yazılmış olur)
+    # Dosyadaki performans özeti birleştirmeye kadarki aşamaları içerir;
+    # sonraki aşamalar dönen sonuçta ve Prometheus sayaçlarında yer alır
+    num_segments = len(result['timeline'])
+    cache_hit = job["cached"] is not None
+    result["metadata"]["performance"] = metrics.summary(audio_duration, num_segments, cache_hit)
+    with metrics.stage("json_save"):
+        json_path = OutputFormatter.save_to_json(result, output_path, pretty=True)
+
+    # Arama indeksini güncelle (hata işi başarısız yapmaz)
+    if settings.SEARCH_INDEX_ENABLED:
+        try:
+            with metrics.stage("search_index"):
+                get_search_index().upsert(result, json_path)
+        except Exception as e:
+            logger.warning(f"Arama indeksi güncellenemedi: {e}")
 
     # Text export
     text_path = None
     if export_text:
         text_path = output_path.with_suffix('.txt')
-        OutputFormatter.export_to_text(result, text_path)
+        with metrics.stage("text_export"):
+            OutputFormatter.export_to_text(result, text_path)
+
+    # Parquet veri seti (Opsiyonel) - hata işi başarısız yapmaz
+    dataset_path = None
+    if settings.TRANSCRIPT_DATASET_EXPORT if dataset_export is None else dataset_export:
+        try:
+            from app.transcript_dataset import export_transcript
+            with metrics.stage("dataset_export"):
+                dataset_path = export_transcript(result)
+        except ImportError as e:
+            logger.warning(f"Veri seti atlanıyor: {e}")
+        except Exception as e:
+            logger.error(f"Veri setine eklenemedi: {e}")
 
     # QA Matching (Opsiyonel)
     qa_json_path = None
     qa_md_path = None
     if questions_path is not None:
-        print_progress(5, 5, "Soru-cevap eşleştirme yapılıyor...")
+        if progress:
+            progress(5, 5, "Soru-cevap eşleştirme yapılıyor...")
         logger.info("QA matching başlıyor...")
 
         try:
             from app.qa_matcher import QAMatcher
 
-            matcher = QAMatcher()
-            questions = matcher.load_questions(questions_path)
-            logger.info(f"{len(questions)} soru yüklendi")
+            with metrics.stage("qa"):
+                matcher = QAMatcher()
+                questions = matcher.load_questions(questions_path)
+                logger.info(f"{len(questions)} soru yüklendi")
 
-            qa_data = matcher.create_qa_pairs(questions, result)
+                qa_data = matcher.create_qa_pairs(questions, result, matching_method=qa_method)
 
-            # JSON kaydet
-            qa_json_path = output_path.with_name(f"{output_path.stem}_qa.json")
-            matcher.save_to_json(qa_data, qa_json_path)
-            logger.success(f"QA JSON: {qa_json_path}")
+                # JSON kaydet
+                qa_json_path = output_path.with_name(f"{output_path.stem}_qa.json")
+                matcher.save_to_json(qa_data, qa_json_path)
+                logger.success(f"QA JSON: {qa_json_path}")
 
-            # Markdown kaydet
-            qa_md_path = output_path.with_name(f"{output_path.stem}_qa.md")
-            matcher.save_to_markdown(qa_data, qa_md_path)
-            logger.success(f"QA Markdown: {qa_md_path}")
+                # Markdown kaydet
+                qa_md_path = output_path.with_name(f"{output_path.stem}_qa.md")
+                matcher.save_to_markdown(qa_data, qa_md_path)
+                logger.success(f"QA Markdown: {qa_md_path}")
 
         except FileNotFoundError as e:
             logger.error(f"Questions dosyası bulunamadı: {e}")
@@ -252,13 +643,21 @@ def process_video(
             logger.exception(e)  # Full traceback
             logger.warning("QA matching atlanıyor...")
 
-    # Geçici ses dosyasını temizle
-    if settings.TEMP_FILE_CLEANUP and audio_path.exists():
-        audio_path.unlink()
-        logger.debug(f"Geçici dosya silindi: {audio_path}")
+    # Çıktı kaydedildi: yarım iş checkpoint'i artık gereksiz
+    if job.get("checkpoint") is not None:
+        job["checkpoint"].discard()
+
+    # Geçici ses dosyasını temizle (sadece "wav" modunda oluşur)
+    cleanup_media(job)
+
+    job["stage_timings"]["finalize"] = time.time() - stage_start
+
+    # İşlem süresi: aşama sürelerinin toplamı
+    # (toplu işlemede kuyrukta bekleme süresi dosyanın süresine eklenmez)
+    elapsed_time = sum(job["stage_timings"].values())
 
-    # Süre hesapla
-    elapsed_time = time.time() - start_time
+    performance = metrics.summary(audio_duration, num_segments, cache_hit)
+    record_job_metrics(performance, audio_duration, num_segments)
 
     return {
         "success": True,
@@ -266,13 +665,221 @@ def process_video(
         "text_path": text_path,
         "qa_json_path": qa_json_path,
         "qa_md_path": qa_md_path,
+        "dataset_path": dataset_path,
         "num_speakers": len(result['speakers']),
-        "num_segments": len(result['timeline']),
+        "num_segments": num_segments,
         "elapsed_time": elapsed_time,
+        "audio_duration": audio_duration,
+        "cache_hit": cache_hit,
+        "stage_timings": {stage: round(seconds, 3) for stage, seconds in job["stage_timings"].items()},
+        "performance": performance,
         "result": result
     }
 
 
+def cleanup_media(job: dict):
+    """Geçici ses dosyasını siler (sadece "wav" modunda oluşur)."""
+    audio_path = job.get("audio_path")
+    job["audio"] = None
+
+    if settings.TEMP_FILE_CLEANUP and audio_path is not None and audio_path.exists():
+        audio_path.unlink()
+        logger.debug(f"Geçici dosya silindi: {audio_path}")
+
+
+def process_video(
+    video_path: Path,
+    model_size: str,
+    language: str,
+    output_path: Path = None,
+    export_text: bool = True,
+    questions_path: Path = None,
+    extract_mode: str = None,
+    jsonl_output=None,
+    chunk_workers: int = None,
+    chunk_length: float = None,
+    batch_size: int = None,
+    use_cache: bool = None,
+    device: str = None,
+    compute_type: str = None,
+    cpu_threads: int = None,
+    qa_method: str = None,
+    dataset_export: bool = None,
+    resume: bool = False,
+    content_hash: str = None,
+    profile: bool = False,
+    profile_memory: bool = False,
+    progress_callback=None
+) -> dict:
+    """
+    Video dosyasını işle (ana pipeline).
+
+    Aşamalar sırayla çalışır: prepare_media() -> transcribe_media() ->
+    finalize_result(). Toplu işlemede aynı aşamalar process_batch_pipelined()
+    ile üst üste bindirilir.
+
+    NOT: Konuşmacı ayırma (diarization) devre dışı - sadece transkripsiyon yapılır.
+
+    Args:
+        video_path: Video dosyası yolu
+        model_size: Whisper model boyutu
+        language: Dil kodu (tr, en)
+        output_path: Çıktı JSON dosyası yolu
+        export_text: Text dosyası da oluştur mu?
+        questions_path: Soru dosyası yolu (opsiyonel, QA matching için)
+        extract_mode: Ses çıkarma modu ("memory" veya "wav")
+            Verilmezse settings.AUDIO_EXTRACTION_MODE kullanılır
+        jsonl_output: Segmentlerin anında yazılacağı JSON Lines hedefi (opsiyonel)
+            Dosya yolu, "-" (stdout) veya açık metin akışı
+        chunk_workers: Paralel parça worker sayısı (0/1 = kapalı)
+            Verilmezse settings.CHUNK_WORKERS kullanılır
+        chunk_length: Paralel parça uzunluğu (saniye)
+            Verilmezse settings.CHUNK_LENGTH_SECONDS kullanılır
+        batch_size: Batch modu pencere sayısı (0 = sıralı)
+            Verilmezse settings.WHISPER_BATCH_SIZE kullanılır
+        use_cache: Transcription önbelleği kullanılsın mı?
+            Verilmezse settings.TRANSCRIPTION_CACHE_ENABLED kullanılır
+        device: "cpu", "cuda" veya "auto"
+            Verilmezse WHISPER_DEVICE, o da "auto" ise donanım algılanır
+        compute_type: "int8", "float16", ... veya "auto"
+            Verilmezse WHISPER_COMPUTE_TYPE, o da "auto" ise donanıma göre seçilir
+        cpu_threads: CTranslate2 thread sayısı (0 = otomatik)
+            Verilmezse WHISPER_CPU_THREADS
+        qa_method: QA eşleştirme yöntemi ("equal_time_segmentation" veya
+            "content_alignment"), verilmezse settings.QA_MATCHING_METHOD
+        dataset_export: Timeline Parquet veri setine eklensin mi?
+            Verilmezse settings.TRANSCRIPT_DATASET_EXPORT kullanılır
+        resume: Yarım kalan transcription'a checkpoint'ten devam edilsin mi?
+            (aynı ses ve aynı decode ayarları gerekir, yoksa baştan başlanır)
+        content_hash: Video dosyasının SHA-256 hash'i (opsiyonel)
+            Yükleme sırasında hesaplandıysa önbellek kaynak anahtarı olarak
+            kullanılır (dosya tekrar okunmaz)
+        profile: Örnekleyici profiler ile çalıştır (app.profiler); aşama başına
+            profil dosyaları çıktı JSON'unun yanına yazılır ("profile_paths")
+        profile_memory: Profile tracemalloc ile en çok bellek ayıranları da ekle
+            (ayırma yoğun kodu yavaşlatır)
+        progress_callback: İlerleme bildirimi (opsiyonel, iş kuyruğu / UI için)
+            Aşama başlarken ve her decode edilen segmentte bir dict ile çağrılır:
+                {"stage": "prepare"}
+                {"stage": "transcribe", "processed_seconds": 0.0, "audio_duration": 3600.0,
+                 "num_segments": 0}
+                {"stage": "transcribe", "processed_seconds": 125.3, "audio_duration": 3600.0,
+                 "num_segments": 42, "segment": {...}, "restored": False}
+                {"stage": "finalize"}
+            processed_seconds: Son segmentin bitişi (ilerleme = processed / duration)
+            restored: Segment checkpoint'ten geri yüklendi (--resume), decode edilmedi
+            Callback'ten fırlatılan istisna işlemi durdurur
+
+    Returns:
+        dict: İşlem sonucu
+
+    Raises:
+        Exception: İşlem hatası
+    """
+    # Logging sistemini kur (UI'dan çağrılırsa)
+    if not _logging_configured:
+        setup_logging(verbose=False)
+
+    def notify(stage: str, **fields):
+        if progress_callback is not None:
+            progress_callback({"stage": stage, **fields})
+
+    profiler = None
+    if profile or profile_memory:
+        from app.profiler import SamplingProfiler
+        profiler = SamplingProfiler(memory=profile_memory)
+        profiler.start()
+
+    # ADIM 1: Video Validasyonu ve Ses Çıkarma
+    notify("prepare")
+    try:
+        job = prepare_media(
+            video_path,
+            model_size,
+            language,
+            extract_mode=extract_mode,
+            chunk_workers=chunk_workers,
+            chunk_length=chunk_length,
+            batch_size=batch_size,
+            use_cache=use_cache,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            resume=resume,
+            content_hash=content_hash,
+            profiler=profiler,
+            progress=print_progress
+        )
+    except Exception:
+        record_job_failure()
+        finish_profile(profiler, video_path, output_path)
+        raise
+
+    try:
+        # ADIM 2: Konuşma Tanıma (Speech-to-Text)
+        notify("transcribe", processed_seconds=0.0, audio_duration=job["audio_duration"], num_segments=0)
+        transcription = transcribe_media(
+            job,
+            jsonl_output=jsonl_output,
+            progress=print_progress,
+            progress_callback=progress_callback
+        )
+
+        # ADIM 3-4: Birleştir, kaydet, QA matching
+        notify("finalize")
+        result = finalize_result(
+            job,
+            transcription,
+            output_path=output_path,
+            export_text=export_text,
+            questions_path=questions_path,
+            progress=print_progress,
+            qa_method=qa_method,
+            dataset_export=dataset_export
+        )
+    except ProcessingCancelled:
+        record_job_failure("cancelled")
+        raise
+    except Exception:
+        record_job_failure()
+        raise
+    finally:
+        # Hata durumunda da geçici WAV kalmasın
+        cleanup_media(job)
+        # Hata / iptal durumunda da o ana kadarki profil yazılır
+        profile_paths = finish_profile(profiler, video_path, output_path)
+
+    result["profile_paths"] = profile_paths
+    return result
+
+
+def finish_profile(profiler, video_path: Path, output_path: Path = None) -> List[Path]:
+    """
+    Profiler'ı durdurur ve profil dosyalarını çıktı JSON'unun yanına yazar.
+
+    Args:
+        profiler: SamplingProfiler (None ise hiçbir şey yapılmaz)
+        video_path: Video dosyası yolu (varsayılan çıktı adı için)
+        output_path: Çıktı JSON dosyası yolu
+
+    Returns:
+        List[Path]: Yazılan profil dosyaları
+    """
+    if profiler is None:
+        return []
+
+    profiler.stop()
+    if output_path is None:
+        output_path = settings.OUTPUT_DIR / f"{video_path.stem}_output.json"
+
+    # Profil yazılamaması işin sonucunu bozmaz
+    try:
+        return profiler.write(output_path)
+    except OSError as e:
+        logger.warning(f"Profil yazılamadı: {e}")
+        return []
+
+
 def print_summary(process_result: dict):
     """
     İşlem özetini ekrana yazdır.
@@ -294,6 +901,21 @@ def print_summary(process_result: dict):
     print(f"  • Konuşmacı sayısı: {process_result['num_speakers']}")
     print(f"  • Segment sayısı: {process_result['num_segments']}")
     print(f"  • İşlem süresi: {format_duration(process_result['elapsed_time'])}")
+    runtime = result['metadata'].get('runtime')
+    if runtime:
+        print(f"  • Çalışma ayarları: {runtime['device']}, {runtime['compute_type']}, {runtime['cpu_threads']} thread")
+    if process_result.get('cache_hit'):
+        print(f"  • Transcription: önbellekten (Whisper çalıştırılmadı)")
+
+    # Aşama süreleri (en uzundan kısaya)
+    performance = process_result.get('performance')
+    if performance:
+        print(f"\nASAMA SURELERI")
+        stages = sorted(performance['stages'].items(), key=lambda item: item[1]['wall_seconds'], reverse=True)
+        for stage, values in stages:
+            print(f"  • {stage:<15} {values['wall_seconds']:>9.2f}s  (CPU {values['cpu_seconds']:.2f}s)")
+        if performance.get('rtf') is not None:
+            print(f"  • RTF: {performance['rtf']:.3f}")
 
     # Konuşmacı istatistikleri
     print(f"\nKONUSMACI ISTATISTIKLERI")
@@ -322,12 +944,677 @@ def print_summary(process_result: dict):
         print(f"  • QA JSON: {process_result['qa_json_path']}")
     if process_result.get('qa_md_path'):
         print(f"  • QA Markdown: {process_result['qa_md_path']}")
+    if process_result.get('dataset_path'):
+        print(f"  • Veri seti: {process_result['dataset_path']}")
+    for profile_path in process_result.get('profile_paths') or []:
+        print(f"  • Profil: {profile_path}")
 
     print("\n" + "="*70)
 
 
+def expand_inputs(patterns: List[str], manifest_path: str = None) -> Tuple[List[Path], List[str]]:
+    """
+    CLI girdilerini video dosyası listesine çevirir.
+
+    Desteklenen girdiler:
+        - Dosya yolu: video.mp4
+        - Glob deseni: "videos/*.mp4", "arsiv/**/*.mkv" (kabuk genişletmese de çalışır)
+        - Klasör: İçindeki desteklenen formatlardaki dosyalar
+        - Manifest: @liste.txt veya --manifest liste.txt
+          (her satırda bir yol veya desen, # ile başlayan satırlar yorum)
+
+    Args:
+        patterns: Pozisyonel CLI girdileri
+        manifest_path: --manifest dosyası (opsiyonel)
+
+    Returns:
+        Tuple[List[Path], List[str]]: (bulunan dosyalar, eşleşmeyen girdiler)
+            Aynı dosya birden çok kez verilirse bir kez işlenir
+    """
+    entries = []
+    sources = list(patterns) + ([f"@{manifest_path}"] if manifest_path else [])
+
+    # Manifest içeriği verildiği sıraya yerleştirilir (girdi sırası korunur)
+    for source in sources:
+        if not source.startswith("@"):
+            entries.append(source)
+            continue
+
+        with open(source[1:], "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    entries.append(line)
+
+    supported = set(settings.SUPPORTED_VIDEO_FORMATS + settings.SUPPORTED_AUDIO_FORMATS)
+    video_paths = []
+    missing = []
+    seen = set()
+
+    for entry in entries:
+        if glob.has_magic(entry):
+            matches = [Path(match) for match in sorted(glob.glob(entry, recursive=True))]
+            matches = [match for match in matches if match.is_file()]
+        elif Path(entry).is_dir():
+            matches = sorted(
+                child for child in Path(entry).iterdir()
+                if child.is_file() and child.suffix.lower() in supported
+            )
+        elif Path(entry).is_file():
+            matches = [Path(entry)]
+        else:
+            matches = []
+
+        if not matches:
+            missing.append(entry)
+            continue
+
+        for match in matches:
+            key = match.resolve()
+            if key not in seen:
+                seen.add(key)
+                video_paths.append(match)
+
+    return video_paths, missing
+
+
+def get_batch_output_path(video_path: Path, output_dir: Path, used_names: set) -> Path:
+    """
+    Toplu işlemede dosya başına çıktı yolunu belirler.
+
+    Farklı klasörlerde aynı isimli videolar varsa (ör. a/intro.mp4, b/intro.mp4)
+    çıktılar birbirinin üzerine yazılmasın diye sona sayaç eklenir.
+
+    Args:
+        video_path: Video dosyası yolu
+        output_dir: Çıktı klasörü
+        used_names: Bu batch'te kullanılan isimler (güncellenir)
+
+    Returns:
+        Path: outputs/<video>_output.json formatında yol
+    """
+    name = f"{video_path.stem}_output"
+    counter = 2
+    while name in used_names:
+        name = f"{video_path.stem}_{counter}_output"
+        counter += 1
+    used_names.add(name)
+
+    return output_dir / f"{name}.json"
+
+
+def _batch_success_entry(video_path: Path, result: dict) -> dict:
+    """process_video() sonucunu batch özet satırına çevirir."""
+    audio_duration = result["audio_duration"]
+    return {
+        "video_path": video_path,
+        "success": True,
+        "error": None,
+        "elapsed_time": result["elapsed_time"],
+        "audio_duration": audio_duration,
+        "rtf": result["elapsed_time"] / audio_duration if audio_duration else None,
+        "num_segments": result["num_segments"],
+        "json_path": result["json_path"],
+        "cache_hit": result["cache_hit"]
+    }
+
+
+def _batch_failure_entry(video_path: Path, error: Exception, elapsed_time: float) -> dict:
+    """Hatalı dosya için batch özet satırı oluşturur (hata loglanır)."""
+    logger.error(f"İşlenemedi: {video_path} - {error}")
+    logger.opt(exception=error).debug("Hata detayı")
+    return {
+        "video_path": video_path,
+        "success": False,
+        "error": str(error) or type(error).__name__,
+        "elapsed_time": elapsed_time,
+        "audio_duration": None,
+        "rtf": None,
+        "num_segments": 0,
+        "json_path": None,
+        "cache_hit": False
+    }
+
+
+def process_batch(
+    video_paths: List[Path],
+    output_dir: Path = None,
+    jsonl_output=None,
+    prefetch: int = None,
+    **process_kwargs
+) -> List[dict]:
+    """
+    Birden çok videoyu aynı süreçte işler.
+
+    Model registry sayesinde model yalnızca ilk dosyada yüklenir; sonraki
+    dosyalar Python başlangıcı, import ve model yükleme maliyetini ödemez.
+    Bir dosyadaki hata batch'i durdurmaz, sonuç listesine kaydedilir.
+
+    Args:
+        video_paths: İşlenecek dosyalar
+        output_dir: Çıktı klasörü (default: settings.OUTPUT_DIR)
+        jsonl_output: JSON Lines hedefi (opsiyonel)
+            "-" veya açık akış: tüm dosyalar aynı akışa (metadata satırıyla ayrılır)
+            Klasör yolu: dosya başına <klasör>/<video>.jsonl
+        prefetch: Transcription sürerken önceden hazırlanacak dosya sayısı
+            0: Kapalı (dosyalar tamamen sırayla işlenir)
+            Verilmezse settings.PREFETCH_FILES kullanılır
+        **process_kwargs: process_video() parametreleri (model_size, language, ...)
+
+    Returns:
+        List[dict]: Dosya başına sonuç (girdi sırasıyla)
+            {"video_path", "success", "error", "elapsed_time", "audio_duration",
+             "rtf", "num_segments", "json_path", "cache_hit"}
+    """
+    output_dir = Path(output_dir) if output_dir else settings.OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    jsonl_dir = None
+    if isinstance(jsonl_output, (str, Path)) and str(jsonl_output) != "-":
+        jsonl_dir = Path(jsonl_output)
+        jsonl_dir.mkdir(parents=True, exist_ok=True)
+
+    # Dosya başına (video, çıktı yolu, JSON Lines hedefi)
+    used_names = set()
+    items = []
+    for video_path in video_paths:
+        output_path = get_batch_output_path(video_path, output_dir, used_names)
+        file_jsonl = jsonl_dir / f"{output_path.stem}.jsonl" if jsonl_dir else jsonl_output
+        items.append((video_path, output_path, file_jsonl))
+
+    prefetch = settings.PREFETCH_FILES if prefetch is None else prefetch
+    if process_kwargs.get("profile") or process_kwargs.get("profile_memory"):
+        # Profil dosya başınadır: üst üste binen dosyaların örnekleri karışmasın
+        if prefetch > 0 and len(items) > 1:
+            logger.info("Profil açık: toplu işleme hat (prefetch) modu olmadan, sırayla çalışır")
+    elif prefetch > 0 and len(items) > 1:
+        # Profil seçenekleri sadece process_video()'ya aittir (prepare_media() almaz)
+        pipeline_kwargs = {
+            key: value for key, value in process_kwargs.items() if key not in ("profile", "profile_memory")
+        }
+        return process_batch_pipelined(items, prefetch=prefetch, **pipeline_kwargs)
+
+    batch_results = []
+
+    for index, (video_path, output_path, file_jsonl) in enumerate(items, 1):
+        print(f"\n[{index}/{len(items)}] {video_path}")
+        file_start = time.time()
+
+        try:
+            result = process_video(
+                video_path=video_path,
+                output_path=output_path,
+                jsonl_output=file_jsonl,
+                **process_kwargs
+            )
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            # Hata bu dosyayla sınırlı kalır, batch devam eder
+            batch_results.append(_batch_failure_entry(video_path, e, time.time() - file_start))
+            continue
+
+        batch_results.append(_batch_success_entry(video_path, result))
+
+    return batch_results
+
+
+def _prepare_timed(video_path: Path, prepare_kwargs: dict) -> Tuple[dict, Exception, float]:
+    """
+    prepare_media()'yı prefetch thread'inde çalıştırır.
+
+    Returns:
+        Tuple[dict, Exception, float]: (job, hata, süre) - hata yoksa None
+    """
+    start = time.time()
+    try:
+        return prepare_media(video_path, **prepare_kwargs), None, time.time() - start
+    except Exception as e:
+        return None, e, time.time() - start
+
+
+def process_batch_pipelined(
+    items: List[Tuple[Path, Path, object]],
+    prefetch: int,
+    extract_workers: int = None,
+    export_text: bool = True,
+    questions_path: Path = None,
+    qa_method: str = None,
+    dataset_export: bool = None,
+    **prepare_kwargs
+) -> List[dict]:
+    """
+    Toplu işlemeyi üretici/tüketici (producer/consumer) hattı olarak çalıştırır.
+
+    Aşamalar üst üste biner:
+        prefetch thread'leri -> [sınırlı kuyruk] -> transcription (bu thread)
+            -> [kuyruk] -> writer thread'i
+
+    - Ses çıkarma (ffmpeg alt süreci, CPU'yu az kullanır) sonraki dosyalar
+      için transcription ile aynı anda yapılır
+    - Birleştirme/kaydetme/QA writer thread'inde yapılır, transcription
+      beklemeden sonraki dosyaya geçer
+    - En fazla prefetch + 1 dosyanın sesi aynı anda bellekte tutulur
+      (1 saatlik kayıt float32 ~230 MB)
+
+    Toplam süre transcription süreleri toplamına yaklaşır.
+
+    Args:
+        items: process_batch()'in hazırladığı (video, çıktı yolu, JSON Lines hedefi) listesi
+        prefetch: Önceden hazırlanacak dosya sayısı (>= 1)
+        extract_workers: Paralel ses çıkarma thread sayısı
+            Verilmezse settings.PREFETCH_WORKERS kullanılır
+        export_text, questions_path, qa_method, dataset_export: finalize_result() parametreleri
+        **prepare_kwargs: prepare_media() parametreleri
+
+    Returns:
+        List[dict]: Dosya başına sonuç (girdi sırasıyla)
+    """
+    extract_workers = extract_workers or settings.PREFETCH_WORKERS
+    logger.info(
+        f"Hat (pipeline) modu: {len(items)} dosya, "
+        f"{prefetch} dosya önceden hazırlanır, {extract_workers} ses çıkarma thread'i"
+    )
+
+    results = [None] * len(items)
+
+    # Transcription'ı bekleyen + işlenen dosya sayısını sınırlar (bellek bütçesi)
+    slots = threading.Semaphore(prefetch + 1)
+    stop_event = threading.Event()
+    prepared_queue = queue.Queue()
+    write_queue = queue.Queue(maxsize=prefetch + 1)
+    executor = ThreadPoolExecutor(max_workers=extract_workers, thread_name_prefix="prefetch")
+
+    def producer():
+        # Dosyalar girdi sırasıyla gönderilir, tüketici de aynı sırayla alır
+        for index, (video_path, _, _) in enumerate(items):
+            while not slots.acquire(timeout=0.5):
+                if stop_event.is_set():
+                    return
+            if stop_event.is_set():
+                slots.release()
+                return
+            prepared_queue.put((index, executor.submit(_prepare_timed, video_path, prepare_kwargs)))
+        prepared_queue.put(None)
+
+    def writer():
+        while True:
+            entry = write_queue.get()
+            if entry is None:
+                return
+
+            index, job, transcription = entry
+            video_path, output_path, _ = items[index]
+            try:
+                result = finalize_result(
+                    job,
+                    transcription,
+                    output_path=output_path,
+                    export_text=export_text,
+                    questions_path=questions_path,
+                    qa_method=qa_method,
+                    dataset_export=dataset_export
+                )
+                results[index] = _batch_success_entry(video_path, result)
+                logger.success(f"Kaydedildi: {result['json_path']}")
+            except Exception as e:
+                cleanup_media(job)
+                record_job_failure()
+                results[index] = _batch_failure_entry(video_path, e, sum(job["stage_timings"].values()))
+
+    producer_thread = threading.Thread(target=producer, name="prefetch-producer", daemon=True)
+    writer_thread = threading.Thread(target=writer, name="result-writer", daemon=True)
+    producer_thread.start()
+    writer_thread.start()
+
+    try:
+        while True:
+            entry = prepared_queue.get()
+            if entry is None:
+                break
+
+            index, future = entry
+            video_path, _, file_jsonl = items[index]
+            print(f"\n[{index + 1}/{len(items)}] {video_path}")
+
+            job, error, prepare_time = future.result()
+            if error is not None:
+                slots.release()
+                record_job_failure()
+                results[index] = _batch_failure_entry(video_path, error, prepare_time)
+                continue
+
+            try:
+                transcription = transcribe_media(job, jsonl_output=file_jsonl)
+            except Exception as e:
+                cleanup_media(job)
+                record_job_failure()
+                results[index] = _batch_failure_entry(video_path, e, prepare_time)
+                continue
+            finally:
+                # Ses bellekten çıktı: bir sonraki dosya hazırlanabilir
+                slots.release()
+
+            write_queue.put((index, job, transcription))
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+        # Kesinti durumunda: hazırlanmış ama işlenmemiş dosyaların geçici WAV'larını sil
+        while True:
+            try:
+                entry = prepared_queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None or entry[1].cancelled():
+                continue
+            job, _, _ = entry[1].result()
+            if job is not None:
+                cleanup_media(job)
+
+        write_queue.put(None)
+        writer_thread.join()
+
+    return results
+
+
+def print_batch_summary(batch_results: List[dict], missing: List[str] = None, total_time: float = None):
+    """
+    Toplu işleme özet tablosunu yazdırır.
+
+    Args:
+        batch_results: process_batch() sonucu
+        missing: Hiçbir dosyayla eşleşmeyen girdiler
+        total_time: Batch'in toplam duvar saati süresi (saniye)
+    """
+    missing = missing or []
+
+    print("\n" + "="*90)
+    print("TOPLU ISLEM OZETI")
+    print("="*90)
+    print(f"{'Dosya':<40} {'Durum':<8} {'Ses':>8} {'Süre':>8} {'RTF':>7} {'Segment':>8}")
+    print("-"*90)
+
+    for item in batch_results:
+        name = str(item["video_path"])
+        if len(name) > 40:
+            name = "..." + name[-37:]
+
+        if item["success"]:
+            status = "CACHE" if item["cache_hit"] else "OK"
+            rtf = f"{item['rtf']:.3f}" if item["rtf"] is not None else "-"
+            print(
+                f"{name:<40} {status:<8} {format_duration(item['audio_duration']):>8} "
+                f"{format_duration(item['elapsed_time']):>8} {rtf:>7} {item['num_segments']:>8}"
+            )
+        else:
+            print(f"{name:<40} {'HATA':<8} {'-':>8} {format_duration(item['elapsed_time']):>8} {'-':>7} {'-':>8}")
+
+    succeeded = [item for item in batch_results if item["success"]]
+    failed = [item for item in batch_results if not item["success"]]
+
+    total_audio = sum(item["audio_duration"] for item in succeeded if item["audio_duration"])
+    print("-"*90)
+    print(f"Başarılı: {len(succeeded)}  Hatalı: {len(failed) + len(missing)}  Toplam ses: {format_duration(total_audio)}")
+    if total_time is not None:
+        overall_rtf = f" (RTF {total_time / total_audio:.3f})" if total_audio else ""
+        print(f"Toplam işlem süresi: {format_duration(total_time)}{overall_rtf}")
+
+    if failed or missing:
+        print("\nBASARISIZ GIRDILER")
+        for item in failed:
+            # Çok satırlı hatalarda (ör. ffmpeg çıktısı) ilk satır yeterli
+            print(f"  • {item['video_path']}: {item['error'].splitlines()[0]}")
+        for entry in missing:
+            print(f"  • {entry}: dosya bulunamadı")
+
+    print("="*90)
+
+
+def dataset_main(argv: List[str]) -> int:
+    """
+    "dataset" alt komutu: Parquet transcript veri setini doldur / sorgula.
+
+    Args:
+        argv: "dataset" sonrasındaki argümanlar
+
+    Returns:
+        int: Çıkış kodu
+    """
+    parser = argparse.ArgumentParser(
+        prog="v_to_t.py dataset",
+        description="Parquet transcript veri seti (toplu analiz)"
+    )
+    parser.add_argument(
+        '--dataset-dir',
+        default=None,
+        help='Veri seti klasörü (default: TRANSCRIPT_DATASET_DIR = outputs/dataset)'
+    )
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    export_parser = subparsers.add_parser('export', help='Çıktı JSON dosyalarını veri setine ekle')
+    export_parser.add_argument(
+        'json_files',
+        nargs='*',
+        help='Çıktı JSON dosyaları veya glob desenleri (default: outputs/*_output.json)'
+    )
+
+    query_parser = subparsers.add_parser('query', help='Veri setini sorgula')
+    query_parser.add_argument('--video', action='append', help='Video adı (tekrarlanabilir)')
+    query_parser.add_argument('--speaker', action='append', help='Konuşmacı (tekrarlanabilir)')
+    query_parser.add_argument('--min-confidence', type=float, default=None, help='En düşük güven skoru')
+    query_parser.add_argument('--max-confidence', type=float, default=None, help='En yüksek güven skoru')
+    query_parser.add_argument('--since', default=None, metavar='YYYY-MM-DD', help='Bu günden itibaren işlenenler')
+    query_parser.add_argument('--until', default=None, metavar='YYYY-MM-DD', help='Bu güne kadar işlenenler')
+    query_parser.add_argument('--columns', default=None, help='Virgülle ayrılmış sütunlar (default: hepsi)')
+    query_parser.add_argument('--summary', action='store_true', help='Video/konuşmacı başına konuşma oranı ve kelime/dk')
+    query_parser.add_argument('--csv', default=None, metavar='PATH', help='Sonucu CSV olarak kaydet')
+    query_parser.add_argument('--limit', type=int, default=20, help='Ekrana yazılacak satır sayısı (default: 20)')
+
+    args = parser.parse_args(argv)
+    setup_logging()
+
+    try:
+        from app import transcript_dataset
+        transcript_dataset._require_pyarrow()
+    except ImportError as e:
+        print(f"[HATA] {e}")
+        return 1
+
+    if args.action == "export":
+        patterns = args.json_files or [str(settings.OUTPUT_DIR / "*_output.json")]
+        json_paths = []
+        for pattern in patterns:
+            if glob.has_magic(pattern):
+                json_paths.extend(sorted(glob.glob(pattern, recursive=True)))
+            else:
+                json_paths.append(pattern)
+
+        summary = transcript_dataset.export_json_files(json_paths, args.dataset_dir)
+        print(f"\n{summary['exported']} dosya, {summary['rows']} segment veri setine eklendi: "
+              f"{transcript_dataset.get_dataset_dir(args.dataset_dir)}")
+        for path, error in summary["failed"]:
+            print(f"  [HATA] {path}: {error}")
+        return 1 if summary["failed"] else 0
+
+    # Filtreler okumadan önce uygulanır (eşleşmeyen dosyalar okunmaz)
+    filters = []
+    if args.video:
+        filters.append(("video", "in", args.video))
+    if args.speaker:
+        filters.append(("speaker", "in", args.speaker))
+    if args.min_confidence is not None:
+        filters.append(("confidence", ">=", args.min_confidence))
+    if args.max_confidence is not None:
+        filters.append(("confidence", "<=", args.max_confidence))
+    if args.since:
+        filters.append((transcript_dataset.PARTITION_COLUMN, ">=", args.since))
+    if args.until:
+        filters.append((transcript_dataset.PARTITION_COLUMN, "<=", args.until))
+
+    if args.summary:
+        columns = ["video", "speaker", "start", "end", "text", "confidence"]
+    elif args.columns:
+        columns = [column.strip() for column in args.columns.split(",") if column.strip()]
+    else:
+        columns = None
+
+    df = transcript_dataset.read_dataset(args.dataset_dir, columns=columns, filters=filters or None)
+    if args.summary:
+        df = transcript_dataset.summarize_speakers(df)
+
+    if args.csv:
+        df.to_csv(args.csv, index=False)
+        print(f"{len(df)} satır kaydedildi: {args.csv}")
+
+    print(df.head(args.limit).to_string(index=False) if len(df) else "Sonuç yok")
+    if len(df) > args.limit:
+        print(f"... toplam {len(df)} satır")
+    return 0
+
+
+def search_main(argv: List[str]) -> int:
+    """
+    "search" alt komutu: İşlenmiş tüm transkriptlerde tam metin arama.
+
+    Args:
+        argv: "search" sonrasındaki argümanlar
+
+    Returns:
+        int: Çıkış kodu
+    """
+    parser = argparse.ArgumentParser(
+        prog="v_to_t.py search",
+        description="İşlenmiş transkriptlerde arama (SQLite FTS5, Türkçe karakter duyarsız)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Örnekler:
+  %(prog)s takım çalışması            (iki kelime de geçen segmentler, önek: çalışmasına da bulunur)
+  %(prog)s '"takım çalışması"'        (yan yana ifade)
+  %(prog)s maaş --speaker SPEAKER_01
+  %(prog)s --index                    (outputs/*_output.json dosyalarını artımlı indeksle)
+"""
+    )
+    parser.add_argument('query', nargs='*', help='Aranacak kelimeler')
+    parser.add_argument('--video', default=None, help='Sadece bu videoda ara (video adı)')
+    parser.add_argument('--speaker', default=None, help='Sadece bu konuşmacıda ara')
+    parser.add_argument('--limit', type=int, default=20, help='Maksimum sonuç (default: 20)')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON olarak yaz')
+    parser.add_argument(
+        '--index',
+        nargs='*',
+        default=None,
+        metavar='PATTERN',
+        help='Önce çıktı dosyalarını indeksle (default: outputs/*_output.json); değişmeyenler atlanır'
+    )
+    parser.add_argument('--force', action='store_true', help='--index: Değişmemiş dosyaları da yeniden indeksle')
+    parser.add_argument('--db', default=None, help='İndeks dosyası (default: SEARCH_INDEX_PATH)')
+
+    args = parser.parse_args(argv)
+    setup_logging()
+
+    from app.search_index import SearchIndex
+    index = SearchIndex(args.db)
+
+    if args.index is not None:
+        patterns = args.index or [str(settings.OUTPUT_DIR / "*_output.json")]
+        json_paths = []
+        for pattern in patterns:
+            if glob.has_magic(pattern):
+                json_paths.extend(sorted(glob.glob(pattern, recursive=True)))
+            else:
+                json_paths.append(pattern)
+
+        summary = index.index_files(json_paths, force=args.force)
+        stats = index.get_stats()
+        print(f"İndekslendi: {summary['indexed']} dosya ({summary['segments']} segment), "
+              f"değişmeyen: {summary['skipped']}, kaldırılan: {summary['removed']}")
+        print(f"İndeks: {stats['documents']} dosya, {stats['segments']} segment, {stats['size_mb']} MB")
+        for path, error in summary["failed"]:
+            print(f"  [HATA] {path}: {error}")
+
+        if not args.query:
+            return 1 if summary["failed"] else 0
+
+    if not args.query:
+        parser.error("aranacak kelime veya --index gerekli")
+
+    query = " ".join(args.query)
+    search_start = time.perf_counter()
+    hits = index.search(query, limit=args.limit, video=args.video, speaker=args.speaker)
+    search_ms = (time.perf_counter() - search_start) * 1000
+
+    if args.json:
+        print(json.dumps(hits, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"\n\"{query}\": {len(hits)} sonuç ({search_ms:.1f} ms)\n")
+    for hit in hits:
+        print(f"  {hit['video']}  [{format_timestamp(hit['start'])} - {format_timestamp(hit['end'])}]  {hit['speaker']}")
+        print(f"    {hit['snippet']}")
+    return 0
+
+
+def serve_main(argv: List[str]) -> int:
+    """
+    "serve" alt komutu: Yerel iş kuyruğu sunucusu (HTTP API + worker havuzu).
+
+    Args:
+        argv: "serve" sonrasındaki argümanlar
+
+    Returns:
+        int: Çıkış kodu
+    """
+    parser = argparse.ArgumentParser(
+        prog="v_to_t.py serve",
+        description="İş kuyruğu sunucusu: videolar HTTP ile gönderilir, modeli sıcak tutan worker'lar işler",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Örnekler:
+  %(prog)s                              (JOB_SERVER_HOST:JOB_SERVER_PORT, JOB_WORKERS worker)
+  %(prog)s --workers 2 --model medium
+  curl -X POST --data-binary @video.mp4 "http://127.0.0.1:8765/jobs?filename=video.mp4"
+  curl http://127.0.0.1:8765/jobs/<id>
+
+Web UI'ı sunucuya bağlamak için: JOB_SERVER_URL=http://127.0.0.1:8765
+"""
+    )
+    parser.add_argument('--host', default=settings.JOB_SERVER_HOST, help='Dinlenecek adres (default: JOB_SERVER_HOST)')
+    parser.add_argument('--port', type=int, default=settings.JOB_SERVER_PORT, help='Port (default: JOB_SERVER_PORT)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker süreç sayısı (default: JOB_WORKERS)')
+    parser.add_argument('--model', default=None, help='Worker\'ların önceden yükleyeceği model (default: WHISPER_MODEL)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='HTTP isteklerini de logla')
+
+    args = parser.parse_args(argv)
+    setup_logging(verbose=args.verbose)
+
+    from app.job_server import JobServer
+
+    try:
+        server = JobServer((args.host, args.port), num_workers=args.workers, model_size=args.model)
+    except OSError as e:
+        logger.error(f"Sunucu başlatılamadı ({args.host}:{args.port}): {e}")
+        return 1
+
+    server.run()
+    return 0
+
+
+# Alt komutlar: python v_to_t.py <komut> ...
+# (aynı adlı bir video için ./dataset gibi yol yazılabilir)
+SUBCOMMANDS = {
+    "dataset": dataset_main,
+    "search": search_main,
+    "serve": serve_main,
+}
+
+
 def main():
     """Ana CLI fonksiyonu."""
+    # Alt komutlar (dataset, search, serve)
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        sys.exit(SUBCOMMANDS[sys.argv[1]](sys.argv[2:]))
+
     # Argument parser
     parser = argparse.ArgumentParser(
         description='Video-to-Text Dönüştürücü - Video dosyalarından konuşmaları metne çevirir',
@@ -339,6 +1626,32 @@ def main():
   %(prog)s video.mp4 --num-speakers 2 --output sonuc.json
   %(prog)s video.mp4 --questions questions.txt
   %(prog)s video.mp4 --model large --questions questions.txt --verbose
+  %(prog)s video.mp4 --jsonl -          (segmentler anında stdout'a, NDJSON)
+  %(prog)s video.mp4 --no-cache         (önbelleği atla, tekrar çöz)
+  %(prog)s video.mp4 --resume           (yarıda kalan işe kaldığı yerden devam et)
+  %(prog)s video.mp4 --dataset          (timeline'ı Parquet veri setine de ekle)
+  %(prog)s video.mp4 --profile          (aşama başına flamegraph: *_profile_<aşama>.speedscope.json)
+
+Veri Seti (Parquet, pyarrow gerekli):
+  %(prog)s dataset export               (outputs/*_output.json -> veri seti)
+  %(prog)s dataset query --speaker SPEAKER_00 --min-confidence 0.8
+  %(prog)s dataset query --summary      (video/konuşmacı başına oran, kelime/dk)
+
+Arama (işlenmiş tüm transkriptler):
+  %(prog)s search takım çalışması       (video, zaman, konuşmacı, alıntı)
+  %(prog)s search --index               (mevcut çıktıları indeksle)
+
+İş Kuyruğu Sunucusu (HTTP API, modeli sıcak tutan worker'lar):
+  %(prog)s serve --workers 2            (Web UI: JOB_SERVER_URL=http://127.0.0.1:8765)
+
+Toplu İşleme (model bir kez yüklenir):
+  %(prog)s a.mp4 b.mp4 c.mkv
+  %(prog)s "videos/*.mp4" --output-dir sonuclar/
+  %(prog)s @liste.txt                   (veya --manifest liste.txt)
+  Bir dosyadaki hata diğerlerini durdurmaz; sonda dosya başına RTF tablosu
+  yazılır, hatalı girdi varsa çıkış kodu 1 olur.
+  Bir dosya çözülürken sonrakilerin sesi önceden çıkarılır (--prefetch N,
+  0 = kapalı), sonuçlar ayrı bir thread'de kaydedilir.
 
 Desteklenen formatlar:
   Video: .mp4, .avi, .mov, .mkv, .webm
@@ -353,16 +1666,28 @@ Model boyutları (faster-whisper):
 
 QA Matching (Soru-Cevap Eşleştirme):
   questions.txt formatı: Her satırda bir soru
-  Eşleştirme metodu: Eşit zaman segmentasyonu (video_duration / num_questions)
+  Eşleştirme metodu (--qa-method):
+    equal_time_segmentation - Eşit zaman segmentasyonu (video_duration / num_questions)
+    content_alignment       - Sorular konuşmada aranır, cevaplar soru anlarından başlar
   Çıktılar: {video_name}_qa.json ve {video_name}_qa.md
         """
     )
 
     # Pozisyonel argüman
     parser.add_argument(
-        'video',
+        'videos',
         type=str,
-        help='Video dosyası yolu'
+        nargs='*',
+        metavar='video',
+        help='Video dosyası yolu (birden çok dosya, glob deseni, klasör veya @manifest verilebilir)'
+    )
+
+    parser.add_argument(
+        '--manifest',
+        type=str,
+        default=None,
+        metavar='FILE',
+        help='İşlenecek dosyaların listesi (her satırda bir yol veya glob deseni)'
     )
 
     # Opsiyonel argümanlar
@@ -387,6 +1712,14 @@ QA Matching (Soru-Cevap Eşleştirme):
         help='Çıktı JSON dosyası yolu (default: outputs/<video>_output.json)'
     )
 
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help='Toplu işlemede çıktı klasörü (default: outputs/)'
+    )
+
     parser.add_argument(
         '--no-text',
         action='store_true',
@@ -400,6 +1733,108 @@ QA Matching (Soru-Cevap Eşleştirme):
         help='Soru dosyası yolu (opsiyonel, .txt formatında her satırda bir soru)'
     )
 
+    parser.add_argument(
+        '--qa-method',
+        type=str,
+        default=None,
+        choices=['equal_time_segmentation', 'content_alignment'],
+        help='Soru-cevap eşleştirme yöntemi (default: QA_MATCHING_METHOD, equal_time_segmentation)'
+    )
+
+    parser.add_argument(
+        '--jsonl',
+        type=str,
+        default=None,
+        metavar='PATH',
+        help='Segmentleri decode edildikçe JSON Lines olarak yaz ("-" = stdout; diğer tüm çıktılar stderr\'e gider)'
+    )
+
+    parser.add_argument(
+        '--parallel-chunks',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Uzun kayıtları sessizlik noktalarından bölüp N süreçte paralel çöz (default: CHUNK_WORKERS, 0 = kapalı)'
+    )
+
+    parser.add_argument(
+        '--chunk-length',
+        type=float,
+        default=None,
+        metavar='SEC',
+        help='Paralel parça uzunluğu, saniye (default: CHUNK_LENGTH_SECONDS = 600)'
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Batch modu: N pencereyi tek seferde çöz (default: WHISPER_BATCH_SIZE, 0 = sıralı)'
+    )
+
+    parser.add_argument(
+        '--device',
+        type=str,
+        default=None,
+        choices=['auto', 'cpu', 'cuda'],
+        help='Çalışma cihazı (default: WHISPER_DEVICE = auto, GPU varsa cuda)'
+    )
+
+    parser.add_argument(
+        '--compute-type',
+        type=str,
+        default=None,
+        choices=['auto', 'int8', 'int8_float32', 'int8_float16', 'float16', 'float32'],
+        help='Compute type (default: WHISPER_COMPUTE_TYPE = auto, CPU\'da int8, GPU\'da float16)'
+    )
+
+    parser.add_argument(
+        '--cpu-threads',
+        type=int,
+        default=None,
+        metavar='N',
+        help='CTranslate2 thread sayısı (default: WHISPER_CPU_THREADS = 0, fiziksel çekirdek sayısı)'
+    )
+
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Toplu işlemede transcription sürerken sonraki N dosyanın sesini önceden çıkar (default: PREFETCH_FILES = 2, 0 = kapalı)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Transcription önbelleğini kullanma (her zaman tam decode)'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Yarıda kalan (çöken / iptal edilen) transcription\'a kaldığı yerden devam et (aynı video ve ayarlar)'
+    )
+
+    parser.add_argument(
+        '--dataset',
+        action='store_true',
+        help='Timeline\'ı Parquet veri setine de ekle (default: TRANSCRIPT_DATASET_EXPORT, pyarrow gerekli)'
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Örnekleyici profiler ile çalıştır: aşama başına speedscope / collapsed-stack dosyası çıktının yanına yazılır'
+    )
+
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='--profile + tracemalloc: aşama başına en çok bellek ayıran satırlar (daha yavaş)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -415,31 +1850,98 @@ QA Matching (Soru-Cevap Eşleştirme):
     # Argümanları parse et
     args = parser.parse_args()
 
+    # --jsonl -: stdout sadece JSON Lines içermeli
+    # Banner, ilerleme çubuğu ve özet stderr'e yönlendirilir
+    jsonl_output = args.jsonl
+    if jsonl_output == "-":
+        jsonl_output = sys.stdout
+        sys.stdout = sys.stderr
+
     # Logging kur
     setup_logging(verbose=args.verbose)
 
     # Banner göster
     print_banner()
 
+    # Girdileri genişlet (glob, klasör, manifest)
+    if not args.videos and not args.manifest:
+        parser.error("en az bir video dosyası veya --manifest gerekli")
+
+    try:
+        video_paths, missing = expand_inputs(args.videos, args.manifest)
+    except OSError as e:
+        logger.error(f"Manifest dosyası okunamadı: {e}")
+        print(f"[HATA] Manifest dosyasi okunamadi: {e}")
+        sys.exit(1)
+
+    process_kwargs = {
+        "model_size": args.model,
+        "language": args.language,
+        "export_text": not args.no_text,
+        "questions_path": Path(args.questions) if args.questions else None,
+        "qa_method": args.qa_method,
+        "chunk_workers": args.parallel_chunks,
+        "chunk_length": args.chunk_length,
+        "batch_size": args.batch_size,
+        "use_cache": False if args.no_cache else None,
+        "dataset_export": True if args.dataset else None,
+        "resume": args.resume,
+        "device": args.device,
+        "compute_type": args.compute_type,
+        "cpu_threads": args.cpu_threads,
+        "profile": args.profile,
+        "profile_memory": args.profile_memory
+    }
+
+    # Birden çok girdi: toplu işleme (hatalar dosya bazında kalır)
+    if len(video_paths) + len(missing) > 1 or args.manifest:
+        if args.output:
+            parser.error("--output tek dosya içindir, toplu işlemede --output-dir kullanın")
+
+        batch_start = time.time()
+        try:
+            batch_results = process_batch(
+                video_paths,
+                output_dir=Path(args.output_dir) if args.output_dir else None,
+                jsonl_output=jsonl_output,
+                prefetch=args.prefetch,
+                **process_kwargs
+            )
+        except KeyboardInterrupt:
+            logger.warning("Toplu işlem kullanıcı tarafından iptal edildi")
+            print(f"\n\n[UYARI] Islem iptal edildi")
+            sys.exit(130)
+
+        print_batch_summary(batch_results, missing, total_time=time.time() - batch_start)
+
+        failed = [str(item["video_path"]) for item in batch_results if not item["success"]] + missing
+        if failed:
+            logger.error(f"{len(failed)} girdi işlenemedi: {', '.join(failed)}")
+            sys.exit(1)
+
+        logger.success(f"Toplu işlem tamamlandı: {len(batch_results)} dosya")
+        sys.exit(0)
+
     # Video yolu kontrolü
-    video_path = Path(args.video)
-    if not video_path.exists():
-        logger.error(f"Video dosyası bulunamadı: {video_path}")
-        print(f"[HATA] Video dosyasi bulunamadi: {video_path}")
+    if missing:
+        logger.error(f"Video dosyası bulunamadı: {missing[0]}")
+        print(f"[HATA] Video dosyasi bulunamadi: {missing[0]}")
         sys.exit(1)
 
+    video_path = video_paths[0]
+
     # Output yolu
     output_path = Path(args.output) if args.output else None
+    if output_path is None and args.output_dir:
+        output_path = Path(args.output_dir) / f"{video_path.stem}_output.json"
 
     try:
         # Video işle
         result = process_video(
             video_path=video_path,
-            model_size=args.model,
-            language=args.language,
             output_path=output_path,
-            export_text=not args.no_text,
-            questions_path=Path(args.questions) if args.questions else None
+            jsonl_output=jsonl_output,
+            **process_kwargs
         )
 
         # Özet göster